@@ -46,10 +46,11 @@ from .adaptation import (CHROMATIC_ADAPTATION_METHODS,
                          CHROMATIC_ADAPTATION_TRANSFORMS,
                          CMCCAT2000_VIEWING_CONDITIONS, chromatic_adaptation)
 from .algebra import (
-    CubicSplineInterpolator, Extrapolator, KernelInterpolator,
-    LinearInterpolator, NullInterpolator, PchipInterpolator,
-    SpragueInterpolator, kernel_cardinal_spline, kernel_lanczos, kernel_linear,
-    kernel_nearest_neighbour, kernel_sinc, lagrange_coefficients)
+    CubicSplineInterpolator, Extrapolator, KernelInterpolator, LUT1D, LUT3D,
+    LogLUT1D, LinearInterpolator, NullInterpolator, PchipInterpolator,
+    SpragueInterpolator, bake_LUT1D, bake_LUT3D, kernel_cardinal_spline,
+    kernel_lanczos, kernel_linear, kernel_nearest_neighbour, kernel_sinc,
+    lagrange_coefficients)
 from .colorimetry import (
     ASTME30815_PRACTISE_SHAPE, BANDPASS_CORRECTION_METHODS,
     CIE_standard_illuminant_A_function, CMFS, DEFAULT_SPECTRAL_SHAPE,
@@ -80,16 +81,23 @@ from .difference import DELTA_E_METHODS, delta_E
 from .characterisation import (CAMERAS_RGB_SPECTRAL_SENSITIVITIES,
                                COLOURCHECKERS, COLOURCHECKERS_SPDS,
                                DISPLAYS_RGB_PRIMARIES, first_order_colour_fit)
-from .io import (IES_TM2714_Spd, read_image, read_spds_from_csv_file,
-                 read_spds_from_xrite_file, read_spectral_data_from_csv_file,
-                 write_image, write_spds_to_csv_file)
+from .io import (
+    IES_TM2714_Spd, SpectralLibrary, image_sequence_paths, read_LUT,
+    read_ENVI_header, read_ENVI_image, read_cgats_file,
+    read_ies_tm2714_directory, read_image, read_image_sequence,
+    read_image_tiles, read_multi_spd_from_csv_file, read_spds_from_csv_file,
+    read_spds_from_xrite_file, read_spectral_array_from_csv_file,
+    read_spectral_data_from_csv_file, read_spectral_library, write_LUT,
+    write_image, write_image_sequence, write_multi_spd_to_csv_file,
+    write_spds_to_csv_file, write_spectral_library)
 from .models import (
     CAM02LCD_to_JMh_CIECAM02, CAM02SCD_to_JMh_CIECAM02,
     CAM02UCS_to_JMh_CIECAM02, CAM16LCD_to_JMh_CAM16, CAM16SCD_to_JMh_CAM16,
-    CAM16UCS_to_JMh_CAM16, CMYK_to_CMY, CMY_to_CMYK, CMY_to_RGB, CV_range,
-    EOTFS, EOTFS_REVERSE, HDR_CIELAB_METHODS, HDR_IPT_METHODS, HSL_to_RGB,
-    HSV_to_RGB, Hunter_Lab_to_XYZ, Hunter_Rdab_to_XYZ, ICTCP_to_RGB,
-    IPT_hue_angle, IPT_to_XYZ, JMh_CAM16_to_CAM16LCD, JMh_CAM16_to_CAM16SCD,
+    CAM16UCS_to_JMh_CAM16, CCTF_LUT1D_REGISTRIES, CHROMA_SUBSAMPLINGS,
+    CMYK_to_CMY, CMY_to_CMYK, CMY_to_RGB, CV_range, EOTFS, EOTFS_REVERSE,
+    HDR_CIELAB_METHODS, HDR_IPT_METHODS, HSL_to_RGB, HSV_to_RGB,
+    Hunter_Lab_to_XYZ, Hunter_Rdab_to_XYZ, ICTCP_to_RGB, IPT_hue_angle,
+    IPT_to_XYZ, JMh_CAM16_to_CAM16LCD, JMh_CAM16_to_CAM16SCD,
     JMh_CAM16_to_CAM16UCS, JMh_CIECAM02_to_CAM02LCD, JMh_CIECAM02_to_CAM02SCD,
     JMh_CIECAM02_to_CAM02UCS, JzAzBz_to_XYZ, LCHab_to_Lab, LCHuv_to_Luv,
     LOG_DECODING_CURVES, LOG_ENCODING_CURVES, Lab_to_DIN99, Lab_to_LCHab,
@@ -98,13 +106,14 @@ from .models import (
     POINTER_GAMUT_BOUNDARIES, POINTER_GAMUT_DATA, POINTER_GAMUT_ILLUMINANT,
     Prismatic_to_RGB, RGB_COLOURSPACES, RGB_Colourspace, RGB_luminance,
     RGB_luminance_equation, RGB_to_CMY, RGB_to_HSL, RGB_to_HSV, RGB_to_ICTCP,
-    RGB_to_Prismatic, RGB_to_RGB, RGB_to_RGB_matrix, RGB_to_XYZ, RGB_to_YCbCr,
-    RGB_to_YcCbcCrc, RGB_to_YCoCg, UCS_to_XYZ, UCS_to_uv, UCS_uv_to_xy,
-    UVW_to_XYZ, XYZ_to_Hunter_Lab, XYZ_to_Hunter_Rdab, XYZ_to_IPT,
-    XYZ_to_JzAzBz, XYZ_to_K_ab_HunterLab1966, XYZ_to_Lab, XYZ_to_Luv,
-    XYZ_to_OSA_UCS, XYZ_to_RGB, XYZ_to_UCS, XYZ_to_UVW, XYZ_to_hdr_CIELab,
-    XYZ_to_hdr_IPT, XYZ_to_sRGB, XYZ_to_xy, XYZ_to_xyY, YCBCR_WEIGHTS,
-    YCbCr_to_RGB, YcCbcCrc_to_RGB, YCoCg_to_RGB,
+    RGB_to_Prismatic, RGB_to_RGB, RGB_to_RGB_Pipeline, RGB_to_RGB_matrix,
+    RGB_to_XYZ, RGB_to_YCbCr, RGB_to_YCbCr_subsampled, RGB_to_YcCbcCrc,
+    RGB_to_YCoCg, UCS_to_XYZ, UCS_to_uv, UCS_uv_to_xy, UVW_to_XYZ,
+    XYZ_to_Hunter_Lab, XYZ_to_Hunter_Rdab, XYZ_to_IPT, XYZ_to_JzAzBz,
+    XYZ_to_K_ab_HunterLab1966, XYZ_to_Lab, XYZ_to_Luv, XYZ_to_OSA_UCS,
+    XYZ_to_RGB, XYZ_to_UCS, XYZ_to_UVW, XYZ_to_hdr_CIELab, XYZ_to_hdr_IPT,
+    XYZ_to_sRGB, XYZ_to_xy, XYZ_to_xyY, YCBCR_WEIGHTS, YCbCr_to_RGB,
+    YCbCr_subsampled_to_RGB, YcCbcCrc_to_RGB, YCoCg_to_RGB, cctf_LUT1D,
     chromatically_adapted_primaries, eotf, eotf_reverse, full_to_legal,
     function_gamma, function_linear, hdr_CIELab_to_XYZ, hdr_IPT_to_XYZ,
     legal_to_full, log_decoding_curve, log_encoding_curve,
@@ -131,8 +140,10 @@ from .volume import (
     RGB_colourspace_pointer_gamut_coverage_MonteCarlo,
     RGB_colourspace_visible_spectrum_coverage_MonteCarlo,
     RGB_colourspace_volume_MonteCarlo,
-    RGB_colourspace_volume_coverage_MonteCarlo, is_within_macadam_limits,
-    is_within_mesh_volume, is_within_pointer_gamut, is_within_visible_spectrum)
+    RGB_colourspace_volume_coverage_MonteCarlo, RGB_colourspace_volume_mesh,
+    XYZ_optimal_colour_stimuli, is_within_convex_hull,
+    is_within_macadam_limits, is_within_mesh_volume, is_within_pointer_gamut,
+    is_within_visible_spectrum)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -147,11 +158,11 @@ __all__ += [
     'CMCCAT2000_VIEWING_CONDITIONS', 'chromatic_adaptation'
 ]
 __all__ += [
-    'CubicSplineInterpolator', 'Extrapolator', 'KernelInterpolator',
-    'LinearInterpolator', 'NullInterpolator', 'PchipInterpolator',
-    'SpragueInterpolator', 'kernel_cardinal_spline', 'kernel_lanczos',
-    'kernel_linear', 'kernel_nearest_neighbour', 'kernel_sinc',
-    'lagrange_coefficients'
+    'CubicSplineInterpolator', 'Extrapolator', 'KernelInterpolator', 'LUT1D',
+    'LUT3D', 'LogLUT1D', 'LinearInterpolator', 'NullInterpolator',
+    'PchipInterpolator', 'SpragueInterpolator', 'bake_LUT1D', 'bake_LUT3D',
+    'kernel_cardinal_spline', 'kernel_lanczos', 'kernel_linear',
+    'kernel_nearest_neighbour', 'kernel_sinc', 'lagrange_coefficients'
 ]
 __all__ += [
     'ASTME30815_PRACTISE_SHAPE', 'BANDPASS_CORRECTION_METHODS',
@@ -190,40 +201,49 @@ __all__ += [
     'COLOURCHECKERS_SPDS', 'DISPLAYS_RGB_PRIMARIES', 'first_order_colour_fit'
 ]
 __all__ += [
-    'IES_TM2714_Spd', 'read_image', 'read_spds_from_csv_file',
-    'read_spds_from_xrite_file', 'read_spectral_data_from_csv_file',
-    'write_image', 'write_spds_to_csv_file'
+    'IES_TM2714_Spd', 'SpectralLibrary', 'image_sequence_paths', 'read_LUT',
+    'read_ENVI_header', 'read_ENVI_image', 'read_cgats_file',
+    'read_ies_tm2714_directory', 'read_image', 'read_image_sequence',
+    'read_image_tiles', 'read_multi_spd_from_csv_file',
+    'read_spds_from_csv_file', 'read_spds_from_xrite_file',
+    'read_spectral_array_from_csv_file', 'read_spectral_data_from_csv_file',
+    'read_spectral_library', 'write_LUT', 'write_image',
+    'write_image_sequence', 'write_multi_spd_to_csv_file',
+    'write_spds_to_csv_file', 'write_spectral_library'
 ]
 __all__ += [
     'CAM02LCD_to_JMh_CIECAM02', 'CAM02SCD_to_JMh_CIECAM02',
     'CAM02UCS_to_JMh_CIECAM02', 'CAM16LCD_to_JMh_CAM16',
-    'CAM16SCD_to_JMh_CAM16', 'CAM16UCS_to_JMh_CAM16', 'CMYK_to_CMY',
-    'CMY_to_CMYK', 'CMY_to_RGB', 'CV_range', 'EOTFS', 'EOTFS_REVERSE',
-    'HDR_CIELAB_METHODS', 'HDR_IPT_METHODS', 'HSL_to_RGB', 'HSV_to_RGB',
-    'Hunter_Lab_to_XYZ', 'Hunter_Rdab_to_XYZ', 'ICTCP_to_RGB', 'IPT_hue_angle',
-    'IPT_to_XYZ', 'JMh_CAM16_to_CAM16LCD', 'JMh_CAM16_to_CAM16SCD',
-    'JMh_CAM16_to_CAM16UCS', 'JMh_CIECAM02_to_CAM02LCD',
-    'JMh_CIECAM02_to_CAM02SCD', 'JMh_CIECAM02_to_CAM02UCS', 'JzAzBz_to_XYZ',
-    'LCHab_to_Lab', 'LCHuv_to_Luv', 'LOG_DECODING_CURVES',
-    'LOG_ENCODING_CURVES', 'Lab_to_DIN99', 'Lab_to_LCHab', 'Lab_to_XYZ',
-    'Luv_to_LCHuv', 'Luv_to_XYZ', 'Luv_to_uv', 'Luv_uv_to_xy', 'OETFS',
-    'OETFS_REVERSE', 'OOTFS', 'OOTFS_REVERSE', 'OSA_UCS_to_XYZ',
-    'POINTER_GAMUT_BOUNDARIES', 'POINTER_GAMUT_DATA',
-    'POINTER_GAMUT_ILLUMINANT', 'Prismatic_to_RGB', 'RGB_COLOURSPACES',
-    'RGB_Colourspace', 'RGB_luminance', 'RGB_luminance_equation', 'RGB_to_CMY',
-    'RGB_to_HSL', 'RGB_to_HSV', 'RGB_to_ICTCP', 'RGB_to_Prismatic',
-    'RGB_to_RGB', 'RGB_to_RGB_matrix', 'RGB_to_XYZ', 'RGB_to_YCbCr',
-    'RGB_to_YcCbcCrc', 'RGB_to_YCoCg', 'UCS_to_XYZ', 'UCS_to_uv',
-    'UCS_uv_to_xy', 'UVW_to_XYZ', 'XYZ_to_Hunter_Lab', 'XYZ_to_Hunter_Rdab',
-    'XYZ_to_IPT', 'XYZ_to_JzAzBz', 'XYZ_to_K_ab_HunterLab1966', 'XYZ_to_Lab',
-    'XYZ_to_Luv', 'XYZ_to_OSA_UCS', 'XYZ_to_RGB', 'XYZ_to_UCS', 'XYZ_to_UVW',
-    'XYZ_to_hdr_CIELab', 'XYZ_to_hdr_IPT', 'XYZ_to_sRGB', 'XYZ_to_xy',
-    'XYZ_to_xyY', 'YCBCR_WEIGHTS', 'YCbCr_to_RGB', 'YcCbcCrc_to_RGB',
-    'YCoCg_to_RGB', 'chromatically_adapted_primaries', 'eotf', 'eotf_reverse',
-    'full_to_legal', 'function_gamma', 'function_linear', 'hdr_CIELab_to_XYZ',
-    'hdr_IPT_to_XYZ', 'legal_to_full', 'log_decoding_curve',
-    'log_encoding_curve', 'normalised_primary_matrix', 'oetf', 'oetf_reverse',
-    'ootf', 'ootf_reverse', 'primaries_whitepoint', 'sRGB_to_XYZ',
+    'CAM16SCD_to_JMh_CAM16', 'CAM16UCS_to_JMh_CAM16', 'CCTF_LUT1D_REGISTRIES',
+    'CHROMA_SUBSAMPLINGS', 'CMYK_to_CMY', 'CMY_to_CMYK', 'CMY_to_RGB',
+    'CV_range', 'EOTFS', 'EOTFS_REVERSE', 'HDR_CIELAB_METHODS',
+    'HDR_IPT_METHODS', 'HSL_to_RGB', 'HSV_to_RGB', 'Hunter_Lab_to_XYZ',
+    'Hunter_Rdab_to_XYZ', 'ICTCP_to_RGB', 'IPT_hue_angle', 'IPT_to_XYZ',
+    'JMh_CAM16_to_CAM16LCD', 'JMh_CAM16_to_CAM16SCD', 'JMh_CAM16_to_CAM16UCS',
+    'JMh_CIECAM02_to_CAM02LCD', 'JMh_CIECAM02_to_CAM02SCD',
+    'JMh_CIECAM02_to_CAM02UCS', 'JzAzBz_to_XYZ', 'LCHab_to_Lab',
+    'LCHuv_to_Luv', 'LOG_DECODING_CURVES', 'LOG_ENCODING_CURVES',
+    'Lab_to_DIN99', 'Lab_to_LCHab', 'Lab_to_XYZ', 'Luv_to_LCHuv', 'Luv_to_XYZ',
+    'Luv_to_uv', 'Luv_uv_to_xy', 'OETFS', 'OETFS_REVERSE', 'OOTFS',
+    'OOTFS_REVERSE', 'OSA_UCS_to_XYZ', 'POINTER_GAMUT_BOUNDARIES',
+    'POINTER_GAMUT_DATA', 'POINTER_GAMUT_ILLUMINANT', 'Prismatic_to_RGB',
+    'RGB_COLOURSPACES', 'RGB_Colourspace', 'RGB_luminance',
+    'RGB_luminance_equation', 'RGB_to_CMY', 'RGB_to_HSL', 'RGB_to_HSV',
+    'RGB_to_ICTCP', 'RGB_to_Prismatic', 'RGB_to_RGB', 'RGB_to_RGB_Pipeline',
+    'RGB_to_RGB_matrix', 'RGB_to_XYZ', 'RGB_to_YCbCr',
+    'RGB_to_YCbCr_subsampled', 'RGB_to_YcCbcCrc', 'RGB_to_YCoCg', 'UCS_to_XYZ',
+    'UCS_to_uv', 'UCS_uv_to_xy', 'UVW_to_XYZ', 'XYZ_to_Hunter_Lab',
+    'XYZ_to_Hunter_Rdab', 'XYZ_to_IPT', 'XYZ_to_JzAzBz',
+    'XYZ_to_K_ab_HunterLab1966', 'XYZ_to_Lab', 'XYZ_to_Luv', 'XYZ_to_OSA_UCS',
+    'XYZ_to_RGB', 'XYZ_to_UCS', 'XYZ_to_UVW', 'XYZ_to_hdr_CIELab',
+    'XYZ_to_hdr_IPT', 'XYZ_to_sRGB', 'XYZ_to_xy', 'XYZ_to_xyY',
+    'YCBCR_WEIGHTS', 'YCbCr_to_RGB', 'YCbCr_subsampled_to_RGB',
+    'YcCbcCrc_to_RGB', 'YCoCg_to_RGB', 'cctf_LUT1D',
+    'chromatically_adapted_primaries', 'eotf', 'eotf_reverse', 'full_to_legal',
+    'function_gamma', 'function_linear', 'hdr_CIELab_to_XYZ', 'hdr_IPT_to_XYZ',
+    'legal_to_full', 'log_decoding_curve', 'log_encoding_curve',
+    'normalised_primary_matrix', 'oetf', 'oetf_reverse', 'ootf',
+    'ootf_reverse', 'primaries_whitepoint', 'sRGB_to_XYZ',
     'spectral_to_aces_relative_exposure_values', 'xyY_to_XYZ', 'xyY_to_xy',
     'xy_to_Luv_uv', 'xy_to_UCS_uv', 'xy_to_XYZ', 'xy_to_xyY'
 ]
@@ -251,7 +271,9 @@ __all__ += [
     'RGB_colourspace_pointer_gamut_coverage_MonteCarlo',
     'RGB_colourspace_visible_spectrum_coverage_MonteCarlo',
     'RGB_colourspace_volume_MonteCarlo',
-    'RGB_colourspace_volume_coverage_MonteCarlo', 'is_within_macadam_limits',
+    'RGB_colourspace_volume_coverage_MonteCarlo',
+    'RGB_colourspace_volume_mesh', 'XYZ_optimal_colour_stimuli',
+    'is_within_convex_hull', 'is_within_macadam_limits',
     'is_within_mesh_volume', 'is_within_pointer_gamut',
     'is_within_visible_spectrum'
 ]
@@ -23,9 +23,8 @@ References
 
 from __future__ import absolute_import
 
-import numpy as np
-
-from colour.utilities import CaseInsensitiveMapping, filter_kwargs
+from colour.utilities import (CaseInsensitiveMapping, as_float_array,
+                              filter_kwargs)
 
 from .dataset import *  # noqa
 from . import dataset
@@ -200,9 +199,9 @@ def chromatic_adaptation(XYZ, XYZ_w, XYZ_wr, method='Von Kries', **kwargs):
     array([ 0.2332526...,  0.2332455...,  0.7611593...])
     """
 
-    XYZ = np.asarray(XYZ)
-    XYZ_w = np.asarray(XYZ_w)
-    XYZ_wr = np.asarray(XYZ_wr)
+    XYZ = as_float_array(XYZ)
+    XYZ_w = as_float_array(XYZ_w)
+    XYZ_wr = as_float_array(XYZ_wr)
 
     function = CHROMATIC_ADAPTATION_METHODS[method]
 
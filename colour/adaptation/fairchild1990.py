@@ -27,7 +27,8 @@ from __future__ import division, unicode_literals
 import numpy as np
 
 from colour.adaptation import VON_KRIES_CAT
-from colour.utilities import dot_vector, row_as_diagonal, tsplit, tstack
+from colour.utilities import (as_float_array, dot_vector, row_as_diagonal,
+                              tsplit, tstack)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -115,10 +116,10 @@ def chromatic_adaptation_Fairchild1990(XYZ_1,
     array([ 23.3252634...,  23.3245581...,  76.1159375...])
     """
 
-    XYZ_1 = np.asarray(XYZ_1)
-    XYZ_n = np.asarray(XYZ_n)
-    XYZ_r = np.asarray(XYZ_r)
-    Y_n = np.asarray(Y_n)
+    XYZ_1 = as_float_array(XYZ_1)
+    XYZ_n = as_float_array(XYZ_n)
+    XYZ_r = as_float_array(XYZ_r)
+    Y_n = as_float_array(Y_n)
 
     LMS_1 = dot_vector(FAIRCHILD1990_XYZ_TO_RGB_MATRIX, XYZ_1)
     LMS_n = dot_vector(FAIRCHILD1990_XYZ_TO_RGB_MATRIX, XYZ_n)
@@ -226,12 +227,12 @@ def degrees_of_adaptation(LMS, Y_n, v=1 / 3, discount_illuminant=False):
     array([ 1.,  1.,  1.])
     """
 
-    LMS = np.asarray(LMS)
+    LMS = as_float_array(LMS)
     if discount_illuminant:
         return np.ones(LMS.shape)
 
-    Y_n = np.asarray(Y_n)
-    v = np.asarray(v)
+    Y_n = as_float_array(Y_n)
+    v = as_float_array(v)
 
     L, M, S = tsplit(LMS)
 
@@ -13,6 +13,7 @@ from .interpolation import (
     kernel_cardinal_spline, KernelInterpolator, LinearInterpolator,
     SpragueInterpolator, CubicSplineInterpolator, PchipInterpolator,
     NullInterpolator, lagrange_coefficients)
+from .lut import LUT1D, bake_LUT1D, LogLUT1D, LUT3D, bake_LUT3D
 from .matrix import is_identity
 from .random import random_triplet_generator
 
@@ -29,5 +30,6 @@ __all__ += [
     'LinearInterpolator', 'SpragueInterpolator', 'CubicSplineInterpolator',
     'PchipInterpolator', 'NullInterpolator', 'lagrange_coefficients'
 ]
+__all__ += ['LUT1D', 'bake_LUT1D', 'LogLUT1D', 'LUT3D', 'bake_LUT3D']
 __all__ += ['is_identity']
 __all__ += ['random_triplet_generator']
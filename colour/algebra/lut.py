@@ -0,0 +1,1176 @@
+# -*- coding: utf-8 -*-
+"""
+Look-Up Tables
+==============
+
+Defines classes and definitions for baking functions into look-up tables and
+applying them:
+
+-   :class:`colour.LUT1D`: 1-D look-up table.
+-   :func:`colour.bake_LUT1D`: Bakes a 1-D function into a 1-D look-up table.
+-   :class:`colour.LogLUT1D`: 1-D look-up table sampled on a base 2
+    logarithmic grid.
+-   :class:`colour.LUT3D`: 3-D look-up table.
+-   :func:`colour.bake_LUT3D`: Bakes an *RGB* to *RGB* function into a 3-D
+    look-up table.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+
+from colour.algebra.interpolation import CubicSplineInterpolator
+from colour.constants import DEFAULT_FLOAT_DTYPE
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'LUT1D_INTERPOLATION_METHODS', 'LUT1D_CODE_VALUE_MAXIMUM_BIT_DEPTH',
+    'LUT1D', 'bake_LUT1D', 'LogLUT1D', 'LUT3D_INTERPOLATION_METHODS',
+    'LUT3D_CHUNK_SIZE', 'LUT3D', 'bake_LUT3D'
+]
+
+LUT1D_INTERPOLATION_METHODS = ('Linear', 'Cubic')
+"""
+Supported 1-D look-up table interpolation methods for floating point inputs.
+
+LUT1D_INTERPOLATION_METHODS : tuple
+    **{'Linear', 'Cubic'}**
+"""
+
+LUT1D_CODE_VALUE_MAXIMUM_BIT_DEPTH = 16
+"""
+Maximum bit depth of the integer code values applied with a direct index in a
+code value table, integer inputs with a greater bit depth are normalised and
+interpolated.
+
+LUT1D_CODE_VALUE_MAXIMUM_BIT_DEPTH : integer
+"""
+
+
+class LUT1D(object):
+    """
+    Defines a 1-D look-up table whose values are uniformly sampled over given
+    domain.
+
+    Floating point inputs are interpolated and clipped to the domain. Integer
+    code values, e.g. *uint8*, *uint10* in a *uint16* container or *uint16*,
+    and *half-float* inputs are applied with a single table gather: if the
+    function the look-up table was baked from is known, the code value tables
+    are evaluated exactly at each code value.
+
+    Parameters
+    ----------
+    table : array_like
+        Look-up table values.
+    domain : array_like, optional
+        Look-up table domain, i.e. the input values corresponding to the first
+        and last table values.
+    function : callable, optional
+        Function the look-up table was baked from.
+    name : unicode, optional
+        Look-up table name.
+
+    Attributes
+    ----------
+    table
+    domain
+    function
+    name
+    size
+
+    Methods
+    -------
+    apply
+    maximum_error
+
+    Examples
+    --------
+    >>> LUT = LUT1D(np.linspace(0, 1, 5) ** 2)
+    >>> LUT.apply(np.array([0.1, 0.5, 0.6]))  # doctest: +ELLIPSIS
+    array([ 0.025,  0.25 ,  0.375])
+    >>> LUT.apply(np.array([0, 128, 255], dtype=np.uint8))
+    ... # doctest: +ELLIPSIS
+    array([ 0.        ,  0.2524509...,  1.        ])
+    """
+
+    def __init__(self, table, domain=None, function=None, name=None):
+        self._table = None
+        self._domain = None
+        self._function = None
+        self._name = None
+
+        self.table = table
+        self.domain = domain if domain is not None else np.array([0, 1])
+        self.function = function
+        self.name = name
+
+    @property
+    def table(self):
+        """
+        Getter and setter property for the look-up table values.
+
+        Parameters
+        ----------
+        value : array_like
+            Value to set the look-up table values with.
+
+        Returns
+        -------
+        ndarray
+            Look-up table values.
+        """
+
+        return self._table
+
+    @table.setter
+    def table(self, value):
+        """
+        Setter for the **self.table** property.
+        """
+
+        value = np.asarray(value, dtype=DEFAULT_FLOAT_DTYPE)
+        assert value.ndim == 1, '"table" must have exactly one dimension!'
+        assert value.size >= 2, '"table" must have at least two values!'
+
+        self._table = value
+        self._reset_cache()
+
+    @property
+    def domain(self):
+        """
+        Getter and setter property for the look-up table domain.
+
+        Parameters
+        ----------
+        value : array_like
+            Value to set the look-up table domain with.
+
+        Returns
+        -------
+        ndarray
+            Look-up table domain.
+        """
+
+        return self._domain
+
+    @domain.setter
+    def domain(self, value):
+        """
+        Setter for the **self.domain** property.
+        """
+
+        value = np.asarray(value, dtype=DEFAULT_FLOAT_DTYPE)
+        assert value.shape == (2, ), '"domain" must have exactly two values!'
+
+        self._domain = value
+        self._reset_cache()
+
+    @property
+    def function(self):
+        """
+        Getter and setter property for the function the look-up table was
+        baked from.
+
+        Parameters
+        ----------
+        value : callable
+            Value to set the function the look-up table was baked from with.
+
+        Returns
+        -------
+        callable
+            Function the look-up table was baked from.
+        """
+
+        return self._function
+
+    @function.setter
+    def function(self, value):
+        """
+        Setter for the **self.function** property.
+        """
+
+        if value is not None:
+            assert hasattr(
+                value,
+                '__call__'), ('"{0}" attribute: "{1}" is not callable!'.format(
+                    'function', value))
+
+        self._function = value
+        self._reset_cache()
+
+    @property
+    def name(self):
+        """
+        Getter and setter property for the look-up table name.
+
+        Parameters
+        ----------
+        value : unicode
+            Value to set the look-up table name with.
+
+        Returns
+        -------
+        unicode
+            Look-up table name.
+        """
+
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        """
+        Setter for the **self.name** property.
+        """
+
+        self._name = value
+
+    @property
+    def size(self):
+        """
+        Getter property for the look-up table size.
+
+        Returns
+        -------
+        integer
+            Look-up table size.
+        """
+
+        return self._table.size
+
+    def _reset_cache(self):
+        """
+        Resets the samples, interpolators and code value tables caches.
+        """
+
+        self._samples = None
+        self._cubic_interpolator = None
+        self._code_value_tables = {}
+
+    def _table_samples(self):
+        """
+        Returns the input values corresponding to the look-up table values.
+
+        Returns
+        -------
+        ndarray
+            Look-up table input values.
+        """
+
+        if self._samples is None:
+            self._samples = np.linspace(self._domain[0], self._domain[1],
+                                        self._table.size)
+
+        return self._samples
+
+    def _interpolate(self, x, method='Linear'):
+        """
+        Interpolates the look-up table at given floating point input values.
+
+        Parameters
+        ----------
+        x : ndarray
+            Input values.
+        method : unicode, optional
+            **{'Linear', 'Cubic'}**,
+            Interpolation method.
+
+        Returns
+        -------
+        ndarray
+            Interpolated values.
+        """
+
+        method = method.lower()
+        samples = self._table_samples()
+
+        if method == 'linear':
+            return np.interp(x, samples, self._table)
+        elif method == 'cubic':
+            if self._cubic_interpolator is None:
+                self._cubic_interpolator = CubicSplineInterpolator(
+                    samples, self._table)
+
+            return self._cubic_interpolator(
+                np.clip(x, self._domain[0], self._domain[1]))
+        else:
+            raise ValueError(
+                'Invalid interpolation method: "{0}", must be one of {1}!'.
+                format(method, LUT1D_INTERPOLATION_METHODS))
+
+    def _code_values_to_domain(self, a, bit_depth):
+        """
+        Maps given integer code values linearly to the look-up table domain.
+
+        Parameters
+        ----------
+        a : ndarray
+            Integer code values.
+        bit_depth : integer
+            Code values bit depth.
+
+        Returns
+        -------
+        ndarray
+            Code values in the look-up table domain.
+        """
+
+        return self._domain[0] + a / (2 ** bit_depth - 1) * (
+            self._domain[1] - self._domain[0])
+
+    def _code_value_table(self, bit_depth):
+        """
+        Returns the table of given integer code values bit depth and caches it
+        if not existing.
+
+        Parameters
+        ----------
+        bit_depth : integer
+            Code values bit depth.
+
+        Returns
+        -------
+        ndarray
+            Code value table.
+        """
+
+        table = self._code_value_tables.get(bit_depth)
+        if table is None:
+            x = self._code_values_to_domain(
+                np.arange(2 ** bit_depth), bit_depth)
+            if self._function is not None:
+                table = np.asarray(
+                    self._function(x), dtype=DEFAULT_FLOAT_DTYPE)
+            else:
+                table = self._interpolate(x)
+
+            self._code_value_tables[bit_depth] = table
+
+        return table
+
+    def _half_float_table(self):
+        """
+        Returns the table of all the *half-float* values and caches it if not
+        existing.
+
+        Returns
+        -------
+        ndarray
+            *Half-float* values table.
+        """
+
+        table = self._code_value_tables.get('half')
+        if table is None:
+            x = np.arange(2 ** 16, dtype=np.uint16).view(np.float16)
+            with np.errstate(all='ignore'):
+                table = np.asarray(
+                    self._function(x.astype(DEFAULT_FLOAT_DTYPE)),
+                    dtype=DEFAULT_FLOAT_DTYPE)
+
+            self._code_value_tables['half'] = table
+
+        return table
+
+    def apply(self, a, method='Linear', bit_depth=None):
+        """
+        Applies the look-up table to given array.
+
+        Parameters
+        ----------
+        a : array_like
+            Floating point values, *half-float* values or integer code values
+            to apply the look-up table to.
+        method : unicode, optional
+            **{'Linear', 'Cubic'}**,
+            Interpolation method for floating point values.
+        bit_depth : integer, optional
+            Integer code values bit depth, default to the array data type bit
+            depth, e.g. 10 for *uint10* code values stored in a *uint16*
+            array. Code values are mapped linearly to the look-up table domain
+            and code values outside the bit depth range are clipped.
+
+        Returns
+        -------
+        ndarray
+            Look-up table applied array.
+
+        Examples
+        --------
+        >>> LUT = bake_LUT1D(lambda x: x ** 2, size=5)
+        >>> LUT.apply(np.array([0.1, 0.5, 0.6]))  # doctest: +ELLIPSIS
+        array([ 0.025,  0.25 ,  0.375])
+        >>> LUT.apply(np.array([0.1, 0.5, 0.6]), 'Cubic')
+        ... # doctest: +ELLIPSIS
+        array([ 0.01,  0.25,  0.36])
+        >>> LUT.apply(np.array([0, 512, 1023], dtype=np.uint16), bit_depth=10)
+        ... # doctest: +ELLIPSIS
+        array([ 0.      ,  0.250489,  1.      ])
+        """
+
+        a = np.asarray(a)
+
+        if a.dtype.kind in 'ui':
+            if bit_depth is None:
+                bit_depth = a.dtype.itemsize * 8
+
+            if bit_depth <= LUT1D_CODE_VALUE_MAXIMUM_BIT_DEPTH:
+                return np.take(
+                    self._code_value_table(bit_depth), a, mode='clip')
+
+            a = self._code_values_to_domain(a, bit_depth)
+        elif a.dtype == np.float16 and self._function is not None:
+            return np.take(self._half_float_table(), a.view(np.uint16))
+
+        return self._interpolate(a, method)
+
+    def maximum_error(self, method='Linear', samples=None):
+        """
+        Returns the maximum absolute error of the look-up table floating point
+        values interpolation against the function it was baked from.
+
+        Parameters
+        ----------
+        method : unicode, optional
+            **{'Linear', 'Cubic'}**,
+            Interpolation method.
+        samples : integer, optional
+            Samples count over the domain used to evaluate the error, default
+            to eight times the look-up table size.
+
+        Returns
+        -------
+        numeric
+            Maximum absolute error.
+
+        Raises
+        ------
+        ValueError
+            If the function the look-up table was baked from is not known.
+
+        Examples
+        --------
+        >>> LUT = bake_LUT1D(lambda x: x ** 2, size=5)
+        >>> LUT.maximum_error()  # doctest: +ELLIPSIS
+        0.0156...
+        """
+
+        if self._function is None:
+            raise ValueError('The function the look-up table was baked from '
+                             'is not known, the error cannot be computed!')
+
+        if samples is None:
+            samples = self._table.size * 8
+
+        x = np.linspace(self._domain[0], self._domain[1], samples)
+
+        return np.max(
+            np.abs(self._interpolate(x, method) - self._function(x)))
+
+
+def bake_LUT1D(function, domain=np.array([0, 1]), size=4096, name=None):
+    """
+    Bakes given 1-D function into a 1-D look-up table.
+
+    Parameters
+    ----------
+    function : callable
+        Function to bake.
+    domain : array_like, optional
+        Look-up table domain.
+    size : integer, optional
+        Look-up table size.
+    name : unicode, optional
+        Look-up table name.
+
+    Returns
+    -------
+    LUT1D
+        Baked 1-D look-up table.
+
+    Examples
+    --------
+    >>> LUT = bake_LUT1D(lambda x: x ** 2, size=5)
+    >>> LUT.table
+    array([ 0.    ,  0.0625,  0.25  ,  0.5625,  1.    ])
+    """
+
+    domain = np.asarray(domain, dtype=DEFAULT_FLOAT_DTYPE)
+    table = function(np.linspace(domain[0], domain[1], size))
+
+    return LUT1D(table, domain, function, name)
+
+
+class LogLUT1D(object):
+    """
+    Defines a 1-D look-up table baked from given function on a base 2
+    logarithmic grid: each octave :math:`[2^e, 2^{e + 1})` of the domain is
+    uniformly sampled with :math:`2^{octave\\_bits}` values.
+
+    The table is indexed directly with the exponent and leading mantissa bits
+    of the *float64* input values, i.e. without evaluating any logarithm, and
+    linearly interpolated. It approximates functions spanning many orders of
+    magnitude, e.g. power functions, with a bounded relative error. The input
+    values outside the domain, e.g. zero, negative and *nan* values, are
+    evaluated with the function.
+
+    Parameters
+    ----------
+    function : callable
+        Function to bake.
+    exponents : array_like, optional
+        Base 2 exponents :math:`a` and :math:`b` of the look-up table domain,
+        i.e. :math:`[2^a, 2^b)`.
+    octave_bits : integer, optional
+        Base 2 logarithm of the samples count per octave.
+    offset : numeric, optional
+        Input values offset, the look-up table domain is applied to the input
+        values minus the offset, e.g. to sample a function accurately near the
+        value it vanishes at.
+    name : unicode, optional
+        Look-up table name.
+
+    Attributes
+    ----------
+    table
+    function
+    exponents
+    octave_bits
+    offset
+    name
+    size
+
+    Methods
+    -------
+    apply
+    maximum_error
+
+    Examples
+    --------
+    >>> LUT = LogLUT1D(lambda x: x ** (1 / 2.4), (-16, 1), 8)
+    >>> LUT.size
+    4353
+    >>> LUT.apply(np.array([0.0, 0.001, 0.18, 1.0]))  # doctest: +ELLIPSIS
+    array([ 0.        ,  0.0562341...,  0.4894369...,  1.        ])
+    >>> LUT.maximum_error() < 1e-6
+    True
+    """
+
+    def __init__(self,
+                 function,
+                 exponents=(-32, 4),
+                 octave_bits=8,
+                 offset=0,
+                 name=None):
+        assert hasattr(function, '__call__'), (
+            '"{0}" attribute: "{1}" is not callable!'.format(
+                'function', function))
+
+        self._function = function
+        self._exponents = tuple(int(exponent) for exponent in exponents)
+        self._octave_bits = int(octave_bits)
+        self._offset = offset
+        self._name = name
+
+        a, b = self._exponents
+        assert -1022 <= a < b <= 1023, (
+            '"exponents" must be sorted normal "float64" exponents!')
+        assert 0 <= self._octave_bits <= 20, (
+            '"octave_bits" must be in domain [0, 20]!')
+
+        self._table = np.asarray(
+            function(self._table_samples() + offset), dtype=np.float_)
+
+    @property
+    def table(self):
+        """
+        Getter property for the look-up table values.
+
+        Returns
+        -------
+        ndarray
+            Look-up table values.
+        """
+
+        return self._table
+
+    @property
+    def function(self):
+        """
+        Getter property for the function the look-up table was baked from.
+
+        Returns
+        -------
+        callable
+            Function the look-up table was baked from.
+        """
+
+        return self._function
+
+    @property
+    def exponents(self):
+        """
+        Getter property for the look-up table domain base 2 exponents.
+
+        Returns
+        -------
+        tuple
+            Look-up table domain base 2 exponents.
+        """
+
+        return self._exponents
+
+    @property
+    def octave_bits(self):
+        """
+        Getter property for the base 2 logarithm of the look-up table samples
+        count per octave.
+
+        Returns
+        -------
+        integer
+            Base 2 logarithm of the samples count per octave.
+        """
+
+        return self._octave_bits
+
+    @property
+    def offset(self):
+        """
+        Getter property for the input values offset.
+
+        Returns
+        -------
+        numeric
+            Input values offset.
+        """
+
+        return self._offset
+
+    @property
+    def name(self):
+        """
+        Getter and setter property for the look-up table name.
+
+        Parameters
+        ----------
+        value : unicode
+            Value to set the look-up table name with.
+
+        Returns
+        -------
+        unicode
+            Look-up table name.
+        """
+
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        """
+        Setter for the **self.name** property.
+        """
+
+        self._name = value
+
+    @property
+    def size(self):
+        """
+        Getter property for the look-up table size.
+
+        Returns
+        -------
+        integer
+            Look-up table size.
+        """
+
+        return self._table.size
+
+    def _table_samples(self):
+        """
+        Returns the input values, minus the offset, corresponding to the
+        look-up table values.
+
+        Returns
+        -------
+        ndarray
+            Look-up table input values.
+        """
+
+        a, b = self._exponents
+        samples = 2 ** self._octave_bits
+        k = np.arange((b - a) * samples + 1)
+
+        return 2.0 ** (a + k // samples) * (1 + (k % samples) / samples)
+
+    def apply(self, a):
+        """
+        Applies the look-up table to given array.
+
+        Parameters
+        ----------
+        a : array_like
+            Values to apply the look-up table to.
+
+        Returns
+        -------
+        ndarray
+            Look-up table applied array, with the input floating point data
+            type.
+
+        Examples
+        --------
+        >>> LUT = LogLUT1D(lambda x: x ** 2, (-4, 4))
+        >>> LUT.apply(np.array([-1.0, 0.5, 3.0, 8.0]))
+        array([  1.  ,   0.25,   9.  ,  64.  ])
+        """
+
+        a = np.asarray(a)
+        shape = a.shape
+        dtype = a.dtype if a.dtype.kind == 'f' else np.float_
+        a = np.ravel(a)
+        x = np.asarray(a, dtype=np.float64)
+        if self._offset:
+            x = x - self._offset
+
+        lower, upper = 2.0 ** np.array(self._exponents)
+        with np.errstate(invalid='ignore'):
+            inside = np.logical_and(x >= lower, x < upper)
+        x = np.where(inside, x, lower)
+
+        # The shifted *float64* bits are the table index: the exponent selects
+        # the octave and the leading mantissa bits the sample in the octave.
+        shift = 52 - self._octave_bits
+        origin = (1023 + self._exponents[0]) << self._octave_bits
+        bits = x.view(np.int64)
+        i = (bits >> shift) - origin
+        f = (bits & ((1 << shift) - 1)) * (1 / (1 << shift))
+
+        y = self._table[i]
+        y += f * (self._table[i + 1] - y)
+
+        if not np.all(inside):
+            outside = ~inside
+            y[outside] = self._function(np.asarray(a, dtype=dtype)[outside])
+
+        y = np.reshape(y.astype(dtype, copy=False), shape)
+
+        return y if y.ndim else y[()]
+
+    def maximum_error(self, samples=None):
+        """
+        Returns the maximum relative error of the look-up table against the
+        function it was baked from.
+
+        The error is evaluated at the middle of the look-up table sampling
+        intervals, where the linear interpolation error is the largest, and
+        at given count of additional log-uniformly distributed samples.
+
+        Parameters
+        ----------
+        samples : integer, optional
+            Additional samples count over the domain used to evaluate the
+            error, default to the look-up table size.
+
+        Returns
+        -------
+        numeric
+            Maximum relative error.
+
+        Examples
+        --------
+        >>> LUT = LogLUT1D(lambda x: x ** 2, (-4, 4), 4)
+        >>> LUT.maximum_error()  # doctest: +ELLIPSIS
+        0.000...
+        """
+
+        if samples is None:
+            samples = self._table.size
+
+        a, b = self._exponents
+        x = self._table_samples()
+        x = np.hstack(
+            [(x[:-1] + x[1:]) / 2,
+             2.0 ** np.linspace(a, b, samples, endpoint=False)]) + self._offset
+
+        y = self._function(x)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            error = np.abs((self.apply(x) - y) / y)
+
+        return np.max(error[np.isfinite(error)])
+
+
+LUT3D_INTERPOLATION_METHODS = ('Trilinear', 'Tetrahedral')
+"""
+Supported 3-D look-up table interpolation methods.
+
+LUT3D_INTERPOLATION_METHODS : tuple
+    **{'Trilinear', 'Tetrahedral'}**
+"""
+
+LUT3D_CHUNK_SIZE = 65536
+"""
+Default count of *RGB* values interpolated at once by
+:meth:`colour.LUT3D.apply` method, bounding the temporary arrays memory.
+
+LUT3D_CHUNK_SIZE : integer
+"""
+
+
+class LUT3D(object):
+    """
+    Defines a 3-D look-up table whose values are uniformly sampled over given
+    domain.
+
+    The table is indexed as *table[r, g, b]*, i.e. it has shape
+    (size, size, size, 3) and its dtype, e.g. *float32*, is used for the
+    interpolation computations.
+
+    Parameters
+    ----------
+    table : array_like
+        Look-up table values.
+    domain : array_like, optional
+        Look-up table domain, i.e. the minimum and maximum input *RGB* values
+        with shape (2, 3).
+    name : unicode, optional
+        Look-up table name.
+
+    Attributes
+    ----------
+    table
+    domain
+    name
+    size
+
+    Methods
+    -------
+    apply
+
+    Examples
+    --------
+    >>> LUT = bake_LUT3D(lambda x: x ** 2, 3)
+    >>> LUT.size
+    3
+    >>> LUT.apply(np.array([0.25, 0.5, 0.75]))
+    array([ 0.125,  0.25 ,  0.625])
+    """
+
+    def __init__(self, table, domain=None, name=None):
+        self._table = None
+        self._domain = None
+        self._name = None
+
+        self.table = table
+        self.domain = (domain if domain is not None else np.array(
+            [[0, 0, 0], [1, 1, 1]]))
+        self.name = name
+
+    @property
+    def table(self):
+        """
+        Getter and setter property for the look-up table values.
+
+        Parameters
+        ----------
+        value : array_like
+            Value to set the look-up table values with.
+
+        Returns
+        -------
+        ndarray
+            Look-up table values.
+        """
+
+        return self._table
+
+    @table.setter
+    def table(self, value):
+        """
+        Setter for the **self.table** property.
+        """
+
+        value = np.asarray(value)
+        if value.dtype.kind != 'f':
+            value = value.astype(DEFAULT_FLOAT_DTYPE)
+
+        assert (value.ndim == 4 and value.shape[0] == value.shape[1] ==
+                value.shape[2] and value.shape[3] == 3), (
+                    '"table" must have a (size, size, size, 3) shape!')
+        assert value.shape[0] >= 2, '"table" must have a size of at least 2!'
+
+        self._table = value
+
+    @property
+    def domain(self):
+        """
+        Getter and setter property for the look-up table domain.
+
+        Parameters
+        ----------
+        value : array_like
+            Value to set the look-up table domain with.
+
+        Returns
+        -------
+        ndarray
+            Look-up table domain.
+        """
+
+        return self._domain
+
+    @domain.setter
+    def domain(self, value):
+        """
+        Setter for the **self.domain** property.
+        """
+
+        value = np.asarray(value, dtype=DEFAULT_FLOAT_DTYPE)
+        assert value.shape == (2, 3), '"domain" must have a (2, 3) shape!'
+
+        self._domain = value
+
+    @property
+    def name(self):
+        """
+        Getter and setter property for the look-up table name.
+
+        Parameters
+        ----------
+        value : unicode
+            Value to set the look-up table name with.
+
+        Returns
+        -------
+        unicode
+            Look-up table name.
+        """
+
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        """
+        Setter for the **self.name** property.
+        """
+
+        self._name = value
+
+    @property
+    def size(self):
+        """
+        Getter property for the look-up table size, i.e. the samples count
+        per axis.
+
+        Returns
+        -------
+        integer
+            Look-up table size.
+        """
+
+        return self._table.shape[0]
+
+    def _trilinear(self, RGB, table, strides):
+        """
+        Trilinearly interpolates the look-up table at given normalised *RGB*
+        values.
+
+        Parameters
+        ----------
+        RGB : ndarray
+            Normalised *RGB* values, i.e. expressed in table indexes.
+        table : ndarray
+            Flattened look-up table values.
+        strides : ndarray
+            Flattened look-up table strides.
+
+        Returns
+        -------
+        ndarray
+            Interpolated values.
+        """
+
+        i = np.minimum(np.floor(RGB), self.size - 2).astype(np.intp)
+        f = RGB - i
+        f_r, f_g, f_b = f[..., 0:1], f[..., 1:2], f[..., 2:3]
+        s_r, s_g, s_b = strides
+
+        v_000 = np.dot(i, strides)
+        v_010 = v_000 + s_g
+        v_100 = v_000 + s_r
+        v_110 = v_100 + s_g
+
+        def lerp(a, b, t):
+            """
+            Linearly interpolates between given values.
+            """
+
+            return a + t * (b - a)
+
+        c_00 = lerp(table[v_000], table[v_000 + s_b], f_b)
+        c_01 = lerp(table[v_010], table[v_010 + s_b], f_b)
+        c_10 = lerp(table[v_100], table[v_100 + s_b], f_b)
+        c_11 = lerp(table[v_110], table[v_110 + s_b], f_b)
+
+        return lerp(lerp(c_00, c_01, f_g), lerp(c_10, c_11, f_g), f_r)
+
+    def _tetrahedral(self, RGB, table, strides):
+        """
+        Tetrahedrally interpolates the look-up table at given normalised *RGB*
+        values.
+
+        Parameters
+        ----------
+        RGB : ndarray
+            Normalised *RGB* values, i.e. expressed in table indexes.
+        table : ndarray
+            Flattened look-up table values.
+        strides : ndarray
+            Flattened look-up table strides.
+
+        Returns
+        -------
+        ndarray
+            Interpolated values.
+
+        Notes
+        -----
+        -   The cube cell containing each value is split along its main
+            diagonal into 6 tetrahedra, the one containing the value is
+            walked from the cell origin along the axes sorted by decreasing
+            fractional part.
+        """
+
+        i = np.minimum(np.floor(RGB), self.size - 2).astype(np.intp)
+        f = RGB - i
+
+        order = np.argsort(-f, axis=-1)
+        rows = np.arange(f.shape[0])[:, np.newaxis]
+        f = f[rows, order]
+        steps = strides[order]
+
+        v_0 = np.dot(i, strides)
+        v_1 = v_0 + steps[..., 0]
+        v_2 = v_1 + steps[..., 1]
+        v_3 = v_2 + steps[..., 2]
+
+        return ((1 - f[..., 0:1]) * table[v_0] +
+                (f[..., 0:1] - f[..., 1:2]) * table[v_1] +
+                (f[..., 1:2] - f[..., 2:3]) * table[v_2] +
+                f[..., 2:3] * table[v_3])
+
+    def apply(self, RGB, method='Tetrahedral', chunk_size=LUT3D_CHUNK_SIZE):
+        """
+        Applies the look-up table to given *RGB* colourspace array.
+
+        Parameters
+        ----------
+        RGB : array_like
+            *RGB* colourspace array to apply the look-up table to, values
+            outside the domain are clipped and *RGB* values with a *NaN*
+            component yield *NaN*.
+        method : unicode, optional
+            **{'Tetrahedral', 'Trilinear'}**,
+            Interpolation method.
+        chunk_size : integer, optional
+            Count of *RGB* values interpolated at once.
+
+        Returns
+        -------
+        ndarray
+            Look-up table applied *RGB* colourspace array with the look-up
+            table dtype.
+
+        Examples
+        --------
+        >>> LUT = bake_LUT3D(lambda x: x ** 2, 3)
+        >>> RGB = np.array([0.25, 0.5, 0.75])
+        >>> LUT.apply(RGB)
+        array([ 0.125,  0.25 ,  0.625])
+        >>> LUT.apply(RGB, 'Trilinear')
+        array([ 0.125,  0.25 ,  0.625])
+        """
+
+        method = method.lower()
+        if method == 'trilinear':
+            interpolator = self._trilinear
+        elif method == 'tetrahedral':
+            interpolator = self._tetrahedral
+        else:
+            raise ValueError(
+                'Invalid interpolation method: "{0}", must be one of {1}!'.
+                format(method, LUT3D_INTERPOLATION_METHODS))
+
+        RGB = np.asarray(RGB)
+        shape = RGB.shape
+        RGB = RGB.reshape(-1, 3)
+
+        size = self.size
+        dtype = self._table.dtype
+        table = self._table.reshape(-1, 3)
+        strides = np.array([size * size, size, 1])
+
+        domain_min = self._domain[0].astype(dtype)
+        scale = ((size - 1) /
+                 (self._domain[1] - self._domain[0])).astype(dtype)
+
+        RGB_o = np.empty(RGB.shape, dtype=dtype)
+        for i in range(0, RGB.shape[0], chunk_size):
+            chunk = (RGB[i:i + chunk_size].astype(dtype) - domain_min) * scale
+            nan = np.isnan(chunk)
+            chunk[nan] = 0
+            np.clip(chunk, 0, size - 1, out=chunk)
+            RGB_o[i:i + chunk_size] = interpolator(chunk, table, strides)
+            RGB_o[i:i + chunk_size][np.any(nan, axis=-1)] = np.nan
+
+        return RGB_o.reshape(shape)
+
+
+def bake_LUT3D(function,
+               size=33,
+               domain=np.array([[0, 0, 0], [1, 1, 1]]),
+               name=None,
+               dtype=DEFAULT_FLOAT_DTYPE):
+    """
+    Bakes given *RGB* to *RGB* function into a 3-D look-up table.
+
+    Parameters
+    ----------
+    function : callable
+        Function to bake, called with an *RGB* colourspace array of shape
+        (size, size, size, 3).
+    size : integer, optional
+        Look-up table size, i.e. the samples count per axis.
+    domain : array_like, optional
+        Look-up table domain.
+    name : unicode, optional
+        Look-up table name.
+    dtype : object, optional
+        Look-up table dtype, e.g. *np.float32*.
+
+    Returns
+    -------
+    LUT3D
+        Baked 3-D look-up table.
+
+    Examples
+    --------
+    >>> LUT = bake_LUT3D(lambda x: x[..., ::-1], 2)
+    >>> LUT.table[1, 0, 0]
+    array([ 0.,  0.,  1.])
+    """
+
+    domain = np.asarray(domain, dtype=DEFAULT_FLOAT_DTYPE)
+    samples = [
+        np.linspace(domain[0, i], domain[1, i], size) for i in range(3)
+    ]
+    RGB = np.stack(np.meshgrid(*samples, indexing='ij'), axis=-1)
+
+    table = np.asarray(function(RGB), dtype=dtype)
+
+    return LUT3D(table, domain, name)
@@ -0,0 +1,402 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.algebra.lut` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import unittest
+
+from colour.algebra import LUT1D, LogLUT1D, LUT3D, bake_LUT1D, bake_LUT3D
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'TestLUT1D', 'TestBakeLUT1D', 'TestLogLUT1D', 'TestLUT3D', 'TestBakeLUT3D'
+]
+
+
+class TestLUT1D(unittest.TestCase):
+    """
+    Defines :class:`colour.algebra.lut.LUT1D` class unit tests methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('table', 'domain', 'function', 'name', 'size')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(LUT1D))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('apply', 'maximum_error')
+
+        for method in required_methods:
+            self.assertIn(method, dir(LUT1D))
+
+    def test_apply(self):
+        """
+        Tests :func:`colour.algebra.lut.LUT1D.apply` method.
+        """
+
+        LUT = LUT1D(np.linspace(0, 1, 5) ** 2, np.array([0, 2]))
+
+        np.testing.assert_almost_equal(
+            LUT.apply(np.array([-1.0, 0.2, 1.0, 1.2, 3.0])),
+            np.array([0.0, 0.025, 0.25, 0.375, 1.0]),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            LUT.apply(np.array([0.2, 1.0, 1.2]), 'Cubic'),
+            np.array([0.01, 0.25, 0.36]),
+            decimal=7)
+
+        self.assertRaises(ValueError, LUT.apply, np.array([0.5]), 'Nearest')
+
+    def test_apply_code_values(self):
+        """
+        Tests :func:`colour.algebra.lut.LUT1D.apply` method with integer code
+        values and *half-float* values.
+        """
+
+        function = lambda x: x ** (1 / 2.2)  # noqa
+        LUT = bake_LUT1D(function, size=33)
+
+        x = np.arange(256, dtype=np.uint8)
+        np.testing.assert_array_equal(LUT.apply(x), function(x / 255))
+
+        x = np.array([[0, 64], [512, 1023]], dtype=np.uint16)
+        np.testing.assert_array_equal(
+            LUT.apply(x, bit_depth=10), function(x / 1023))
+
+        np.testing.assert_array_equal(
+            LUT.apply(np.array([2048], dtype=np.uint16), bit_depth=10),
+            np.array([1.0]))
+
+        x = np.array([0.0, 0.18, 0.5, 1.0], dtype=np.float16)
+        np.testing.assert_array_equal(
+            LUT.apply(x), function(x.astype(np.float_)))
+
+        LUT = LUT1D(np.linspace(0, 1, 5) ** 2)
+        np.testing.assert_almost_equal(
+            LUT.apply(np.array([0, 51, 255], dtype=np.uint8)),
+            np.array([0.0, 0.05, 1.0]),
+            decimal=7)
+
+        function = lambda x: x / 10000  # noqa
+        LUT = bake_LUT1D(function, np.array([0, 10000]), 65)
+        LUT = LUT1D(LUT.table, LUT.domain)
+        x = np.array([0, 16384, 65535], dtype=np.uint16)
+        np.testing.assert_almost_equal(
+            LUT.apply(x), function(x / 65535 * 10000), decimal=7)
+        np.testing.assert_almost_equal(
+            LUT.apply(np.array([0, 2 ** 20 - 1], dtype=np.uint32),
+                      bit_depth=20),
+            np.array([0.0, 1.0]),
+            decimal=7)
+        np.testing.assert_almost_equal(
+            bake_LUT1D(function, np.array([0, 10000]), 65).apply(x),
+            function(x / 65535 * 10000),
+            decimal=7)
+
+    def test_maximum_error(self):
+        """
+        Tests :func:`colour.algebra.lut.LUT1D.maximum_error` method.
+        """
+
+        LUT = bake_LUT1D(lambda x: x ** 2, size=5)
+
+        self.assertAlmostEqual(LUT.maximum_error(), 0.015625, places=4)
+
+        self.assertAlmostEqual(LUT.maximum_error('Cubic'), 0.0, places=7)
+
+        LUT = bake_LUT1D(lambda x: x ** (1 / 2.4), size=4096)
+        self.assertLess(LUT.maximum_error('Cubic'), LUT.maximum_error())
+
+        self.assertRaises(ValueError, LUT1D(np.array([0, 1])).maximum_error)
+
+
+class TestBakeLUT1D(unittest.TestCase):
+    """
+    Defines :func:`colour.algebra.lut.bake_LUT1D` definition unit tests
+    methods.
+    """
+
+    def test_bake_LUT1D(self):
+        """
+        Tests :func:`colour.algebra.lut.bake_LUT1D` definition.
+        """
+
+        LUT = bake_LUT1D(lambda x: x * 2, np.array([-1, 1]), 3, 'Double')
+
+        np.testing.assert_almost_equal(
+            LUT.table, np.array([-2.0, 0.0, 2.0]), decimal=7)
+        np.testing.assert_almost_equal(
+            LUT.domain, np.array([-1.0, 1.0]), decimal=7)
+        self.assertEqual(LUT.size, 3)
+        self.assertEqual(LUT.name, 'Double')
+
+
+class TestLogLUT1D(unittest.TestCase):
+    """
+    Defines :class:`colour.algebra.lut.LogLUT1D` class unit tests methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('table', 'function', 'exponents',
+                               'octave_bits', 'offset', 'name', 'size')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(LogLUT1D))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('apply', 'maximum_error')
+
+        for method in required_methods:
+            self.assertIn(method, dir(LogLUT1D))
+
+    def test_table(self):
+        """
+        Tests :attr:`colour.algebra.lut.LogLUT1D.table` attribute.
+        """
+
+        LUT = LogLUT1D(lambda x: x, (-1, 1), 1, 0.5)
+
+        np.testing.assert_almost_equal(
+            LUT.table, np.array([1.0, 1.25, 1.5, 2.0, 2.5]), decimal=7)
+        self.assertEqual(LUT.size, 5)
+
+    def test_apply(self):
+        """
+        Tests :func:`colour.algebra.lut.LogLUT1D.apply` method.
+        """
+
+        function = lambda x: x ** (1 / 2.4)  # noqa
+        LUT = LogLUT1D(function, (-16, 1), 8)
+
+        x = np.array([-1.0, 0.0, 2 ** -20, 0.001, 0.18, 1.0, 2.0, np.nan])
+        y = LUT.apply(x)
+        np.testing.assert_array_equal(y[[0, 1, 2, 6, 7]],
+                                      function(x[[0, 1, 2, 6, 7]]))
+        np.testing.assert_allclose(y, function(x), rtol=1e-6)
+
+        np.testing.assert_array_equal(
+            LUT.apply(np.reshape(x[1:7], (2, 3, 1))),
+            np.reshape(y[1:7], (2, 3, 1)))
+
+        self.assertAlmostEqual(LUT.apply(0.18), function(0.18), places=6)
+
+        self.assertEqual(
+            LUT.apply(np.array([0.18], dtype=np.float32)).dtype, np.float32)
+
+        LUT = LogLUT1D(lambda x: (x - 1) ** 6, (-16, 0), 10, 1)
+        np.testing.assert_allclose(
+            LUT.apply(np.array([1.001, 1.5])),
+            np.array([1e-18, 0.015625]),
+            rtol=1e-5)
+
+    def test_maximum_error(self):
+        """
+        Tests :func:`colour.algebra.lut.LogLUT1D.maximum_error` method.
+        """
+
+        function = lambda x: x ** 2.4  # noqa
+        self.assertAlmostEqual(
+            LogLUT1D(function, octave_bits=4).maximum_error(),
+            0.0015443,
+            places=5)
+
+        self.assertLess(
+            LogLUT1D(function, octave_bits=8).maximum_error(),
+            LogLUT1D(function, octave_bits=4).maximum_error() / 200)
+
+
+class TestLUT3D(unittest.TestCase):
+    """
+    Defines :class:`colour.algebra.lut.LUT3D` class unit tests methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('table', 'domain', 'name', 'size')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(LUT3D))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('apply', )
+
+        for method in required_methods:
+            self.assertIn(method, dir(LUT3D))
+
+    def test_apply(self):
+        """
+        Tests :func:`colour.algebra.lut.LUT3D.apply` method.
+        """
+
+        RGB = np.array([
+            [0.00000000, 0.00000000, 0.00000000],
+            [0.18000000, 0.18000000, 0.18000000],
+            [0.25000000, 0.50000000, 0.75000000],
+            [0.90000000, 0.10000000, 0.40000000],
+            [1.00000000, 1.00000000, 1.00000000],
+        ])
+
+        LUT = bake_LUT3D(lambda x: x, 5)
+        for method in ('Trilinear', 'Tetrahedral'):
+            np.testing.assert_almost_equal(
+                LUT.apply(RGB, method), RGB, decimal=7)
+
+        LUT = bake_LUT3D(lambda x: x ** 2, 3)
+        np.testing.assert_almost_equal(
+            LUT.apply(RGB, 'Trilinear'),
+            np.array([
+                [0.00000000, 0.00000000, 0.00000000],
+                [0.09000000, 0.09000000, 0.09000000],
+                [0.12500000, 0.25000000, 0.62500000],
+                [0.85000000, 0.05000000, 0.20000000],
+                [1.00000000, 1.00000000, 1.00000000],
+            ]),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            LUT.apply(RGB, 'Tetrahedral'),
+            LUT.apply(RGB, 'Trilinear'),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            LUT.apply(np.array([-0.5, 0.5, 1.5])),
+            np.array([0.0, 0.25, 1.0]),
+            decimal=7)
+
+        for method in ('Trilinear', 'Tetrahedral'):
+            np.testing.assert_almost_equal(
+                LUT.apply(
+                    np.array([
+                        [0.5, np.nan, 0.2],
+                        [-np.inf, 0.5, np.inf],
+                        [0.5, 0.5, 0.5],
+                    ]), method, chunk_size=2),
+                np.array([
+                    [np.nan, np.nan, np.nan],
+                    [0.0, 0.25, 1.0],
+                    [0.25, 0.25, 0.25],
+                ]),
+                decimal=7)
+
+        self.assertRaises(ValueError, LUT.apply, RGB, 'Nearest')
+
+    def test_apply_tetrahedral(self):
+        """
+        Tests :func:`colour.algebra.lut.LUT3D.apply` method tetrahedral
+        interpolation.
+        """
+
+        table = np.zeros((2, 2, 2, 3))
+        table[1, 1, 1] = 1
+        LUT = LUT3D(table)
+
+        np.testing.assert_almost_equal(
+            LUT.apply(np.array([
+                [0.2, 0.5, 0.8],
+                [0.5, 0.5, 0.5],
+            ]), 'Tetrahedral')[..., 0],
+            np.array([0.2, 0.5]),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            LUT.apply(np.array([0.2, 0.5, 0.8]), 'Trilinear'),
+            np.array([0.08, 0.08, 0.08]),
+            decimal=7)
+
+    def test_n_dimensional_apply(self):
+        """
+        Tests :func:`colour.algebra.lut.LUT3D.apply` method n-dimensional
+        arrays support.
+        """
+
+        LUT = bake_LUT3D(lambda x: x ** 2, 9)
+
+        RGB = np.array([0.25, 0.50, 0.75])
+        RGB_o = LUT.apply(RGB)
+
+        RGB = np.tile(RGB, (6, 1))
+        RGB_o = np.tile(RGB_o, (6, 1))
+        np.testing.assert_almost_equal(
+            LUT.apply(RGB, chunk_size=4), RGB_o, decimal=7)
+
+        RGB = np.reshape(RGB, (2, 3, 3))
+        RGB_o = np.reshape(RGB_o, (2, 3, 3))
+        np.testing.assert_almost_equal(LUT.apply(RGB), RGB_o, decimal=7)
+
+    def test_float32_apply(self):
+        """
+        Tests :func:`colour.algebra.lut.LUT3D.apply` method *float32* support.
+        """
+
+        LUT = bake_LUT3D(lambda x: x ** 2, 9, dtype=np.float32)
+
+        RGB = np.array([0.25, 0.50, 0.75], dtype=np.float32)
+        RGB_o = LUT.apply(RGB)
+
+        self.assertEqual(RGB_o.dtype, np.float32)
+        np.testing.assert_almost_equal(
+            RGB_o, np.array([0.0625, 0.25, 0.5625]), decimal=6)
+
+
+class TestBakeLUT3D(unittest.TestCase):
+    """
+    Defines :func:`colour.algebra.lut.bake_LUT3D` definition unit tests
+    methods.
+    """
+
+    def test_bake_LUT3D(self):
+        """
+        Tests :func:`colour.algebra.lut.bake_LUT3D` definition.
+        """
+
+        LUT = bake_LUT3D(
+            lambda x: x[..., ::-1], 3,
+            np.array([[0, 0, 0], [2, 4, 8]]), 'Reverse')
+
+        self.assertTupleEqual(LUT.table.shape, (3, 3, 3, 3))
+        np.testing.assert_almost_equal(
+            LUT.table[1, 2, 0], np.array([0.0, 4.0, 1.0]), decimal=7)
+        np.testing.assert_almost_equal(
+            LUT.apply(np.array([1.0, 2.0, 4.0])),
+            np.array([4.0, 2.0, 1.0]),
+            decimal=7)
+        self.assertEqual(LUT.size, 3)
+        self.assertEqual(LUT.name, 'Reverse')
+
+
+if __name__ == '__main__':
+    unittest.main()
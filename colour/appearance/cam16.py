@@ -41,8 +41,8 @@ from colour.appearance.ciecam02 import (
     post_adaptation_non_linear_response_compression_matrix,
     saturation_correlate, temporary_magnitude_quantity_reverse,
     viewing_condition_dependent_parameters)
-from colour.utilities import (CaseInsensitiveMapping, as_namedtuple,
-                              dot_vector, tsplit)
+from colour.utilities import (CaseInsensitiveMapping, as_float_array,
+                              as_namedtuple, dot_vector, tsplit)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2015-2018 - Colour Developers'
@@ -218,8 +218,8 @@ s=25.3564036..., Q=193.0617673..., M=12.4128523..., H=267.0983345..., HC=None)
     """
 
     _X_w, Y_w, _Z_w = tsplit(XYZ_w)
-    L_A = np.asarray(L_A)
-    Y_b = np.asarray(Y_b)
+    L_A = as_float_array(L_A)
+    Y_b = as_float_array(Y_b)
 
     # Step 0
     # Converting *CIE XYZ* tristimulus values to sharpened *RGB* values.
@@ -29,8 +29,8 @@ from __future__ import division, unicode_literals
 import numpy as np
 from collections import namedtuple
 
-from colour.utilities import (CaseInsensitiveMapping, dot_vector, tsplit,
-                              tstack, warning)
+from colour.utilities import (CaseInsensitiveMapping, as_float_array,
+                              dot_vector, tsplit, tstack, warning)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -479,7 +479,7 @@ def luminance_level_adaptation_factor(L_A):
     1.1675444...
     """
 
-    L_A = np.asarray(L_A)
+    L_A = as_float_array(L_A)
 
     k = 1 / (5 * L_A + 1)
     k4 = k ** 4
@@ -511,8 +511,8 @@ def illuminant_scotopic_luminance(L_A, CCT):
     769.9376286...
     """
 
-    L_A = np.asarray(L_A)
-    CCT = np.asarray(CCT)
+    L_A = as_float_array(L_A)
+    CCT = as_float_array(CCT)
 
     CCT = 2.26 * L_A * ((CCT / 4000) - 0.4) ** (1 / 3)
 
@@ -567,7 +567,7 @@ def f_n(x):
     array([ 5.8968592...,  5.8969521...,  5.8975927...])
     """
 
-    x = np.asarray(x)
+    x = as_float_array(x)
 
     x_m = 40 * ((x ** 0.73) / (x ** 0.73 + 2))
 
@@ -630,10 +630,10 @@ def chromatic_adaptation(XYZ,
     array([ 6.8959454...,  6.8959991...,  6.8965708...])
     """
 
-    XYZ_w = np.asarray(XYZ_w)
-    XYZ_b = np.asarray(XYZ_b)
-    L_A = np.asarray(L_A)
-    F_L = np.asarray(F_L)
+    XYZ_w = as_float_array(XYZ_w)
+    XYZ_b = as_float_array(XYZ_b)
+    L_A = as_float_array(L_A)
+    F_L = as_float_array(F_L)
 
     rgb = XYZ_to_rgb(XYZ)
     rgb_w = XYZ_to_rgb(XYZ_w)
@@ -647,17 +647,17 @@ def chromatic_adaptation(XYZ,
         F_rgb = ((1 + (L_A ** (1 / 3)) + h_rgb) / (1 + (L_A ** (1 / 3)) +
                                                    (1 / h_rgb)))
     else:
-        F_rgb = np.ones(h_rgb.shape)
+        F_rgb = np.ones_like(h_rgb)
 
     # Computing Helson-Judd effect parameters.
     if helson_judd_effect:
         D_rgb = (f_n((Y_b / Y_w) * F_L * F_rgb[..., 1]) - f_n(
             (Y_b / Y_w) * F_L * F_rgb))
     else:
-        D_rgb = np.zeros(F_rgb.shape)
+        D_rgb = np.zeros_like(F_rgb)
 
     # Computing cone bleach factors.
-    B_rgb = (10 ** 7) / ((10 ** 7) + 5 * L_A[..., np.newaxis] * (rgb_w / 100))
+    B_rgb = 1e7 / (1e7 + 5 * L_A[..., np.newaxis] * (rgb_w / 100))
 
     # Computing adjusted reference white signals.
     if XYZ_p is not None and p is not None:
@@ -708,10 +708,10 @@ def adjusted_reference_white_signals(rgb_p, rgb_b, rgb_w, p):
     array([ 88.0792742...,  91.8569553...,  98.4876543...])
     """
 
-    rgb_p = np.asarray(rgb_p)
-    rgb_b = np.asarray(rgb_b)
-    rgb_w = np.asarray(rgb_w)
-    p = np.asarray(p)
+    rgb_p = as_float_array(rgb_p)
+    rgb_b = as_float_array(rgb_b)
+    rgb_w = as_float_array(rgb_w)
+    p = as_float_array(p)
 
     p_rgb = rgb_p / rgb_b
     rgb_w = (rgb_w * (((1 - p) * p_rgb + (1 + p) / p_rgb) ** 0.5) /
@@ -837,12 +837,12 @@ def eccentricity_factor(hue):
     array(1.1108365...)
     """
 
-    hue = np.asarray(hue)
+    hue = as_float_array(hue)
 
     h_s = HUE_DATA_FOR_HUE_QUADRATURE['h_s']
     e_s = HUE_DATA_FOR_HUE_QUADRATURE['e_s']
 
-    x = np.interp(hue, h_s, e_s)
+    x = as_float_array(np.interp(hue, h_s, e_s))
     x = np.where(hue < 20.14, 0.856 - (hue / 20.14) * 0.056, x)
     x = np.where(hue > 237.53, 0.856 + 0.344 * (360 - hue) / (360 - 237.53), x)
 
@@ -870,7 +870,7 @@ def low_luminance_tritanopia_factor(L_A):
     0.9996859...
     """
 
-    L_A = np.asarray(L_A)
+    L_A = as_float_array(L_A)
 
     F_t = L_A / (L_A + 0.1)
 
@@ -916,10 +916,10 @@ def yellowness_blueness_response(C, e_s, N_c, N_cb, F_t):
     """
 
     _C_1, C_2, C_3 = tsplit(C)
-    e_s = np.asarray(e_s)
-    N_c = np.asarray(N_c)
-    N_cb = np.asarray(N_cb)
-    F_t = np.asarray(F_t)
+    e_s = as_float_array(e_s)
+    N_c = as_float_array(N_c)
+    N_cb = as_float_array(N_cb)
+    F_t = as_float_array(F_t)
 
     M_yb = (100 * (0.5 * (C_2 - C_3) / 4.5) * (e_s *
                                                (10 / 13) * N_c * N_cb * F_t))
@@ -962,9 +962,9 @@ def redness_greenness_response(C, e_s, N_c, N_cb):
     """
 
     C_1, C_2, _C_3 = tsplit(C)
-    e_s = np.asarray(e_s)
-    N_c = np.asarray(N_c)
-    N_cb = np.asarray(N_cb)
+    e_s = as_float_array(e_s)
+    N_c = as_float_array(N_c)
+    N_cb = as_float_array(N_cb)
 
     M_rg = 100 * (C_1 - (C_2 / 11)) * (e_s * (10 / 13) * N_c * N_cb)
 
@@ -995,8 +995,8 @@ def overall_chromatic_response(M_yb, M_rg):
     0.0082378...
     """
 
-    M_yb = np.asarray(M_yb)
-    M_rg = np.asarray(M_rg)
+    M_yb = as_float_array(M_yb)
+    M_rg = as_float_array(M_rg)
 
     M = ((M_yb ** 2) + (M_rg ** 2)) ** 0.5
 
@@ -1028,8 +1028,8 @@ def saturation_correlate(M, rgb_a):
     0.0199093...
     """
 
-    M = np.asarray(M)
-    rgb_a = np.asarray(rgb_a)
+    M = as_float_array(M)
+    rgb_a = as_float_array(rgb_a)
 
     s = 50 * M / np.sum(rgb_a, axis=-1)
 
@@ -1069,11 +1069,11 @@ def achromatic_signal(L_AS, S, S_w, N_bb, A_a):
     15.5068546...
     """
 
-    L_AS = np.asarray(L_AS)
-    S = np.asarray(S)
-    S_w = np.asarray(S_w)
-    N_bb = np.asarray(N_bb)
-    A_a = np.asarray(A_a)
+    L_AS = as_float_array(L_AS)
+    S = as_float_array(S)
+    S_w = as_float_array(S_w)
+    N_bb = as_float_array(N_bb)
+    A_a = as_float_array(A_a)
 
     j = 0.00001 / ((5 * L_AS / 2.26) + 0.00001)
 
@@ -1124,10 +1124,10 @@ def brightness_correlate(A, A_w, M, N_b):
     22.2097654...
     """
 
-    A = np.asarray(A)
-    A_w = np.asarray(A_w)
-    M = np.asarray(M)
-    N_b = np.asarray(N_b)
+    A = as_float_array(A)
+    A_w = as_float_array(A_w)
+    M = as_float_array(M)
+    N_b = as_float_array(N_b)
 
     N_1 = ((7 * A_w) ** 0.5) / (5.33 * N_b ** 0.13)
     N_2 = (7 * A_w * N_b ** 0.362) / 200
@@ -1166,10 +1166,10 @@ def lightness_correlate(Y_b, Y_w, Q, Q_w):
     30.0462678...
     """
 
-    Y_b = np.asarray(Y_b)
-    Y_w = np.asarray(Y_w)
-    Q = np.asarray(Q)
-    Q_w = np.asarray(Q_w)
+    Y_b = as_float_array(Y_b)
+    Y_w = as_float_array(Y_w)
+    Q = as_float_array(Q)
+    Q_w = as_float_array(Q_w)
 
     Z = 1 + (Y_b / Y_w) ** 0.5
     J = 100 * (Q / Q_w) ** Z
@@ -1210,11 +1210,11 @@ def chroma_correlate(s, Y_b, Y_w, Q, Q_w):
     0.1210508...
     """
 
-    s = np.asarray(s)
-    Y_b = np.asarray(Y_b)
-    Y_w = np.asarray(Y_w)
-    Q = np.asarray(Q)
-    Q_w = np.asarray(Q_w)
+    s = as_float_array(s)
+    Y_b = as_float_array(Y_b)
+    Y_w = as_float_array(Y_w)
+    Q = as_float_array(Q)
+    Q_w = as_float_array(Q_w)
 
     C_94 = (2.44 * (s ** 0.69) * ((Q / Q_w) ** (Y_b / Y_w)) * (1.64 - 0.29 **
                                                                (Y_b / Y_w)))
@@ -1246,8 +1246,8 @@ def colourfulness_correlate(F_L, C_94):
     0.1238964...
     """
 
-    F_L = np.asarray(F_L)
-    C_94 = np.asarray(C_94)
+    F_L = as_float_array(F_L)
+    C_94 = as_float_array(C_94)
 
     M_94 = F_L ** 0.15 * C_94
 
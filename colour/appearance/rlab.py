@@ -32,7 +32,7 @@ from collections import namedtuple
 
 from colour.appearance.hunt import XYZ_TO_HPE_MATRIX, XYZ_to_rgb
 from colour.utilities import (CaseInsensitiveMapping, dot_matrix, dot_vector,
-                              tsplit, row_as_diagonal)
+                              tsplit, row_as_diagonal, as_float_array)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -230,9 +230,9 @@ def XYZ_to_RLAB(XYZ,
 s=1.1010410..., HC=None, a=15.5711021..., b=-52.6142956...)
     """
 
-    Y_n = np.asarray(Y_n)
-    D = np.asarray(D)
-    sigma = np.asarray(sigma)
+    Y_n = as_float_array(Y_n)
+    D = as_float_array(D)
+    sigma = as_float_array(sigma)
 
     # Converting to cone responses.
     LMS_n = XYZ_to_rgb(XYZ_n)
@@ -15,9 +15,10 @@ from __future__ import absolute_import
 
 from .crt import CRT_DISPLAYS_RGB_PRIMARIES
 from .lcd import LCD_DISPLAYS_RGB_PRIMARIES
-from colour.utilities import CaseInsensitiveMapping
+from colour.utilities import LazyCaseInsensitiveMapping
 
-DISPLAYS_RGB_PRIMARIES = CaseInsensitiveMapping(CRT_DISPLAYS_RGB_PRIMARIES)
+DISPLAYS_RGB_PRIMARIES = LazyCaseInsensitiveMapping(
+    CRT_DISPLAYS_RGB_PRIMARIES)
 DISPLAYS_RGB_PRIMARIES.update(LCD_DISPLAYS_RGB_PRIMARIES)
 DISPLAYS_RGB_PRIMARIES.__doc__ = """
 Displays *RGB* primaries multi-spectral power distributions.
@@ -31,8 +31,10 @@ References
 
 from __future__ import division, unicode_literals
 
+from functools import partial
+
 from colour.characterisation import RGB_DisplayPrimaries
-from colour.utilities import CaseInsensitiveMapping
+from colour.utilities import LazyCaseInsensitiveMapping
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -129,9 +131,10 @@ CRT_DISPLAYS_RGB_PRIMARIES_DATA = {
     }
 }
 
-CRT_DISPLAYS_RGB_PRIMARIES = CaseInsensitiveMapping({
+CRT_DISPLAYS_RGB_PRIMARIES = LazyCaseInsensitiveMapping({
     'Typical CRT Brainard 1997':
-        RGB_DisplayPrimaries(
+        partial(
+            RGB_DisplayPrimaries,
             CRT_DISPLAYS_RGB_PRIMARIES_DATA['Typical CRT Brainard 1997'],
             name='Typical CRT Brainard 1997')
 })
@@ -68,10 +68,12 @@ References
 
 from __future__ import division, unicode_literals
 
+from functools import partial
+
 from colour.colorimetry import (LMS_ConeFundamentals,
                                 RGB_ColourMatchingFunctions,
                                 XYZ_ColourMatchingFunctions)
-from colour.utilities import CaseInsensitiveMapping
+from colour.utilities import LazyCaseInsensitiveMapping
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -1059,19 +1061,22 @@ LMS_CMFS_DATA = {
     }
 }
 
-LMS_CMFS = CaseInsensitiveMapping({
+LMS_CMFS = LazyCaseInsensitiveMapping({
     'Stockman & Sharpe 2 Degree Cone Fundamentals':
-        LMS_ConeFundamentals(
+        partial(
+            LMS_ConeFundamentals,
             LMS_CMFS_DATA['Stockman & Sharpe 2 Degree Cone Fundamentals'],
             name='Stockman & Sharpe 2 Degree Cone Fundamentals',
             strict_name='Stockman & Sharpe 2$^\\circ$ Cone Fundamentals'),
     'Stockman & Sharpe 10 Degree Cone Fundamentals':
-        LMS_ConeFundamentals(
+        partial(
+            LMS_ConeFundamentals,
             LMS_CMFS_DATA['Stockman & Sharpe 10 Degree Cone Fundamentals'],
             name='Stockman & Sharpe 10 Degree Cone Fundamentals',
             strict_name='Stockman & Sharpe 10$^\\circ$ Cone Fundamentals'),
     'Smith & Pokorny 1975 Normal Trichromats':
-        LMS_ConeFundamentals(
+        partial(
+            LMS_ConeFundamentals,
             LMS_CMFS_DATA['Smith & Pokorny 1975 Normal Trichromats'],
             name='Smith & Pokorny 1975 Normal Trichromats',
             strict_name='Smith & Pokorny (1975) Normal Trichromats')
@@ -1338,19 +1343,22 @@ RGB_CMFS_DATA = {
     }
 }
 
-RGB_CMFS = CaseInsensitiveMapping({
+RGB_CMFS = LazyCaseInsensitiveMapping({
     'Wright & Guild 1931 2 Degree RGB CMFs':
-        RGB_ColourMatchingFunctions(
+        partial(
+            RGB_ColourMatchingFunctions,
             RGB_CMFS_DATA['Wright & Guild 1931 2 Degree RGB CMFs'],
             name='Wright & Guild 1931 2 Degree RGB CMFs',
             strict_name='Wright & Guild (1931) 2$^\\circ$ RGB CMFs', ),
     'Stiles & Burch 1955 2 Degree RGB CMFs':
-        RGB_ColourMatchingFunctions(
+        partial(
+            RGB_ColourMatchingFunctions,
             RGB_CMFS_DATA['Stiles & Burch 1955 2 Degree RGB CMFs'],
             name='Stiles & Burch 1955 2 Degree RGB CMFs',
             strict_name='Stiles & Burch (1955) 2$^\\circ$ RGB CMFs'),
     'Stiles & Burch 1959 10 Degree RGB CMFs':
-        RGB_ColourMatchingFunctions(
+        partial(
+            RGB_ColourMatchingFunctions,
             RGB_CMFS_DATA['Stiles & Burch 1959 10 Degree RGB CMFs'],
             name='Stiles & Burch 1959 10 Degree RGB CMFs',
             strict_name='Stiles & Burch (1959) 10$^\\circ$ RGB CMFs')
@@ -3205,27 +3213,31 @@ STANDARD_OBSERVERS_CMFS_DATA = {
     }
 }
 
-STANDARD_OBSERVERS_CMFS = CaseInsensitiveMapping({
+STANDARD_OBSERVERS_CMFS = LazyCaseInsensitiveMapping({
     'CIE 1931 2 Degree Standard Observer':
-        XYZ_ColourMatchingFunctions(
+        partial(
+            XYZ_ColourMatchingFunctions,
             STANDARD_OBSERVERS_CMFS_DATA[
                 'CIE 1931 2 Degree Standard Observer'],
             name='CIE 1931 2 Degree Standard Observer',
             strict_name='CIE 1931 2$^\\circ$ Standard Observer'),
     'CIE 1964 10 Degree Standard Observer':
-        XYZ_ColourMatchingFunctions(
+        partial(
+            XYZ_ColourMatchingFunctions,
             STANDARD_OBSERVERS_CMFS_DATA[
                 'CIE 1964 10 Degree Standard Observer'],
             name='CIE 1964 10 Degree Standard Observer',
             strict_name='CIE 1964 10$^\\circ$ Standard Observer'),
     'CIE 2012 2 Degree Standard Observer':
-        XYZ_ColourMatchingFunctions(
+        partial(
+            XYZ_ColourMatchingFunctions,
             STANDARD_OBSERVERS_CMFS_DATA[
                 'CIE 2012 2 Degree Standard Observer'],
             name='CIE 2012 2 Degree Standard Observer',
             strict_name='CIE 2012 2$^\\circ$ Standard Observer'),
     'CIE 2012 10 Degree Standard Observer':
-        XYZ_ColourMatchingFunctions(
+        partial(
+            XYZ_ColourMatchingFunctions,
             STANDARD_OBSERVERS_CMFS_DATA[
                 'CIE 2012 10 Degree Standard Observer'],
             name='CIE 2012 10 Degree Standard Observer',
@@ -3251,11 +3263,11 @@ Aliases:
 -   'cie_10_1964': 'CIE 1964 10 Degree Standard Observer'
 """
 STANDARD_OBSERVERS_CMFS['cie_2_1931'] = (
-    STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer'])
+    lambda: STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer'])
 STANDARD_OBSERVERS_CMFS['cie_10_1964'] = (
-    STANDARD_OBSERVERS_CMFS['CIE 1964 10 Degree Standard Observer'])
+    lambda: STANDARD_OBSERVERS_CMFS['CIE 1964 10 Degree Standard Observer'])
 
-CMFS = CaseInsensitiveMapping(LMS_CMFS)
+CMFS = LazyCaseInsensitiveMapping(LMS_CMFS)
 CMFS.__doc__ = """
 Aggregated colour matching functions.
 
@@ -25,8 +25,10 @@ References
 
 from __future__ import division, unicode_literals
 
+from functools import partial
+
 from colour.colorimetry import SpectralPowerDistribution
-from colour.utilities import CaseInsensitiveMapping
+from colour.utilities import LazyCaseInsensitiveMapping
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -367,13 +369,16 @@ D_ILLUMINANTS_S_SPDS_DATA = {
     }
 }
 
-D_ILLUMINANTS_S_SPDS = CaseInsensitiveMapping({
+D_ILLUMINANTS_S_SPDS = LazyCaseInsensitiveMapping({
     'S0':
-        SpectralPowerDistribution(D_ILLUMINANTS_S_SPDS_DATA['S0'], name='S0'),
+        partial(SpectralPowerDistribution, D_ILLUMINANTS_S_SPDS_DATA['S0'],
+                name='S0'),
     'S1':
-        SpectralPowerDistribution(D_ILLUMINANTS_S_SPDS_DATA['S1'], name='S1'),
+        partial(SpectralPowerDistribution, D_ILLUMINANTS_S_SPDS_DATA['S1'],
+                name='S1'),
     'S2':
-        SpectralPowerDistribution(D_ILLUMINANTS_S_SPDS_DATA['S2'], name='S2')
+        partial(SpectralPowerDistribution, D_ILLUMINANTS_S_SPDS_DATA['S2'],
+                name='S2')
 })
 """
 *CIE Standard Illuminant D Series* :math:`S_n(\lambda)` spectral power
@@ -47,8 +47,10 @@ References
 
 from __future__ import division, unicode_literals
 
+from functools import partial
+
 from colour.colorimetry.spectrum import SpectralPowerDistribution
-from colour.utilities import CaseInsensitiveMapping
+from colour.utilities import LazyCaseInsensitiveMapping
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -3615,104 +3617,145 @@ ILLUMINANTS_SPDS_DATA = {
     }
 }
 
-ILLUMINANTS_SPDS = CaseInsensitiveMapping({
+ILLUMINANTS_SPDS = LazyCaseInsensitiveMapping({
     'A':
-        SpectralPowerDistribution(ILLUMINANTS_SPDS_DATA['A'], name='A'),
+        partial(SpectralPowerDistribution, ILLUMINANTS_SPDS_DATA['A'],
+                name='A'),
     'B':
-        SpectralPowerDistribution(ILLUMINANTS_SPDS_DATA['B'], name='B'),
+        partial(SpectralPowerDistribution, ILLUMINANTS_SPDS_DATA['B'],
+                name='B'),
     'C':
-        SpectralPowerDistribution(ILLUMINANTS_SPDS_DATA['C'], name='C'),
+        partial(SpectralPowerDistribution, ILLUMINANTS_SPDS_DATA['C'],
+                name='C'),
     'D50':
-        SpectralPowerDistribution(ILLUMINANTS_SPDS_DATA['D50'], name='D50'),
+        partial(SpectralPowerDistribution, ILLUMINANTS_SPDS_DATA['D50'],
+                name='D50'),
     'D55':
-        SpectralPowerDistribution(ILLUMINANTS_SPDS_DATA['D55'], name='D55'),
+        partial(SpectralPowerDistribution, ILLUMINANTS_SPDS_DATA['D55'],
+                name='D55'),
     'D60':
-        SpectralPowerDistribution(ILLUMINANTS_SPDS_DATA['D60'], name='D60'),
+        partial(SpectralPowerDistribution, ILLUMINANTS_SPDS_DATA['D60'],
+                name='D60'),
     'D65':
-        SpectralPowerDistribution(ILLUMINANTS_SPDS_DATA['D65'], name='D65'),
+        partial(SpectralPowerDistribution, ILLUMINANTS_SPDS_DATA['D65'],
+                name='D65'),
     'D75':
-        SpectralPowerDistribution(ILLUMINANTS_SPDS_DATA['D75'], name='D75'),
+        partial(SpectralPowerDistribution, ILLUMINANTS_SPDS_DATA['D75'],
+                name='D75'),
     'E':
-        SpectralPowerDistribution(ILLUMINANTS_SPDS_DATA['E'], name='E'),
+        partial(SpectralPowerDistribution, ILLUMINANTS_SPDS_DATA['E'],
+                name='E'),
     'F1':
-        SpectralPowerDistribution(ILLUMINANTS_SPDS_DATA['F1'], name='F1'),
+        partial(SpectralPowerDistribution, ILLUMINANTS_SPDS_DATA['F1'],
+                name='F1'),
     'F2':
-        SpectralPowerDistribution(ILLUMINANTS_SPDS_DATA['F2'], name='F2'),
+        partial(SpectralPowerDistribution, ILLUMINANTS_SPDS_DATA['F2'],
+                name='F2'),
     'F3':
-        SpectralPowerDistribution(ILLUMINANTS_SPDS_DATA['F3'], name='F3'),
+        partial(SpectralPowerDistribution, ILLUMINANTS_SPDS_DATA['F3'],
+                name='F3'),
     'F4':
-        SpectralPowerDistribution(ILLUMINANTS_SPDS_DATA['F4'], name='F4'),
+        partial(SpectralPowerDistribution, ILLUMINANTS_SPDS_DATA['F4'],
+                name='F4'),
     'F5':
-        SpectralPowerDistribution(ILLUMINANTS_SPDS_DATA['F5'], name='F5'),
+        partial(SpectralPowerDistribution, ILLUMINANTS_SPDS_DATA['F5'],
+                name='F5'),
     'F6':
-        SpectralPowerDistribution(ILLUMINANTS_SPDS_DATA['F6'], name='F6'),
+        partial(SpectralPowerDistribution, ILLUMINANTS_SPDS_DATA['F6'],
+                name='F6'),
     'F7':
-        SpectralPowerDistribution(ILLUMINANTS_SPDS_DATA['F7'], name='F7'),
+        partial(SpectralPowerDistribution, ILLUMINANTS_SPDS_DATA['F7'],
+                name='F7'),
     'F8':
-        SpectralPowerDistribution(ILLUMINANTS_SPDS_DATA['F8'], name='F8'),
+        partial(SpectralPowerDistribution, ILLUMINANTS_SPDS_DATA['F8'],
+                name='F8'),
     'F9':
-        SpectralPowerDistribution(ILLUMINANTS_SPDS_DATA['F9'], name='F9'),
+        partial(SpectralPowerDistribution, ILLUMINANTS_SPDS_DATA['F9'],
+                name='F9'),
     'F10':
-        SpectralPowerDistribution(ILLUMINANTS_SPDS_DATA['F10'], name='F10'),
+        partial(SpectralPowerDistribution, ILLUMINANTS_SPDS_DATA['F10'],
+                name='F10'),
     'F11':
-        SpectralPowerDistribution(ILLUMINANTS_SPDS_DATA['F11'], name='F11'),
+        partial(SpectralPowerDistribution, ILLUMINANTS_SPDS_DATA['F11'],
+                name='F11'),
     'F12':
-        SpectralPowerDistribution(ILLUMINANTS_SPDS_DATA['F12'], name='F12'),
+        partial(SpectralPowerDistribution, ILLUMINANTS_SPDS_DATA['F12'],
+                name='F12'),
     'FL3.1':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             ILLUMINANTS_SPDS_DATA['FL3.1'], name='FL3.1'),
     'FL3.2':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             ILLUMINANTS_SPDS_DATA['FL3.2'], name='FL3.2'),
     'FL3.3':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             ILLUMINANTS_SPDS_DATA['FL3.3'], name='FL3.3'),
     'FL3.4':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             ILLUMINANTS_SPDS_DATA['FL3.4'], name='FL3.4'),
     'FL3.5':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             ILLUMINANTS_SPDS_DATA['FL3.5'], name='FL3.5'),
     'FL3.6':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             ILLUMINANTS_SPDS_DATA['FL3.6'], name='FL3.6'),
     'FL3.7':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             ILLUMINANTS_SPDS_DATA['FL3.7'], name='FL3.7'),
     'FL3.8':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             ILLUMINANTS_SPDS_DATA['FL3.8'], name='FL3.8'),
     'FL3.9':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             ILLUMINANTS_SPDS_DATA['FL3.9'], name='FL3.9'),
     'FL3.10':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             ILLUMINANTS_SPDS_DATA['FL3.10'], name='FL3.10'),
     'FL3.11':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             ILLUMINANTS_SPDS_DATA['FL3.11'], name='FL3.11'),
     'FL3.12':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             ILLUMINANTS_SPDS_DATA['FL3.12'], name='FL3.12'),
     'FL3.13':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             ILLUMINANTS_SPDS_DATA['FL3.13'], name='FL3.13'),
     'FL3.14':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             ILLUMINANTS_SPDS_DATA['FL3.14'], name='FL3.14'),
     'FL3.15':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             ILLUMINANTS_SPDS_DATA['FL3.15'], name='FL3.15'),
     'HP1':
-        SpectralPowerDistribution(ILLUMINANTS_SPDS_DATA['HP1'], name='HP1'),
+        partial(SpectralPowerDistribution, ILLUMINANTS_SPDS_DATA['HP1'],
+                name='HP1'),
     'HP2':
-        SpectralPowerDistribution(ILLUMINANTS_SPDS_DATA['HP2'], name='HP2'),
+        partial(SpectralPowerDistribution, ILLUMINANTS_SPDS_DATA['HP2'],
+                name='HP2'),
     'HP3':
-        SpectralPowerDistribution(ILLUMINANTS_SPDS_DATA['HP3'], name='HP3'),
+        partial(SpectralPowerDistribution, ILLUMINANTS_SPDS_DATA['HP3'],
+                name='HP3'),
     'HP4':
-        SpectralPowerDistribution(ILLUMINANTS_SPDS_DATA['HP4'], name='HP4'),
+        partial(SpectralPowerDistribution, ILLUMINANTS_SPDS_DATA['HP4'],
+                name='HP4'),
     'HP5':
-        SpectralPowerDistribution(ILLUMINANTS_SPDS_DATA['HP5'], name='HP5')
+        partial(SpectralPowerDistribution, ILLUMINANTS_SPDS_DATA['HP5'],
+                name='HP5')
 })
 ILLUMINANTS_SPDS.__doc__ = """
 *CIE* illuminants relative spectral power distributions.
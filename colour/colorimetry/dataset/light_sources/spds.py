@@ -56,8 +56,10 @@ References
 
 from __future__ import division, unicode_literals
 
+from functools import partial
+
 from colour.colorimetry.spectrum import SpectralPowerDistribution
-from colour.utilities import CaseInsensitiveMapping
+from colour.utilities import LazyCaseInsensitiveMapping
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -742,37 +744,45 @@ LIGHT_SOURCES_RIT_SPDS_DATA = {
     }
 }
 
-LIGHT_SOURCES_RIT_SPDS = CaseInsensitiveMapping({
+LIGHT_SOURCES_RIT_SPDS = LazyCaseInsensitiveMapping({
     'Natural':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             LIGHT_SOURCES_RIT_SPDS_DATA['Natural'],
             name='Natural'),
     'Philips TL-84':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             LIGHT_SOURCES_RIT_SPDS_DATA['Philips TL-84'],
             name='Philips TL-84'),
     'SA':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             LIGHT_SOURCES_RIT_SPDS_DATA['SA'],
             name='SA'),
     'SC':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             LIGHT_SOURCES_RIT_SPDS_DATA['SC'],
             name='SC'),
     'T8 Luxline Plus White':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             LIGHT_SOURCES_RIT_SPDS_DATA['T8 Luxline Plus White'],
             name='T8 Luxline Plus White'),
     'T8 Polylux 3000':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             LIGHT_SOURCES_RIT_SPDS_DATA['T8 Polylux 3000'],
             name='T8 Polylux 3000'),
     'T8 Polylux 4000':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             LIGHT_SOURCES_RIT_SPDS_DATA['T8 Polylux 4000'],
             name='T8 Polylux 4000'),
     'Thorn Kolor-rite':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             LIGHT_SOURCES_RIT_SPDS_DATA['Thorn Kolor-rite'],
             name='Thorn Kolor-rite')
 })  # yapf: disable
@@ -1627,43 +1637,53 @@ LIGHT_SOURCES_NIST_TRADITIONAL_SPDS_DATA = {
     }
 }
 
-LIGHT_SOURCES_NIST_TRADITIONAL_SPDS = CaseInsensitiveMapping({
+LIGHT_SOURCES_NIST_TRADITIONAL_SPDS = LazyCaseInsensitiveMapping({
     'Cool White FL':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             LIGHT_SOURCES_NIST_TRADITIONAL_SPDS_DATA['Cool White FL'],
             name='Cool White FL'),
     'Daylight FL':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             LIGHT_SOURCES_NIST_TRADITIONAL_SPDS_DATA['Daylight FL'],
             name='Daylight FL'),
     'HPS':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             LIGHT_SOURCES_NIST_TRADITIONAL_SPDS_DATA['HPS'], name='HPS'),
     'Incandescent':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             LIGHT_SOURCES_NIST_TRADITIONAL_SPDS_DATA['Incandescent'],
             name='Incandescent'),
     'LPS':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             LIGHT_SOURCES_NIST_TRADITIONAL_SPDS_DATA['LPS'], name='LPS'),
     'Mercury':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             LIGHT_SOURCES_NIST_TRADITIONAL_SPDS_DATA['Mercury'],
             name='Mercury'),
     'Metal Halide':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             LIGHT_SOURCES_NIST_TRADITIONAL_SPDS_DATA['Metal Halide'],
             name='Metal Halide'),
     'Neodimium Incandescent':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             LIGHT_SOURCES_NIST_TRADITIONAL_SPDS_DATA['Neodimium Incandescent'],
             name='Neodimium Incandescent'),
     'Super HPS':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             LIGHT_SOURCES_NIST_TRADITIONAL_SPDS_DATA['Super HPS'],
             name='Super HPS'),
     'Triphosphor FL':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             LIGHT_SOURCES_NIST_TRADITIONAL_SPDS_DATA['Triphosphor FL'],
             name='Triphosphor FL')
 })
@@ -2928,61 +2948,76 @@ LIGHT_SOURCES_NIST_LED_SPDS_DATA = {
     }
 }
 
-LIGHT_SOURCES_NIST_LED_SPDS = CaseInsensitiveMapping({
+LIGHT_SOURCES_NIST_LED_SPDS = LazyCaseInsensitiveMapping({
     '3-LED-1 (457/540/605)':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             LIGHT_SOURCES_NIST_LED_SPDS_DATA['3-LED-1 (457/540/605)'],
             name='3-LED-1 (457/540/605)'),
     '3-LED-2 (473/545/616)':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             LIGHT_SOURCES_NIST_LED_SPDS_DATA['3-LED-2 (473/545/616)'],
             name='3-LED-2 (473/545/616)'),
     '3-LED-2 Yellow':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             LIGHT_SOURCES_NIST_LED_SPDS_DATA['3-LED-2 Yellow'],
             name='3-LED-2 Yellow'),
     '3-LED-3 (465/546/614)':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             LIGHT_SOURCES_NIST_LED_SPDS_DATA['3-LED-3 (465/546/614)'],
             name='3-LED-3 (465/546/614)'),
     '3-LED-4 (455/547/623)':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             LIGHT_SOURCES_NIST_LED_SPDS_DATA['3-LED-4 (455/547/623)'],
             name='3-LED-4 (455/547/623)'),
     '4-LED No Yellow':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             LIGHT_SOURCES_NIST_LED_SPDS_DATA['4-LED No Yellow'],
             name='4-LED No Yellow'),
     '4-LED Yellow':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             LIGHT_SOURCES_NIST_LED_SPDS_DATA['4-LED Yellow'],
             name='4-LED Yellow'),
     '4-LED-1 (461/526/576/624)':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             LIGHT_SOURCES_NIST_LED_SPDS_DATA['4-LED-1 (461/526/576/624)'],
             name='4-LED-1 (461/526/576/624)'),
     '4-LED-2 (447/512/573/627)':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             LIGHT_SOURCES_NIST_LED_SPDS_DATA['4-LED-2 (447/512/573/627)'],
             name='4-LED-2 (447/512/573/627)'),
     'Luxeon WW 2880':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             LIGHT_SOURCES_NIST_LED_SPDS_DATA['Luxeon WW 2880'],
             name='Luxeon WW 2880'),
     'PHOS-1':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             LIGHT_SOURCES_NIST_LED_SPDS_DATA['PHOS-1'], name='PHOS-1'),
     'PHOS-2':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             LIGHT_SOURCES_NIST_LED_SPDS_DATA['PHOS-2'], name='PHOS-2'),
     'PHOS-3':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             LIGHT_SOURCES_NIST_LED_SPDS_DATA['PHOS-3'], name='PHOS-3'),
     'PHOS-4':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             LIGHT_SOURCES_NIST_LED_SPDS_DATA['PHOS-4'], name='PHOS-4'),
     'Phosphor LED YAG':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             LIGHT_SOURCES_NIST_LED_SPDS_DATA['Phosphor LED YAG'],
             name='Phosphor LED YAG')
 })
@@ -4826,96 +4861,118 @@ LIGHT_SOURCES_NIST_PHILIPS_SPDS_DATA = {
     }
 }
 
-LIGHT_SOURCES_NIST_PHILIPS_SPDS = CaseInsensitiveMapping({
+LIGHT_SOURCES_NIST_PHILIPS_SPDS = LazyCaseInsensitiveMapping({
     '60 A/W (Soft White)':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             LIGHT_SOURCES_NIST_PHILIPS_SPDS_DATA['60 A/W (Soft White)'],
             name='60 A/W (Soft White)'),
     'C100S54 (HPS)':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             LIGHT_SOURCES_NIST_PHILIPS_SPDS_DATA['C100S54 (HPS)'],
             name='C100S54 (HPS)'),
     'C100S54C (HPS)':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             LIGHT_SOURCES_NIST_PHILIPS_SPDS_DATA['C100S54C (HPS)'],
             name='C100S54C (HPS)'),
     'F32T8/TL830 (Triphosphor)':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             LIGHT_SOURCES_NIST_PHILIPS_SPDS_DATA['F32T8/TL830 (Triphosphor)'],
             name='F32T8/TL830 (Triphosphor)'),
     'F32T8/TL835 (Triphosphor)':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             LIGHT_SOURCES_NIST_PHILIPS_SPDS_DATA['F32T8/TL835 (Triphosphor)'],
             name='F32T8/TL835 (Triphosphor)'),
     'F32T8/TL841 (Triphosphor)':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             LIGHT_SOURCES_NIST_PHILIPS_SPDS_DATA['F32T8/TL841 (Triphosphor)'],
             name='F32T8/TL841 (Triphosphor)'),
     'F32T8/TL850 (Triphosphor)':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             LIGHT_SOURCES_NIST_PHILIPS_SPDS_DATA['F32T8/TL850 (Triphosphor)'],
             name='F32T8/TL850 (Triphosphor)'),
     'F32T8/TL865 /PLUS (Triphosphor)':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             LIGHT_SOURCES_NIST_PHILIPS_SPDS_DATA[
                 'F32T8/TL865 /PLUS (Triphosphor)'],
             name='F32T8/TL865 /PLUS (Triphosphor)'),
     'F34/CW/RS/EW (Cool White FL)':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             LIGHT_SOURCES_NIST_PHILIPS_SPDS_DATA[
                 'F34/CW/RS/EW (Cool White FL)'],
             name='F34/CW/RS/EW (Cool White FL)'),
     'F34T12/LW/RS /EW':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             LIGHT_SOURCES_NIST_PHILIPS_SPDS_DATA['F34T12/LW/RS /EW'],
             name='F34T12/LW/RS /EW'),
     'F34T12WW/RS /EW (Warm White FL)':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             LIGHT_SOURCES_NIST_PHILIPS_SPDS_DATA[
                 'F34T12WW/RS /EW (Warm White FL)'],
             name='F34T12WW/RS /EW (Warm White FL)'),
     'F40/C50 (Broadband FL)':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             LIGHT_SOURCES_NIST_PHILIPS_SPDS_DATA['F40/C50 (Broadband FL)'],
             name='F40/C50 (Broadband FL)'),
     'F40/C75 (Broadband FL)':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             LIGHT_SOURCES_NIST_PHILIPS_SPDS_DATA['F40/C75 (Broadband FL)'],
             name='F40/C75 (Broadband FL)'),
     'F40/CWX (Broadband FL)':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             LIGHT_SOURCES_NIST_PHILIPS_SPDS_DATA['F40/CWX (Broadband FL)'],
             name='F40/CWX (Broadband FL)'),
     'F40/DX (Broadband FL)':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             LIGHT_SOURCES_NIST_PHILIPS_SPDS_DATA['F40/DX (Broadband FL)'],
             name='F40/DX (Broadband FL)'),
     'F40/DXTP (Delux FL)':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             LIGHT_SOURCES_NIST_PHILIPS_SPDS_DATA['F40/DXTP (Delux FL)'],
             name='F40/DXTP (Delux FL)'),
     'F40/N (Natural FL)':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             LIGHT_SOURCES_NIST_PHILIPS_SPDS_DATA['F40/N (Natural FL)'],
             name='F40/N (Natural FL)'),
     'H38HT-100 (Mercury)':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             LIGHT_SOURCES_NIST_PHILIPS_SPDS_DATA['H38HT-100 (Mercury)'],
             name='H38HT-100 (Mercury)'),
     'H38JA-100/DX (Mercury DX)':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             LIGHT_SOURCES_NIST_PHILIPS_SPDS_DATA['H38JA-100/DX (Mercury DX)'],
             name='H38JA-100/DX (Mercury DX)'),
     'MHC100/U/MP /3K':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             LIGHT_SOURCES_NIST_PHILIPS_SPDS_DATA['MHC100/U/MP /3K'],
             name='MHC100/U/MP /3K'),
     'MHC100/U/MP /4K':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             LIGHT_SOURCES_NIST_PHILIPS_SPDS_DATA['MHC100/U/MP /4K'],
             name='MHC100/U/MP /4K'),
     'SDW-T 100W/LV (Super HPS)':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             LIGHT_SOURCES_NIST_PHILIPS_SPDS_DATA['SDW-T 100W/LV (Super HPS)'],
             name='SDW-T 100W/LV (Super HPS)')
 })
@@ -5141,9 +5198,10 @@ LIGHT_SOURCES_PROJECTORS_SPDS_DATA = {
     }
 }
 
-LIGHT_SOURCES_PROJECTORS_SPDS = CaseInsensitiveMapping({
+LIGHT_SOURCES_PROJECTORS_SPDS = LazyCaseInsensitiveMapping({
     'Kinoton 75P':
-        SpectralPowerDistribution(
+        partial(
+            SpectralPowerDistribution,
             LIGHT_SOURCES_PROJECTORS_SPDS_DATA['Kinoton 75P'],
             name='Kinoton 75P')
 })
@@ -5158,7 +5216,7 @@ LIGHT_SOURCES_PROJECTORS_SPDS : CaseInsensitiveMapping
     **{'Kinoton 75P', }**
 """
 
-LIGHT_SOURCES_SPDS = CaseInsensitiveMapping(LIGHT_SOURCES_RIT_SPDS)
+LIGHT_SOURCES_SPDS = LazyCaseInsensitiveMapping(LIGHT_SOURCES_RIT_SPDS)
 LIGHT_SOURCES_SPDS.__doc__ = """
 Aggregated light sources spectral power distributions.
 
@@ -1582,9 +1582,13 @@ MultiSpectralPowerDistribution or array_like or dict_like, optional
     """
 
     def __init__(self, data=None, domain=None, labels=None, **kwargs):
-        signals = self.multi_signal_unpack_data(data, domain, labels)
+        # The given domain takes precedence over the data one, unpacking the
+        # data is only required to determine the latter.
+        if domain is None:
+            data = self.multi_signal_unpack_data(data, domain, labels)
+            domain = data[list(data.keys())[0]].domain if data else None
+            labels = None
 
-        domain = signals[list(signals.keys())[0]].domain if signals else None
         uniform = is_uniform(domain) if domain is not None else True
 
         # Initialising with *CIE 15:2004* and *CIE 167:2005* recommendations
@@ -1602,7 +1606,11 @@ MultiSpectralPowerDistribution or array_like or dict_like, optional
         })
 
         super(MultiSpectralPowerDistribution, self).__init__(
-            signals, domain, signal_type=SpectralPowerDistribution, **kwargs)
+            data,
+            domain,
+            labels,
+            signal_type=SpectralPowerDistribution,
+            **kwargs)
 
         self._strict_name = None
         self.strict_name = kwargs.get('strict_name')
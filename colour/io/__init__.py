@@ -2,16 +2,53 @@
 
 from __future__ import absolute_import
 
-from .ies_tm2714 import IES_TM2714_Spd
-from .image import ImageAttribute_Specification, read_image, write_image
+from .cgats import CGATS_Data, read_cgats_file
+from .envi import (ENVI_DATA_TYPES, ENVI_WAVELENGTH_UNITS_SCALES,
+                   SpectralResamplingPlan, ENVI_Image, read_ENVI_header,
+                   read_ENVI_image)
+from .ies_tm2714 import IES_TM2714_Spd, read_ies_tm2714_directory
+from .image import (ImageAttribute_Specification, IMAGE_SCANLINES_CHUNK_SIZE,
+                    read_image, read_image_tiles, write_image,
+                    image_sequence_paths, read_image_sequence,
+                    write_image_sequence)
+from .luts import (read_LUT_IridasCube, write_LUT_IridasCube,
+                   read_LUT_SonySPI3D, write_LUT_SonySPI3D, LUT_READ_METHODS,
+                   LUT_WRITE_METHODS, read_LUT, write_LUT)
+from .spectral_library import (
+    SPECTRAL_LIBRARY_MAGIC, SPECTRAL_LIBRARY_VERSION,
+    SPECTRAL_LIBRARY_ALIGNMENT, SpectralLibrary, read_spectral_library,
+    write_spectral_library)
 from .tabular import (read_spectral_data_from_csv_file,
-                      read_spds_from_csv_file, write_spds_to_csv_file)
+                      read_spectral_array_from_csv_file,
+                      read_spds_from_csv_file, read_multi_spd_from_csv_file,
+                      write_spds_to_csv_file, write_multi_spd_to_csv_file)
 from .xrite import read_spds_from_xrite_file
 
-__all__ = ['IES_TM2714_Spd']
-__all__ += ['ImageAttribute_Specification', 'read_image', 'write_image']
+__all__ = ['CGATS_Data', 'read_cgats_file']
 __all__ += [
-    'read_spectral_data_from_csv_file', 'read_spds_from_csv_file',
-    'write_spds_to_csv_file'
+    'ENVI_DATA_TYPES', 'ENVI_WAVELENGTH_UNITS_SCALES',
+    'SpectralResamplingPlan', 'ENVI_Image', 'read_ENVI_header',
+    'read_ENVI_image'
+]
+__all__ += ['IES_TM2714_Spd', 'read_ies_tm2714_directory']
+__all__ += [
+    'ImageAttribute_Specification', 'IMAGE_SCANLINES_CHUNK_SIZE', 'read_image',
+    'read_image_tiles', 'write_image', 'image_sequence_paths',
+    'read_image_sequence', 'write_image_sequence'
+]
+__all__ += [
+    'read_LUT_IridasCube', 'write_LUT_IridasCube', 'read_LUT_SonySPI3D',
+    'write_LUT_SonySPI3D', 'LUT_READ_METHODS', 'LUT_WRITE_METHODS',
+    'read_LUT', 'write_LUT'
+]
+__all__ += [
+    'SPECTRAL_LIBRARY_MAGIC', 'SPECTRAL_LIBRARY_VERSION',
+    'SPECTRAL_LIBRARY_ALIGNMENT', 'SpectralLibrary', 'read_spectral_library',
+    'write_spectral_library'
+]
+__all__ += [
+    'read_spectral_data_from_csv_file', 'read_spectral_array_from_csv_file',
+    'read_spds_from_csv_file', 'read_multi_spd_from_csv_file',
+    'write_spds_to_csv_file', 'write_multi_spd_to_csv_file'
 ]
 __all__ += ['read_spds_from_xrite_file']
@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+"""
+CGATS Data Input
+================
+
+Defines input objects for *CGATS.17* measurement data files, e.g. *X-Rite*
+spectrophotometers exports:
+
+-   :class:`colour.io.CGATS_Data`
+-   :func:`colour.read_cgats_file`
+
+The data block is tokenised in a single pass and converted to arrays column
+wise, the spectral columns yielding a single
+:class:`colour.MultiSpectralPowerDistribution` class instance.
+"""
+
+from __future__ import division, unicode_literals
+
+import codecs
+import numpy as np
+import re
+from collections import OrderedDict, namedtuple
+
+from colour.colorimetry import MultiSpectralPowerDistribution
+from colour.constants import DEFAULT_FLOAT_DTYPE
+from colour.utilities import is_string
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'CGATS_FILE_ENCODING', 'CGATS_SPECTRAL_FIELD_PATTERN',
+    'CGATS_SAMPLE_FIELDS', 'CGATS_XYZ_FIELDS', 'CGATS_LAB_FIELDS',
+    'CGATS_Data', 'read_cgats_file'
+]
+
+CGATS_FILE_ENCODING = 'utf-8'
+"""
+*CGATS.17* file encoding.
+
+CGATS_FILE_ENCODING : unicode
+"""
+
+CGATS_SPECTRAL_FIELD_PATTERN = (
+    '^(?:SPECTRAL_NM|SPECTRAL_|NM)_?(\\d+(?:\\.\\d+)?)$')
+"""
+*CGATS.17* spectral data fields names pattern, e.g. *SPECTRAL_NM380* or
+*nm380* for *X-Rite* files, matched case insensitively, its group being the
+wavelength.
+
+CGATS_SPECTRAL_FIELD_PATTERN : unicode
+"""
+
+CGATS_SAMPLE_FIELDS = ('SAMPLE_NAME', 'SAMPLE_ID', 'SAMPLEID')
+"""
+*CGATS.17* sample fields names, by order of preference, used to label the
+samples.
+
+CGATS_SAMPLE_FIELDS : tuple
+"""
+
+CGATS_XYZ_FIELDS = ('XYZ_X', 'XYZ_Y', 'XYZ_Z')
+"""
+*CGATS.17* *CIE XYZ* tristimulus values fields names.
+
+CGATS_XYZ_FIELDS : tuple
+"""
+
+CGATS_LAB_FIELDS = ('LAB_L', 'LAB_A', 'LAB_B')
+"""
+*CGATS.17* *CIE L\\*a\\*b\\** colourspace array fields names.
+
+CGATS_LAB_FIELDS : tuple
+"""
+
+
+class CGATS_Data(
+        namedtuple('CGATS_Data', ('keywords', 'labels', 'multi_spd', 'XYZ',
+                                  'Lab', 'data'))):
+    """
+    Defines the data of a *CGATS.17* file.
+
+    Parameters
+    ----------
+    keywords : OrderedDict
+        Header keywords values, the values of repeated keywords, e.g.
+        *KEYWORD*, are collected in a *list*.
+    labels : list
+        Samples labels, repeated labels are made unique with their occurrence
+        number, e.g. *Sample (2)*.
+    multi_spd : MultiSpectralPowerDistribution
+        Samples spectral data, *None* if the file has no spectral data
+        fields.
+    XYZ : ndarray
+        Samples *CIE XYZ* tristimulus values, *None* if the file has no
+        *CIE XYZ* fields.
+    Lab : ndarray
+        Samples *CIE L\\*a\\*b\\** colourspace array, *None* if the file has
+        no *CIE L\\*a\\*b\\** fields.
+    data : OrderedDict
+        Data fields columns, *float* arrays for numeric fields and *unicode*
+        arrays otherwise.
+    """
+
+
+def _parse_keywords(text):
+    """
+    Parses given *CGATS.17* header text keywords.
+    """
+
+    keywords = OrderedDict()
+    for line in text.splitlines():
+        match = re.match('^\\s*([^\\s#"]+)(?:[ \\t]+("[^"]*"|[^#]*))?', line)
+        if match is None:
+            continue
+
+        keyword, value = match.group(1), (match.group(2) or '').strip()
+        value = value.strip('"')
+        if keyword in keywords:
+            if not isinstance(keywords[keyword], list):
+                keywords[keyword] = [keywords[keyword]]
+            keywords[keyword].append(value)
+        else:
+            keywords[keyword] = value
+
+    return keywords
+
+
+def read_cgats_file(path, encoding=CGATS_FILE_ENCODING):
+    """
+    Reads the data from given *CGATS.17* file.
+
+    Parameters
+    ----------
+    path : unicode
+        Absolute *CGATS.17* file path.
+    encoding : unicode, optional
+        *CGATS.17* file encoding.
+
+    Returns
+    -------
+    CGATS_Data
+        *CGATS.17* file data.
+
+    Raises
+    ------
+    ValueError
+        If the file has no data format or data blocks or if the data block
+        values count is not a multiple of the fields count.
+
+    Notes
+    -----
+    -   Only the first data set of the file is read.
+
+    Examples
+    --------
+    >>> import os
+    >>> cgats_file = os.path.join(os.path.dirname(__file__), 'tests',
+    ...                           'resources',
+    ...                           'xrite_digital_colour_checker.txt')
+    >>> cgats_data = read_cgats_file(cgats_file)
+    >>> print(cgats_data.keywords['INSTRUMENTATION'])
+    Spectrolino
+    >>> print(cgats_data.labels[:3])
+    ['X1', 'X2', 'X3']
+    >>> cgats_data.multi_spd.shape
+    SpectralShape(380.0, 730.0, 10.0)
+    >>> cgats_data.data['RGB_R'][:3]
+    array([ 109.97,  110.33,  110.51])
+    """
+
+    with codecs.open(path, encoding=encoding) as cgats_file:
+        content = cgats_file.read().replace('\r\n', '\n')
+
+    data_format = re.search(
+        '^[ \\t]*BEGIN_DATA_FORMAT[ \\t]*$(.*?)'
+        '^[ \\t]*END_DATA_FORMAT[ \\t]*$', content, re.MULTILINE | re.DOTALL)
+    data = re.search('^[ \\t]*BEGIN_DATA[ \\t]*$(.*?)^[ \\t]*END_DATA[ \\t]*$',
+                     content, re.MULTILINE | re.DOTALL)
+    if data_format is None or data is None:
+        raise ValueError(
+            '"{0}" file has no "BEGIN_DATA_FORMAT" or "BEGIN_DATA" '
+            'block!'.format(path))
+
+    keywords = _parse_keywords(content[:data_format.start()] +
+                               content[data_format.end():data.start()])
+
+    fields = data_format.group(1).split()
+    tokens = re.findall('"[^"]*"|[^\\s"]+', data.group(1))
+    if not fields or len(tokens) % len(fields):
+        raise ValueError(
+            '"{0}" file data block values count ({1}) is not a multiple of '
+            'the fields count ({2})!'.format(path, len(tokens), len(fields)))
+
+    table = np.reshape(np.array(tokens), (-1, len(fields)))
+
+    columns = OrderedDict()
+    for i, field in enumerate(fields):
+        try:
+            columns[field] = table[:, i].astype(DEFAULT_FLOAT_DTYPE)
+        except ValueError:
+            columns[field] = np.char.strip(table[:, i], '"')
+
+    upper_fields = [field.upper() for field in fields]
+
+    def columns_array(names):
+        """
+        Returns the array of given fields columns if they all exist.
+        """
+
+        if all(name in upper_fields for name in names):
+            return np.column_stack([
+                columns[fields[upper_fields.index(name)]] for name in names
+            ])
+
+    for name in CGATS_SAMPLE_FIELDS:
+        if name in upper_fields:
+            labels = [
+                '{0}'.format(label).strip('"')
+                for label in table[:, upper_fields.index(name)]
+            ]
+            break
+    else:
+        labels = ['{0}'.format(i + 1) for i in range(len(table))]
+
+    unique_labels = set(labels)
+    if len(unique_labels) != len(labels):
+        counts = {}
+        for i, label in enumerate(labels):
+            counts[label] = counts.get(label, 0) + 1
+            if counts[label] == 1:
+                continue
+
+            while '{0} ({1})'.format(label, counts[label]) in unique_labels:
+                counts[label] += 1
+
+            labels[i] = '{0} ({1})'.format(label, counts[label])
+            unique_labels.add(labels[i])
+
+    multi_spd = None
+    spectral_fields = [(field, re.match(CGATS_SPECTRAL_FIELD_PATTERN, field,
+                                        re.IGNORECASE)) for field in fields]
+    spectral_fields = [(field, DEFAULT_FLOAT_DTYPE(match.group(1)))
+                       for field, match in spectral_fields if match]
+    if spectral_fields:
+        wavelengths = np.array([x[1] for x in spectral_fields])
+        values = np.column_stack([columns[x[0]] for x in spectral_fields])
+        descriptor = keywords.get('DESCRIPTOR')
+        multi_spd = MultiSpectralPowerDistribution(
+            np.transpose(values),
+            wavelengths,
+            labels=labels,
+            name=descriptor if is_string(descriptor) and descriptor else None)
+
+    return CGATS_Data(keywords, labels, multi_spd,
+                      columns_array(CGATS_XYZ_FIELDS),
+                      columns_array(CGATS_LAB_FIELDS), columns)
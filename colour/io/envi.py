@@ -0,0 +1,375 @@
+# -*- coding: utf-8 -*-
+"""
+ENVI Hyperspectral Image Input
+==============================
+
+Defines input objects for *ENVI* hyperspectral images, i.e. a *.hdr* text
+header and a raw binary data file interleaved by band (*BSQ*), by line
+(*BIL*) or by pixel (*BIP*):
+
+-   :func:`colour.read_ENVI_header`
+-   :func:`colour.read_ENVI_image`
+
+The image data is memory mapped with :class:`numpy.memmap` class and
+returned as a view in the channels-last layout expected by
+:func:`colour.multi_spectral_to_XYZ` definition, i.e. (lines, samples, bands).
+"""
+
+from __future__ import division, unicode_literals
+
+import codecs
+import numpy as np
+import os
+import re
+from collections import OrderedDict, namedtuple
+
+from colour.colorimetry import SpectralShape
+from colour.utilities import CaseInsensitiveMapping
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'ENVI_DATA_TYPES', 'ENVI_WAVELENGTH_UNITS_SCALES',
+    'SpectralResamplingPlan', 'ENVI_Image', 'read_ENVI_header',
+    'read_ENVI_image'
+]
+
+ENVI_DATA_TYPES = {
+    1: np.uint8,
+    2: np.int16,
+    3: np.int32,
+    4: np.float32,
+    5: np.float64,
+    6: np.complex64,
+    9: np.complex128,
+    12: np.uint16,
+    13: np.uint32,
+    14: np.int64,
+    15: np.uint64
+}
+"""
+*ENVI* header *data type* codes and their *Numpy* dtypes.
+
+ENVI_DATA_TYPES : dict
+"""
+
+ENVI_WAVELENGTH_UNITS_SCALES = CaseInsensitiveMapping({
+    'Nanometers': 1,
+    'nm': 1,
+    'Micrometers': 1000,
+    'Microns': 1000,
+    'um': 1000,
+    'Millimeters': 1000000,
+    'mm': 1000000
+})
+ENVI_WAVELENGTH_UNITS_SCALES.__doc__ = """
+*ENVI* header *wavelength units* and their scales to nanometers.
+
+ENVI_WAVELENGTH_UNITS_SCALES : CaseInsensitiveMapping
+"""
+
+_ENVI_HEADER_INTEGER_FIELDS = ('samples', 'lines', 'bands', 'header offset',
+                               'data type', 'byte order')
+"""
+*ENVI* header integer fields.
+
+_ENVI_HEADER_INTEGER_FIELDS : tuple
+"""
+
+_ENVI_HEADER_FLOAT_FIELDS = ('wavelength', 'fwhm', 'bbl',
+                             'data gain values', 'data offset values')
+"""
+*ENVI* header floating point list fields.
+
+_ENVI_HEADER_FLOAT_FIELDS : tuple
+"""
+
+
+class SpectralResamplingPlan(
+        namedtuple('SpectralResamplingPlan', ('shape', 'indexes',
+                                              'weights'))):
+    """
+    Defines a plan linearly resampling multi-spectral arrays with non-uniform
+    bands centres to a uniform spectral shape.
+
+    Parameters
+    ----------
+    shape : SpectralShape
+        Uniform spectral shape the multi-spectral arrays are resampled to.
+    indexes : ndarray
+        Indexes of the lower bands bracketing each wavelength of the spectral
+        shape, the upper bands indexes being the next ones.
+    weights : ndarray
+        Weights of the upper bands bracketing each wavelength of the spectral
+        shape.
+
+    Methods
+    -------
+    apply
+
+    Examples
+    --------
+    >>> plan = SpectralResamplingPlan.from_wavelengths(
+    ...     np.array([400, 410, 425, 430, 440, 450]))
+    >>> plan.shape
+    SpectralShape(400.0, 450.0, 10.0)
+    >>> plan.apply(np.array([0.1, 0.2, 0.35, 0.4, 0.5, 0.6]))
+    array([ 0.1,  0.2,  0.3,  0.4,  0.5,  0.6])
+    """
+
+    @classmethod
+    def from_wavelengths(cls, wavelengths, interval=None):
+        """
+        Returns the resampling plan of given bands centres.
+
+        Parameters
+        ----------
+        wavelengths : array_like
+            Increasing bands centres.
+        interval : numeric, optional
+            Spectral shape interval, default to the bands centres median
+            spacing rounded to the nearest integer, 1 at least.
+
+        Returns
+        -------
+        SpectralResamplingPlan
+            Resampling plan.
+        """
+
+        wavelengths = np.asarray(wavelengths, dtype=np.float64)
+        if interval is None:
+            interval = max(np.round(np.median(np.diff(wavelengths))), 1)
+
+        start = np.ceil(wavelengths[0] / interval) * interval
+        count = int(np.floor((wavelengths[-1] - start) / interval)) + 1
+        domain = start + np.arange(count) * interval
+
+        indexes = np.clip(
+            np.searchsorted(wavelengths, domain, side='right') - 1, 0,
+            len(wavelengths) - 2)
+        weights = ((domain - wavelengths[indexes]) /
+                   (wavelengths[indexes + 1] - wavelengths[indexes]))
+
+        return cls(
+            SpectralShape(domain[0], domain[-1], interval), indexes, weights)
+
+    def apply(self, msa):
+        """
+        Resamples given multi-spectral array.
+
+        Parameters
+        ----------
+        msa : array_like
+            Multi-spectral array :math:`msa`, the bands are expected to be in
+            the last axis.
+
+        Returns
+        -------
+        ndarray
+            Resampled multi-spectral array.
+        """
+
+        msa = np.asarray(msa)
+
+        return (msa[..., self.indexes] * (1 - self.weights) +
+                msa[..., self.indexes + 1] * self.weights)
+
+
+class ENVI_Image(
+        namedtuple('ENVI_Image', ('data', 'shape', 'resampling_plan',
+                                  'header'))):
+    """
+    Defines an *ENVI* hyperspectral image.
+
+    Parameters
+    ----------
+    data : memmap
+        Memory mapped image data of shape (lines, samples, bands).
+    shape : SpectralShape
+        Spectral shape of the bands if their centres are uniformly spaced,
+        the resampling plan spectral shape otherwise, *None* if the header
+        has no *wavelength* field.
+    resampling_plan : SpectralResamplingPlan
+        Resampling plan to the spectral shape if the bands centres are not
+        uniformly spaced, *None* otherwise.
+    header : OrderedDict
+        *ENVI* header fields.
+    """
+
+
+def read_ENVI_header(path):
+    """
+    Reads given *ENVI* header file.
+
+    Parameters
+    ----------
+    path : unicode
+        *ENVI* header file path.
+
+    Returns
+    -------
+    OrderedDict
+        *ENVI* header fields with lower case names. The *samples*, *lines*,
+        *bands*, *header offset*, *data type* and *byte order* fields are
+        converted to *integer*, the *wavelength*, *fwhm*, *bbl*,
+        *data gain values* and *data offset values* fields to *ndarray* and
+        the other brace enclosed fields to *list* of *unicode*.
+
+    Raises
+    ------
+    ValueError
+        If the file is not an *ENVI* header file.
+
+    Examples
+    --------
+    >>> header = read_ENVI_header('image.hdr')  # doctest: +SKIP
+    """
+
+    with codecs.open(path, encoding='utf-8', errors='replace') as header_file:
+        content = header_file.read()
+
+    if not content.lstrip().startswith('ENVI'):
+        raise ValueError('"{0}" is not an "ENVI" header file!'.format(path))
+
+    header = OrderedDict()
+    for match in re.finditer('^[ \\t]*([^=\\n;]+?)[ \\t]*=[ \\t]*'
+                             '(\\{[^}]*\\}|[^\\n]*)', content, re.MULTILINE):
+        field, value = match.group(1).lower(), match.group(2).strip()
+
+        if value.startswith('{'):
+            value = value[1:-1].strip()
+            if field == 'description':
+                header[field] = value
+                continue
+
+            value = [x.strip() for x in value.split(',')] if value else []
+            if field in _ENVI_HEADER_FLOAT_FIELDS:
+                value = np.array(value, dtype=np.float64)
+        elif field in _ENVI_HEADER_INTEGER_FIELDS:
+            value = int(value)
+
+        header[field] = value
+
+    return header
+
+
+def _ENVI_data_path(path, header):
+    """
+    Returns the *ENVI* data file path of given header file path.
+    """
+
+    root = os.path.splitext(path)[0]
+    candidates = [root, path[:-4] if path.lower().endswith('.hdr') else path]
+    candidates += [
+        '{0}{1}'.format(root, extension)
+        for extension in ('.img', '.dat', '.raw', '.{0}'.format(
+            header.get('interleave', 'bsq').lower()))
+    ]
+    for candidate in candidates:
+        if os.path.isfile(candidate) and candidate != path:
+            return candidate
+
+    raise ValueError('"{0}" header data file was not found!'.format(path))
+
+
+def read_ENVI_image(path, data_path=None, mode='r'):
+    """
+    Reads given *ENVI* hyperspectral image.
+
+    Parameters
+    ----------
+    path : unicode
+        *ENVI* header file path.
+    data_path : unicode, optional
+        *ENVI* data file path, default to the header file path without its
+        extension or with one of the *.img*, *.dat*, *.raw* or interleave
+        extensions.
+    mode : unicode, optional
+        **{'r', 'r+', 'c'}**,
+        :class:`numpy.memmap` class mode.
+
+    Returns
+    -------
+    ENVI_Image
+        *ENVI* hyperspectral image.
+
+    Raises
+    ------
+    ValueError
+        If the header *data type* or *interleave* is not supported or the data
+        file is not found.
+
+    Notes
+    -----
+    -   The data is not copied: the array returned for the *BSQ* and *BIL*
+        interleaves is a non-contiguous view, processing it in tiles with
+        :func:`colour.utilities.apply_tiled` definition bounds the memory
+        read at once.
+    -   The wavelengths are converted to nanometers according to the header
+        *wavelength units* field.
+
+    Examples
+    --------
+    >>> from colour import multi_spectral_to_XYZ
+    >>> image = read_ENVI_image('image.hdr')  # doctest: +SKIP
+    >>> msa = image.data  # doctest: +SKIP
+    >>> if image.resampling_plan is not None:  # doctest: +SKIP
+    ...     msa = image.resampling_plan.apply(msa)
+    >>> XYZ = multi_spectral_to_XYZ(msa, image.shape)  # doctest: +SKIP
+    """
+
+    header = read_ENVI_header(path)
+
+    if data_path is None:
+        data_path = _ENVI_data_path(path, header)
+
+    data_type = header.get('data type')
+    if data_type not in ENVI_DATA_TYPES:
+        raise ValueError('"{0}" data type is not supported, it must be one '
+                         'of {1}!'.format(data_type,
+                                          sorted(ENVI_DATA_TYPES.keys())))
+
+    dtype = np.dtype(ENVI_DATA_TYPES[data_type]).newbyteorder(
+        '>' if header.get('byte order', 0) == 1 else '<')
+
+    lines, samples, bands = (header['lines'], header['samples'],
+                             header['bands'])
+    interleave = header.get('interleave', 'bsq').lower()
+    if interleave == 'bsq':
+        shape, axes = (bands, lines, samples), (1, 2, 0)
+    elif interleave == 'bil':
+        shape, axes = (lines, bands, samples), (0, 2, 1)
+    elif interleave == 'bip':
+        shape, axes = (lines, samples, bands), (0, 1, 2)
+    else:
+        raise ValueError('"{0}" interleave is not supported, it must be one '
+                         'of {1}!'.format(interleave, ['bsq', 'bil', 'bip']))
+
+    data = np.transpose(
+        np.memmap(
+            data_path,
+            dtype=dtype,
+            mode=mode,
+            offset=header.get('header offset', 0),
+            shape=shape), axes)
+
+    spectral_shape, resampling_plan = None, None
+    wavelengths = header.get('wavelength')
+    if wavelengths is not None and len(wavelengths) > 1:
+        wavelengths = wavelengths * ENVI_WAVELENGTH_UNITS_SCALES.get(
+            header.get('wavelength units', 'Nanometers'), 1)
+        spacing = np.diff(wavelengths)
+        if np.allclose(spacing, spacing[0]):
+            spectral_shape = SpectralShape(wavelengths[0], wavelengths[-1],
+                                           spacing[0])
+        else:
+            resampling_plan = SpectralResamplingPlan.from_wavelengths(
+                wavelengths)
+            spectral_shape = resampling_plan.shape
+
+    return ENVI_Image(data, spectral_shape, resampling_plan, header)
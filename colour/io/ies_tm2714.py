@@ -4,7 +4,8 @@ IES TM-27-14 Data Input / Output
 ================================
 
 Defines the :class:`colour.IES_TM2714_Spd` class handling *IES TM-27-14*
-spectral data XML files.
+spectral data XML files and the :func:`colour.read_ies_tm2714_directory`
+definition reading a directory of such files.
 
 References
 ----------
@@ -15,13 +16,17 @@ References
 
 from __future__ import division, unicode_literals
 
+import multiprocessing
+import numpy as np
 import os
 import re
 from collections import namedtuple
+from multiprocessing.pool import ThreadPool
 from xml.etree import ElementTree
 from xml.dom import minidom
 
-from colour.colorimetry import SpectralPowerDistribution
+from colour.colorimetry import (MultiSpectralPowerDistribution,
+                                SpectralPowerDistribution)
 from colour.constants import DEFAULT_FLOAT_DTYPE
 from colour.utilities import Structure, is_numeric, is_string, tstack
 
@@ -34,7 +39,8 @@ __status__ = 'Production'
 
 __all__ = [
     'IES_TM2714_VERSION', 'IES_TM2714_NAMESPACE',
-    'IES_TM2714_ElementSpecification', 'IES_TM2714_Header', 'IES_TM2714_Spd'
+    'IES_TM2714_ElementSpecification', 'IES_TM2714_Header', 'IES_TM2714_Spd',
+    'read_ies_tm2714_directory'
 ]
 
 IES_TM2714_VERSION = '1.0'
@@ -950,39 +956,50 @@ class IES_TM2714_Spd(SpectralPowerDistribution):
         0.0339999...
         """
 
-        formatter = './{{{0}}}{1}/{{{0}}}{2}'
-
-        tree = ElementTree.parse(self._path)
-        root = tree.getroot()
-
-        namespace = re.match('{(.*)}', root.tag).group(1)
-
         self.name = os.path.splitext(os.path.basename(self._path))[0]
 
-        iterator = root.iter
-
-        for header_element in (self.header, self):
-            mapping = header_element.mapping
-            for specification in mapping.elements:
-                element = root.find(
-                    formatter.format(namespace, mapping.element,
-                                     specification.element))
-                if element is not None:
-                    setattr(header_element, specification.attribute,
-                            specification.read_conversion(element.text))
-
-        # Reading spectral data.
+        # The document is parsed incrementally, the spectral data elements
+        # are removed from the tree once read so that large files are parsed
+        # with bounded memory.
+        elements = None
+        data_tag = None
         wavelengths = []
         values = []
-        for spectral_data in iterator(
-                '{{{0}}}{1}'.format(namespace, self.mapping.data.element)):
-            wavelengths.append(
-                DEFAULT_FLOAT_DTYPE(spectral_data.attrib[
-                    self.mapping.data.attribute]))
-            values.append(DEFAULT_FLOAT_DTYPE(spectral_data.text))
+        stack = []
+        for event, element in ElementTree.iterparse(
+                self._path, events=('start', 'end')):
+            if event == 'start':
+                if not stack:
+                    namespace = re.match('{.*}', element.tag).group(0)
+                    elements = dict(
+                        ((namespace + mapping.element,
+                          namespace + specification.element),
+                         (header_element, specification))
+                        for header_element, mapping in (
+                            (self.header, self.header.mapping),
+                            (self, self.mapping))
+                        for specification in mapping.elements)
+                    data_tag = namespace + self.mapping.data.element
+
+                stack.append(element)
+                continue
+
+            stack.pop()
+            if element.tag == data_tag:
+                wavelengths.append(
+                    element.attrib[self.mapping.data.attribute])
+                values.append(element.text)
+                if stack:
+                    del stack[-1][:]
+            elif len(stack) == 2:
+                specification = elements.get((stack[-1].tag, element.tag))
+                if specification is not None:
+                    header_element, specification = specification
+                    setattr(header_element, specification.attribute,
+                            specification.read_conversion(element.text))
 
-        self.wavelengths = wavelengths
-        self.values = values
+        self.wavelengths = np.array(wavelengths, dtype=DEFAULT_FLOAT_DTYPE)
+        self.values = np.array(values, dtype=DEFAULT_FLOAT_DTYPE)
 
         return True
 
@@ -1046,3 +1063,86 @@ class IES_TM2714_Spd(SpectralPowerDistribution):
             file.write(xml)
 
         return True
+
+
+def read_ies_tm2714_directory(directory, shape=None, workers=None):
+    """
+    Reads the *IES TM-27-14* spectral data XML files, i.e. *.spdx* files, of
+    given directory concurrently on a thread pool and returns them as a
+    single multi-spectral power distribution labeled by file name.
+
+    Parameters
+    ----------
+    directory : unicode
+        Directory containing the *IES TM-27-14* spectral data XML files.
+    shape : SpectralShape, optional
+        Spectral shape to align the spectral power distributions to, it is
+        required if their wavelengths differ.
+    workers : integer, optional
+        Thread pool workers count, default to the *CPU* count.
+
+    Returns
+    -------
+    MultiSpectralPowerDistribution
+        Multi-spectral power distribution labeled by file name without
+        extension.
+
+    Raises
+    ------
+    ValueError
+        If the directory contains no *.spdx* files or if their wavelengths
+        differ and no spectral shape is given.
+
+    Examples
+    --------
+    >>> from os.path import dirname, join
+    >>> directory = join(dirname(__file__), 'tests', 'resources')
+    >>> multi_spd = read_ies_tm2714_directory(directory)
+    >>> print(multi_spd.labels)
+    ['Fluorescent']
+    >>> multi_spd[400]  # doctest: +ELLIPSIS
+    array([ 0.034...])
+    """
+
+    paths = sorted(
+        os.path.join(directory, name) for name in os.listdir(directory)
+        if name.lower().endswith('.spdx'))
+    if not paths:
+        raise ValueError(
+            '"{0}" directory does not contain any "IES TM-27-14" spectral '
+            'data XML file!'.format(directory))
+
+    def read(path):
+        """
+        Reads given *IES TM-27-14* spectral data XML file.
+        """
+
+        spd = IES_TM2714_Spd(path)
+        spd.read()
+        if shape is not None:
+            spd.align(shape)
+
+        return spd
+
+    if workers is None:
+        workers = multiprocessing.cpu_count()
+
+    pool = ThreadPool(max(min(workers, len(paths)), 1))
+    try:
+        spds = pool.map(read, paths)
+    finally:
+        pool.close()
+        pool.join()
+
+    wavelengths = spds[0].wavelengths
+    for spd in spds[1:]:
+        if not np.array_equal(spd.wavelengths, wavelengths):
+            raise ValueError(
+                '"{0}" and "{1}" wavelengths differ, a spectral shape must be '
+                'given to align them!'.format(spd.name, spds[0].name))
+
+    return MultiSpectralPowerDistribution(
+        np.transpose([spd.values for spd in spds]),
+        wavelengths,
+        labels=[spd.name for spd in spds],
+        name=os.path.basename(os.path.normpath(directory)))
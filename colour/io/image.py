@@ -8,11 +8,18 @@ Defines image related input / output utilities objects.
 
 from __future__ import division, unicode_literals
 
+import itertools
+import multiprocessing
 import numpy as np
-from collections import namedtuple
+import os
+import re
+from collections import deque, namedtuple
+from multiprocessing.pool import ThreadPool
 from six import string_types
+from six.moves import zip
 
-from colour.utilities import CaseInsensitiveMapping, is_openimageio_installed
+from colour.utilities import (CaseInsensitiveMapping, is_openimageio_installed,
+                              is_string)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -23,7 +30,9 @@ __status__ = 'Production'
 
 __all__ = [
     'BitDepth_Specification', 'ImageAttribute_Specification',
-    'BIT_DEPTH_MAPPING', 'read_image', 'write_image'
+    'BIT_DEPTH_MAPPING', 'IMAGE_SCANLINES_CHUNK_SIZE', 'read_image',
+    'read_image_tiles', 'write_image', 'image_sequence_paths',
+    'read_image_sequence', 'write_image_sequence'
 ]
 
 BitDepth_Specification = namedtuple('BitDepth_Specification',
@@ -82,11 +91,170 @@ else:
             BitDepth_Specification('float32', np.float32, None, 1, False)
     })
 
+IMAGE_SCANLINES_CHUNK_SIZE = 64
+"""
+Count of image scanlines read, or converted and written, at once by
+:func:`colour.read_image` and :func:`colour.write_image` definitions, bounding
+the buffers memory.
+
+IMAGE_SCANLINES_CHUNK_SIZE : integer
+"""
+
+
+def _open_image_input(path, subimage=0, miplevel=0):
+    """
+    Opens given image with *OpenImageIO* and seeks given subimage and mip
+    level.
+
+    Parameters
+    ----------
+    path : unicode
+        Image path.
+    subimage : integer, optional
+        Subimage index, e.g. a multi-part *OpenEXR* file part.
+    miplevel : integer, optional
+        Mip level index.
+
+    Returns
+    -------
+    tuple
+        *OpenImageIO* :class:`ImageInput` class instance and subimage
+        :class:`ImageSpec` class instance.
+
+    Raises
+    ------
+    ValueError
+        If the image cannot be opened or has no such subimage or mip level.
+    """
+
+    from OpenImageIO import ImageInput
+
+    path = str(path)
+
+    image_input = ImageInput.open(path)
+    if image_input is None:
+        raise ValueError('"{0}" image cannot be opened!'.format(path))
+
+    if ((subimage, miplevel) != (0, 0) and
+            not image_input.seek_subimage(subimage, miplevel)):
+        image_input.close()
+        raise ValueError(
+            '"{0}" image has no "{1}" subimage with "{2}" mip level!'.format(
+                path, subimage, miplevel))
+
+    return image_input, image_input.spec()
+
+
+def _image_region(specification, roi=None, channels=None):
+    """
+    Returns the region of interest and channels of an image with given
+    specification.
+
+    Parameters
+    ----------
+    specification : ImageSpec
+        *OpenImageIO* :class:`ImageSpec` class instance.
+    roi : array_like, optional
+        Region of interest :math:`(x, y, width, height)` relative to the image
+        data window, default to the whole image.
+    channels : array_like, optional
+        Channels indexes, default to all the channels.
+
+    Returns
+    -------
+    tuple
+        Region of interest and channels indexes.
+
+    Raises
+    ------
+    ValueError
+        If the region of interest or channels are outside the image.
+    """
+
+    if roi is None:
+        roi = (0, 0, specification.width, specification.height)
+
+    x, y, width, height = [int(value) for value in roi]
+    if (x < 0 or y < 0 or width < 1 or height < 1 or
+            x + width > specification.width or
+            y + height > specification.height):
+        raise ValueError(
+            '"{0}" region of interest is outside the "{1}x{2}" image!'.format(
+                roi, specification.width, specification.height))
+
+    if channels is None:
+        channels = np.arange(specification.nchannels)
+
+    channels = np.atleast_1d(np.asarray(channels, dtype=np.int_))
+    if (channels.size == 0 or np.min(channels) < 0 or
+            np.max(channels) >= specification.nchannels):
+        raise ValueError(
+            '"{0}" channels are outside the "{1}" image channels!'.format(
+                channels, specification.nchannels))
+
+    return (x, y, width, height), channels
+
 
-def read_image(path, bit_depth='float32'):
+def _read_scanlines(image_input, specification, bit_depth, roi, channels, y,
+                    rows):
+    """
+    Reads given scanlines of given region of interest and channels.
+
+    Parameters
+    ----------
+    image_input : ImageInput
+        *OpenImageIO* :class:`ImageInput` class instance.
+    specification : ImageSpec
+        *OpenImageIO* :class:`ImageSpec` class instance.
+    bit_depth : TypeDesc
+        *OpenImageIO* bit depth.
+    roi : tuple
+        Region of interest :math:`(x, y, width, height)`.
+    channels : ndarray
+        Channels indexes.
+    y : integer
+        First scanline index relative to the region of interest.
+    rows : integer
+        Scanlines count.
+
+    Returns
+    -------
+    ndarray
+        Scanlines with shape (rows, width, channels).
+    """
+
+    x_r, y_r, width, _height = roi
+    channel_begin, channel_end = np.min(channels), np.max(channels) + 1
+    y_begin = specification.y + y_r + y
+
+    scanlines = np.reshape(
+        np.asarray(
+            image_input.read_scanlines(y_begin, y_begin + rows, 0,
+                                       int(channel_begin), int(channel_end),
+                                       bit_depth)),
+        (rows, specification.width, channel_end - channel_begin))
+    scanlines = scanlines[:, x_r:x_r + width]
+
+    if channels.size != channel_end - channel_begin or np.any(
+            np.diff(channels) != 1):
+        scanlines = scanlines[..., channels - channel_begin]
+
+    return scanlines
+
+
+def read_image(path,
+               bit_depth='float32',
+               roi=None,
+               channels=None,
+               subimage=0,
+               miplevel=0):
     """
     Reads given image using *OpenImageIO*.
 
+    The image is read in chunks of :attr:`colour.io.IMAGE_SCANLINES_CHUNK_SIZE`
+    scanlines into a preallocated array, only the scanlines of the region of
+    interest are read.
+
     Parameters
     ----------
     path : unicode
@@ -94,43 +262,160 @@ def read_image(path, bit_depth='float32'):
     bit_depth : unicode, optional
         **{'float32', 'uint8', 'uint16', 'float16'}**,
         Image bit_depth.
+    roi : array_like, optional
+        Region of interest :math:`(x, y, width, height)` to read, relative to
+        the image data window, default to the whole image.
+    channels : array_like, optional
+        Indexes of the channels to read, default to all the channels.
+    subimage : integer, optional
+        Subimage index to read, e.g. a multi-part *OpenEXR* file part.
+    miplevel : integer, optional
+        Mip level index to read.
 
     Returns
     -------
     ndarray
         Image as a ndarray.
 
+    Raises
+    ------
+    ValueError
+        If the image cannot be opened, has no such subimage or mip level, or
+        if the region of interest or channels are outside the image.
+
     Notes
     -----
-    -   For convenience, single channel images are squeezed to 2d arrays.
+    -   For convenience, single channel images are squeezed to 2d arrays,
+        the rows and columns axes are always preserved.
 
     Examples
     --------
     >>> import os
     >>> path = os.path.join('tests', 'resources', 'CMSTestPattern.exr')
     >>> image = read_image(path)  # doctest: +SKIP
+
+    Reading the red and green channels of the top left corner of the image:
+
+    >>> image = read_image(  # doctest: +SKIP
+    ...     path, roi=(0, 0, 64, 32), channels=[0, 1])
     """
 
     if is_openimageio_installed(raise_exception=True):
-        from OpenImageIO import ImageInput
+        bit_depth = BIT_DEPTH_MAPPING[bit_depth].openimageio
 
-        path = str(path)
+        image_input, specification = _open_image_input(
+            path, subimage, miplevel)
+        try:
+            roi, channels = _image_region(specification, roi, channels)
+            _x, _y, width, height = roi
+
+            image = None
+            for y in range(0, height, IMAGE_SCANLINES_CHUNK_SIZE):
+                rows = min(IMAGE_SCANLINES_CHUNK_SIZE, height - y)
+                scanlines = _read_scanlines(image_input, specification,
+                                            bit_depth, roi, channels, y, rows)
+                if image is None:
+                    image = np.empty(
+                        (height, width, channels.size), dtype=scanlines.dtype)
+
+                image[y:y + rows] = scanlines
+        finally:
+            image_input.close()
+
+        return image[..., 0] if channels.size == 1 else image
+
+
+def read_image_tiles(path,
+                     tile_size=None,
+                     bit_depth='float32',
+                     roi=None,
+                     channels=None,
+                     subimage=0,
+                     miplevel=0):
+    """
+    Reads given image using *OpenImageIO* and yields its tiles or scanline
+    blocks, e.g. to compute statistics on images that do not fit in memory.
+
+    Only one row of tiles, or one block of scanlines, is held in memory at a
+    time.
+
+    Parameters
+    ----------
+    path : unicode
+        Image path.
+    tile_size : integer, optional
+        Tiles size in pixels along the image rows and columns, default to
+        blocks of :attr:`colour.io.IMAGE_SCANLINES_CHUNK_SIZE` full scanlines.
+    bit_depth : unicode, optional
+        **{'float32', 'uint8', 'uint16', 'float16'}**,
+        Image bit_depth.
+    roi : array_like, optional
+        Region of interest :math:`(x, y, width, height)` to read, relative to
+        the image data window, default to the whole image.
+    channels : array_like, optional
+        Indexes of the channels to read, default to all the channels.
+    subimage : integer, optional
+        Subimage index to read, e.g. a multi-part *OpenEXR* file part.
+    miplevel : integer, optional
+        Mip level index to read.
+
+    Yields
+    ------
+    tuple
+        Tile slices relative to the region of interest, as returned by
+        :func:`colour.utilities.image_tiles` definition, and tile with shape
+        (rows, columns, channels).
+
+    Raises
+    ------
+    ValueError
+        If the image cannot be opened, has no such subimage or mip level, or
+        if the region of interest or channels are outside the image.
 
+    Examples
+    --------
+    >>> import os
+    >>> path = os.path.join('tests', 'resources', 'CMSTestPattern.exr')
+    >>> maximum = 0
+    >>> for _slices, tile in read_image_tiles(  # doctest: +SKIP
+    ...         path, 256, roi=(0, 0, 512, 512)):
+    ...     maximum = max(maximum, np.max(tile))
+    """
+
+    if is_openimageio_installed(raise_exception=True):
         bit_depth = BIT_DEPTH_MAPPING[bit_depth].openimageio
 
-        image = ImageInput.open(path)
-        specification = image.spec()
+        image_input, specification = _open_image_input(
+            path, subimage, miplevel)
+        try:
+            roi, channels = _image_region(specification, roi, channels)
+            _x, _y, width, height = roi
 
-        shape = (specification.height, specification.width,
-                 specification.nchannels)
+            if tile_size is None:
+                rows_size, columns_size = IMAGE_SCANLINES_CHUNK_SIZE, width
+            else:
+                rows_size, columns_size = tile_size, tile_size
 
-        return np.squeeze(np.array(image.read_image(bit_depth)).reshape(shape))
+            for y in range(0, height, rows_size):
+                rows = min(rows_size, height - y)
+                scanlines = _read_scanlines(image_input, specification,
+                                            bit_depth, roi, channels, y, rows)
+                for x in range(0, width, columns_size):
+                    yield ((slice(y, y + rows), slice(x, x + columns_size)),
+                           scanlines[:, x:x + columns_size])
+        finally:
+            image_input.close()
 
 
 def write_image(image, path, bit_depth='float32', attributes=None):
     """
     Writes given image using *OpenImageIO*.
 
+    The image is converted to given bit depth and written in chunks of
+    :attr:`colour.io.IMAGE_SCANLINES_CHUNK_SIZE` scanlines through reused
+    buffers: given image is never modified and no full size copy of it is
+    allocated.
+
     Parameters
     ----------
     image : array_like
@@ -179,10 +464,6 @@ def write_image(image, path, bit_depth='float32', attributes=None):
         bit_depth = bit_depth_specification.openimageio
 
         image = np.asarray(image)
-        image *= bit_depth_specification.domain
-        if bit_depth_specification.clip:
-            image = np.clip(image, 0, bit_depth_specification.domain)
-        image = image.astype(bit_depth_specification.numpy)
 
         if image.ndim == 2:
             height, width = image.shape
@@ -190,6 +471,8 @@ def write_image(image, path, bit_depth='float32', attributes=None):
         else:
             height, width, channels = image.shape
 
+        image = np.reshape(image, (height, width, channels))
+
         specification = ImageSpec(width, height, channels, bit_depth)
         for attribute in attributes:
             name = str(attribute.name)
@@ -201,9 +484,284 @@ def write_image(image, path, bit_depth='float32', attributes=None):
             else:
                 specification.attribute(name, type_, value)
 
+        domain = bit_depth_specification.domain
+        scale = domain != 1 or bit_depth_specification.clip
+
+        chunk_size = max(min(IMAGE_SCANLINES_CHUNK_SIZE, height), 1)
+        chunk_shape = (chunk_size, width, channels)
+        output = np.empty(chunk_shape, dtype=bit_depth_specification.numpy)
+        if scale:
+            buffer = np.empty(
+                chunk_shape, dtype=np.promote_types(image.dtype, np.float32))
+
         image_output = ImageOutput.create(path)
         image_output.open(path, specification, ImageOutputOpenMode.Create)
-        image_output.write_image(bit_depth, image.tostring())
-        image_output.close()
+        try:
+            for y in range(0, height, chunk_size):
+                chunk = image[y:y + chunk_size]
+                rows = chunk.shape[0]
+                if scale:
+                    np.multiply(chunk, domain, out=buffer[:rows])
+                    if bit_depth_specification.clip:
+                        np.clip(
+                            buffer[:rows], 0, domain, out=buffer[:rows])
+                    chunk = buffer[:rows]
+
+                np.copyto(output[:rows], chunk, casting='unsafe')
+
+                image_output.write_scanlines(y, y + rows, 0, bit_depth,
+                                             output[:rows].tostring())
+        finally:
+            image_output.close()
 
         return True
+
+
+def _parse_image_sequence_pattern(pattern):
+    """
+    Parses given image sequence pattern.
+
+    Parameters
+    ----------
+    pattern : unicode
+        Image sequence pattern with a frame number token, either a run of
+        *#* characters, e.g. *render.####.exr*, or a *printf* style integer
+        conversion, e.g. *render.%04d.exr*.
+
+    Returns
+    -------
+    tuple
+        Pattern prefix, frame number padding and pattern suffix.
+
+    Raises
+    ------
+    ValueError
+        If the pattern has no frame number token.
+    """
+
+    matches = list(re.finditer('#+|%(0\\d+)?d', pattern))
+    if not matches:
+        raise ValueError(
+            '"{0}" pattern has no frame number token, e.g. "####" or '
+            '"%04d"!'.format(pattern))
+
+    match = matches[-1]
+    token = match.group(0)
+    padding = (len(token)
+               if token.startswith('#') else int(match.group(1) or 0))
+
+    return pattern[:match.start()], padding, pattern[match.end():]
+
+
+def image_sequence_paths(pattern, frames=None):
+    """
+    Returns the paths of the frames of given image sequence pattern.
+
+    Parameters
+    ----------
+    pattern : unicode
+        Image sequence pattern with a frame number token, either a run of
+        *#* characters, e.g. *render.####.exr*, or a *printf* style integer
+        conversion, e.g. *render.%04d.exr*, the token padding being the
+        frame numbers minimum digits count.
+    frames : array_like, optional
+        Frame numbers, default to the frames of the image sequence existing
+        on disk.
+
+    Returns
+    -------
+    list
+        Frames paths sorted by frame number if the frames are discovered on
+        disk.
+
+    Raises
+    ------
+    ValueError
+        If the pattern has no frame number token.
+
+    Examples
+    --------
+    >>> image_sequence_paths('render.####.exr', range(1, 4))
+    ['render.0001.exr', 'render.0002.exr', 'render.0003.exr']
+    >>> image_sequence_paths('render.%d.exr', [9, 10])
+    ['render.9.exr', 'render.10.exr']
+    """
+
+    prefix, padding, suffix = _parse_image_sequence_pattern(pattern)
+
+    if frames is not None:
+        return [
+            '{0}{1:0{2}d}{3}'.format(prefix, frame, padding, suffix)
+            for frame in frames
+        ]
+
+    directory, prefix = os.path.split(prefix)
+    expression = re.compile('^{0}(-?\\d{{{1},}}){2}$'.format(
+        re.escape(prefix), max(padding, 1), re.escape(suffix)))
+
+    frames = []
+    for name in os.listdir(directory or os.curdir):
+        match = expression.match(name)
+        if match is not None:
+            frames.append((int(match.group(1)), name))
+
+    return [os.path.join(directory, name) for _frame, name in sorted(frames)]
+
+
+def read_image_sequence(sequence,
+                        frames=None,
+                        workers=None,
+                        queue_size=None,
+                        reader=read_image,
+                        **kwargs):
+    """
+    Reads given image sequence and yields its frames in order, the next
+    frames being read ahead on a thread pool.
+
+    Reading the frames ahead overlaps the input / output with the frames
+    processing, *OpenImageIO* releasing the *GIL* while reading.
+
+    Parameters
+    ----------
+    sequence : unicode or array_like
+        Image sequence pattern, see
+        :func:`colour.io.image_sequence_paths` definition, or frames paths.
+    frames : array_like, optional
+        Frame numbers of the image sequence pattern, default to the frames
+        existing on disk.
+    workers : integer, optional
+        Thread pool workers count, default to the *CPU* count.
+    queue_size : integer, optional
+        Maximum count of frames read ahead and held in memory, default to
+        twice the workers count.
+    reader : callable, optional
+        Frame reading function called as *reader(path, \\**kwargs)*.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        {:func:`colour.read_image`},
+        Keywords arguments passed to the frame reading function.
+
+    Yields
+    ------
+    ndarray
+        Frames.
+
+    Examples
+    --------
+    >>> for image in read_image_sequence(  # doctest: +SKIP
+    ...         'render.####.exr', bit_depth='float16'):
+    ...     pass
+    """
+
+    paths = (image_sequence_paths(sequence, frames)
+             if is_string(sequence) else sequence)
+    paths = iter(paths)
+
+    if workers is None:
+        workers = multiprocessing.cpu_count()
+
+    if queue_size is None:
+        queue_size = 2 * workers
+
+    pool = ThreadPool(workers)
+    try:
+        results = deque(
+            pool.apply_async(reader, (path, ), kwargs)
+            for path in itertools.islice(paths, max(queue_size, 1)))
+        while results:
+            image = results.popleft().get()
+            for path in itertools.islice(paths, 1):
+                results.append(pool.apply_async(reader, (path, ), kwargs))
+
+            yield image
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def write_image_sequence(images,
+                         sequence,
+                         frames=None,
+                         workers=None,
+                         queue_size=None,
+                         writer=write_image,
+                         **kwargs):
+    """
+    Writes given images as an image sequence, the frames being written on a
+    thread pool while the next images are produced.
+
+    Parameters
+    ----------
+    images : iterable
+        Images to write, e.g. a generator processing the frames yielded by
+        :func:`colour.io.read_image_sequence` definition.
+    sequence : unicode or array_like
+        Image sequence pattern, see
+        :func:`colour.io.image_sequence_paths` definition, or frames paths.
+    frames : array_like, optional
+        Frame numbers of the image sequence pattern, default to the frame
+        numbers starting at 1.
+    workers : integer, optional
+        Thread pool workers count, default to the *CPU* count.
+    queue_size : integer, optional
+        Maximum count of frames being written and held in memory, default to
+        twice the workers count.
+    writer : callable, optional
+        Frame writing function called as *writer(image, path, \\**kwargs)*.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        {:func:`colour.write_image`},
+        Keywords arguments passed to the frame writing function.
+
+    Returns
+    -------
+    integer
+        Written frames count, the images in excess of the frames paths are
+        not written.
+
+    Examples
+    --------
+    >>> images = (  # doctest: +SKIP
+    ...     image * 2 for image in read_image_sequence('render.####.exr'))
+    >>> write_image_sequence(  # doctest: +SKIP
+    ...     images, 'output.####.exr', bit_depth='float16')
+    """
+
+    if is_string(sequence):
+        prefix, padding, suffix = _parse_image_sequence_pattern(sequence)
+        if frames is None:
+            frames = itertools.count(1)
+
+        paths = ('{0}{1:0{2}d}{3}'.format(prefix, frame, padding, suffix)
+                 for frame in frames)
+    else:
+        paths = sequence
+
+    if workers is None:
+        workers = multiprocessing.cpu_count()
+
+    if queue_size is None:
+        queue_size = 2 * workers
+
+    count = 0
+    pool = ThreadPool(workers)
+    try:
+        results = deque()
+        for image, path in zip(images, paths):
+            if len(results) >= max(queue_size, 1):
+                results.popleft().get()
+
+            results.append(pool.apply_async(writer, (image, path), kwargs))
+            count += 1
+
+        while results:
+            results.popleft().get()
+    finally:
+        pool.close()
+        pool.join()
+
+    return count
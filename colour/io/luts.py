@@ -0,0 +1,364 @@
+# -*- coding: utf-8 -*-
+"""
+Look-Up Tables Input / Output
+=============================
+
+Defines various input / output objects for 3-D look-up table files:
+
+-   :func:`colour.io.read_LUT_IridasCube`
+-   :func:`colour.io.write_LUT_IridasCube`
+-   :func:`colour.io.read_LUT_SonySPI3D`
+-   :func:`colour.io.write_LUT_SonySPI3D`
+-   :func:`colour.read_LUT`
+-   :func:`colour.write_LUT`
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import os
+import re
+
+from colour.algebra import LUT3D
+from colour.constants import DEFAULT_FLOAT_DTYPE
+from colour.utilities import CaseInsensitiveMapping
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'read_LUT_IridasCube', 'write_LUT_IridasCube', 'read_LUT_SonySPI3D',
+    'write_LUT_SonySPI3D', 'LUT_READ_METHODS', 'LUT_WRITE_METHODS',
+    'EXTENSION_TO_LUT_FORMAT_MAPPING', 'read_LUT', 'write_LUT'
+]
+
+
+def _parse_LUT_file(path):
+    """
+    Splits given look-up table file into its header lines and its numeric
+    data, parsed at once.
+
+    Parameters
+    ----------
+    path : unicode
+        Look-up table file path.
+
+    Returns
+    -------
+    tuple
+        Header lines and numeric data.
+    """
+
+    header, data = [], []
+    with open(path) as LUT_file:
+        for line in LUT_file:
+            line = line.strip()
+
+            if not line or line.startswith('#'):
+                continue
+
+            if re.match('^[-+.0-9]', line):
+                data.append(line)
+            else:
+                header.append(line)
+
+    return header, np.array(' '.join(data).split(), dtype=DEFAULT_FLOAT_DTYPE)
+
+
+def read_LUT_IridasCube(path):
+    """
+    Reads given *Iridas* *.cube* 3-D look-up table file.
+
+    Parameters
+    ----------
+    path : unicode
+        *Iridas* *.cube* 3-D look-up table file path.
+
+    Returns
+    -------
+    LUT3D
+        3-D look-up table.
+
+    Raises
+    ------
+    ValueError
+        If the file does not define a 3-D look-up table or if its data count
+        does not match its size.
+
+    Examples
+    --------
+    >>> import os
+    >>> path = os.path.join(
+    ...     os.path.dirname(__file__), 'tests', 'resources',
+    ...     'ColourCorrect.cube')
+    >>> LUT = read_LUT_IridasCube(path)
+    >>> LUT.name
+    'Colour Correct'
+    >>> LUT.size
+    4
+    """
+
+    header, data = _parse_LUT_file(path)
+
+    name = os.path.splitext(os.path.basename(path))[0]
+    size = None
+    domain = np.array([[0, 0, 0], [1, 1, 1]], dtype=DEFAULT_FLOAT_DTYPE)
+    for line in header:
+        tokens = line.split(None, 1)
+        keyword = tokens[0]
+        if keyword == 'TITLE':
+            name = tokens[1].strip('"')
+        elif keyword == 'LUT_3D_SIZE':
+            size = int(tokens[1])
+        elif keyword == 'DOMAIN_MIN':
+            domain[0] = np.array(tokens[1].split(), DEFAULT_FLOAT_DTYPE)
+        elif keyword == 'DOMAIN_MAX':
+            domain[1] = np.array(tokens[1].split(), DEFAULT_FLOAT_DTYPE)
+        elif keyword == 'LUT_1D_SIZE':
+            raise ValueError(
+                '"{0}" file defines a 1-D look-up table, only 3-D look-up '
+                'tables are supported!'.format(path))
+
+    if size is None:
+        raise ValueError(
+            '"{0}" file does not define a 3-D look-up table size!'.format(
+                path))
+
+    if data.size != size ** 3 * 3:
+        raise ValueError(
+            '"{0}" file data count does not match its size!'.format(path))
+
+    # Red index changes fastest in *.cube* files.
+    table = data.reshape(size, size, size, 3).transpose(2, 1, 0, 3)
+
+    return LUT3D(np.ascontiguousarray(table), domain, name)
+
+
+def write_LUT_IridasCube(LUT, path, decimals=7):
+    """
+    Writes given 3-D look-up table to given *Iridas* *.cube* 3-D look-up
+    table file.
+
+    Parameters
+    ----------
+    LUT : LUT3D
+        3-D look-up table to write.
+    path : unicode
+        *Iridas* *.cube* 3-D look-up table file path.
+    decimals : integer, optional
+        Formatting decimals.
+
+    Returns
+    -------
+    bool
+        Definition success.
+    """
+
+    table = LUT.table.transpose(2, 1, 0, 3).reshape(-1, 3)
+
+    with open(path, 'w') as LUT_file:
+        if LUT.name is not None:
+            LUT_file.write('TITLE "{0}"\n'.format(LUT.name))
+
+        LUT_file.write('LUT_3D_SIZE {0}\n'.format(LUT.size))
+
+        for keyword, values in zip(('DOMAIN_MIN', 'DOMAIN_MAX'), LUT.domain):
+            LUT_file.write('{0} {1}\n'.format(
+                keyword, ' '.join('{0:.{1}f}'.format(value, decimals)
+                                  for value in values)))
+
+        np.savetxt(LUT_file, table, '%.{0}f'.format(decimals))
+
+    return True
+
+
+def read_LUT_SonySPI3D(path):
+    """
+    Reads given *Sony* *.spi3d* 3-D look-up table file.
+
+    Parameters
+    ----------
+    path : unicode
+        *Sony* *.spi3d* 3-D look-up table file path.
+
+    Returns
+    -------
+    LUT3D
+        3-D look-up table.
+
+    Raises
+    ------
+    ValueError
+        If the file data count does not match its size.
+
+    Examples
+    --------
+    >>> import os
+    >>> path = os.path.join(
+    ...     os.path.dirname(__file__), 'tests', 'resources',
+    ...     'ColourCorrect.spi3d')
+    >>> LUT = read_LUT_SonySPI3D(path)
+    >>> LUT.name
+    'ColourCorrect'
+    >>> LUT.size
+    4
+    """
+
+    with open(path) as LUT_file:
+        lines = [line.strip() for line in LUT_file if line.strip()]
+
+    size = int(lines[2].split()[0])
+    data = np.array(
+        ' '.join(lines[3:]).split(), dtype=DEFAULT_FLOAT_DTYPE).reshape(-1, 6)
+
+    if data.shape[0] != size ** 3:
+        raise ValueError(
+            '"{0}" file data count does not match its size!'.format(path))
+
+    indexes = data[..., 0:3].astype(np.intp)
+    table = np.zeros((size, size, size, 3), dtype=DEFAULT_FLOAT_DTYPE)
+    table[indexes[..., 0], indexes[..., 1], indexes[..., 2]] = data[..., 3:6]
+
+    return LUT3D(table, name=os.path.splitext(os.path.basename(path))[0])
+
+
+def write_LUT_SonySPI3D(LUT, path, decimals=7):
+    """
+    Writes given 3-D look-up table to given *Sony* *.spi3d* 3-D look-up table
+    file.
+
+    Parameters
+    ----------
+    LUT : LUT3D
+        3-D look-up table to write.
+    path : unicode
+        *Sony* *.spi3d* 3-D look-up table file path.
+    decimals : integer, optional
+        Formatting decimals.
+
+    Returns
+    -------
+    bool
+        Definition success.
+
+    Raises
+    ------
+    ValueError
+        If the 3-D look-up table domain is not [0, 1].
+    """
+
+    if not np.array_equal(LUT.domain, np.array([[0, 0, 0], [1, 1, 1]])):
+        raise ValueError('"Sony" ".spi3d" files only support 3-D look-up '
+                         'tables with a [0, 1] domain!')
+
+    size = LUT.size
+    indexes = np.indices((size, size, size)).reshape(3, -1).T
+
+    with open(path, 'w') as LUT_file:
+        LUT_file.write('SPILUT 1.0\n3 3\n{0} {0} {0}\n'.format(size))
+
+        np.savetxt(
+            LUT_file,
+            np.hstack([indexes, LUT.table.reshape(-1, 3)]),
+            ' '.join(['%d'] * 3 + ['%.{0}f'.format(decimals)] * 3))
+
+    return True
+
+
+LUT_READ_METHODS = CaseInsensitiveMapping({
+    'Iridas Cube': read_LUT_IridasCube,
+    'Sony SPI3D': read_LUT_SonySPI3D,
+})
+LUT_READ_METHODS.__doc__ = """
+Supported 3-D look-up table reading methods.
+
+LUT_READ_METHODS : CaseInsensitiveMapping
+    **{'Iridas Cube', 'Sony SPI3D'}**
+"""
+
+LUT_WRITE_METHODS = CaseInsensitiveMapping({
+    'Iridas Cube': write_LUT_IridasCube,
+    'Sony SPI3D': write_LUT_SonySPI3D,
+})
+LUT_WRITE_METHODS.__doc__ = """
+Supported 3-D look-up table writing methods.
+
+LUT_WRITE_METHODS : CaseInsensitiveMapping
+    **{'Iridas Cube', 'Sony SPI3D'}**
+"""
+
+EXTENSION_TO_LUT_FORMAT_MAPPING = CaseInsensitiveMapping({
+    '.cube': 'Iridas Cube',
+    '.spi3d': 'Sony SPI3D',
+})
+"""
+Extension to 3-D look-up table format mapping.
+
+EXTENSION_TO_LUT_FORMAT_MAPPING : CaseInsensitiveMapping
+    **{'.cube', '.spi3d'}**
+"""
+
+
+def read_LUT(path, method=None):
+    """
+    Reads given 3-D look-up table file using given method.
+
+    Parameters
+    ----------
+    path : unicode
+        3-D look-up table file path.
+    method : unicode, optional
+        **{None, 'Iridas Cube', 'Sony SPI3D'}**,
+        Reading method, if *None*, it is defined by the file extension.
+
+    Returns
+    -------
+    LUT3D
+        3-D look-up table.
+
+    Examples
+    --------
+    >>> import os
+    >>> path = os.path.join(
+    ...     os.path.dirname(__file__), 'tests', 'resources',
+    ...     'ColourCorrect.cube')
+    >>> read_LUT(path).name
+    'Colour Correct'
+    """
+
+    if method is None:
+        method = EXTENSION_TO_LUT_FORMAT_MAPPING[os.path.splitext(path)[1]]
+
+    return LUT_READ_METHODS[method](path)
+
+
+def write_LUT(LUT, path, decimals=7, method=None):
+    """
+    Writes given 3-D look-up table to given file using given method.
+
+    Parameters
+    ----------
+    LUT : LUT3D
+        3-D look-up table to write.
+    path : unicode
+        3-D look-up table file path.
+    decimals : integer, optional
+        Formatting decimals.
+    method : unicode, optional
+        **{None, 'Iridas Cube', 'Sony SPI3D'}**,
+        Writing method, if *None*, it is defined by the file extension.
+
+    Returns
+    -------
+    bool
+        Definition success.
+    """
+
+    if method is None:
+        method = EXTENSION_TO_LUT_FORMAT_MAPPING[os.path.splitext(path)[1]]
+
+    return LUT_WRITE_METHODS[method](LUT, path, decimals)
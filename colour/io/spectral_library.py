@@ -0,0 +1,489 @@
+# -*- coding: utf-8 -*-
+"""
+Binary Spectral Library Input / Output
+======================================
+
+Defines the :class:`colour.SpectralLibrary` class and
+:func:`colour.write_spectral_library` definition handling binary spectral
+library files.
+
+A spectral library file stores a shared wavelengths axis, a matrix of
+*float32* or *float64* spectral values, one row per spectrum, the spectra
+labels and metadata. The arrays are stored uncompressed and aligned so that
+they are memory mapped with :class:`numpy.memmap` class when the library is
+opened: opening a library with millions of spectra is immediate and only the
+fetched spectra are read from disk.
+
+The file layout is as follows:
+
+-   *COLOURSL* magic string.
+-   Header length as a little-endian unsigned 64-bit integer.
+-   *JSON* header with the arrays dtypes, shapes and offsets and the
+    metadata.
+-   Wavelengths, values, labels, sorted labels and sorted labels indexes
+    arrays, each aligned on :attr:`colour.io.spectral_library.\
+SPECTRAL_LIBRARY_ALIGNMENT` bytes.
+
+The sorted labels and their indexes allow the labels to be resolved to rows
+with a binary search on the memory mapped arrays, without building any
+*dict*.
+"""
+
+from __future__ import division, unicode_literals
+
+import json
+import numpy as np
+import struct
+
+from colour.colorimetry import MultiSpectralPowerDistribution
+from colour.utilities import is_string
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'SPECTRAL_LIBRARY_MAGIC', 'SPECTRAL_LIBRARY_VERSION',
+    'SPECTRAL_LIBRARY_ALIGNMENT', 'SpectralLibrary', 'read_spectral_library',
+    'write_spectral_library'
+]
+
+SPECTRAL_LIBRARY_MAGIC = b'COLOURSL'
+"""
+Binary spectral library file magic string.
+
+SPECTRAL_LIBRARY_MAGIC : bytes
+"""
+
+SPECTRAL_LIBRARY_VERSION = 1
+"""
+Binary spectral library file format version.
+
+SPECTRAL_LIBRARY_VERSION : integer
+"""
+
+SPECTRAL_LIBRARY_ALIGNMENT = 64
+"""
+Binary spectral library file arrays alignment in bytes.
+
+SPECTRAL_LIBRARY_ALIGNMENT : integer
+"""
+
+_SPECTRAL_LIBRARY_CHUNK_SIZE = 8192
+"""
+Spectra count written at once by :func:`colour.write_spectral_library`
+definition.
+
+_SPECTRAL_LIBRARY_CHUNK_SIZE : integer
+"""
+
+
+def _encode_labels(labels):
+    """
+    Encodes given labels to an *UTF-8* fixed width bytes array.
+    """
+
+    return np.array(
+        [('{0}'.format(label)).encode('utf-8') for label in labels],
+        dtype=bytes)
+
+
+class SpectralLibrary(object):
+    """
+    Defines a binary spectral library, the spectra are memory mapped and
+    fetched on demand as :class:`colour.MultiSpectralPowerDistribution` class
+    instances.
+
+    Parameters
+    ----------
+    path : unicode
+        Spectral library file path.
+
+    Attributes
+    ----------
+    path
+    wavelengths
+    values
+    labels
+    metadata
+
+    Methods
+    -------
+    __len__
+    __contains__
+    __getitem__
+    index
+
+    Raises
+    ------
+    ValueError
+        If the file is not a spectral library file or its version is not
+        supported.
+
+    Examples
+    --------
+    >>> import os
+    >>> import tempfile
+    >>> from colour import STANDARD_OBSERVERS_CMFS
+    >>> cmfs = STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer']
+    >>> path = os.path.join(tempfile.mkdtemp(), 'cmfs.csl')
+    >>> write_spectral_library(cmfs, path, metadata={'name': cmfs.name})
+    True
+    >>> library = SpectralLibrary(path)
+    >>> len(library)
+    3
+    >>> library.metadata['name']
+    'CIE 1931 2 Degree Standard Observer'
+    >>> library['y_bar'].labels
+    ['y_bar']
+    >>> library['y_bar'].values[library.wavelengths == 555]
+    array([[ 1.]])
+    """
+
+    def __init__(self, path):
+        self._path = path
+
+        with open(path, 'rb') as library_file:
+            magic = library_file.read(len(SPECTRAL_LIBRARY_MAGIC))
+            if magic != SPECTRAL_LIBRARY_MAGIC:
+                raise ValueError(
+                    '"{0}" is not a spectral library file!'.format(path))
+
+            length = struct.unpack(str('<Q'), library_file.read(8))[0]
+            header = json.loads(library_file.read(length).decode('utf-8'))
+
+        if header['version'] > SPECTRAL_LIBRARY_VERSION:
+            raise ValueError(
+                '"{0}" spectral library file version {1} is not '
+                'supported!'.format(path, header['version']))
+
+        self._metadata = header['metadata']
+
+        arrays = {}
+        for name, (dtype, shape, offset) in header['arrays'].items():
+            shape = tuple(shape)
+            if np.prod(shape) == 0:
+                arrays[name] = np.empty(shape, dtype=dtype)
+            else:
+                arrays[name] = np.memmap(
+                    path, dtype=dtype, mode='r', offset=offset, shape=shape)
+
+        self._wavelengths = arrays['wavelengths']
+        self._values = arrays['values']
+        self._labels = arrays['labels']
+        self._sorted_labels = arrays['sorted_labels']
+        self._sorted_indexes = arrays['sorted_indexes']
+
+    @property
+    def path(self):
+        """
+        Getter property for the spectral library path.
+
+        Returns
+        -------
+        unicode
+            Spectral library path.
+        """
+
+        return self._path
+
+    @property
+    def wavelengths(self):
+        """
+        Getter property for the spectral library shared wavelengths.
+
+        Returns
+        -------
+        ndarray
+            Spectral library wavelengths.
+        """
+
+        return self._wavelengths
+
+    @property
+    def values(self):
+        """
+        Getter property for the spectral library memory mapped values, one
+        row per spectrum.
+
+        Returns
+        -------
+        memmap
+            Spectral library values.
+        """
+
+        return self._values
+
+    @property
+    def labels(self):
+        """
+        Getter property for the spectral library memory mapped labels, encoded
+        as *UTF-8* bytes.
+
+        Returns
+        -------
+        memmap
+            Spectral library labels.
+        """
+
+        return self._labels
+
+    @property
+    def metadata(self):
+        """
+        Getter property for the spectral library metadata.
+
+        Returns
+        -------
+        dict
+            Spectral library metadata.
+        """
+
+        return self._metadata
+
+    def __len__(self):
+        """
+        Returns the spectral library spectra count.
+
+        Returns
+        -------
+        integer
+            Spectra count.
+        """
+
+        return self._values.shape[0]
+
+    def __contains__(self, label):
+        """
+        Returns whether the spectral library contains given label.
+
+        Parameters
+        ----------
+        label : unicode
+            Label to check.
+
+        Returns
+        -------
+        bool
+            Whether the label is in the spectral library.
+        """
+
+        try:
+            self.index(label)
+            return True
+        except KeyError:
+            return False
+
+    def index(self, labels):
+        """
+        Returns the rows of given labels using a binary search on the memory
+        mapped sorted labels.
+
+        Parameters
+        ----------
+        labels : unicode or array_like
+            Label or labels to find the rows of.
+
+        Returns
+        -------
+        integer or ndarray
+            Label or labels rows.
+
+        Raises
+        ------
+        KeyError
+            If a label is not in the spectral library.
+        """
+
+        is_label = is_string(labels)
+        encoded = _encode_labels([labels] if is_label else labels)
+
+        positions = np.searchsorted(self._sorted_labels, encoded)
+        found = positions < len(self._sorted_labels)
+        found[found] = (
+            self._sorted_labels[positions[found]] == encoded[found])
+        if not np.all(found):
+            raise KeyError('"{0}" labels are not in the spectral library!'
+                           .format([
+                               label.decode('utf-8')
+                               for label in encoded[~found]
+                           ]))
+
+        indexes = np.asarray(self._sorted_indexes[positions])
+
+        return int(indexes[0]) if is_label else indexes
+
+    def __getitem__(self, key):
+        """
+        Returns the spectra of given key.
+
+        Parameters
+        ----------
+        key : unicode or integer or slice or array_like
+            Label, labels, row, slice or rows of the spectra to return.
+
+        Returns
+        -------
+        MultiSpectralPowerDistribution
+            Spectra.
+        """
+
+        if is_string(key):
+            rows = [self.index(key)]
+        elif isinstance(key, slice):
+            rows = key
+        else:
+            rows = np.atleast_1d(key)
+            if rows.dtype.kind not in 'iub':
+                rows = self.index(rows)
+
+        values = np.asarray(self._values[rows])
+        labels = [label.decode('utf-8') for label in self._labels[rows]]
+
+        return MultiSpectralPowerDistribution(
+            np.transpose(values), self._wavelengths, labels=labels)
+
+
+def read_spectral_library(path):
+    """
+    Opens given binary spectral library file.
+
+    Parameters
+    ----------
+    path : unicode
+        Spectral library file path.
+
+    Returns
+    -------
+    SpectralLibrary
+        Spectral library.
+
+    Examples
+    --------
+    >>> library = read_spectral_library('library.csl')  # doctest: +SKIP
+    """
+
+    return SpectralLibrary(path)
+
+
+def write_spectral_library(data, path, dtype=np.float32, metadata=None):
+    """
+    Writes given spectral data to given binary spectral library file.
+
+    Parameters
+    ----------
+    data : MultiSpectralPowerDistribution or tuple
+        Multi-spectral power distribution or *(wavelengths, values, labels)*
+        tuple, the values being of shape (spectra count, wavelengths count),
+        e.g. a :class:`numpy.memmap` class instance, and written in chunks.
+    path : unicode
+        Spectral library file path.
+    dtype : type, optional
+        **{np.float32, np.float64}**,
+        Spectral values type.
+    metadata : dict, optional
+        *JSON* serialisable metadata.
+
+    Returns
+    -------
+    bool
+        Definition success.
+
+    Raises
+    ------
+    ValueError
+        If the dtype is not supported, the values shape does not match the
+        wavelengths and labels or the labels are not unique.
+
+    Examples
+    --------
+    >>> from colour import STANDARD_OBSERVERS_CMFS
+    >>> cmfs = STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer']
+    >>> write_spectral_library(cmfs, 'cmfs.csl')  # doctest: +SKIP
+    True
+    """
+
+    dtype = np.dtype(dtype)
+    if dtype not in (np.float32, np.float64):
+        raise ValueError(
+            '"{0}" dtype is not supported, it must be one of {1}!'.format(
+                dtype, ['float32', 'float64']))
+
+    if isinstance(data, MultiSpectralPowerDistribution):
+        wavelengths, values, labels = (data.wavelengths,
+                                       np.transpose(data.values), data.labels)
+    else:
+        wavelengths, values, labels = data
+        if not hasattr(values, 'shape'):
+            values = np.asarray(values)
+
+    wavelengths = np.asarray(wavelengths, dtype=np.float64)
+    labels = _encode_labels(labels)
+    if values.shape != (len(labels), len(wavelengths)):
+        raise ValueError(
+            'Values shape {0} does not match the {1} labels and {2} '
+            'wavelengths!'.format(values.shape, len(labels), len(wavelengths)))
+
+    sorted_indexes = np.argsort(labels, kind='mergesort').astype(np.int64)
+    sorted_labels = labels[sorted_indexes]
+    if np.any(sorted_labels[1:] == sorted_labels[:-1]):
+        raise ValueError('Spectral library labels must be unique!')
+
+    arrays = [('wavelengths', wavelengths.dtype, wavelengths.shape),
+              ('values', dtype, values.shape), ('labels', labels.dtype,
+                                                labels.shape),
+              ('sorted_labels', sorted_labels.dtype, sorted_labels.shape),
+              ('sorted_indexes', sorted_indexes.dtype, sorted_indexes.shape)]
+
+    def align(offset):
+        """
+        Aligns given offset on the spectral library alignment.
+        """
+
+        return -(-offset // SPECTRAL_LIBRARY_ALIGNMENT
+                 ) * SPECTRAL_LIBRARY_ALIGNMENT
+
+    # The header length depends on the arrays offsets, they are computed
+    # with a fixed width header length placeholder.
+    header = {
+        'version': SPECTRAL_LIBRARY_VERSION,
+        'metadata': metadata if metadata is not None else {},
+        'arrays': dict((name, [dtype_.str, list(shape), 0])
+                       for name, dtype_, shape in arrays),
+    }
+    length = len(json.dumps(header).encode('utf-8')) + 32 * len(arrays)
+    offset = align(len(SPECTRAL_LIBRARY_MAGIC) + 8 + length)
+    for name, dtype_, shape in arrays:
+        header['arrays'][name][2] = offset
+        offset = align(offset + np.dtype(dtype_).itemsize * int(
+            np.prod(shape)))
+
+    header = json.dumps(header).encode('utf-8')
+    header += b' ' * (length - len(header))
+
+    def write_array(library_file, a, dtype_):
+        """
+        Writes given array at the next aligned offset.
+        """
+
+        library_file.write(b'\x00' * (
+            align(library_file.tell()) - library_file.tell()))
+        for i in range(0, max(len(a), 1), _SPECTRAL_LIBRARY_CHUNK_SIZE):
+            np.ascontiguousarray(
+                a[i:i + _SPECTRAL_LIBRARY_CHUNK_SIZE],
+                dtype=dtype_).tofile(library_file)
+
+    with open(path, 'wb') as library_file:
+        library_file.write(SPECTRAL_LIBRARY_MAGIC)
+        library_file.write(struct.pack(str('<Q'), length))
+        library_file.write(header)
+        write_array(library_file, wavelengths, wavelengths.dtype)
+        write_array(library_file, values, dtype)
+        write_array(library_file, labels, labels.dtype)
+        write_array(library_file, sorted_labels, sorted_labels.dtype)
+        write_array(library_file, sorted_indexes, sorted_indexes.dtype)
+
+    return True
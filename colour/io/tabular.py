@@ -6,16 +6,22 @@ CSV Tabular Data Input / Output
 Defines various input / output objects for *CSV* tabular data files:
 
 -   :func:`colour.read_spectral_data_from_csv_file`
+-   :func:`colour.read_spectral_array_from_csv_file`
 -   :func:`colour.read_spds_from_csv_file`
+-   :func:`colour.read_multi_spd_from_csv_file`
 -   :func:`colour.write_spds_to_csv_file`
+-   :func:`colour.write_multi_spd_to_csv_file`
 """
 
 from __future__ import division, unicode_literals
 
+import numpy as np
+import warnings
 from collections import OrderedDict
 import csv
 
-from colour.colorimetry import SpectralPowerDistribution
+from colour.colorimetry import (MultiSpectralPowerDistribution,
+                                SpectralPowerDistribution)
 from colour.constants import DEFAULT_FLOAT_DTYPE
 
 __author__ = 'Colour Developers'
@@ -26,8 +32,9 @@ __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
 __all__ = [
-    'read_spectral_data_from_csv_file', 'read_spds_from_csv_file',
-    'write_spds_to_csv_file'
+    'read_spectral_data_from_csv_file', 'read_spectral_array_from_csv_file',
+    'read_spds_from_csv_file', 'read_multi_spd_from_csv_file',
+    'write_spds_to_csv_file', 'write_multi_spd_to_csv_file'
 ]
 
 
@@ -138,6 +145,110 @@ def read_spectral_data_from_csv_file(path,
         return data
 
 
+def read_spectral_array_from_csv_file(path,
+                                      delimiter=',',
+                                      fields=None,
+                                      default=0):
+    """
+    Reads the spectral data from given *CSV* file and returns it as a single
+    2-D array along with the fields names.
+
+    Unlike :func:`colour.read_spectral_data_from_csv_file` definition, the
+    values are parsed in bulk by *Numpy* without building intermediate *dict*
+    instances, which is considerably faster for large spectral databases.
+    Files with quoted, missing or invalid values, or rows with a fields count
+    different from the fields names count, are parsed row by row with
+    :func:`csv.reader` definition.
+
+    Parameters
+    ----------
+    path : unicode
+        Absolute *CSV* file path.
+    delimiter : unicode, optional
+        *CSV* file content delimiter.
+    fields : array_like, optional
+        *CSV* file spectral data fields names. If no value is provided the
+        first line of the file will be used as spectral data fields names.
+    default : numeric, optional
+        Default value for fields row with missing value.
+
+    Returns
+    -------
+    tuple
+        *CSV* file content as an array of shape (wavelengths, fields), the
+        first column holding the wavelengths, and fields names of the
+        spectral data, i.e. without the wavelengths field name.
+
+    Raises
+    ------
+    RuntimeError
+        If the *CSV* spectral data file doesn't define the appropriate fields.
+    ValueError
+        If a wavelength value is invalid.
+
+    Examples
+    --------
+    >>> import os
+    >>> csv_file = os.path.join(os.path.dirname(__file__), 'tests',
+    ...                         'resources', 'colorchecker_n_ohta.csv')
+    >>> data, labels = read_spectral_array_from_csv_file(csv_file)
+    >>> data.shape
+    (81, 25)
+    >>> print(labels[:4])
+    ['1', '2', '3', '4']
+    >>> data[0, :3]
+    array([  3.80000000e+02,   4.80000000e-02,   1.03000000e-01])
+    """
+
+    with open(path, 'rU') as csv_file:
+        if fields is None:
+            fields = next(csv.reader(csv_file, delimiter=str(delimiter)), [])
+
+        fields = list(fields)
+        if len(fields) < 2:
+            raise RuntimeError(('A "CSV" spectral data file should define '
+                                'the following fields: '
+                                '("wavelength", "field 1", ..., "field n")!'))
+
+        content = csv_file.read().strip()
+
+    lines = content.splitlines()
+    if not lines:
+        return (np.empty((0, len(fields)), dtype=DEFAULT_FLOAT_DTYPE),
+                fields[1:])
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        data = np.fromstring(
+            content.replace(str('\n'), str(delimiter)),
+            dtype=DEFAULT_FLOAT_DTYPE,
+            sep=str(delimiter))
+
+    counts = np.char.count(np.array(lines), str(delimiter))
+    if (data.size == len(lines) * len(fields) and
+            np.all(counts == len(fields) - 1)):
+        data = np.reshape(data, (len(lines), len(fields)))
+    else:
+        rows = []
+        for row in csv.reader(lines, delimiter=str(delimiter)):
+            if not row:
+                continue
+
+            values = [DEFAULT_FLOAT_DTYPE(row[0])]
+            for value in row[1:len(fields)]:
+                try:
+                    values.append(DEFAULT_FLOAT_DTYPE(value))
+                except ValueError:
+                    values.append(default)
+
+            values += [default] * (len(fields) - len(values))
+            rows.append(values)
+
+        data = np.array(rows, dtype=DEFAULT_FLOAT_DTYPE)
+
+    return data, fields[1:]
+
+
 def read_spds_from_csv_file(path, delimiter=',', fields=None, default=0):
     """
     Reads the spectral data from given *CSV* file and return its content as an
@@ -259,13 +370,68 @@ def read_spds_from_csv_file(path, delimiter=',', fields=None, default=0):
                               extrapolator_args={...})
     """
 
-    data = read_spectral_data_from_csv_file(path, delimiter, fields, default)
+    data, labels = read_spectral_array_from_csv_file(path, delimiter, fields,
+                                                     default)
 
-    spds = OrderedDict(((key, SpectralPowerDistribution(value, name=key))
-                        for key, value in data.items()))
+    wavelengths = data[:, 0]
+    spds = OrderedDict(
+        ((label, SpectralPowerDistribution(
+            data[:, i + 1], wavelengths, name=label))
+         for i, label in enumerate(labels)))
     return spds
 
 
+def read_multi_spd_from_csv_file(path,
+                                 delimiter=',',
+                                 fields=None,
+                                 default=0,
+                                 **kwargs):
+    """
+    Reads the spectral data from given *CSV* file and returns its content as
+    a single :class:`colour.MultiSpectralPowerDistribution` class instance.
+
+    Parameters
+    ----------
+    path : unicode
+        Absolute *CSV* file path.
+    delimiter : unicode, optional
+        *CSV* file content delimiter.
+    fields : array_like, optional
+        *CSV* file spectral data fields names. If no value is provided the
+        first line of the file will be used as spectral data fields names.
+    default : numeric, optional
+        Default value for fields row with missing value.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        Keywords arguments passed to the
+        :class:`colour.MultiSpectralPowerDistribution` class, e.g. *name*.
+
+    Returns
+    -------
+    MultiSpectralPowerDistribution
+        Multi-spectral power distribution of given *CSV* file.
+
+    Examples
+    --------
+    >>> import os
+    >>> csv_file = os.path.join(os.path.dirname(__file__), 'tests',
+    ...                         'resources', 'colorchecker_n_ohta.csv')
+    >>> multi_spd = read_multi_spd_from_csv_file(csv_file)
+    >>> multi_spd.shape
+    SpectralShape(380.0, 780.0, 5.0)
+    >>> print(multi_spd.labels[:4])
+    ['1', '2', '3', '4']
+    """
+
+    data, labels = read_spectral_array_from_csv_file(path, delimiter, fields,
+                                                     default)
+
+    return MultiSpectralPowerDistribution(
+        data[:, 1:], data[:, 0], labels=labels, **kwargs)
+
+
 def write_spds_to_csv_file(spds, path, delimiter=',', fields=None):
     """
     Writes the given spectral power distributions to given *CSV* file.
@@ -301,20 +467,90 @@ def write_spds_to_csv_file(spds, path, delimiter=',', fields=None):
                                 'with different shapes to "CSV" file!'))
 
     wavelengths = tuple(spds.values())[0].wavelengths
+    fields = list(fields) if fields is not None else sorted(spds.keys())
+    data = np.column_stack([wavelengths] + [
+        spds[field].values
+        if np.array_equal(spds[field].wavelengths, wavelengths) else
+        spds[field][wavelengths] for field in fields
+    ])
+
+    return write_multi_spd_to_csv_file([(fields, data)], path, delimiter)
+
+
+def write_multi_spd_to_csv_file(data, path, delimiter=',', fmt='%r'):
+    """
+    Writes given multi-spectral power distribution or spectral data chunks to
+    given *CSV* file.
+
+    The rows are formatted and streamed to disk as they are produced, thus
+    an iterator of spectral data chunks, e.g. read from a spectral database
+    in blocks of wavelengths, is written with constant memory.
+
+    Parameters
+    ----------
+    data : MultiSpectralPowerDistribution or iterable
+        Multi-spectral power distribution to write or iterable of
+        *(labels, array)* spectral data chunks, each array being of shape
+        (wavelengths, labels + 1) with its first column holding the
+        wavelengths, i.e. rows of the *CSV* file.
+    path : unicode
+        Absolute *CSV* file path.
+    delimiter : unicode, optional
+        *CSV* file content delimiter.
+    fmt : unicode, optional
+        Values *printf* style format, the default format writes the shortest
+        representation that reads back to the same value.
+
+    Returns
+    -------
+    bool
+        Definition success.
+
+    Raises
+    ------
+    ValueError
+        If the spectral data chunks labels or columns count differ.
+
+    Examples
+    --------
+    >>> import os
+    >>> from colour import STANDARD_OBSERVERS_CMFS
+    >>> cmfs = STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer']
+    >>> csv_file = os.path.join(  # doctest: +SKIP
+    ...     os.path.dirname(__file__), 'cmfs.csv')
+    >>> write_multi_spd_to_csv_file(cmfs, csv_file)  # doctest: +SKIP
+    True
+    """
+
+    if isinstance(data, MultiSpectralPowerDistribution):
+        data = [(data.labels,
+                 np.column_stack([data.wavelengths, data.values]))]
+
     with open(path, 'w') as csv_file:
-        fields = list(fields) if fields is not None else sorted(spds.keys())
-        writer = csv.DictWriter(
-            csv_file,
-            delimiter=str(delimiter),
-            fieldnames=['wavelength'] + fields,
-            lineterminator='\n')
-        # Python 2.7.x / 3.4.x only.
-        # writer.writeheader()
-        writer.writerow(dict((name, name) for name in writer.fieldnames))
-        for wavelength in wavelengths:
-            row = {'wavelength': wavelength}
-            row.update(
-                dict((field, spds[field][wavelength]) for field in fields))
-            writer.writerow(row)
+        fields = None
+        for labels, array in data:
+            labels = [str(label) for label in labels]
+            array = np.atleast_2d(array)
+
+            if fields is None:
+                fields = labels
+                row_format = (
+                    str(delimiter).join([fmt] * (len(fields) + 1)) + '\n')
+                csv.writer(
+                    csv_file, delimiter=str(delimiter),
+                    lineterminator='\n').writerow(['wavelength'] + fields)
+            elif labels != fields:
+                raise ValueError(
+                    '"{0}" labels do not match the previous chunks "{1}" '
+                    'labels!'.format(labels, fields))
+
+            if array.shape[-1] != len(fields) + 1:
+                raise ValueError(
+                    'Spectral data chunk shape {0} does not match the '
+                    '"wavelength" and "{1}" labels!'.format(
+                        array.shape, fields))
+
+            for row in array:
+                csv_file.write(row_format % tuple(row.tolist()))
 
     return True
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.io.cgats` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import codecs
+import numpy as np
+import os
+import shutil
+import unittest
+import tempfile
+
+from colour.colorimetry import MultiSpectralPowerDistribution
+from colour.io import CGATS_Data, read_cgats_file
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['RESOURCES_DIRECTORY', 'CGATS_FILE', 'TestReadCgatsFile']
+
+RESOURCES_DIRECTORY = os.path.join(os.path.dirname(__file__), 'resources')
+
+CGATS_FILE = """CGATS.17
+ORIGINATOR "Colour Developers"
+DESCRIPTOR "Sample Measurements"
+KEYWORD "SAMPLE_LOCATION"
+KEYWORD "FILTER"
+NUMBER_OF_FIELDS 13
+BEGIN_DATA_FORMAT
+SAMPLE_ID SAMPLE_NAME SPECTRAL_NM400 SPECTRAL_NM450 SPECTRAL_NM500
+SPECTRAL_NM550 SPECTRAL_NM600 SPECTRAL_NM650 XYZ_X XYZ_Y XYZ_Z LAB_L LAB_A
+END_DATA_FORMAT
+NUMBER_OF_SETS 2
+BEGIN_DATA
+1 "Dark Skin" 0.05 0.06 0.06 0.07 0.12 0.16 11.2 9.9 6.7 37.7 14.1
+2 "Light Skin" 0.19 0.26 0.32 0.37 0.58 0.62 38.4 35.6 28.8 66.2 18.4
+END_DATA
+"""
+
+
+class TestReadCgatsFile(unittest.TestCase):
+    """
+    Defines :func:`colour.io.cgats.read_cgats_file` definition units tests
+    methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def _write(self, content, name='cgats.txt'):
+        """
+        Writes given content to a temporary file and returns its path.
+        """
+
+        path = os.path.join(self._temporary_directory, name)
+        with codecs.open(path, 'w', encoding='utf-8') as cgats_file:
+            cgats_file.write(content)
+
+        return path
+
+    def test_read_cgats_file(self):
+        """
+        Tests :func:`colour.io.cgats.read_cgats_file` definition.
+        """
+
+        cgats_data = read_cgats_file(
+            os.path.join(RESOURCES_DIRECTORY,
+                         'xrite_digital_colour_checker.txt'))
+        self.assertIsInstance(cgats_data, CGATS_Data)
+        self.assertEqual(cgats_data.keywords['OBSERVER_ANGLE'], '10')
+        self.assertEqual(cgats_data.keywords['CREATED'], '11/14/2014')
+        self.assertListEqual(cgats_data.keywords['KEYWORD'],
+                             ['SampleID', 'SAMPLE_NAME'])
+        self.assertListEqual(cgats_data.labels,
+                             ['X{0}'.format(i) for i in range(1, 11)])
+        self.assertIsInstance(cgats_data.multi_spd,
+                              MultiSpectralPowerDistribution)
+        np.testing.assert_equal(cgats_data.multi_spd.wavelengths,
+                                np.arange(380, 740, 10))
+        self.assertEqual(cgats_data.multi_spd.values[0, 0], 0.0069)
+        self.assertIsNone(cgats_data.XYZ)
+        self.assertIsNone(cgats_data.Lab)
+        np.testing.assert_equal(cgats_data.data['SampleID'],
+                                np.arange(1, 11))
+
+        cgats_data = read_cgats_file(self._write(CGATS_FILE))
+        self.assertEqual(cgats_data.keywords['DESCRIPTOR'],
+                         'Sample Measurements')
+        self.assertEqual(cgats_data.multi_spd.name, 'Sample Measurements')
+        self.assertListEqual(cgats_data.labels, ['Dark Skin', 'Light Skin'])
+        self.assertListEqual(
+            list(cgats_data.data['SAMPLE_NAME']), ['Dark Skin', 'Light Skin'])
+        np.testing.assert_equal(cgats_data.multi_spd.wavelengths,
+                                np.arange(400, 700, 50))
+        np.testing.assert_equal(
+            cgats_data.multi_spd.values,
+            np.array([[0.05, 0.19], [0.06, 0.26], [0.06, 0.32], [0.07, 0.37],
+                      [0.12, 0.58], [0.16, 0.62]]))
+        np.testing.assert_equal(
+            cgats_data.XYZ, np.array([[11.2, 9.9, 6.7], [38.4, 35.6, 28.8]]))
+        self.assertIsNone(cgats_data.Lab)
+
+        cgats_data = read_cgats_file(
+            self._write(CGATS_FILE.replace('SAMPLE_NAME', 'NAME').replace(
+                '\n', '\r\n')))
+        self.assertListEqual(cgats_data.labels, ['1', '2'])
+
+        cgats_data = read_cgats_file(
+            self._write(CGATS_FILE.replace('Light Skin', 'Dark Skin')))
+        self.assertListEqual(cgats_data.labels,
+                             ['Dark Skin', 'Dark Skin (2)'])
+        self.assertListEqual(cgats_data.multi_spd.labels,
+                             ['Dark Skin', 'Dark Skin (2)'])
+        np.testing.assert_equal(cgats_data.multi_spd.values[:, 1],
+                                np.array([0.19, 0.26, 0.32, 0.37, 0.58, 0.62]))
+
+    def test_raise_exception_read_cgats_file(self):
+        """
+        Tests :func:`colour.io.cgats.read_cgats_file` definition raised
+        exception.
+        """
+
+        self.assertRaises(ValueError, read_cgats_file,
+                          self._write(CGATS_FILE.replace('END_DATA\n', '')))
+        self.assertRaises(ValueError, read_cgats_file,
+                          self._write(CGATS_FILE.replace(' 14.1', '')))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,274 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.io.envi` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import codecs
+import numpy as np
+import os
+import shutil
+import unittest
+import tempfile
+
+from colour.colorimetry import SpectralShape
+from colour.io import (ENVI_Image, SpectralResamplingPlan, read_ENVI_header,
+                       read_ENVI_image)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'ENVI_HEADER', 'TestSpectralResamplingPlan', 'TestReadENVIHeader',
+    'TestReadENVIImage'
+]
+
+ENVI_HEADER = """ENVI
+description = {
+  Synthetic Cube}
+samples = 4
+lines = 3
+bands = 6
+header offset = {offset}
+file type = ENVI Standard
+data type = {data_type}
+interleave = {interleave}
+byte order = {byte_order}
+band names = {
+ Band 1, Band 2, Band 3,
+ Band 4, Band 5, Band 6}
+wavelength units = {units}
+wavelength = {
+ {wavelengths}}
+"""
+
+
+class TestSpectralResamplingPlan(unittest.TestCase):
+    """
+    Defines :class:`colour.io.envi.SpectralResamplingPlan` class units tests
+    methods.
+    """
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('from_wavelengths', 'apply')
+
+        for method in required_methods:
+            self.assertIn(method, dir(SpectralResamplingPlan))
+
+    def test_from_wavelengths(self):
+        """
+        Tests :func:`colour.io.envi.SpectralResamplingPlan.from_wavelengths`
+        method.
+        """
+
+        plan = SpectralResamplingPlan.from_wavelengths(
+            [397.66, 401.2, 404.1, 408.3, 411.5, 414.9])
+        self.assertEqual(plan.shape, SpectralShape(399, 414, 3))
+        np.testing.assert_equal(plan.indexes, np.array([0, 1, 2, 2, 3, 4]))
+
+        plan = SpectralResamplingPlan.from_wavelengths(
+            [400, 410, 425, 430, 440, 450], 5)
+        self.assertEqual(plan.shape, SpectralShape(400, 450, 5))
+
+    def test_apply(self):
+        """
+        Tests :func:`colour.io.envi.SpectralResamplingPlan.apply` method.
+        """
+
+        wavelengths = np.array([400, 410, 425, 430, 440, 450])
+        plan = SpectralResamplingPlan.from_wavelengths(wavelengths, 5)
+        msa = np.tile(wavelengths / 100, (2, 3, 1))
+
+        np.testing.assert_almost_equal(
+            plan.apply(msa), np.tile(plan.shape.range() / 100, (2, 3, 1)),
+            decimal=7)
+
+
+class TestReadENVIHeader(unittest.TestCase):
+    """
+    Defines :func:`colour.io.envi.read_ENVI_header` definition units tests
+    methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def _write(self, content):
+        """
+        Writes given header content to a temporary file and returns its path.
+        """
+
+        path = os.path.join(self._temporary_directory, 'cube.hdr')
+        with codecs.open(path, 'w', encoding='utf-8') as header_file:
+            header_file.write(content)
+
+        return path
+
+    def test_read_ENVI_header(self):
+        """
+        Tests :func:`colour.io.envi.read_ENVI_header` definition.
+        """
+
+        header = read_ENVI_header(
+            self._write(
+                ENVI_HEADER.replace('{offset}', '0').replace(
+                    '{data_type}', '4').replace('{interleave}', 'bsq').replace(
+                        '{byte_order}', '0').replace(
+                            '{units}', 'Nanometers').replace(
+                                '{wavelengths}',
+                                '400.0, 410.0, 420.0,\n 430.0, 440, 450')))
+
+        self.assertEqual(header['description'], 'Synthetic Cube')
+        self.assertEqual(header['samples'], 4)
+        self.assertEqual(header['lines'], 3)
+        self.assertEqual(header['bands'], 6)
+        self.assertEqual(header['data type'], 4)
+        self.assertEqual(header['file type'], 'ENVI Standard')
+        self.assertListEqual(header['band names'],
+                             ['Band {0}'.format(i) for i in range(1, 7)])
+        np.testing.assert_equal(header['wavelength'], np.arange(400, 460, 10))
+
+    def test_raise_exception_read_ENVI_header(self):
+        """
+        Tests :func:`colour.io.envi.read_ENVI_header` definition raised
+        exception.
+        """
+
+        self.assertRaises(ValueError, read_ENVI_header,
+                          self._write('samples = 4\nlines = 3\n'))
+
+
+class TestReadENVIImage(unittest.TestCase):
+    """
+    Defines :func:`colour.io.envi.read_ENVI_image` definition units tests
+    methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+        self._cube = np.random.RandomState(4).random_sample((3, 4, 6))
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def _write(self,
+               interleave='bsq',
+               data_type=4,
+               dtype='<f4',
+               offset=0,
+               units='Nanometers',
+               wavelengths='400, 410, 420, 430, 440, 450',
+               extension='.img'):
+        """
+        Writes the synthetic cube to temporary header and data files and
+        returns the header file path.
+        """
+
+        cube = self._cube
+        if interleave == 'bsq':
+            cube = np.transpose(cube, (2, 0, 1))
+        elif interleave == 'bil':
+            cube = np.transpose(cube, (0, 2, 1))
+
+        path = os.path.join(self._temporary_directory, 'cube.hdr')
+        with codecs.open(path, 'w', encoding='utf-8') as header_file:
+            header_file.write(
+                ENVI_HEADER.replace('{offset}', str(offset)).replace(
+                    '{data_type}', str(data_type)).replace(
+                        '{interleave}', interleave).replace(
+                            '{byte_order}', '1' if dtype.startswith('>') else
+                            '0').replace('{units}', units).replace(
+                                '{wavelengths}', wavelengths))
+
+        with open(os.path.join(self._temporary_directory, 'cube' + extension),
+                  'wb') as data_file:
+            data_file.write(b'\x00' * offset)
+            data_file.write(np.ascontiguousarray(cube, dtype=dtype).tobytes())
+
+        return path
+
+    def test_read_ENVI_image(self):
+        """
+        Tests :func:`colour.io.envi.read_ENVI_image` definition.
+        """
+
+        for interleave in ('bsq', 'bil', 'bip'):
+            image = read_ENVI_image(self._write(interleave))
+            self.assertIsInstance(image, ENVI_Image)
+            self.assertIsInstance(image.data.base, np.memmap)
+            self.assertTupleEqual(image.data.shape, (3, 4, 6))
+            np.testing.assert_almost_equal(image.data, self._cube, decimal=7)
+            self.assertEqual(image.shape, SpectralShape(400, 450, 10))
+            self.assertIsNone(image.resampling_plan)
+
+        os.remove(os.path.join(self._temporary_directory, 'cube.img'))
+        image = read_ENVI_image(
+            self._write('bil', 5, '>f8', 128, extension='.bil'))
+        os.remove(os.path.join(self._temporary_directory, 'cube.bil'))
+        self.assertEqual(image.data.dtype, np.dtype('>f8'))
+        np.testing.assert_equal(image.data, self._cube)
+
+        image = read_ENVI_image(
+            self._write(units='Micrometers',
+                        wavelengths='0.4, 0.41, 0.42, 0.43, 0.44, 0.45'))
+        self.assertEqual(image.shape, SpectralShape(400, 450, 10))
+
+        image = read_ENVI_image(
+            self._write(wavelengths='397.66, 401.2, 404.1, 408.3, 411.5, '
+                        '414.9'))
+        self.assertIsInstance(image.resampling_plan, SpectralResamplingPlan)
+        self.assertEqual(image.shape, SpectralShape(399, 414, 3))
+        self.assertTupleEqual(
+            image.resampling_plan.apply(image.data).shape, (3, 4, 6))
+
+        image = read_ENVI_image(self._write(wavelengths=''))
+        self.assertIsNone(image.shape)
+        self.assertIsNone(image.resampling_plan)
+
+    def test_raise_exception_read_ENVI_image(self):
+        """
+        Tests :func:`colour.io.envi.read_ENVI_image` definition raised
+        exception.
+        """
+
+        self.assertRaises(ValueError, read_ENVI_image,
+                          self._write(data_type=7))
+        self.assertRaises(ValueError, read_ENVI_image,
+                          self._write(interleave='bxp'))
+
+        os.remove(os.path.join(self._temporary_directory, 'cube.img'))
+        self.assertRaises(ValueError, read_ENVI_image,
+                          os.path.join(self._temporary_directory, 'cube.hdr'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -11,8 +11,10 @@ import shutil
 import unittest
 import tempfile
 
-from colour.colorimetry import SpectralPowerDistribution
-from colour.io.ies_tm2714 import IES_TM2714_Header, IES_TM2714_Spd
+from colour.colorimetry import (MultiSpectralPowerDistribution,
+                                SpectralPowerDistribution, SpectralShape)
+from colour.io.ies_tm2714 import (IES_TM2714_Header, IES_TM2714_Spd,
+                                  read_ies_tm2714_directory)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -24,7 +26,8 @@ __status__ = 'Production'
 __all__ = [
     'RESOURCES_DIRECTORY', 'FLUORESCENT_FILE_HEADER',
     'FLUORESCENT_FILE_SPECTRAL_DESCRIPTION', 'FLUORESCENT_FILE_SPECTRAL_DATA',
-    'TestIES_TM2714_Header', 'TestIES_TM2714_Spd'
+    'TestIES_TM2714_Header', 'TestIES_TM2714_Spd',
+    'TestReadIES_TM2714Directory'
 ]
 
 RESOURCES_DIRECTORY = os.path.join(os.path.dirname(__file__), 'resources')
@@ -249,5 +252,80 @@ class TestIES_TM2714_Spd(unittest.TestCase):
         self.assertEquals(spd_r, spd_t)
 
 
+class TestReadIES_TM2714Directory(unittest.TestCase):
+    """
+    Defines :func:`colour.io.iestm2714.read_ies_tm2714_directory` definition
+    unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+        self._spd = IES_TM2714_Spd(
+            os.path.join(RESOURCES_DIRECTORY, 'Fluorescent.spdx'))
+        self._spd.read()
+        for name in ('Lamp A', 'Lamp B', 'Lamp C'):
+            self._spd.path = os.path.join(self._temporary_directory,
+                                          '{0}.spdx'.format(name))
+            self._spd.write()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_read_ies_tm2714_directory(self):
+        """
+        Tests :func:`colour.io.iestm2714.read_ies_tm2714_directory`
+        definition.
+        """
+
+        for workers in (1, None):
+            multi_spd = read_ies_tm2714_directory(
+                self._temporary_directory, workers=workers)
+            self.assertIsInstance(multi_spd, MultiSpectralPowerDistribution)
+            self.assertListEqual(multi_spd.labels,
+                                 ['Lamp A', 'Lamp B', 'Lamp C'])
+            np.testing.assert_array_equal(multi_spd.wavelengths,
+                                          self._spd.wavelengths)
+            for i in range(3):
+                np.testing.assert_almost_equal(
+                    multi_spd.values[..., i], self._spd.values, decimal=7)
+
+        self._spd.align(SpectralShape(400, 700, 10))
+        self._spd.path = os.path.join(self._temporary_directory,
+                                      'Lamp D.spdx')
+        self._spd.write()
+
+        multi_spd = read_ies_tm2714_directory(
+            self._temporary_directory, shape=SpectralShape(400, 700, 10))
+        self.assertEqual(multi_spd.shape, SpectralShape(400, 700, 10))
+        self.assertEqual(len(multi_spd.labels), 4)
+
+    def test_raise_exception_read_ies_tm2714_directory(self):
+        """
+        Tests :func:`colour.io.iestm2714.read_ies_tm2714_directory`
+        definition raised exception.
+        """
+
+        self._spd.align(SpectralShape(400, 700, 10))
+        self._spd.path = os.path.join(self._temporary_directory,
+                                      'Lamp D.spdx')
+        self._spd.write()
+
+        self.assertRaises(ValueError, read_ies_tm2714_directory,
+                          self._temporary_directory)
+
+        directory = os.path.join(self._temporary_directory, 'Empty')
+        os.makedirs(directory)
+        self.assertRaises(ValueError, read_ies_tm2714_directory, directory)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,578 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.io.image` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import os
+import shutil
+import sys
+import types
+import unittest
+import tempfile
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+from colour.io import (image_sequence_paths, read_image, read_image_sequence,
+                       read_image_tiles, write_image, write_image_sequence)
+from colour.io.image import ImageAttribute_Specification
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'MockImageSpec', 'MockImageInput', 'MockImageOutputOpenMode',
+    'MockImageOutput', 'mock_OpenImageIO', 'save_image', 'TestReadImage',
+    'TestReadImageTiles', 'TestWriteImage', 'TestImageSequencePaths',
+    'TestReadImageSequence', 'TestWriteImageSequence'
+]
+
+
+class MockImageSpec(object):
+    """
+    Mocks *OpenImageIO* :class:`ImageSpec` class.
+    """
+
+    def __init__(self, width, height, nchannels, format=None, x=0, y=0):
+        self.width = width
+        self.height = height
+        self.nchannels = nchannels
+        self.format = format
+        self.x = x
+        self.y = y
+        self.attributes = {}
+
+    def attribute(self, name, *args):
+        self.attributes[name] = args[-1]
+
+
+class MockImageInput(object):
+    """
+    Mocks *OpenImageIO* :class:`ImageInput` class reading the images of
+    :attr:`MockImageInput.images` attribute, a *dict* of paths and *dict* of
+    subimage and mip level indexes and image data window *x* and *y* offsets
+    and image.
+
+    The scanlines ranges read are recorded in
+    :attr:`MockImageInput.scanlines` attribute.
+    """
+
+    images = {}
+
+    scanlines = []
+
+    def __init__(self, subimages):
+        self._subimages = subimages
+        self._x, self._y, self._image = subimages[(0, 0)]
+
+    @classmethod
+    def open(cls, path):
+        subimages = cls.images.get(path)
+
+        return None if subimages is None else cls(subimages)
+
+    def seek_subimage(self, subimage, miplevel):
+        if (subimage, miplevel) not in self._subimages:
+            return False
+
+        self._x, self._y, self._image = self._subimages[(subimage, miplevel)]
+
+        return True
+
+    def spec(self):
+        height, width, channels = self._image.shape
+
+        return MockImageSpec(width, height, channels, x=self._x, y=self._y)
+
+    def read_scanlines(self, ybegin, yend, z, chbegin, chend, format):
+        self.scanlines.append((ybegin, yend))
+
+        return np.copy(self._image[ybegin - self._y:yend - self._y, :,
+                                   chbegin:chend])
+
+    def close(self):
+        pass
+
+
+class MockImageOutputOpenMode(object):
+    """
+    Mocks *OpenImageIO* :class:`ImageOutputOpenMode` enumeration.
+    """
+
+    Create = 0
+
+
+class MockImageOutput(object):
+    """
+    Mocks *OpenImageIO* :class:`ImageOutput` class, the instances created are
+    stored in :attr:`MockImageOutput.outputs` attribute by path and record
+    their specification and the scanlines written.
+    """
+
+    outputs = {}
+
+    def __init__(self):
+        self.specification = None
+        self.scanlines = []
+
+    @classmethod
+    def create(cls, path):
+        cls.outputs[path] = cls()
+
+        return cls.outputs[path]
+
+    def open(self, path, specification, mode):
+        self.specification = specification
+
+    def write_scanlines(self, ybegin, yend, z, format, data):
+        self.scanlines.append((ybegin, yend, data))
+
+    def close(self):
+        pass
+
+
+def mock_OpenImageIO():
+    """
+    Returns the patchers substituting the mock classes to *OpenImageIO*.
+    """
+
+    OpenImageIO = types.ModuleType(str('OpenImageIO'))
+    OpenImageIO.ImageSpec = MockImageSpec
+    OpenImageIO.ImageInput = MockImageInput
+    OpenImageIO.ImageOutput = MockImageOutput
+    OpenImageIO.ImageOutputOpenMode = MockImageOutputOpenMode
+
+    return [
+        mock.patch.dict(sys.modules, {'OpenImageIO': OpenImageIO}),
+        mock.patch(
+            'colour.io.image.is_openimageio_installed', return_value=True),
+        mock.patch('colour.io.image.IMAGE_SCANLINES_CHUNK_SIZE', 4)
+    ]
+
+
+def save_image(image, path):
+    """
+    Saves given image as a *Numpy* *.npy* file.
+    """
+
+    np.save(path, image)
+
+
+class TestReadImage(unittest.TestCase):
+    """
+    Defines :func:`colour.io.image.read_image` definition units tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._patchers = mock_OpenImageIO()
+        for patcher in self._patchers:
+            patcher.start()
+
+        self._image = np.random.RandomState(4).random_sample((10, 7, 4))
+        MockImageInput.images = {
+            'image.exr': {
+                (0, 0): (3, 5, self._image),
+                (0, 1): (0, 0, self._image[::2, ::2]),
+                (1, 0): (0, 0, self._image[..., :3] * 2),
+            }
+        }
+        MockImageInput.scanlines = []
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        for patcher in reversed(self._patchers):
+            patcher.stop()
+
+    def test_read_image(self):
+        """
+        Tests :func:`colour.io.image.read_image` definition.
+        """
+
+        np.testing.assert_equal(read_image('image.exr'), self._image)
+        self.assertListEqual(MockImageInput.scanlines, [(5, 9), (9, 13),
+                                                        (13, 15)])
+
+        MockImageInput.scanlines = []
+        np.testing.assert_equal(
+            read_image('image.exr', roi=(2, 3, 4, 6), channels=[3, 0]),
+            self._image[3:9, 2:6][..., [3, 0]])
+        self.assertListEqual(MockImageInput.scanlines, [(8, 12), (12, 14)])
+
+        np.testing.assert_equal(
+            read_image('image.exr', roi=(6, 9, 1, 1), channels=[1, 2]),
+            self._image[9:10, 6:7, 1:3])
+
+        np.testing.assert_equal(
+            read_image('image.exr', roi=(1, 4, 5, 1)),
+            self._image[4:5, 1:6])
+
+        image = read_image('image.exr', roi=(6, 9, 1, 1), channels=[3])
+        self.assertTupleEqual(image.shape, (1, 1))
+        np.testing.assert_equal(image, self._image[9:10, 6:7, 3])
+
+        np.testing.assert_equal(
+            read_image('image.exr', channels=2), self._image[..., 2])
+
+        np.testing.assert_equal(
+            read_image('image.exr', subimage=1), self._image[..., :3] * 2)
+
+        np.testing.assert_equal(
+            read_image('image.exr', miplevel=1), self._image[::2, ::2])
+
+    def test_raise_exception_read_image(self):
+        """
+        Tests :func:`colour.io.image.read_image` definition raised exception.
+        """
+
+        self.assertRaises(ValueError, read_image, 'missing.exr')
+        self.assertRaises(
+            ValueError, read_image, 'image.exr', roi=(5, 0, 4, 4))
+        self.assertRaises(
+            ValueError, read_image, 'image.exr', roi=(0, -1, 4, 4))
+        self.assertRaises(ValueError, read_image, 'image.exr', channels=[4])
+        self.assertRaises(ValueError, read_image, 'image.exr', subimage=2)
+
+
+class TestReadImageTiles(unittest.TestCase):
+    """
+    Defines :func:`colour.io.image.read_image_tiles` definition units tests
+    methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._patchers = mock_OpenImageIO()
+        for patcher in self._patchers:
+            patcher.start()
+
+        self._image = np.random.RandomState(4).random_sample((10, 7, 4))
+        MockImageInput.images = {'image.exr': {(0, 0): (3, 5, self._image)}}
+        MockImageInput.scanlines = []
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        for patcher in reversed(self._patchers):
+            patcher.stop()
+
+    def test_read_image_tiles(self):
+        """
+        Tests :func:`colour.io.image.read_image_tiles` definition.
+        """
+
+        tiles = list(read_image_tiles('image.exr'))
+        self.assertListEqual(
+            [slices for slices, _tile in tiles],
+            [(slice(0, 4), slice(0, 7)), (slice(4, 8), slice(0, 7)),
+             (slice(8, 10), slice(0, 7))])
+        for slices, tile in tiles:
+            np.testing.assert_equal(tile, self._image[slices])
+
+        MockImageInput.scanlines = []
+        roi = self._image[2:9, 1:6][..., [0, 2]]
+        tiles = list(
+            read_image_tiles(
+                'image.exr', 3, roi=(1, 2, 5, 7), channels=[0, 2]))
+        self.assertEqual(len(tiles), 6)
+        self.assertListEqual(MockImageInput.scanlines, [(7, 10), (10, 13),
+                                                        (13, 14)])
+
+        image = np.zeros(roi.shape)
+        for slices, tile in tiles:
+            self.assertTupleEqual(tile.shape, roi[slices].shape)
+            image[slices] = tile
+
+        np.testing.assert_equal(image, roi)
+
+    def test_raise_exception_read_image_tiles(self):
+        """
+        Tests :func:`colour.io.image.read_image_tiles` definition raised
+        exception.
+        """
+
+        self.assertRaises(ValueError, next, read_image_tiles('missing.exr'))
+        self.assertRaises(ValueError, next,
+                          read_image_tiles('image.exr', roi=(0, 0, 8, 1)))
+
+
+class TestWriteImage(unittest.TestCase):
+    """
+    Defines :func:`colour.io.image.write_image` definition units tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._patchers = mock_OpenImageIO()
+        for patcher in self._patchers:
+            patcher.start()
+
+        self._image = np.random.RandomState(4).random_sample(
+            (10, 7, 3)) * 2 - 0.5
+        MockImageOutput.outputs = {}
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        for patcher in reversed(self._patchers):
+            patcher.stop()
+
+    def _written(self, path, dtype):
+        """
+        Returns the scanlines ranges written to given path and the image they
+        form.
+        """
+
+        image_output = MockImageOutput.outputs[path]
+        specification = image_output.specification
+
+        return ([(ybegin, yend)
+                 for ybegin, yend, _data in image_output.scanlines],
+                np.reshape(
+                    np.frombuffer(
+                        b''.join(data
+                                 for _ybegin, _yend, data in
+                                 image_output.scanlines),
+                        dtype=dtype), (specification.height,
+                                       specification.width,
+                                       specification.nchannels)))
+
+    def test_write_image(self):
+        """
+        Tests :func:`colour.io.image.write_image` definition.
+        """
+
+        image = np.copy(self._image)
+        image.setflags(write=False)
+
+        self.assertTrue(
+            write_image(image, 'image.tif', 'uint8',
+                        [ImageAttribute_Specification('Compression', 'none')]))
+        np.testing.assert_equal(image, self._image)
+        self.assertDictEqual(
+            MockImageOutput.outputs['image.tif'].specification.attributes,
+            {'Compression': 'none'})
+
+        scanlines, written = self._written('image.tif', np.uint8)
+        self.assertListEqual(scanlines, [(0, 4), (4, 8), (8, 10)])
+        np.testing.assert_equal(
+            written,
+            np.clip(self._image * 255, 0, 255).astype(np.uint8))
+
+        image = np.copy(self._image)
+        write_image(image, 'image.exr', 'float16')
+        np.testing.assert_equal(image, self._image)
+        np.testing.assert_equal(
+            self._written('image.exr', np.float16)[1],
+            self._image.astype(np.float16))
+
+        write_image(self._image[..., 0], 'image.png', 'uint16')
+        scanlines, written = self._written('image.png', np.uint16)
+        self.assertListEqual(scanlines, [(0, 4), (4, 8), (8, 10)])
+        np.testing.assert_equal(
+            written[..., 0],
+            np.clip(self._image[..., 0] * 65535, 0, 65535).astype(np.uint16))
+
+
+class TestImageSequencePaths(unittest.TestCase):
+    """
+    Defines :func:`colour.io.image.image_sequence_paths` definition units tests
+    methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_image_sequence_paths(self):
+        """
+        Tests :func:`colour.io.image.image_sequence_paths` definition.
+        """
+
+        self.assertListEqual(
+            image_sequence_paths('render.####.exr', [1, 2, 10]),
+            ['render.0001.exr', 'render.0002.exr', 'render.0010.exr'])
+
+        self.assertListEqual(
+            image_sequence_paths('v01/render.%03d.exr', [7, 1001]),
+            ['v01/render.007.exr', 'v01/render.1001.exr'])
+
+        self.assertListEqual(
+            image_sequence_paths('render.%d.exr', [9, 10]),
+            ['render.9.exr', 'render.10.exr'])
+
+        for name in ('render.0010.npy', 'render.0002.npy', 'render.0001.npy',
+                     'render.0003.exr', 'other.0004.npy', 'render.01.npy'):
+            open(os.path.join(self._temporary_directory, name), 'w').close()
+
+        pattern = os.path.join(self._temporary_directory, 'render.####.npy')
+        self.assertListEqual(
+            image_sequence_paths(pattern),
+            image_sequence_paths(pattern, [1, 2, 10]))
+
+    def test_raise_exception_image_sequence_paths(self):
+        """
+        Tests :func:`colour.io.image.image_sequence_paths` definition raised
+        exception.
+        """
+
+        self.assertRaises(ValueError, image_sequence_paths, 'render.exr',
+                          [1, 2])
+
+
+class TestReadImageSequence(unittest.TestCase):
+    """
+    Defines :func:`colour.io.image.read_image_sequence` definition units tests
+    methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+        self._pattern = os.path.join(self._temporary_directory,
+                                     'render.####.npy')
+        for frame, path in enumerate(
+                image_sequence_paths(self._pattern, range(1, 13)), 1):
+            save_image(np.full((2, 3, 3), frame), path)
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_read_image_sequence(self):
+        """
+        Tests :func:`colour.io.image.read_image_sequence` definition.
+        """
+
+        for workers, queue_size in ((1, 1), (4, 2), (None, None)):
+            images = list(
+                read_image_sequence(
+                    self._pattern,
+                    workers=workers,
+                    queue_size=queue_size,
+                    reader=np.load))
+            self.assertListEqual([image[0, 0, 0] for image in images],
+                                 list(range(1, 13)))
+
+        images = list(
+            read_image_sequence(
+                self._pattern, frames=[5, 3], reader=np.load))
+        self.assertListEqual([image[0, 0, 0] for image in images], [5, 3])
+
+        paths = image_sequence_paths(self._pattern, [12, 1])
+        images = list(
+            read_image_sequence(paths, reader=np.load, mmap_mode='r'))
+        self.assertListEqual([image[0, 0, 0] for image in images], [12, 1])
+
+    def test_raise_exception_read_image_sequence(self):
+        """
+        Tests :func:`colour.io.image.read_image_sequence` definition raised
+        exception.
+        """
+
+        sequence = read_image_sequence(
+            self._pattern, frames=[1, 99], reader=np.load)
+        next(sequence)
+        self.assertRaises(IOError, next, sequence)
+
+
+class TestWriteImageSequence(unittest.TestCase):
+    """
+    Defines :func:`colour.io.image.write_image_sequence` definition units
+    tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_write_image_sequence(self):
+        """
+        Tests :func:`colour.io.image.write_image_sequence` definition.
+        """
+
+        pattern = os.path.join(self._temporary_directory, 'render.%04d.npy')
+        images = (np.full((2, 3, 3), frame) for frame in range(1, 11))
+
+        self.assertEqual(
+            write_image_sequence(
+                images, pattern, workers=2, queue_size=1, writer=save_image),
+            10)
+
+        paths = image_sequence_paths(pattern)
+        self.assertListEqual(paths, image_sequence_paths(
+            pattern, range(1, 11)))
+        self.assertListEqual(
+            [np.load(path)[0, 0, 0] for path in paths], list(range(1, 11)))
+
+        images = (np.zeros((2, 3, 3)) for _frame in range(4))
+        self.assertEqual(
+            write_image_sequence(
+                images, pattern, frames=[20, 30], writer=save_image), 2)
+        self.assertEqual(len(image_sequence_paths(pattern)), 12)
+
+    def test_raise_exception_write_image_sequence(self):
+        """
+        Tests :func:`colour.io.image.write_image_sequence` definition raised
+        exception.
+        """
+
+        path = os.path.join(self._temporary_directory, 'missing', 'a.npy')
+        self.assertRaises(IOError, write_image_sequence, [np.zeros(3)],
+                          [path], writer=save_image)
+
+
+if __name__ == '__main__':
+    unittest.main()
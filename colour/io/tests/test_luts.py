@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.io.luts` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import os
+import shutil
+import unittest
+import tempfile
+
+from colour.algebra import bake_LUT3D
+from colour.io import (read_LUT_IridasCube, write_LUT_IridasCube,
+                       read_LUT_SonySPI3D, write_LUT_SonySPI3D, read_LUT,
+                       write_LUT)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'RESOURCES_DIRECTORY', 'TestReadLUTIridasCube', 'TestWriteLUTIridasCube',
+    'TestReadLUTSonySPI3D', 'TestWriteLUTSonySPI3D', 'TestReadLUT',
+    'TestWriteLUT'
+]
+
+RESOURCES_DIRECTORY = os.path.join(os.path.dirname(__file__), 'resources')
+
+
+class TestReadLUTIridasCube(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.read_LUT_IridasCube` definition units
+    tests methods.
+    """
+
+    def test_read_LUT_IridasCube(self):
+        """
+        Tests :func:`colour.io.luts.read_LUT_IridasCube` definition.
+        """
+
+        LUT = read_LUT_IridasCube(
+            os.path.join(RESOURCES_DIRECTORY, 'ColourCorrect.cube'))
+
+        self.assertEqual(LUT.name, 'Colour Correct')
+        self.assertEqual(LUT.size, 4)
+        np.testing.assert_almost_equal(
+            LUT.domain, np.array([[0, 0, 0], [1, 1, 1]]), decimal=7)
+        np.testing.assert_almost_equal(
+            LUT.table[1, 2, 3],
+            np.array([0.327217, 0.723692, 1.000000]),
+            decimal=7)
+        np.testing.assert_almost_equal(
+            LUT.table[3, 0, 0],
+            np.array([1.000000, 0.000000, 0.000000]),
+            decimal=7)
+
+
+class TestWriteLUTIridasCube(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.write_LUT_IridasCube` definition units
+    tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_write_LUT_IridasCube(self):
+        """
+        Tests :func:`colour.io.luts.write_LUT_IridasCube` definition.
+        """
+
+        LUT = bake_LUT3D(lambda x: x[..., ::-1] ** 2, 5,
+                         np.array([[-1, 0, 0], [1, 2, 4]]), 'Reverse')
+        path = os.path.join(self._temporary_directory, 'Reverse.cube')
+        write_LUT_IridasCube(LUT, path)
+        LUT_test = read_LUT_IridasCube(path)
+
+        self.assertEqual(LUT_test.name, LUT.name)
+        np.testing.assert_almost_equal(LUT_test.domain, LUT.domain, decimal=7)
+        np.testing.assert_almost_equal(LUT_test.table, LUT.table, decimal=7)
+
+
+class TestReadLUTSonySPI3D(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.read_LUT_SonySPI3D` definition units
+    tests methods.
+    """
+
+    def test_read_LUT_SonySPI3D(self):
+        """
+        Tests :func:`colour.io.luts.read_LUT_SonySPI3D` definition.
+        """
+
+        LUT = read_LUT_SonySPI3D(
+            os.path.join(RESOURCES_DIRECTORY, 'ColourCorrect.spi3d'))
+
+        self.assertEqual(LUT.name, 'ColourCorrect')
+        self.assertEqual(LUT.size, 4)
+        np.testing.assert_almost_equal(
+            LUT.table,
+            read_LUT_IridasCube(
+                os.path.join(RESOURCES_DIRECTORY,
+                             'ColourCorrect.cube')).table,
+            decimal=7)
+
+
+class TestWriteLUTSonySPI3D(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.write_LUT_SonySPI3D` definition units
+    tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_write_LUT_SonySPI3D(self):
+        """
+        Tests :func:`colour.io.luts.write_LUT_SonySPI3D` definition.
+        """
+
+        LUT = bake_LUT3D(lambda x: x[..., ::-1] ** 2, 5)
+        path = os.path.join(self._temporary_directory, 'Reverse.spi3d')
+        write_LUT_SonySPI3D(LUT, path)
+        LUT_test = read_LUT_SonySPI3D(path)
+
+        np.testing.assert_almost_equal(LUT_test.table, LUT.table, decimal=7)
+
+        LUT.domain = np.array([[0, 0, 0], [2, 2, 2]])
+        self.assertRaises(ValueError, write_LUT_SonySPI3D, LUT, path)
+
+
+class TestReadLUT(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.read_LUT` definition units tests methods.
+    """
+
+    def test_read_LUT(self):
+        """
+        Tests :func:`colour.io.luts.read_LUT` definition.
+        """
+
+        LUT_1 = read_LUT(
+            os.path.join(RESOURCES_DIRECTORY, 'ColourCorrect.cube'))
+        LUT_2 = read_LUT(
+            os.path.join(RESOURCES_DIRECTORY, 'ColourCorrect.spi3d'))
+
+        np.testing.assert_almost_equal(LUT_1.table, LUT_2.table, decimal=7)
+
+
+class TestWriteLUT(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.write_LUT` definition units tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_write_LUT(self):
+        """
+        Tests :func:`colour.io.luts.write_LUT` definition.
+        """
+
+        LUT = bake_LUT3D(lambda x: x ** 2, 5)
+        for extension in ('.cube', '.spi3d'):
+            path = os.path.join(self._temporary_directory,
+                                'Square{0}'.format(extension))
+            write_LUT(LUT, path)
+            np.testing.assert_almost_equal(
+                read_LUT(path).table, LUT.table, decimal=7)
+
+        path = os.path.join(self._temporary_directory, 'Square.lut')
+        write_LUT(LUT, path, method='Iridas Cube')
+        np.testing.assert_almost_equal(
+            read_LUT(path, method='Iridas Cube').table, LUT.table, decimal=7)
+
+
+if __name__ == '__main__':
+    unittest.main()
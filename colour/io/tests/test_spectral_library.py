@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.io.spectral_library` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import os
+import shutil
+import unittest
+import tempfile
+
+from colour.colorimetry import (MultiSpectralPowerDistribution,
+                                STANDARD_OBSERVERS_CMFS)
+from colour.io import (SpectralLibrary, read_spectral_library,
+                       write_spectral_library)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['TestSpectralLibrary', 'TestWriteSpectralLibrary']
+
+
+class TestSpectralLibrary(unittest.TestCase):
+    """
+    Defines :class:`colour.io.spectral_library.SpectralLibrary` class units
+    tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+        self._wavelengths = np.arange(380, 790, 10)
+        self._values = np.random.RandomState(4).random_sample(
+            (100, len(self._wavelengths)))
+        self._labels = ['Sample {0}'.format(i) for i in range(100)]
+        self._labels[7] = 'Échantillon'
+
+        self._path = os.path.join(self._temporary_directory, 'library.csl')
+        write_spectral_library(
+            (self._wavelengths, self._values, self._labels),
+            self._path,
+            dtype=np.float64,
+            metadata={'name': 'Random'})
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('path', 'wavelengths', 'values', 'labels',
+                               'metadata')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(SpectralLibrary))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__init__', '__len__', '__contains__',
+                            '__getitem__', 'index')
+
+        for method in required_methods:
+            self.assertIn(method, dir(SpectralLibrary))
+
+    def test__init__(self):
+        """
+        Tests :func:`colour.io.spectral_library.SpectralLibrary.__init__`
+        method.
+        """
+
+        library = read_spectral_library(self._path)
+        self.assertIsInstance(library, SpectralLibrary)
+        self.assertEqual(library.path, self._path)
+        self.assertDictEqual(library.metadata, {'name': 'Random'})
+        self.assertEqual(len(library), 100)
+        self.assertIsInstance(library.values, np.memmap)
+        np.testing.assert_equal(library.wavelengths, self._wavelengths)
+        np.testing.assert_equal(library.values, self._values)
+
+    def test_raise_exception__init__(self):
+        """
+        Tests :func:`colour.io.spectral_library.SpectralLibrary.__init__`
+        method raised exception.
+        """
+
+        path = os.path.join(self._temporary_directory, 'invalid.csl')
+        with open(path, 'wb') as library_file:
+            library_file.write(b'wavelength,1,2,3\n')
+
+        self.assertRaises(ValueError, SpectralLibrary, path)
+
+    def test_index(self):
+        """
+        Tests :func:`colour.io.spectral_library.SpectralLibrary.index` method.
+        """
+
+        library = SpectralLibrary(self._path)
+        self.assertEqual(library.index('Sample 42'), 42)
+        self.assertEqual(library.index('Échantillon'), 7)
+        np.testing.assert_equal(
+            library.index(['Sample 99', 'Sample 0', 'Sample 10']),
+            np.array([99, 0, 10]))
+
+        self.assertRaises(KeyError, library.index, 'Sample 100')
+        self.assertRaises(KeyError, library.index, ['Sample 1', 'Sample'])
+        self.assertIn('Sample 1', library)
+        self.assertNotIn('Sample 7', library)
+
+    def test__getitem__(self):
+        """
+        Tests :func:`colour.io.spectral_library.SpectralLibrary.__getitem__`
+        method.
+        """
+
+        library = SpectralLibrary(self._path)
+
+        multi_spd = library['Sample 42']
+        self.assertIsInstance(multi_spd, MultiSpectralPowerDistribution)
+        self.assertListEqual(multi_spd.labels, ['Sample 42'])
+        np.testing.assert_equal(multi_spd.wavelengths, self._wavelengths)
+        np.testing.assert_equal(multi_spd.values[..., 0], self._values[42])
+
+        multi_spd = library[['Sample 3', 'Échantillon']]
+        self.assertListEqual(multi_spd.labels, ['Sample 3', 'Échantillon'])
+        np.testing.assert_equal(multi_spd.values,
+                                np.transpose(self._values[[3, 7]]))
+
+        self.assertListEqual(library[5:8].labels,
+                             ['Sample 5', 'Sample 6', 'Échantillon'])
+        self.assertListEqual(library[[2, 1]].labels, ['Sample 2', 'Sample 1'])
+
+
+class TestWriteSpectralLibrary(unittest.TestCase):
+    """
+    Defines :func:`colour.io.spectral_library.write_spectral_library`
+    definition units tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_write_spectral_library(self):
+        """
+        Tests :func:`colour.io.spectral_library.write_spectral_library`
+        definition.
+        """
+
+        cmfs = STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer']
+        path = os.path.join(self._temporary_directory, 'cmfs.csl')
+        self.assertTrue(write_spectral_library(cmfs, path))
+
+        library = SpectralLibrary(path)
+        self.assertEqual(library.values.dtype, np.float32)
+        self.assertEqual(library.values.offset % 64, 0)
+        self.assertDictEqual(library.metadata, {})
+        self.assertListEqual(library[:].labels, cmfs.labels)
+        np.testing.assert_almost_equal(
+            library[:].values, cmfs.values, decimal=7)
+
+        values = np.zeros((0, 3))
+        write_spectral_library(([400, 500, 600], values, []), path)
+        self.assertEqual(len(SpectralLibrary(path)), 0)
+
+    def test_raise_exception_write_spectral_library(self):
+        """
+        Tests :func:`colour.io.spectral_library.write_spectral_library`
+        definition raised exception.
+        """
+
+        path = os.path.join(self._temporary_directory, 'invalid.csl')
+        values = np.zeros((2, 3))
+
+        self.assertRaises(ValueError, write_spectral_library,
+                          ([400, 500, 600], values, ['a', 'b']), path,
+                          np.int32)
+        self.assertRaises(ValueError, write_spectral_library,
+                          ([400, 500], values, ['a', 'b']), path)
+        self.assertRaises(ValueError, write_spectral_library,
+                          ([400, 500, 600], values, ['a', 'a']), path)
+
+
+if __name__ == '__main__':
+    unittest.main()
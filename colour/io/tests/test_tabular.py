@@ -12,9 +12,12 @@ import unittest
 import tempfile
 from six import PY2, text_type
 
-from colour.colorimetry import SpectralPowerDistribution
+from colour.colorimetry import (MultiSpectralPowerDistribution,
+                                SpectralPowerDistribution)
 from colour.io import (read_spectral_data_from_csv_file,
-                       read_spds_from_csv_file, write_spds_to_csv_file)
+                       read_spectral_array_from_csv_file,
+                       read_spds_from_csv_file, read_multi_spd_from_csv_file,
+                       write_spds_to_csv_file, write_multi_spd_to_csv_file)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -25,8 +28,9 @@ __status__ = 'Production'
 
 __all__ = [
     'RESOURCES_DIRECTORY', 'COLOURCHECKER_N_OHTA_1',
-    'TestReadSpectralDataFromCsvFile', 'TestReadSpdsFromCsvFile',
-    'TestWriteSpdsToCsvFile'
+    'TestReadSpectralDataFromCsvFile', 'TestReadSpectralArrayFromCsvFile',
+    'TestReadSpdsFromCsvFile', 'TestReadMultiSpdFromCsvFile',
+    'TestWriteSpdsToCsvFile', 'TestWriteMultiSpdToCsvFile'
 ]
 
 RESOURCES_DIRECTORY = os.path.join(os.path.dirname(__file__), 'resources')
@@ -148,6 +152,102 @@ class TestReadSpectralDataFromCsvFile(unittest.TestCase):
         self.assertEqual(data['s_bar'][760], -1)
 
 
+class TestReadSpectralArrayFromCsvFile(unittest.TestCase):
+    """
+    Defines :func:`colour.io.tabular.read_spectral_array_from_csv_file`
+    definition unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_read_spectral_array_from_csv_file(self):
+        """
+        Tests :func:`colour.io.tabular.read_spectral_array_from_csv_file`
+        definition.
+        """
+
+        colour_checker_n_ohta = os.path.join(RESOURCES_DIRECTORY,
+                                             'colorchecker_n_ohta.csv')
+        data, labels = read_spectral_array_from_csv_file(colour_checker_n_ohta)
+        self.assertListEqual(labels, [text_type(x) for x in range(1, 25)])
+        self.assertTupleEqual(data.shape, (81, 25))
+        self.assertDictEqual(
+            dict(zip(data[:, 0], data[:, 1])), COLOURCHECKER_N_OHTA_1)
+
+        linss2_10e_5 = os.path.join(RESOURCES_DIRECTORY, 'linss2_10e_5.csv')
+        data, labels = read_spectral_array_from_csv_file(
+            linss2_10e_5, fields=['wavelength', 'l_bar', 'm_bar', 's_bar'])
+        self.assertListEqual(labels, ['l_bar', 'm_bar', 's_bar'])
+        self.assertEqual(data[data[:, 0] == 760, 3], 0)
+        data, labels = read_spectral_array_from_csv_file(
+            linss2_10e_5,
+            fields=['wavelength', 'l_bar', 'm_bar', 's_bar'],
+            default=-1)
+        self.assertEqual(data[data[:, 0] == 760, 3], -1)
+
+        path = os.path.join(self._temporary_directory, 'invalid.csv')
+        with open(path, 'w') as csv_file:
+            csv_file.write('wavelength,a,b\n400,0.5,\n410,n/a,0.25\n')
+
+        data, labels = read_spectral_array_from_csv_file(path, default=-1)
+        np.testing.assert_equal(data,
+                                np.array([[400, 0.5, -1], [410, -1, 0.25]]))
+
+        path = os.path.join(self._temporary_directory, 'ragged.csv')
+        with open(path, 'w') as csv_file:
+            csv_file.write('wavelength,a,b\n380,1\n385,3,4,9\n')
+
+        data, labels = read_spectral_array_from_csv_file(path, default=-1)
+        np.testing.assert_equal(data, np.array([[380, 1, -1], [385, 3, 4]]))
+
+        path = os.path.join(self._temporary_directory, 'quoted.csv')
+        with open(path, 'w') as csv_file:
+            csv_file.write('"wavelength","a"\n"380","0.1"\n"385","0.2"\n')
+
+        data, labels = read_spectral_array_from_csv_file(path)
+        self.assertListEqual(labels, ['a'])
+        np.testing.assert_equal(data, np.array([[380, 0.1], [385, 0.2]]))
+
+        path = os.path.join(self._temporary_directory, 'header.csv')
+        with open(path, 'w') as csv_file:
+            csv_file.write('wavelength,a,b\n')
+
+        data, labels = read_spectral_array_from_csv_file(path)
+        self.assertListEqual(labels, ['a', 'b'])
+        self.assertTupleEqual(data.shape, (0, 3))
+
+    def test_raise_exception_read_spectral_array_from_csv_file(self):
+        """
+        Tests :func:`colour.io.tabular.read_spectral_array_from_csv_file`
+        definition raised exception.
+        """
+
+        path = os.path.join(self._temporary_directory, 'wavelength.csv')
+        with open(path, 'w') as csv_file:
+            csv_file.write('wavelength\n400\n410\n')
+
+        self.assertRaises(RuntimeError, read_spectral_array_from_csv_file,
+                          path)
+
+        path = os.path.join(self._temporary_directory, 'total.csv')
+        with open(path, 'w') as csv_file:
+            csv_file.write('wavelength,a\n380,0.1\n385,0.2\nTotal,0.3\n')
+
+        self.assertRaises(ValueError, read_spectral_array_from_csv_file, path)
+
+
 class TestReadSpdsFromCsvFile(unittest.TestCase):
     """
     Defines :func:`colour.io.tabular.read_spds_from_csv_file` definition units
@@ -170,6 +270,34 @@ class TestReadSpdsFromCsvFile(unittest.TestCase):
                              COLOURCHECKER_N_OHTA_1, name='1'))
 
 
+class TestReadMultiSpdFromCsvFile(unittest.TestCase):
+    """
+    Defines :func:`colour.io.tabular.read_multi_spd_from_csv_file` definition
+    units tests methods.
+    """
+
+    def test_read_multi_spd_from_csv_file(self):
+        """
+        Tests :func:`colour.io.tabular.read_multi_spd_from_csv_file`
+        definition.
+        """
+
+        colour_checker_n_ohta = os.path.join(RESOURCES_DIRECTORY,
+                                             'colorchecker_n_ohta.csv')
+        multi_spd = read_multi_spd_from_csv_file(
+            colour_checker_n_ohta, name='ColorChecker N Ohta')
+        self.assertIsInstance(multi_spd, MultiSpectralPowerDistribution)
+        self.assertEqual(multi_spd.name, 'ColorChecker N Ohta')
+        self.assertListEqual(multi_spd.labels,
+                             [text_type(x) for x in range(1, 25)])
+
+        spds = read_spds_from_csv_file(colour_checker_n_ohta)
+        np.testing.assert_equal(multi_spd.wavelengths, spds['1'].wavelengths)
+        np.testing.assert_equal(
+            multi_spd.values,
+            np.transpose([spd.values for spd in spds.values()]))
+
+
 class TestWriteSpdsToCsvFile(unittest.TestCase):
     """
     Defines :func:`colour.io.tabular.write_spds_to_csv_file` definition units
@@ -220,5 +348,68 @@ class TestWriteSpdsToCsvFile(unittest.TestCase):
         self.assertEqual(len(spds_test), 1)
 
 
+class TestWriteMultiSpdToCsvFile(unittest.TestCase):
+    """
+    Defines :func:`colour.io.tabular.write_multi_spd_to_csv_file` definition
+    units tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_write_multi_spd_to_csv_file(self):
+        """
+        Tests :func:`colour.io.tabular.write_multi_spd_to_csv_file`
+        definition.
+        """
+
+        colour_checker_n_ohta = os.path.join(RESOURCES_DIRECTORY,
+                                             'colorchecker_n_ohta.csv')
+        multi_spd = read_multi_spd_from_csv_file(colour_checker_n_ohta)
+        colour_checker_n_ohta_test = os.path.join(self._temporary_directory,
+                                                  'colorchecker_n_ohta.csv')
+        self.assertTrue(
+            write_multi_spd_to_csv_file(multi_spd, colour_checker_n_ohta_test))
+        multi_spd_test = read_multi_spd_from_csv_file(
+            colour_checker_n_ohta_test)
+        self.assertListEqual(multi_spd_test.labels, multi_spd.labels)
+        np.testing.assert_equal(multi_spd_test.wavelengths,
+                                multi_spd.wavelengths)
+        np.testing.assert_equal(multi_spd_test.values, multi_spd.values)
+
+        data, labels = read_spectral_array_from_csv_file(colour_checker_n_ohta)
+        chunks = ((labels, data[i:i + 10]) for i in range(0, len(data), 10))
+        write_multi_spd_to_csv_file(
+            chunks, colour_checker_n_ohta_test, delimiter=';', fmt='%.3f')
+        data_test, labels_test = read_spectral_array_from_csv_file(
+            colour_checker_n_ohta_test, delimiter=';')
+        self.assertListEqual(labels_test, labels)
+        np.testing.assert_equal(data_test, data)
+
+    def test_raise_exception_write_multi_spd_to_csv_file(self):
+        """
+        Tests :func:`colour.io.tabular.write_multi_spd_to_csv_file`
+        definition raised exception.
+        """
+
+        path = os.path.join(self._temporary_directory, 'invalid.csv')
+        self.assertRaises(ValueError, write_multi_spd_to_csv_file,
+                          [(['a', 'b'], np.ones((2, 3))),
+                           (['a', 'c'], np.ones((2, 3)))], path)
+        self.assertRaises(ValueError, write_multi_spd_to_csv_file,
+                          [(['a', 'b'], np.ones((2, 2)))], path)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -5,8 +5,11 @@ Defines unit tests for :mod:`colour.io.xrite` module.
 
 from __future__ import division, unicode_literals
 
+import codecs
 import os
+import shutil
 import unittest
+import tempfile
 
 from colour.colorimetry import SpectralPowerDistribution
 from colour.io import read_spds_from_xrite_file
@@ -70,6 +73,20 @@ class TestReadSpdsFromXRiteFile(unittest.TestCase):
     tests methods.
     """
 
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
     def test_read_spds_from_xrite_file(self):
         """
         Tests :func:`colour.io.xrite.read_spds_from_xrite_file` definition.
@@ -85,6 +102,18 @@ class TestReadSpdsFromXRiteFile(unittest.TestCase):
                          SpectralPowerDistribution(
                              COLOURCHECKER_XRITE_1, name='X1'))
 
+        path = os.path.join(self._temporary_directory, 'xrite.txt')
+        with codecs.open(path, 'w', encoding='utf-8') as xrite_file:
+            xrite_file.write('CGATS.17\n'
+                             'BEGIN_DATA_FORMAT\n'
+                             'SAMPLE_ID XYZ_X XYZ_Y XYZ_Z\n'
+                             'END_DATA_FORMAT\n'
+                             'BEGIN_DATA\n'
+                             '1 11.2 9.9 6.7\n'
+                             'END_DATA\n')
+
+        self.assertDictEqual(read_spds_from_xrite_file(path), {})
+
 
 if __name__ == '__main__':
     unittest.main()
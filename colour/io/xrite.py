@@ -10,12 +10,10 @@ Defines input object for *X-Rite* spectral data files:
 
 from __future__ import division, unicode_literals
 
-import codecs
-import re
 from collections import OrderedDict
 
 from colour.colorimetry import SpectralPowerDistribution
-from colour.constants import DEFAULT_FLOAT_DTYPE
+from colour.io.cgats import read_cgats_file
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -43,11 +41,14 @@ def read_spds_from_xrite_file(path):
     -------
     OrderedDict
         :class:`colour.SpectralPowerDistribution` classes of given *X-Rite*
-        file.
+        file, empty if the file has no spectral data.
 
     Notes
     -----
-    -   This parser is minimalistic and absolutely not bullet proof.
+    -   *X-Rite* spectral data files are *CGATS.17* files, they are read with
+        :func:`colour.read_cgats_file` definition which also returns the
+        spectral data as a single
+        :class:`colour.MultiSpectralPowerDistribution` class instance.
 
     Examples
     --------
@@ -61,37 +62,11 @@ def read_spds_from_xrite_file(path):
     ['X1', 'X2', 'X3', 'X4', 'X5', 'X6', 'X7', 'X8', 'X9', 'X10']
     """
 
-    with codecs.open(path, encoding=XRITE_FILE_ENCODING) as xrite_file:
-        lines = xrite_file.read().strip().split('\n')
+    multi_spd = read_cgats_file(path, XRITE_FILE_ENCODING).multi_spd
+    if multi_spd is None:
+        return OrderedDict()
 
-        xrite_spds = OrderedDict()
-        is_spectral_data_format, is_spectral_data = False, False
-        for line in lines:
-            line = line.strip()
-
-            if line == 'END_DATA_FORMAT':
-                is_spectral_data_format = False
-
-            if line == 'END_DATA':
-                is_spectral_data = False
-
-            if is_spectral_data_format:
-                wavelengths = [
-                    DEFAULT_FLOAT_DTYPE(x)
-                    for x in re.findall('nm(\d+)', line)
-                ]
-                index = len(wavelengths)
-
-            if is_spectral_data:
-                tokens = line.split()
-                values = [DEFAULT_FLOAT_DTYPE(x) for x in tokens[-index:]]
-                xrite_spds[tokens[1]] = (SpectralPowerDistribution(
-                    dict(zip(wavelengths, values)), name=tokens[1]))
-
-            if line == 'BEGIN_DATA_FORMAT':
-                is_spectral_data_format = True
-
-            if line == 'BEGIN_DATA':
-                is_spectral_data = True
-
-        return xrite_spds
+    return OrderedDict(
+        (label, SpectralPowerDistribution(
+            multi_spd.values[..., i], multi_spd.wavelengths, name=label))
+        for i, label in enumerate(multi_spd.labels))
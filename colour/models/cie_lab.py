@@ -27,11 +27,10 @@ from __future__ import division, unicode_literals
 
 import numpy as np
 
-from colour.algebra import cartesian_to_polar, polar_to_cartesian
 from colour.colorimetry import ILLUMINANTS
 from colour.constants import CIE_E, CIE_K
 from colour.models import xy_to_xyY, xyY_to_XYZ
-from colour.utilities import tsplit, tstack
+from colour.utilities import as_float_array, tsplit, tstack
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -45,7 +44,8 @@ __all__ = ['XYZ_to_Lab', 'Lab_to_XYZ', 'Lab_to_LCHab', 'LCHab_to_Lab']
 
 def XYZ_to_Lab(
         XYZ,
-        illuminant=ILLUMINANTS['CIE 1931 2 Degree Standard Observer']['D50']):
+        illuminant=ILLUMINANTS['CIE 1931 2 Degree Standard Observer']['D50'],
+        out=None):
     """
     Converts from *CIE XYZ* tristimulus values to *CIE L\*a\*b\** colourspace.
 
@@ -56,6 +56,9 @@ def XYZ_to_Lab(
     illuminant : array_like, optional
         Reference *illuminant* *xy* chromaticity coordinates or *CIE xyY*
         colourspace array.
+    out : ndarray, optional
+        Array to write the *CIE L\*a\*b\** colourspace array into, it may be
+        the *CIE XYZ* tristimulus values array itself for in-place conversion.
 
     Returns
     -------
@@ -80,28 +83,29 @@ def XYZ_to_Lab(
     array([ 37.9856291..., -23.6290768...,  -4.4174661...])
     """
 
-    XYZ = np.asarray(XYZ)
-    XYZ_r = xyY_to_XYZ(xy_to_xyY(illuminant))
+    XYZ = as_float_array(XYZ)
+    XYZ_r = as_float_array(xyY_to_XYZ(xy_to_xyY(illuminant)))
 
     XYZ_f = XYZ / XYZ_r
 
     XYZ_f = np.where(XYZ_f > CIE_E,
                      np.power(XYZ_f, 1 / 3), (CIE_K * XYZ_f + 16) / 116)
 
-    X_f, Y_f, Z_f = tsplit(XYZ_f)
+    X_f, Y_f, Z_f = tsplit(XYZ_f, copy=False)
 
     L = 116 * Y_f - 16
     a = 500 * (X_f - Y_f)
     b = 200 * (Y_f - Z_f)
 
-    Lab = tstack((L, a, b))
+    Lab = tstack((L, a, b), out)
 
     return Lab
 
 
 def Lab_to_XYZ(
         Lab,
-        illuminant=ILLUMINANTS['CIE 1931 2 Degree Standard Observer']['D50']):
+        illuminant=ILLUMINANTS['CIE 1931 2 Degree Standard Observer']['D50'],
+        out=None):
     """
     Converts from *CIE L\*a\*b\** colourspace to *CIE XYZ* tristimulus values.
 
@@ -112,6 +116,9 @@ def Lab_to_XYZ(
     illuminant : array_like, optional
         Reference *illuminant* *xy* chromaticity coordinates or *CIE xyY*
         colourspace array.
+    out : ndarray, optional
+        Array to write the *CIE XYZ* tristimulus values into, it may be the
+        *CIE L\*a\*b\** colourspace array itself for in-place conversion.
 
     Returns
     -------
@@ -136,8 +143,8 @@ def Lab_to_XYZ(
     array([ 0.0704953...,  0.1008    ,  0.0955831...])
     """
 
-    L, a, b = tsplit(Lab)
-    XYZ_r = xyY_to_XYZ(xy_to_xyY(illuminant))
+    L, a, b = tsplit(Lab, copy=False)
+    X_r, Y_r, Z_r = tsplit(xyY_to_XYZ(xy_to_xyY(illuminant)))
 
     f_y = (L + 16) / 116
     f_x = a / 500 + f_y
@@ -147,12 +154,12 @@ def Lab_to_XYZ(
     y_r = np.where(L > CIE_K * CIE_E, ((L + 16) / 116) ** 3, L / CIE_K)
     z_r = np.where(f_z ** 3 > CIE_E, f_z ** 3, (116 * f_z - 16) / CIE_K)
 
-    XYZ = tstack((x_r, y_r, z_r)) * XYZ_r
+    XYZ = tstack((x_r * X_r, y_r * Y_r, z_r * Z_r), out)
 
     return XYZ
 
 
-def Lab_to_LCHab(Lab):
+def Lab_to_LCHab(Lab, out=None):
     """
     Converts from *CIE L\*a\*b\** colourspace to *CIE L\*C\*Hab* colourspace.
 
@@ -160,6 +167,9 @@ def Lab_to_LCHab(Lab):
     ----------
     Lab : array_like
         *CIE L\*a\*b\** colourspace array.
+    out : ndarray, optional
+        Array to write the *CIE L\*C\*Hab* colourspace array into, it may be
+        the *CIE L\*a\*b\** colourspace array itself for in-place conversion.
 
     Returns
     -------
@@ -181,16 +191,17 @@ def Lab_to_LCHab(Lab):
     array([  37.9856291...,   24.0384542...,  190.5892337...])
     """
 
-    L, a, b = tsplit(Lab)
+    L, a, b = tsplit(Lab, copy=False)
 
-    C, H = tsplit(cartesian_to_polar(tstack((a, b))))
+    C = np.hypot(a, b)
+    H = np.degrees(np.arctan2(b, a)) % 360
 
-    LCHab = tstack((L, C, np.degrees(H) % 360))
+    LCHab = tstack((L, C, H), out)
 
     return LCHab
 
 
-def LCHab_to_Lab(LCHab):
+def LCHab_to_Lab(LCHab, out=None):
     """
     Converts from *CIE L\*C\*Hab* colourspace to *CIE L\*a\*b\** colourspace.
 
@@ -198,6 +209,9 @@ def LCHab_to_Lab(LCHab):
     ----------
     LCHab : array_like
         *CIE L\*C\*Hab* colourspace array.
+    out : ndarray, optional
+        Array to write the *CIE L\*a\*b\** colourspace array into, it may be
+        the *CIE L\*C\*Hab* colourspace array itself for in-place conversion.
 
     Returns
     -------
@@ -219,10 +233,12 @@ def LCHab_to_Lab(LCHab):
     array([ 37.9856291..., -23.6290768...,  -4.4174661...])
     """
 
-    L, C, H = tsplit(LCHab)
+    L, C, H = tsplit(LCHab, copy=False)
 
-    a, b = tsplit(polar_to_cartesian(tstack((C, np.radians(H)))))
+    H = np.radians(H)
+    a = C * np.cos(H)
+    b = C * np.sin(H)
 
-    Lab = tstack((L, a, b))
+    Lab = tstack((L, a, b), out)
 
     return Lab
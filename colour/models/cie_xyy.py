@@ -33,8 +33,8 @@ from __future__ import division, unicode_literals
 import numpy as np
 
 from colour.colorimetry import ILLUMINANTS
-from colour.constants import DEFAULT_FLOAT_DTYPE
-from colour.utilities import tsplit, tstack
+from colour.utilities import (as_float_array, get_float_precision, tsplit,
+                              tstack)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -51,7 +51,8 @@ __all__ = [
 
 def XYZ_to_xyY(
         XYZ,
-        illuminant=ILLUMINANTS['CIE 1931 2 Degree Standard Observer']['D50']):
+        illuminant=ILLUMINANTS['CIE 1931 2 Degree Standard Observer']['D50'],
+        out=None):
     """
     Converts from *CIE XYZ* tristimulus values to *CIE xyY* colourspace and
     reference *illuminant*.
@@ -62,6 +63,9 @@ def XYZ_to_xyY(
         *CIE XYZ* tristimulus values.
     illuminant : array_like, optional
         Reference *illuminant* chromaticity coordinates.
+    out : ndarray, optional
+        Array to write the *CIE xyY* colourspace array into, it may be the
+        *CIE XYZ* tristimulus values array itself for in-place conversion.
 
     Returns
     -------
@@ -85,21 +89,22 @@ def XYZ_to_xyY(
     array([ 0.2641477...,  0.3777000...,  0.1008    ])
     """
 
-    XYZ = np.asarray(XYZ)
-    X, Y, Z = tsplit(XYZ)
-    xy_w = np.asarray(illuminant)
+    XYZ = as_float_array(XYZ)
+    X, Y, Z = tsplit(XYZ, copy=False)
+    x_w, y_w = tsplit(illuminant)
 
-    XYZ_n = np.zeros(XYZ.shape)
-    XYZ_n[..., 0:2] = xy_w
+    is_black = np.all(XYZ == 0, axis=-1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        XYZ_s = X + Y + Z
+        x = np.where(is_black, x_w, X / XYZ_s)
+        y = np.where(is_black, y_w, Y / XYZ_s)
 
-    xyY = np.where(
-        np.all(XYZ == 0, axis=-1)[..., np.newaxis], XYZ_n,
-        tstack((X / (X + Y + Z), Y / (X + Y + Z), Y)))
+    xyY = tstack((x, y, Y), out)
 
     return xyY
 
 
-def xyY_to_XYZ(xyY):
+def xyY_to_XYZ(xyY, out=None):
     """
     Converts from *CIE xyY* colourspace to *CIE XYZ* tristimulus values.
 
@@ -107,6 +112,9 @@ def xyY_to_XYZ(xyY):
     ----------
     xyY : array_like
         *CIE xyY* colourspace array.
+    out : ndarray, optional
+        Array to write the *CIE XYZ* tristimulus values into, it may be the
+        *CIE xyY* colourspace array itself for in-place conversion.
 
     Returns
     -------
@@ -130,11 +138,16 @@ def xyY_to_XYZ(xyY):
     array([ 0.0704953...,  0.1008    ,  0.0955831...])
     """
 
-    x, y, Y = tsplit(xyY)
+    x, y, Y = tsplit(xyY, copy=False)
+
+    is_zero = y == 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        Y_y = Y / y
+        X = np.where(is_zero, y, x * Y_y)
+        Z = np.where(is_zero, y, (1 - x - y) * Y_y)
+        Y = np.where(is_zero, y, Y)
 
-    XYZ = np.where((y == 0)[..., np.newaxis],
-                   tstack((y, y, y)),
-                   tstack((x * Y / y, Y, (1 - x - y) * Y / y)))
+    XYZ = tstack((X, Y, Z), out)
 
     return XYZ
 
@@ -187,7 +200,7 @@ def xy_to_xyY(xy, Y=1):
     array([   0.2641477...,    0.3777000...,  100.        ])
     """
 
-    xy = np.asarray(xy)
+    xy = as_float_array(xy)
 
     shape = xy.shape
     # Assuming ``xy`` is actually a *CIE xyY* colourspace array argument and
@@ -197,7 +210,7 @@ def xy_to_xyY(xy, Y=1):
 
     x, y = tsplit(xy)
 
-    xyY = tstack((x, y, np.full(x.shape, Y, DEFAULT_FLOAT_DTYPE)))
+    xyY = tstack((x, y, np.full(x.shape, Y, get_float_precision())))
 
     return xyY
 
@@ -239,7 +252,7 @@ def xyY_to_xy(xyY):
     array([ 0.2641477...,  0.3777000...])
     """
 
-    xyY = np.asarray(xyY)
+    xyY = as_float_array(xyY)
 
     shape = xyY.shape
     # Assuming ``xyY`` is actually a *xy* chromaticity coordinates argument and
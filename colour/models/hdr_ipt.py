@@ -35,7 +35,7 @@ from colour.colorimetry import (
     luminance_Fairchild2011)
 from colour.models.ipt import (IPT_XYZ_TO_LMS_MATRIX, IPT_LMS_TO_XYZ_MATRIX,
                                IPT_LMS_TO_IPT_MATRIX, IPT_IPT_TO_LMS_MATRIX)
-from colour.utilities import dot_vector
+from colour.utilities import as_float_array, dot_vector
 from colour.utilities.documentation import DocstringTuple
 
 __author__ = 'Colour Developers'
@@ -94,8 +94,8 @@ def exponent_hdr_IPT(Y_s, Y_abs, method='Fairchild 2011'):
     1.6891383...
     """
 
-    Y_s = np.asarray(Y_s)
-    Y_abs = np.asarray(Y_abs)
+    Y_s = as_float_array(Y_s)
+    Y_abs = as_float_array(Y_abs)
 
     method_l = method.lower()
     assert method.lower() in [
@@ -100,7 +100,7 @@ JZAZBZ_IZAZBZ_TO_LMS_P_MATRIX : array_like, (3, 3)
 """
 
 
-def XYZ_to_JzAzBz(XYZ_D65, constants=JZAZBZ_CONSTANTS):
+def XYZ_to_JzAzBz(XYZ_D65, constants=JZAZBZ_CONSTANTS, use_LUT=False):
     """
     Converts from *CIE XYZ* tristimulus values to :math:`J_zA_zB_z`
     colourspace.
@@ -112,6 +112,9 @@ def XYZ_to_JzAzBz(XYZ_D65, constants=JZAZBZ_CONSTANTS):
         *CIE Standard Illuminant D Series D65*.
     constants : Structure, optional
         :math:`J_zA_zB_z` colourspace constants.
+    use_LUT : bool, optional
+        Whether to apply a cached *SMPTE ST 2084:2014* look-up table, see
+        :func:`colour.models.oetf_ST2084` definition.
 
     Returns
     -------
@@ -140,7 +143,7 @@ def XYZ_to_JzAzBz(XYZ_D65, constants=JZAZBZ_CONSTANTS):
 
     LMS = dot_vector(JZAZBZ_XYZ_TO_LMS_MATRIX, XYZ_p_D65)
 
-    LMS_p = oetf_ST2084(LMS, 10000, constants)
+    LMS_p = oetf_ST2084(LMS, 10000, constants, use_LUT)
 
     I_z, A_z, B_z = tsplit(dot_vector(JZAZBZ_LMS_P_TO_IZAZBZ_MATRIX, LMS_p))
 
@@ -149,7 +152,7 @@ def XYZ_to_JzAzBz(XYZ_D65, constants=JZAZBZ_CONSTANTS):
     return tstack([J_z, A_z, B_z])
 
 
-def JzAzBz_to_XYZ(JzAzBz, constants=JZAZBZ_CONSTANTS):
+def JzAzBz_to_XYZ(JzAzBz, constants=JZAZBZ_CONSTANTS, use_LUT=False):
     """
     Converts from :math:`J_zA_zB_z` colourspace to *CIE XYZ* tristimulus
     values.
@@ -162,6 +165,9 @@ def JzAzBz_to_XYZ(JzAzBz, constants=JZAZBZ_CONSTANTS):
         yellowness-blueness.
     constants : Structure, optional
         :math:`J_zA_zB_z` colourspace constants.
+    use_LUT : bool, optional
+        Whether to apply a cached *SMPTE ST 2084:2014* look-up table, see
+        :func:`colour.models.eotf_ST2084` definition.
 
     Returns
     -------
@@ -186,7 +192,7 @@ def JzAzBz_to_XYZ(JzAzBz, constants=JZAZBZ_CONSTANTS):
                                     (J_z + constants.d_0)))
     LMS_p = dot_vector(JZAZBZ_IZAZBZ_TO_LMS_P_MATRIX, tstack([I_z, A_z, B_z]))
 
-    LMS = eotf_ST2084(LMS_p, 10000, constants)
+    LMS = eotf_ST2084(LMS_p, 10000, constants, use_LUT)
 
     X_p_D65, Y_p_D65, Z_p_D65 = tsplit(
         dot_vector(JZAZBZ_LMS_TO_XYZ_MATRIX, LMS))
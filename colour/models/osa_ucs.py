@@ -32,7 +32,7 @@ import numpy as np
 from scipy.optimize import fmin
 
 from colour.models import XYZ_to_xyY
-from colour.utilities import dot_vector, tsplit, tstack
+from colour.utilities import as_float_array, dot_vector, tsplit, tstack
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -110,8 +110,8 @@ def XYZ_to_OSA_UCS(XYZ):
 
     C = Lambda / (5.9 * Y_0_es)
     L = (Lambda - 14.4) / 2 ** (1 / 2)
-    j = C * np.dot(RGB_3, np.array([1.7, 8, -9.7]))
-    g = C * np.dot(RGB_3, np.array([-13.7, 17.7, -4]))
+    j = C * np.dot(RGB_3, as_float_array([1.7, 8, -9.7]))
+    g = C * np.dot(RGB_3, as_float_array([-13.7, 17.7, -4]))
 
     return tstack((L, j, g))
 
@@ -160,7 +160,7 @@ def OSA_UCS_to_XYZ(Ljg, optimisation_parameters=None):
     array([  7.0495049...,  10.0799723...,   9.5583020...])
     """
 
-    Ljg = np.asarray(Ljg)
+    Ljg = as_float_array(Ljg)
     shape = Ljg.shape
     Ljg = np.atleast_1d(Ljg.reshape((-1, 3)))
 
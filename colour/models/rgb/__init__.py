@@ -7,7 +7,8 @@ from .derivation import (normalised_primary_matrix,
                          RGB_luminance_equation, RGB_luminance)
 from .rgb_colourspace import RGB_Colourspace
 from .rgb_colourspace import XYZ_to_RGB, RGB_to_XYZ
-from .rgb_colourspace import RGB_to_RGB_matrix, RGB_to_RGB
+from .rgb_colourspace import (RGB_to_RGB_matrix, RGB_to_RGB,
+                              RGB_to_RGB_Pipeline)
 from .transfer_functions import *  # noqa
 from . import transfer_functions
 from .dataset import *  # noqa
@@ -17,8 +18,9 @@ from .aces_it import spectral_to_aces_relative_exposure_values
 from .deprecated import (RGB_to_HSV, HSV_to_RGB, RGB_to_HSL, HSL_to_RGB,
                          RGB_to_CMY, CMY_to_RGB, CMY_to_CMYK, CMYK_to_CMY)
 from .prismatic import RGB_to_Prismatic, Prismatic_to_RGB
-from .ycbcr import (YCBCR_WEIGHTS, RGB_to_YCbCr, YCbCr_to_RGB, RGB_to_YcCbcCrc,
-                    YcCbcCrc_to_RGB)
+from .ycbcr import (YCBCR_WEIGHTS, CHROMA_SUBSAMPLINGS, RGB_to_YCbCr,
+                    YCbCr_to_RGB, RGB_to_YCbCr_subsampled,
+                    YCbCr_subsampled_to_RGB, RGB_to_YcCbcCrc, YcCbcCrc_to_RGB)
 from .ycocg import RGB_to_YCoCg, YCoCg_to_RGB
 from .ictcp import RGB_to_ICTCP, ICTCP_to_RGB
 
@@ -28,7 +30,7 @@ __all__ = [
 ]
 __all__ += ['RGB_Colourspace']
 __all__ += ['XYZ_to_RGB', 'RGB_to_XYZ']
-__all__ += ['RGB_to_RGB_matrix', 'RGB_to_RGB']
+__all__ += ['RGB_to_RGB_matrix', 'RGB_to_RGB', 'RGB_to_RGB_Pipeline']
 __all__ += transfer_functions.__all__
 __all__ += dataset.__all__
 __all__ += ['XYZ_to_sRGB', 'sRGB_to_XYZ']
@@ -39,7 +41,8 @@ __all__ += [
 ]
 __all__ += ['RGB_to_Prismatic', 'Prismatic_to_RGB']
 __all__ += [
-    'YCBCR_WEIGHTS', 'RGB_to_YCbCr', 'YCbCr_to_RGB', 'RGB_to_YcCbcCrc',
+    'YCBCR_WEIGHTS', 'CHROMA_SUBSAMPLINGS', 'RGB_to_YCbCr', 'YCbCr_to_RGB',
+    'RGB_to_YCbCr_subsampled', 'YCbCr_subsampled_to_RGB', 'RGB_to_YcCbcCrc',
     'YcCbcCrc_to_RGB'
 ]
 __all__ += ['RGB_to_YCoCg', 'YCoCg_to_RGB']
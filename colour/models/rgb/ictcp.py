@@ -86,7 +86,7 @@ ICTCP_ICTCP_TO_LMS_P_MATRIX : array_like, (3, 3)
 """
 
 
-def RGB_to_ICTCP(RGB, L_p=10000):
+def RGB_to_ICTCP(RGB, L_p=10000, use_LUT=False):
     """
     Converts from *ITU-R BT.2020* colourspace to :math:`IC_TC_P` colour
     encoding.
@@ -98,6 +98,9 @@ def RGB_to_ICTCP(RGB, L_p=10000):
     L_p : numeric, optional
         Display peak luminance :math:`cd/m^2` for *SMPTE ST 2084:2014*
         non-linear encoding.
+    use_LUT : bool, optional
+        Whether to apply a cached *SMPTE ST 2084:2014* look-up table, see
+        :func:`colour.models.oetf_ST2084` definition.
 
     Returns
     -------
@@ -117,13 +120,13 @@ def RGB_to_ICTCP(RGB, L_p=10000):
     """
 
     LMS = dot_vector(ICTCP_RGB_TO_LMS_MATRIX, RGB)
-    LMS_p = oetf_ST2084(LMS, L_p)
+    LMS_p = oetf_ST2084(LMS, L_p, use_LUT=use_LUT)
     ICTCP = dot_vector(ICTCP_LMS_P_TO_ICTCP_MATRIX, LMS_p)
 
     return ICTCP
 
 
-def ICTCP_to_RGB(ICTCP, L_p=10000):
+def ICTCP_to_RGB(ICTCP, L_p=10000, use_LUT=False):
     """
     Converts from :math:`IC_TC_P` colour encoding to *ITU-R BT.2020*
     colourspace.
@@ -135,6 +138,9 @@ def ICTCP_to_RGB(ICTCP, L_p=10000):
     L_p : numeric, optional
         Display peak luminance :math:`cd/m^2` for *SMPTE ST 2084:2014*
         non-linear encoding.
+    use_LUT : bool, optional
+        Whether to apply a cached *SMPTE ST 2084:2014* look-up table, see
+        :func:`colour.models.eotf_ST2084` definition.
 
     Returns
     -------
@@ -154,7 +160,7 @@ def ICTCP_to_RGB(ICTCP, L_p=10000):
     """
 
     LMS_p = dot_vector(ICTCP_ICTCP_TO_LMS_P_MATRIX, ICTCP)
-    LMS = eotf_ST2084(LMS_p, L_p)
+    LMS = eotf_ST2084(LMS_p, L_p, use_LUT=use_LUT)
     RGB = dot_vector(ICTCP_LMS_TO_RGB_MATRIX, LMS)
 
     return RGB
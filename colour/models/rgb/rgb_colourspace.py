@@ -11,6 +11,7 @@ dataset from :mod:`colour.models.dataset.aces_rgb`, etc... and the following
 -   :func:`colour.RGB_to_XYZ`
 -   :func:`colour.RGB_to_RGB_matrix`
 -   :func:`colour.RGB_to_RGB`
+-   :class:`colour.RGB_to_RGB_Pipeline`
 
 See Also
 --------
@@ -36,7 +37,7 @@ import numpy as np
 from colour.models import (xy_to_XYZ, xy_to_xyY, xyY_to_XYZ)
 from colour.models.rgb import normalised_primary_matrix
 from colour.adaptation import chromatic_adaptation_matrix_VonKries
-from colour.utilities import dot_matrix, dot_vector, is_string
+from colour.utilities import as_float_array, dot_matrix, dot_vector, is_string
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -47,7 +48,7 @@ __status__ = 'Production'
 
 __all__ = [
     'RGB_Colourspace', 'XYZ_to_RGB', 'RGB_to_XYZ', 'RGB_to_RGB_matrix',
-    'RGB_to_RGB'
+    'RGB_to_RGB', 'RGB_to_RGB_Pipeline'
 ]
 
 
@@ -300,7 +301,7 @@ class RGB_Colourspace(object):
             value = np.reshape(value, (3, 2))
         self._primaries = value
 
-        self._derive_transformation_matrices()
+        self._invalidate_derived_transformation_matrices()
 
     @property
     def whitepoint(self):
@@ -330,10 +331,10 @@ class RGB_Colourspace(object):
             assert isinstance(value, (tuple, list, np.ndarray, np.matrix)), (
                 '"{0}" attribute: "{1}" is not a "tuple", "list", "ndarray" '
                 'or "matrix" instance!'.format('whitepoint', value))
-            value = np.asarray(value)
+            value = as_float_array(value)
         self._whitepoint = value
 
-        self._derive_transformation_matrices()
+        self._invalidate_derived_transformation_matrices()
 
     @property
     def illuminant(self):
@@ -387,6 +388,8 @@ class RGB_Colourspace(object):
         if not self._use_derived_RGB_to_XYZ_matrix:
             return self._RGB_to_XYZ_matrix
         else:
+            self._derive_transformation_matrices()
+
             return self._derived_RGB_to_XYZ_matrix
 
     @RGB_to_XYZ_matrix.setter
@@ -396,7 +399,7 @@ class RGB_Colourspace(object):
         """
 
         if value is not None:
-            value = np.asarray(value)
+            value = as_float_array(value)
         self._RGB_to_XYZ_matrix = value
 
     @property
@@ -421,6 +424,8 @@ class RGB_Colourspace(object):
         if not self._use_derived_XYZ_to_RGB_matrix:
             return self._XYZ_to_RGB_matrix
         else:
+            self._derive_transformation_matrices()
+
             return self._derived_XYZ_to_RGB_matrix
 
     @XYZ_to_RGB_matrix.setter
@@ -430,7 +435,7 @@ class RGB_Colourspace(object):
         """
 
         if value is not None:
-            value = np.asarray(value)
+            value = as_float_array(value)
         self._XYZ_to_RGB_matrix = value
 
     @property
@@ -628,6 +633,8 @@ class RGB_Colourspace(object):
 
             return str(a).replace(' [', ' ' * 22 + '[')
 
+        self._derive_transformation_matrices()
+
         return ('{0}\n'
                 '{1}\n\n'
                 'Primaries          : {2}\n'
@@ -723,15 +730,27 @@ class RGB_Colourspace(object):
         """
         Computes the derived transformations matrices, the normalised primary
         matrix and its inverse.
+
+        The matrices are only computed when first needed and are then cached
+        until the primaries or the whitepoint change.
         """
 
-        if hasattr(self, '_primaries') and hasattr(self, '_whitepoint'):
-            if self._primaries is not None and self._whitepoint is not None:
-                npm = normalised_primary_matrix(self._primaries,
-                                                self._whitepoint)
+        if self._derived_RGB_to_XYZ_matrix is not None:
+            return
 
-                self._derived_RGB_to_XYZ_matrix = npm
-                self._derived_XYZ_to_RGB_matrix = np.linalg.inv(npm)
+        if self._primaries is not None and self._whitepoint is not None:
+            npm = normalised_primary_matrix(self._primaries, self._whitepoint)
+
+            self._derived_RGB_to_XYZ_matrix = npm
+            self._derived_XYZ_to_RGB_matrix = np.linalg.inv(npm)
+
+    def _invalidate_derived_transformation_matrices(self):
+        """
+        Invalidates the cached derived transformations matrices.
+        """
+
+        self._derived_RGB_to_XYZ_matrix = None
+        self._derived_XYZ_to_RGB_matrix = None
 
     def use_derived_transformation_matrices(self, usage=True):
         """
@@ -761,7 +780,8 @@ def XYZ_to_RGB(XYZ,
                illuminant_RGB,
                XYZ_to_RGB_matrix,
                chromatic_adaptation_transform='CAT02',
-               encoding_cctf=None):
+               encoding_cctf=None,
+               out=None):
     """
     Converts from *CIE XYZ* tristimulus values to given *RGB* colourspace.
 
@@ -785,6 +805,9 @@ def XYZ_to_RGB(XYZ,
     encoding_cctf : object, optional
         Encoding colour component transfer function (Encoding CCTF) or
         opto-electronic transfer function (OETF / OECF).
+    out : ndarray, optional
+        Array to write the *RGB* colourspace array into, it may be the
+        *CIE XYZ* tristimulus values array itself for in-place conversion.
 
     Returns
     -------
@@ -821,12 +844,15 @@ def XYZ_to_RGB(XYZ,
         xyY_to_XYZ(xy_to_xyY(illuminant_RGB)),
         transform=chromatic_adaptation_transform)
 
-    XYZ_a = dot_vector(M, XYZ)
+    M = dot_matrix(XYZ_to_RGB_matrix, M)
 
-    RGB = dot_vector(XYZ_to_RGB_matrix, XYZ_a)
+    RGB = dot_vector(M, XYZ, out)
 
     if encoding_cctf is not None:
-        RGB = encoding_cctf(RGB)
+        if out is None:
+            RGB = encoding_cctf(RGB)
+        else:
+            out[...] = encoding_cctf(RGB)
 
     return RGB
 
@@ -836,7 +862,8 @@ def RGB_to_XYZ(RGB,
                illuminant_XYZ,
                RGB_to_XYZ_matrix,
                chromatic_adaptation_transform='CAT02',
-               decoding_cctf=None):
+               decoding_cctf=None,
+               out=None):
     """
     Converts from given *RGB* colourspace to *CIE XYZ* tristimulus values.
 
@@ -860,6 +887,9 @@ def RGB_to_XYZ(RGB,
     decoding_cctf : object, optional
         Decoding colour component transfer function (Decoding CCTF) or
         electro-optical transfer function (EOTF / EOCF).
+    out : ndarray, optional
+        Array to write the *CIE XYZ* tristimulus values into, it may be the
+        *RGB* colourspace array itself for in-place conversion.
 
     Returns
     -------
@@ -899,9 +929,9 @@ def RGB_to_XYZ(RGB,
         xyY_to_XYZ(xy_to_xyY(illuminant_XYZ)),
         transform=chromatic_adaptation_transform)
 
-    XYZ = dot_vector(RGB_to_XYZ_matrix, RGB)
+    M = dot_matrix(M, RGB_to_XYZ_matrix)
 
-    XYZ_a = dot_vector(M, XYZ)
+    XYZ_a = dot_vector(M, RGB, out)
 
     return XYZ_a
 
@@ -957,7 +987,8 @@ def RGB_to_RGB(RGB,
                output_colourspace,
                chromatic_adaptation_transform='CAT02',
                apply_decoding_cctf=False,
-               apply_encoding_cctf=False):
+               apply_encoding_cctf=False,
+               out=None):
     """
     Converts from given input *RGB* colourspace to output *RGB* colourspace
     using given *chromatic adaptation* method.
@@ -981,6 +1012,9 @@ def RGB_to_RGB(RGB,
     apply_encoding_cctf : bool, optional
         Apply output colourspace encoding colour component transfer function /
         opto-electronic transfer function.
+    out : ndarray, optional
+        Array to write the output *RGB* colourspace array into, it may be the
+        input *RGB* colourspace array itself for in-place conversion.
 
     Returns
     -------
@@ -1001,6 +1035,11 @@ def RGB_to_RGB(RGB,
     >>> RGB_to_RGB(RGB, sRGB_COLOURSPACE, PROPHOTO_RGB_COLOURSPACE)
     ... # doctest: +ELLIPSIS
     array([ 0.0643561...,  0.1157331...,  0.1158069...])
+    >>> RGB_to_RGB(RGB, sRGB_COLOURSPACE, PROPHOTO_RGB_COLOURSPACE, out=RGB)
+    ... # doctest: +ELLIPSIS
+    array([ 0.0643561...,  0.1157331...,  0.1158069...])
+    >>> RGB  # doctest: +ELLIPSIS
+    array([ 0.0643561...,  0.1157331...,  0.1158069...])
     """
 
     if apply_decoding_cctf:
@@ -1009,9 +1048,338 @@ def RGB_to_RGB(RGB,
     M = RGB_to_RGB_matrix(input_colourspace, output_colourspace,
                           chromatic_adaptation_transform)
 
-    RGB = dot_vector(M, RGB)
+    RGB = dot_vector(M, RGB, out)
 
     if apply_encoding_cctf:
-        RGB = output_colourspace.encoding_cctf(RGB)
+        if out is None:
+            RGB = output_colourspace.encoding_cctf(RGB)
+        else:
+            out[...] = output_colourspace.encoding_cctf(RGB)
 
     return RGB
+
+
+class RGB_to_RGB_Pipeline(object):
+    """
+    Implements a precompiled conversion from given input *RGB* colourspace to
+    output *RGB* colourspace for repeated application, e.g. on image
+    sequences.
+
+    The chromatic adaptation and colourspaces transformation matrices are
+    fused into a single :math:`M` matrix upon instantiation or when any of the
+    pipeline attributes is changed, the colour component transfer functions
+    are resolved at the same time.
+
+    Parameters
+    ----------
+    input_colourspace : RGB_Colourspace
+        *RGB* input colourspace.
+    output_colourspace : RGB_Colourspace
+        *RGB* output colourspace.
+    chromatic_adaptation_transform : unicode, optional
+        **{'CAT02', 'XYZ Scaling', 'Von Kries', 'Bradford', 'Sharp',
+        'Fairchild', 'CMCCAT97', 'CMCCAT2000', 'CAT02_BRILL_CAT', 'Bianco',
+        'Bianco PC'}**,
+        *Chromatic adaptation* transform.
+    apply_decoding_cctf : bool, optional
+        Apply input colourspace decoding colour component transfer function /
+        electro-optical transfer function.
+    apply_encoding_cctf : bool, optional
+        Apply output colourspace encoding colour component transfer function /
+        opto-electronic transfer function.
+
+    Attributes
+    ----------
+    input_colourspace
+    output_colourspace
+    chromatic_adaptation_transform
+    apply_decoding_cctf
+    apply_encoding_cctf
+    matrix
+    decoding_cctf
+    encoding_cctf
+
+    Methods
+    -------
+    __call__
+
+    Notes
+    -----
+    -   The pipeline is compiled from the colourspaces state at the time its
+        attributes are set, subsequent changes to the colourspaces themselves
+        require the pipeline to be re-compiled by setting the related
+        attributes again.
+
+    Examples
+    --------
+    >>> from colour.models import sRGB_COLOURSPACE, PROPHOTO_RGB_COLOURSPACE
+    >>> pipeline = RGB_to_RGB_Pipeline(sRGB_COLOURSPACE,
+    ...                                PROPHOTO_RGB_COLOURSPACE)
+    >>> RGB = np.array([0.01103742, 0.12734226, 0.11632971])
+    >>> pipeline(RGB)  # doctest: +ELLIPSIS
+    array([ 0.0643561...,  0.1157331...,  0.1158069...])
+    """
+
+    def __init__(self,
+                 input_colourspace,
+                 output_colourspace,
+                 chromatic_adaptation_transform='CAT02',
+                 apply_decoding_cctf=False,
+                 apply_encoding_cctf=False):
+        self._matrix = None
+        self._decoding_cctf = None
+        self._encoding_cctf = None
+
+        self._input_colourspace = input_colourspace
+        self._output_colourspace = output_colourspace
+        self._chromatic_adaptation_transform = chromatic_adaptation_transform
+        self._apply_decoding_cctf = apply_decoding_cctf
+        self._apply_encoding_cctf = apply_encoding_cctf
+
+        self._compile()
+
+    @property
+    def input_colourspace(self):
+        """
+        Getter and setter property for the *RGB* input colourspace.
+
+        Parameters
+        ----------
+        value : RGB_Colourspace
+            Value to set the *RGB* input colourspace with.
+
+        Returns
+        -------
+        RGB_Colourspace
+            *RGB* input colourspace.
+        """
+
+        return self._input_colourspace
+
+    @input_colourspace.setter
+    def input_colourspace(self, value):
+        """
+        Setter for the **self.input_colourspace** property.
+        """
+
+        self._input_colourspace = value
+        self._compile()
+
+    @property
+    def output_colourspace(self):
+        """
+        Getter and setter property for the *RGB* output colourspace.
+
+        Parameters
+        ----------
+        value : RGB_Colourspace
+            Value to set the *RGB* output colourspace with.
+
+        Returns
+        -------
+        RGB_Colourspace
+            *RGB* output colourspace.
+        """
+
+        return self._output_colourspace
+
+    @output_colourspace.setter
+    def output_colourspace(self, value):
+        """
+        Setter for the **self.output_colourspace** property.
+        """
+
+        self._output_colourspace = value
+        self._compile()
+
+    @property
+    def chromatic_adaptation_transform(self):
+        """
+        Getter and setter property for the *chromatic adaptation* transform.
+
+        Parameters
+        ----------
+        value : unicode
+            Value to set the *chromatic adaptation* transform with.
+
+        Returns
+        -------
+        unicode
+            *Chromatic adaptation* transform.
+        """
+
+        return self._chromatic_adaptation_transform
+
+    @chromatic_adaptation_transform.setter
+    def chromatic_adaptation_transform(self, value):
+        """
+        Setter for the **self.chromatic_adaptation_transform** property.
+        """
+
+        self._chromatic_adaptation_transform = value
+        self._compile()
+
+    @property
+    def apply_decoding_cctf(self):
+        """
+        Getter and setter property for whether to apply the input colourspace
+        decoding colour component transfer function.
+
+        Parameters
+        ----------
+        value : bool
+            Whether to apply the input colourspace decoding colour component
+            transfer function.
+
+        Returns
+        -------
+        bool
+            Whether to apply the input colourspace decoding colour component
+            transfer function.
+        """
+
+        return self._apply_decoding_cctf
+
+    @apply_decoding_cctf.setter
+    def apply_decoding_cctf(self, value):
+        """
+        Setter for the **self.apply_decoding_cctf** property.
+        """
+
+        self._apply_decoding_cctf = value
+        self._compile()
+
+    @property
+    def apply_encoding_cctf(self):
+        """
+        Getter and setter property for whether to apply the output colourspace
+        encoding colour component transfer function.
+
+        Parameters
+        ----------
+        value : bool
+            Whether to apply the output colourspace encoding colour component
+            transfer function.
+
+        Returns
+        -------
+        bool
+            Whether to apply the output colourspace encoding colour component
+            transfer function.
+        """
+
+        return self._apply_encoding_cctf
+
+    @apply_encoding_cctf.setter
+    def apply_encoding_cctf(self, value):
+        """
+        Setter for the **self.apply_encoding_cctf** property.
+        """
+
+        self._apply_encoding_cctf = value
+        self._compile()
+
+    @property
+    def matrix(self):
+        """
+        Getter property for the fused conversion matrix :math:`M`.
+
+        Returns
+        -------
+        ndarray
+            Conversion matrix :math:`M`.
+        """
+
+        return self._matrix
+
+    @property
+    def decoding_cctf(self):
+        """
+        Getter property for the decoding colour component transfer function
+        applied by the pipeline.
+
+        Returns
+        -------
+        callable or None
+            Decoding colour component transfer function.
+        """
+
+        return self._decoding_cctf
+
+    @property
+    def encoding_cctf(self):
+        """
+        Getter property for the encoding colour component transfer function
+        applied by the pipeline.
+
+        Returns
+        -------
+        callable or None
+            Encoding colour component transfer function.
+        """
+
+        return self._encoding_cctf
+
+    def _compile(self):
+        """
+        Computes the fused conversion matrix and resolves the colour component
+        transfer functions.
+        """
+
+        self._matrix = RGB_to_RGB_matrix(self._input_colourspace,
+                                         self._output_colourspace,
+                                         self._chromatic_adaptation_transform)
+        # The conversion is performed as a right multiplication on
+        # channel-last arrays.
+        self._matrix_T = np.ascontiguousarray(np.transpose(self._matrix))
+
+        self._decoding_cctf = (self._input_colourspace.decoding_cctf
+                               if self._apply_decoding_cctf else None)
+        self._encoding_cctf = (self._output_colourspace.encoding_cctf
+                               if self._apply_encoding_cctf else None)
+
+    def __call__(self, RGB, out=None):
+        """
+        Converts given *RGB* colourspace array from the input *RGB*
+        colourspace to the output *RGB* colourspace.
+
+        Parameters
+        ----------
+        RGB : array_like
+            *RGB* colourspace array.
+        out : ndarray, optional
+            Array with the same shape as ``RGB`` the result is written into.
+
+        Returns
+        -------
+        ndarray
+            *RGB* colourspace array.
+
+        Examples
+        --------
+        >>> from colour.models import (sRGB_COLOURSPACE,
+        ...                            PROPHOTO_RGB_COLOURSPACE)
+        >>> pipeline = RGB_to_RGB_Pipeline(sRGB_COLOURSPACE,
+        ...                                PROPHOTO_RGB_COLOURSPACE)
+        >>> RGB = np.array([0.01103742, 0.12734226, 0.11632971])
+        >>> out = np.zeros(3)
+        >>> pipeline(RGB, out)  # doctest: +ELLIPSIS
+        array([ 0.0643561...,  0.1157331...,  0.1158069...])
+        >>> out  # doctest: +ELLIPSIS
+        array([ 0.0643561...,  0.1157331...,  0.1158069...])
+        """
+
+        RGB = as_float_array(RGB)
+
+        if self._decoding_cctf is not None:
+            RGB = self._decoding_cctf(RGB)
+
+        RGB = np.matmul(RGB, self._matrix_T, out=out)
+
+        if self._encoding_cctf is not None:
+            if out is None:
+                RGB = self._encoding_cctf(RGB)
+            else:
+                out[...] = self._encoding_cctf(RGB)
+
+        return RGB
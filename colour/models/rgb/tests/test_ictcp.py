@@ -66,6 +66,16 @@ class TestRGB_to_ICTCP(unittest.TestCase):
         ICTCP = np.reshape(ICTCP, (2, 3, 3))
         np.testing.assert_almost_equal(RGB_to_ICTCP(RGB), ICTCP, decimal=7)
 
+    def test_LUT_RGB_to_ICTCP(self):
+        """
+        Tests :func:`colour.models.rgb.ictcp.RGB_to_ICTCP` definition look-up
+        table support.
+        """
+
+        RGB = np.random.RandomState(4).random_sample((64, 3))
+        np.testing.assert_almost_equal(
+            RGB_to_ICTCP(RGB, use_LUT=True), RGB_to_ICTCP(RGB), decimal=6)
+
     @ignore_numpy_errors
     def test_nan_RGB_to_ICTCP(self):
         """
@@ -126,6 +136,16 @@ class TestICTCP_to_RGB(unittest.TestCase):
         RGB = np.reshape(RGB, (2, 3, 3))
         np.testing.assert_almost_equal(ICTCP_to_RGB(ICTCP), RGB, decimal=7)
 
+    def test_LUT_ICTCP_to_RGB(self):
+        """
+        Tests :func:`colour.models.rgb.ictcp.ICTCP_to_RGB` definition look-up
+        table support.
+        """
+
+        ICTCP = RGB_to_ICTCP(np.random.RandomState(4).random_sample((64, 3)))
+        np.testing.assert_almost_equal(
+            ICTCP_to_RGB(ICTCP, use_LUT=True), ICTCP_to_RGB(ICTCP), decimal=5)
+
     @ignore_numpy_errors
     def test_nan_ICTCP_to_RGB(self):
         """
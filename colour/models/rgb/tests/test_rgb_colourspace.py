@@ -14,10 +14,10 @@ import unittest
 from copy import deepcopy
 from itertools import permutations
 
-from colour.models import (RGB_COLOURSPACES, RGB_Colourspace, XYZ_to_RGB,
-                           RGB_to_XYZ, RGB_to_RGB_matrix, RGB_to_RGB,
-                           normalised_primary_matrix, oetf_sRGB,
-                           oetf_reverse_sRGB)
+from colour.models import (
+    RGB_COLOURSPACES, RGB_Colourspace, XYZ_to_RGB, RGB_to_XYZ,
+    RGB_to_RGB_matrix, RGB_to_RGB, RGB_to_RGB_Pipeline,
+    normalised_primary_matrix, oetf_sRGB, oetf_reverse_sRGB)
 from colour.utilities import ignore_numpy_errors
 
 __author__ = 'Colour Developers'
@@ -29,7 +29,8 @@ __status__ = 'Production'
 
 __all__ = [
     'TestRGB_COLOURSPACES', 'TestRGB_Colourspace', 'TestXYZ_to_RGB',
-    'TestRGB_to_XYZ', 'TestRGB_to_RGB_matrix', 'TestRGB_to_RGB'
+    'TestRGB_to_XYZ', 'TestRGB_to_RGB_matrix', 'TestRGB_to_RGB',
+    'TestRGB_to_RGB_Pipeline'
 ]
 
 
@@ -307,6 +308,35 @@ use_derived_transformation_matrices` method.
         np.testing.assert_array_equal(self._colourspace.XYZ_to_RGB_matrix,
                                       np.identity(3))
 
+    def test_derived_transformation_matrices_caching(self):
+        """
+        Tests :class:`colour.models.rgb.rgb_colourspace.RGB_Colourspace` class
+        derived transformation matrices caching.
+        """
+
+        self._colourspace.use_derived_transformation_matrices(True)
+
+        RGB_to_XYZ_matrix = self._colourspace.RGB_to_XYZ_matrix
+        self.assertIs(self._colourspace.RGB_to_XYZ_matrix, RGB_to_XYZ_matrix)
+
+        self._colourspace.whitepoint = np.array([0.31270, 0.32900])
+        np.testing.assert_almost_equal(
+            self._colourspace.RGB_to_XYZ_matrix,
+            normalised_primary_matrix(self._colourspace.primaries,
+                                      np.array([0.31270, 0.32900])),
+            decimal=7)
+
+        self._colourspace.primaries = np.array(
+            [0.6400, 0.3300, 0.3000, 0.6000, 0.1500, 0.0600])
+        np.testing.assert_almost_equal(
+            self._colourspace.XYZ_to_RGB_matrix,
+            np.array([
+                [3.24096994, -1.53738318, -0.49861076],
+                [-0.96924364, 1.87596750, 0.04155506],
+                [0.05563008, -0.20397696, 1.05697151],
+            ]),
+            decimal=7)
+
 
 class TestXYZ_to_RGB(unittest.TestCase):
     """
@@ -393,6 +423,35 @@ class TestXYZ_to_RGB(unittest.TestCase):
         np.testing.assert_almost_equal(
             XYZ_to_RGB(XYZ, W_R, W_T, M), RGB, decimal=7)
 
+    def test_out_XYZ_to_RGB(self):
+        """
+        Tests :func:`colour.models.rgb.rgb_colourspace.XYZ_to_RGB` definition
+        *out* argument support.
+        """
+
+        XYZ = np.array([0.07049534, 0.10080000, 0.09558313])
+        W_R = np.array([0.34570, 0.35850])
+        W_T = np.array([0.31270, 0.32900])
+        M = np.array([
+            [3.24062548, -1.53720797, -0.49862860],
+            [-0.96893071, 1.87575606, 0.04151752],
+            [0.05571012, -0.20402105, 1.05699594],
+        ])
+        RGB = np.array([0.01087863, 0.12719923, 0.11642816])
+
+        XYZ = np.tile(XYZ, (6, 1))
+        RGB = np.tile(RGB, (6, 1))
+        out = np.zeros(XYZ.shape)
+        self.assertIs(XYZ_to_RGB(XYZ, W_R, W_T, M, out=out), out)
+        np.testing.assert_almost_equal(out, RGB, decimal=7)
+
+        out = np.zeros(XYZ.shape)
+        XYZ_to_RGB(XYZ, W_R, W_T, M, encoding_cctf=np.sqrt, out=out)
+        np.testing.assert_almost_equal(out, np.sqrt(RGB), decimal=7)
+
+        self.assertIs(XYZ_to_RGB(XYZ, W_R, W_T, M, out=XYZ), XYZ)
+        np.testing.assert_almost_equal(XYZ, RGB, decimal=7)
+
     @ignore_numpy_errors
     def test_nan_XYZ_to_RGB(self):
         """
@@ -499,6 +558,31 @@ class TestRGB_to_XYZ(unittest.TestCase):
         np.testing.assert_almost_equal(
             RGB_to_XYZ(RGB, W_R, W_T, M), XYZ, decimal=7)
 
+    def test_out_RGB_to_XYZ(self):
+        """
+        Tests :func:`colour.models.rgb.rgb_colourspace.RGB_to_XYZ` definition
+        *out* argument support.
+        """
+
+        RGB = np.array([0.01087863, 0.12719923, 0.11642816])
+        W_R = np.array([0.31270, 0.32900])
+        W_T = np.array([0.34570, 0.35850])
+        M = np.array([
+            [0.41240000, 0.35760000, 0.18050000],
+            [0.21260000, 0.71520000, 0.07220000],
+            [0.01930000, 0.11920000, 0.95050000],
+        ])
+        XYZ = RGB_to_XYZ(RGB, W_R, W_T, M)
+
+        RGB = np.tile(RGB, (6, 1))
+        XYZ = np.tile(XYZ, (6, 1))
+        out = np.zeros(RGB.shape)
+        self.assertIs(RGB_to_XYZ(RGB, W_R, W_T, M, out=out), out)
+        np.testing.assert_almost_equal(out, XYZ, decimal=7)
+
+        self.assertIs(RGB_to_XYZ(RGB, W_R, W_T, M, out=RGB), RGB)
+        np.testing.assert_almost_equal(RGB, XYZ, decimal=7)
+
     @ignore_numpy_errors
     def test_nan_RGB_to_XYZ(self):
         """
@@ -648,6 +732,30 @@ class TestRGB_to_RGB(unittest.TestCase):
             RGB_o,
             decimal=7)
 
+    def test_out_RGB_to_RGB(self):
+        """
+        Tests :func:`colour.models.rgb.rgb_colourspace.RGB_to_RGB` definition
+        *out* argument support.
+        """
+
+        aces_2065_1_colourspace = RGB_COLOURSPACES['ACES2065-1']
+        sRGB_colourspace = RGB_COLOURSPACES['sRGB']
+        RGB_i = np.tile(np.array([0.35521588, 0.41000000, 0.24177934]), (6, 1))
+        RGB_o = np.tile(np.array([0.33654049, 0.44099674, 0.21512677]), (6, 1))
+
+        out = np.zeros(RGB_i.shape)
+        self.assertIs(
+            RGB_to_RGB(
+                RGB_i, aces_2065_1_colourspace, sRGB_colourspace, out=out),
+            out)
+        np.testing.assert_almost_equal(out, RGB_o, decimal=7)
+
+        self.assertIs(
+            RGB_to_RGB(
+                RGB_i, aces_2065_1_colourspace, sRGB_colourspace, out=RGB_i),
+            RGB_i)
+        np.testing.assert_almost_equal(RGB_i, RGB_o, decimal=7)
+
     @ignore_numpy_errors
     def test_nan_RGB_to_RGB(self):
         """
@@ -665,5 +773,137 @@ class TestRGB_to_RGB(unittest.TestCase):
             RGB_to_RGB(RGB, aces_2065_1_colourspace, sRGB_colourspace)
 
 
+class TestRGB_to_RGB_Pipeline(unittest.TestCase):
+    """
+    Defines :class:`colour.models.rgb.rgb_colourspace.RGB_to_RGB_Pipeline`
+    class unit tests methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('input_colourspace', 'output_colourspace',
+                               'chromatic_adaptation_transform',
+                               'apply_decoding_cctf', 'apply_encoding_cctf',
+                               'matrix', 'decoding_cctf', 'encoding_cctf')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(RGB_to_RGB_Pipeline))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__call__', )
+
+        for method in required_methods:
+            self.assertIn(method, dir(RGB_to_RGB_Pipeline))
+
+    def test___call__(self):
+        """
+        Tests :func:`colour.models.rgb.rgb_colourspace.RGB_to_RGB_Pipeline.\
+__call__` method.
+        """
+
+        aces_2065_1_colourspace = RGB_COLOURSPACES['ACES2065-1']
+        sRGB_colourspace = RGB_COLOURSPACES['sRGB']
+
+        pipeline = RGB_to_RGB_Pipeline(aces_2065_1_colourspace,
+                                       sRGB_colourspace)
+        np.testing.assert_almost_equal(
+            pipeline(np.array([0.35521588, 0.41000000, 0.24177934])),
+            np.array([0.33654049, 0.44099674, 0.21512677]),
+            decimal=7)
+
+        pipeline.chromatic_adaptation_transform = 'Bradford'
+        np.testing.assert_almost_equal(
+            pipeline(np.array([0.35521588, 0.41000000, 0.24177934])),
+            np.array([0.33699893, 0.44136948, 0.21432296]),
+            decimal=7)
+
+        aces_cg_colourspace = RGB_COLOURSPACES['ACEScg']
+        aces_cc_colourspace = RGB_COLOURSPACES['ACEScc']
+
+        pipeline = RGB_to_RGB_Pipeline(
+            aces_cg_colourspace,
+            aces_cc_colourspace,
+            apply_decoding_cctf=True,
+            apply_encoding_cctf=True)
+        np.testing.assert_almost_equal(
+            pipeline(np.array([0.35521588, 0.41000000, 0.24177934])),
+            np.array([0.46956438, 0.48137533, 0.43788601]),
+            decimal=7)
+
+        pipeline.input_colourspace = aces_cc_colourspace
+        pipeline.output_colourspace = sRGB_colourspace
+        np.testing.assert_almost_equal(
+            pipeline(np.array([0.46956438, 0.48137533, 0.43788601])),
+            np.array([0.60983062, 0.67896356, 0.50435764]),
+            decimal=7)
+
+        RGB = np.random.RandomState(4).random_sample((4, 4, 3))
+        out = np.zeros(RGB.shape)
+        np.testing.assert_almost_equal(
+            pipeline(RGB, out),
+            RGB_to_RGB(
+                RGB,
+                aces_cc_colourspace,
+                sRGB_colourspace,
+                apply_decoding_cctf=True,
+                apply_encoding_cctf=True),
+            decimal=7)
+        np.testing.assert_equal(out, pipeline(RGB))
+
+        pipeline.apply_decoding_cctf = False
+        pipeline.apply_encoding_cctf = False
+        np.testing.assert_almost_equal(
+            pipeline.matrix,
+            RGB_to_RGB_matrix(aces_cc_colourspace, sRGB_colourspace),
+            decimal=7)
+        np.testing.assert_almost_equal(
+            pipeline(RGB, out),
+            RGB_to_RGB(RGB, aces_cc_colourspace, sRGB_colourspace),
+            decimal=7)
+
+    def test_n_dimensional___call__(self):
+        """
+        Tests :func:`colour.models.rgb.rgb_colourspace.RGB_to_RGB_Pipeline.\
+__call__` method n-dimensions support.
+        """
+
+        pipeline = RGB_to_RGB_Pipeline(RGB_COLOURSPACES['ACES2065-1'],
+                                       RGB_COLOURSPACES['sRGB'])
+        RGB_i = np.array([0.35521588, 0.41000000, 0.24177934])
+        RGB_o = np.array([0.33654049, 0.44099674, 0.21512677])
+        np.testing.assert_almost_equal(pipeline(RGB_i), RGB_o, decimal=7)
+
+        RGB_i = np.tile(RGB_i, (6, 1))
+        RGB_o = np.tile(RGB_o, (6, 1))
+        np.testing.assert_almost_equal(pipeline(RGB_i), RGB_o, decimal=7)
+
+        RGB_i = np.reshape(RGB_i, (2, 3, 3))
+        RGB_o = np.reshape(RGB_o, (2, 3, 3))
+        np.testing.assert_almost_equal(pipeline(RGB_i), RGB_o, decimal=7)
+
+    @ignore_numpy_errors
+    def test_nan___call__(self):
+        """
+        Tests :func:`colour.models.rgb.rgb_colourspace.RGB_to_RGB_Pipeline.\
+__call__` method nan support.
+        """
+
+        pipeline = RGB_to_RGB_Pipeline(RGB_COLOURSPACES['ACES2065-1'],
+                                       RGB_COLOURSPACES['sRGB'])
+
+        cases = [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]
+        cases = set(permutations(cases * 3, r=3))
+        for case in cases:
+            RGB = np.array(case)
+            pipeline(RGB)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -9,9 +9,9 @@ import numpy as np
 import unittest
 from itertools import permutations
 
-from colour.models.rgb.ycbcr import (RGB_to_YCbCr, YCbCr_to_RGB,
-                                     RGB_to_YcCbcCrc, YcCbcCrc_to_RGB,
-                                     YCBCR_WEIGHTS)
+from colour.models.rgb.ycbcr import (
+    RGB_to_YCbCr, YCbCr_to_RGB, RGB_to_YCbCr_subsampled,
+    YCbCr_subsampled_to_RGB, RGB_to_YcCbcCrc, YcCbcCrc_to_RGB, YCBCR_WEIGHTS)
 from colour.utilities import ignore_numpy_errors
 
 __author__ = 'Colour Developers'
@@ -22,8 +22,8 @@ __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Development'
 
 __all__ = [
-    'TestRGB_to_YCbCr', 'TestYCbCr_to_RGB', 'TestRGB_to_YcCbcCrc',
-    'TestYcCbcCrc_to_RGB'
+    'TestRGB_to_YCbCr', 'TestYCbCr_to_RGB', 'TestRGB_to_YCbCr_subsampled',
+    'TestYCbCr_subsampled_to_RGB', 'TestRGB_to_YcCbcCrc', 'TestYcCbcCrc_to_RGB'
 ]
 
 
@@ -98,6 +98,32 @@ class TestRGB_to_YCbCr(unittest.TestCase):
         YCbCr = np.reshape(YCbCr, (4, 4, 4, 3))
         np.testing.assert_almost_equal(RGB_to_YCbCr(RGB), YCbCr)
 
+    def test_integer_RGB_to_YCbCr(self):
+        """
+        Tests :func:`colour.models.rgb.ycbcr.RGB_to_YCbCr` definition
+        fixed-point integer arithmetic.
+        """
+
+        RGB = np.random.RandomState(4).randint(0, 1024, (64, 3))
+        for K in YCBCR_WEIGHTS.values():
+            for in_legal, out_bits, out_legal in ((False, 10, True),
+                                                  (True, 8, False),
+                                                  (False, 12, True)):
+                kwargs = {
+                    'K': K,
+                    'in_bits': 10,
+                    'in_legal': in_legal,
+                    'in_int': True,
+                    'out_bits': out_bits,
+                    'out_legal': out_legal,
+                    'out_int': True
+                }
+                YCbCr = RGB_to_YCbCr(RGB, **kwargs)
+
+                self.assertEqual(YCbCr.dtype, np.int_)
+                np.testing.assert_array_equal(
+                    YCbCr, RGB_to_YCbCr(RGB.astype(np.float_), **kwargs))
+
     @ignore_numpy_errors
     def test_nan_RGB_to_YCbCr(self):
         """
@@ -177,6 +203,30 @@ class TestYCbCr_to_RGB(unittest.TestCase):
         YCbCr = np.reshape(YCbCr, (4, 4, 4, 3))
         np.testing.assert_almost_equal(YCbCr_to_RGB(YCbCr), RGB)
 
+    def test_integer_YCbCr_to_RGB(self):
+        """
+        Tests :func:`colour.models.rgb.ycbcr.YCbCr_to_RGB` definition
+        fixed-point integer arithmetic.
+        """
+
+        YCbCr = np.random.RandomState(4).randint(64, 941, (64, 3))
+        for K in YCBCR_WEIGHTS.values():
+            for out_bits, out_legal in ((10, False), (8, True), (12, False)):
+                kwargs = {
+                    'K': K,
+                    'in_bits': 10,
+                    'in_legal': True,
+                    'in_int': True,
+                    'out_bits': out_bits,
+                    'out_legal': out_legal,
+                    'out_int': True
+                }
+                RGB = YCbCr_to_RGB(YCbCr, **kwargs)
+
+                self.assertEqual(RGB.dtype, np.int_)
+                np.testing.assert_array_equal(
+                    RGB, YCbCr_to_RGB(YCbCr.astype(np.float_), **kwargs))
+
     @ignore_numpy_errors
     def test_nan_YCbCr_to_RGB(self):
         """
@@ -191,6 +241,106 @@ class TestYCbCr_to_RGB(unittest.TestCase):
             YCbCr_to_RGB(YCbCr)
 
 
+class TestRGB_to_YCbCr_subsampled(unittest.TestCase):
+    """
+    Defines :func:`colour.models.rgb.ycbcr.RGB_to_YCbCr_subsampled` definition
+    unit tests methods.
+    """
+
+    def test_RGB_to_YCbCr_subsampled(self):
+        """
+        Tests :func:`colour.models.rgb.ycbcr.RGB_to_YCbCr_subsampled`
+        definition.
+        """
+
+        RGB = np.random.RandomState(4).randint(0, 1024, (4, 6, 3))
+        YCbCr = RGB_to_YCbCr(
+            RGB.astype(np.float_),
+            in_bits=10,
+            in_int=True,
+            out_bits=10,
+            out_legal=True,
+            out_range=(64, 940, 64, 960))
+
+        Y, Cb, Cr = RGB_to_YCbCr_subsampled(RGB, '4:4:4')
+        np.testing.assert_array_equal(
+            np.stack([Y, Cb, Cr], -1), np.round(YCbCr))
+
+        Y, Cb, Cr = RGB_to_YCbCr_subsampled(RGB, '4:2:0')
+        self.assertTupleEqual(Y.shape, (4, 6))
+        self.assertTupleEqual(Cb.shape, (2, 3))
+        np.testing.assert_array_equal(Y, np.round(YCbCr[..., 0]))
+        YCbCr_s = np.mean(np.reshape(YCbCr, (2, 2, 3, 2, 3)), axis=(1, 3))
+        np.testing.assert_array_equal(Cb, np.round(YCbCr_s[..., 1]))
+        np.testing.assert_array_equal(Cr, np.round(YCbCr_s[..., 2]))
+
+        Y, Cb, Cr = RGB_to_YCbCr_subsampled(RGB, '4:2:2', out_legal=False)
+        self.assertTupleEqual(Cb.shape, (4, 3))
+
+    def test_raise_exception_RGB_to_YCbCr_subsampled(self):
+        """
+        Tests :func:`colour.models.rgb.ycbcr.RGB_to_YCbCr_subsampled`
+        definition raised exception.
+        """
+
+        self.assertRaises(ValueError, RGB_to_YCbCr_subsampled,
+                          np.zeros((3, 4, 3), dtype=np.int_))
+        self.assertRaises(ValueError, RGB_to_YCbCr_subsampled,
+                          np.zeros((4, 4, 3)))
+
+
+class TestYCbCr_subsampled_to_RGB(unittest.TestCase):
+    """
+    Defines :func:`colour.models.rgb.ycbcr.YCbCr_subsampled_to_RGB` definition
+    unit tests methods.
+    """
+
+    def test_YCbCr_subsampled_to_RGB(self):
+        """
+        Tests :func:`colour.models.rgb.ycbcr.YCbCr_subsampled_to_RGB`
+        definition.
+        """
+
+        random_state = np.random.RandomState(4)
+        Y = random_state.randint(64, 941, (4, 6))
+        Cb, Cr = random_state.randint(64, 961, (2, 2, 3))
+
+        YCbCr = np.stack([
+            Y,
+            np.repeat(np.repeat(Cb, 2, 0), 2, 1),
+            np.repeat(np.repeat(Cr, 2, 0), 2, 1),
+        ], -1)
+        np.testing.assert_array_equal(
+            YCbCr_subsampled_to_RGB(Y, Cb, Cr, '4:2:0'),
+            YCbCr_to_RGB(
+                YCbCr,
+                in_bits=10,
+                in_legal=True,
+                in_int=True,
+                out_bits=10,
+                out_int=True))
+
+        RGB = np.random.RandomState(4).randint(0, 1024, (2, 4, 3))
+        np.testing.assert_array_equal(
+            YCbCr_subsampled_to_RGB(
+                *RGB_to_YCbCr_subsampled(RGB, '4:4:4', out_bits=16),
+                subsampling='4:4:4',
+                in_bits=16), RGB)
+
+    def test_raise_exception_YCbCr_subsampled_to_RGB(self):
+        """
+        Tests :func:`colour.models.rgb.ycbcr.YCbCr_subsampled_to_RGB`
+        definition raised exception.
+        """
+
+        Y = np.zeros((4, 4), dtype=np.int_)
+        C = np.zeros((2, 2), dtype=np.int_)
+        self.assertRaises(ValueError, YCbCr_subsampled_to_RGB, Y, C, C,
+                          '4:2:2')
+        self.assertRaises(ValueError, YCbCr_subsampled_to_RGB,
+                          Y.astype(np.float_), C, C)
+
+
 class TestRGB_to_YcCbcCrc(unittest.TestCase):
     """
     Defines :func:`colour.models.rgb.ycbcr.RGB_to_YcCbcCrc` definition unit
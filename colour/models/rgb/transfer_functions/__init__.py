@@ -2,6 +2,9 @@
 
 from __future__ import absolute_import
 
+import numpy as np
+
+from colour.algebra import bake_LUT1D
 from colour.utilities import CaseInsensitiveMapping, filter_kwargs
 
 from .common import CV_range, legal_to_full, full_to_legal
@@ -22,7 +25,7 @@ from .itur_bt_601 import oetf_BT601, oetf_reverse_BT601
 from .itur_bt_709 import oetf_BT709, oetf_reverse_BT709
 from .itur_bt_1886 import eotf_reverse_BT1886, eotf_BT1886
 from .itur_bt_2020 import oetf_BT2020, eotf_BT2020
-from .st_2084 import oetf_ST2084, eotf_ST2084
+from .st_2084 import ST2084_LUT_ERRORS, oetf_ST2084, eotf_ST2084
 from .itur_bt_2100 import (
     oetf_BT2100_PQ, oetf_reverse_BT2100_PQ, eotf_BT2100_PQ,
     eotf_reverse_BT2100_PQ, ootf_BT2100_PQ, ootf_reverse_BT2100_PQ,
@@ -67,7 +70,7 @@ __all__ += ['oetf_BT601', 'oetf_reverse_BT601']
 __all__ += ['oetf_BT709', 'oetf_reverse_BT709']
 __all__ += ['eotf_reverse_BT1886', 'eotf_BT1886']
 __all__ += ['oetf_BT2020', 'eotf_BT2020']
-__all__ += ['oetf_ST2084', 'eotf_ST2084']
+__all__ += ['ST2084_LUT_ERRORS', 'oetf_ST2084', 'eotf_ST2084']
 __all__ += [
     'oetf_BT2100_PQ', 'oetf_reverse_BT2100_PQ', 'eotf_BT2100_PQ',
     'eotf_reverse_BT2100_PQ', 'ootf_BT2100_PQ', 'ootf_reverse_BT2100_PQ',
@@ -761,3 +764,83 @@ def ootf_reverse(value, function='ITU-R BT.2100 PQ', **kwargs):
 
 __all__ += ['OOTFS', 'OOTFS_REVERSE']
 __all__ += ['ootf', 'ootf_reverse']
+
+CCTF_LUT1D_REGISTRIES = CaseInsensitiveMapping({
+    'Log Encoding': LOG_ENCODING_CURVES,
+    'Log Decoding': LOG_DECODING_CURVES,
+    'OETF': OETFS,
+    'OETF Reverse': OETFS_REVERSE,
+    'EOTF': EOTFS,
+    'EOTF Reverse': EOTFS_REVERSE,
+})
+CCTF_LUT1D_REGISTRIES.__doc__ = """
+Supported colour component transfer functions registries that can be baked
+into a 1-D look-up table.
+
+CCTF_LUT1D_REGISTRIES : CaseInsensitiveMapping
+    **{'Log Encoding', 'Log Decoding', 'OETF', 'OETF Reverse', 'EOTF',
+    'EOTF Reverse'}**
+"""
+
+
+def cctf_LUT1D(function='sRGB',
+               kind='OETF',
+               domain=np.array([0, 1]),
+               size=4096,
+               **kwargs):
+    """
+    Bakes given colour component transfer function into a 1-D look-up table.
+
+    The returned look-up table applies integer code values, e.g. *uint8*,
+    *uint10* or *uint16*, and *half-float* values exactly with a single table
+    gather and interpolates floating point values, the interpolation error
+    being reported by the :meth:`colour.LUT1D.maximum_error` method.
+
+    Parameters
+    ----------
+    function : unicode, optional
+        Colour component transfer function name in the registry of given
+        kind, e.g. *sRGB* for the *OETF* kind.
+    kind : unicode, optional
+        **{'OETF', 'OETF Reverse', 'EOTF', 'EOTF Reverse', 'Log Encoding',
+        'Log Decoding'}**,
+        Colour component transfer function kind.
+    domain : array_like, optional
+        Look-up table domain.
+    size : integer, optional
+        Look-up table size.
+
+    Other Parameters
+    ----------------
+    \**kwargs : dict, optional
+        Keywords arguments passed to the colour component transfer function.
+
+    Returns
+    -------
+    LUT1D
+        Baked 1-D look-up table.
+
+    Examples
+    --------
+    >>> LUT = cctf_LUT1D('ALEXA Log C', 'Log Decoding')
+    >>> LUT.name
+    'ALEXA Log C - Log Decoding'
+    >>> LUT.apply(np.array([0, 512, 1023], dtype=np.uint16), bit_depth=10)
+    ... # doctest: +ELLIPSIS
+    array([ -1.7290418...e-02,   5.1576899...e-01,   5.5079576...e+01])
+    >>> LUT.maximum_error() < 1e-4
+    True
+    """
+
+    callable_ = CCTF_LUT1D_REGISTRIES[kind][function]
+    kwargs = filter_kwargs(callable_, **kwargs)
+
+    return bake_LUT1D(
+        lambda x: callable_(x, **kwargs),
+        domain,
+        size,
+        '{0} - {1}'.format(function, kind))
+
+
+__all__ += ['CCTF_LUT1D_REGISTRIES']
+__all__ += ['cctf_LUT1D']
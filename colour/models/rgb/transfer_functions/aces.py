@@ -60,7 +60,7 @@ from __future__ import division, unicode_literals
 
 import numpy as np
 
-from colour.utilities import Structure, as_numeric
+from colour.utilities import Structure, as_float_array, as_numeric
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -158,7 +158,7 @@ def log_encoding_ACESproxy(lin_AP1,
     426
     """
 
-    lin_AP1 = np.asarray(lin_AP1)
+    lin_AP1 = as_float_array(lin_AP1)
 
     constants = constants[bit_depth]
 
@@ -253,7 +253,7 @@ def log_encoding_ACEScc(lin_AP1):
     0.4135884...
     """
 
-    lin_AP1 = np.asarray(lin_AP1)
+    lin_AP1 = as_float_array(lin_AP1)
 
     output = np.where(lin_AP1 < 0, (np.log2(2 ** -16) + 9.72) / 17.52,
                       (np.log2(2 ** -16 + lin_AP1 * 0.5) + 9.72) / 17.52)
@@ -291,7 +291,7 @@ def log_decoding_ACEScc(ACEScc):
     0.1799999...
     """
 
-    ACEScc = np.asarray(ACEScc)
+    ACEScc = as_float_array(ACEScc)
 
     output = np.where(ACEScc < (9.72 - 15) / 17.52,
                       (2 ** (ACEScc * 17.52 - 9.72) - 2 ** -16) * 2, 2
@@ -331,7 +331,7 @@ def log_encoding_ACEScct(lin_AP1, constants=ACES_CCT_CONSTANTS):
     0.4135884...
     """
 
-    lin_AP1 = np.asarray(lin_AP1)
+    lin_AP1 = as_float_array(lin_AP1)
 
     output = np.where(lin_AP1 <= constants.X_BRK,
                       constants.A * lin_AP1 + constants.B,
@@ -370,7 +370,7 @@ def log_decoding_ACEScct(ACEScct, constants=ACES_CCT_CONSTANTS):
     0.1799999...
     """
 
-    ACEScct = np.asarray(ACEScct)
+    ACEScct = as_float_array(ACEScct)
 
     output = np.where(ACEScct > constants.Y_BRK, 2 ** (ACEScct * 17.52 - 9.72),
                       (ACEScct - constants.B) / constants.A)
@@ -24,7 +24,7 @@ from __future__ import division, unicode_literals
 
 import numpy as np
 
-from colour.utilities import CaseInsensitiveMapping, as_numeric
+from colour.utilities import CaseInsensitiveMapping, as_float_array, as_numeric
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -222,7 +222,7 @@ def log_encoding_ALEXALogC(x,
     0.3910068...
     """
 
-    x = np.asarray(x)
+    x = as_float_array(x)
 
     cut, a, b, c, d, e, f, _e_cut_f = (
         ALEXA_LOG_C_CURVE_CONVERSION_DATA[firmware][method][EI])
@@ -267,7 +267,7 @@ def log_decoding_ALEXALogC(t,
     0.18...
     """
 
-    t = np.asarray(t)
+    t = as_float_array(t)
 
     cut, a, b, c, d, e, f, _e_cut_f = (
         ALEXA_LOG_C_CURVE_CONVERSION_DATA[firmware][method][EI])
@@ -25,6 +25,8 @@ from __future__ import division, unicode_literals
 
 import numpy as np
 
+from colour.utilities import as_float_array
+
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
 __license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
@@ -62,7 +64,7 @@ def log_encoding_Cineon(x, black_offset=10 ** ((95 - 685) / 300)):
     0.4573196...
     """
 
-    x = np.asarray(x)
+    x = as_float_array(x)
 
     return ((
         685 + 300 * np.log10(x * (1 - black_offset) + black_offset)) / 1023)
@@ -95,7 +97,7 @@ def log_decoding_Cineon(y, black_offset=10 ** ((95 - 685) / 300)):
     0.1799999...
     """
 
-    y = np.asarray(y)
+    y = as_float_array(y)
 
     return ((10 ** ((1023 * y - 685) / 300) - black_offset) /
             (1 - black_offset))
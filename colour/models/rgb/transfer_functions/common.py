@@ -16,7 +16,7 @@ from __future__ import division, unicode_literals
 
 import numpy as np
 
-from colour.constants import DEFAULT_FLOAT_DTYPE
+from colour.utilities import as_float_array, get_float_precision
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -64,7 +64,7 @@ def CV_range(bit_depth=10, is_legal=False, is_int=False):
         ranges = np.array([0, 2 ** bit_depth - 1])
 
     if not is_int:
-        ranges = ranges.astype(DEFAULT_FLOAT_DTYPE) / (2 ** bit_depth - 1)
+        ranges = ranges.astype(get_float_precision()) / (2 ** bit_depth - 1)
 
     return ranges
 
@@ -115,7 +115,7 @@ def legal_to_full(CV, bit_depth=10, in_int=False, out_int=False):
     1023
     """
 
-    CV = np.asarray(CV)
+    CV = as_float_array(CV)
 
     MV = 2 ** bit_depth - 1
 
@@ -174,7 +174,7 @@ def full_to_legal(CV, bit_depth=10, in_int=False, out_int=False):
     940
     """
 
-    CV = np.asarray(CV)
+    CV = as_float_array(CV)
 
     MV = 2 ** bit_depth - 1
 
@@ -25,7 +25,7 @@ DCI_DCinema_System_Spec_v1_1.pdf
 
 from __future__ import division, unicode_literals
 
-import numpy as np
+from colour.utilities import as_float_array
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -66,7 +66,7 @@ def oetf_DCDM(XYZ, out_int=False):
     461.9922059...
     """
 
-    XYZ = np.asarray(XYZ)
+    XYZ = as_float_array(XYZ)
 
     XYZ_p = (XYZ / 52.37) ** (1 / 2.6)
 
@@ -107,7 +107,7 @@ def eotf_DCDM(XYZ_p, in_int=False):
     0.18...
     """
 
-    XYZ_p = np.asarray(XYZ_p)
+    XYZ_p = as_float_array(XYZ_p)
 
     if in_int:
         XYZ_p = XYZ_p / 4095
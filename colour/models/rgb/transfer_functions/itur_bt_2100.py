@@ -45,7 +45,8 @@ import numpy as np
 from colour.models.rgb.transfer_functions import (
     eotf_BT1886, eotf_ST2084, eotf_reverse_BT1886, oetf_ARIBSTDB67, oetf_BT709,
     oetf_ST2084, oetf_reverse_ARIBSTDB67, oetf_reverse_BT709)
-from colour.utilities import as_numeric, tsplit, tstack, warning
+from colour.utilities import (as_float_array, as_numeric, tsplit, tstack,
+                              warning)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -70,7 +71,7 @@ BT2100_HLG_WEIGHTS : ndarray
 """
 
 
-def oetf_BT2100_PQ(E):
+def oetf_BT2100_PQ(E, use_LUT=False):
     """
     Defines *Recommendation ITU-R BT.2100* *Reference PQ* opto-electrical
     transfer function (OETF / OECF).
@@ -85,6 +86,9 @@ def oetf_BT2100_PQ(E):
         scene light and scaled by camera exposure. The values :math:`E`,
         :math:`R_S`, :math:`G_S`, :math:`B_S`, :math:`Y_S`, :math:`I_S` are
         normalised to range [0, 1].
+    use_LUT : bool, optional
+        Whether to apply a cached *SMPTE ST 2084:2014* look-up table, see
+        :func:`colour.models.oetf_ST2084` definition.
 
     Returns
     -------
@@ -103,10 +107,10 @@ def oetf_BT2100_PQ(E):
     0.7247698...
     """
 
-    return oetf_ST2084(ootf_BT2100_PQ(E), 10000)
+    return oetf_ST2084(ootf_BT2100_PQ(E), 10000, use_LUT=use_LUT)
 
 
-def oetf_reverse_BT2100_PQ(E_p):
+def oetf_reverse_BT2100_PQ(E_p, use_LUT=False):
     """
     Defines *Recommendation ITU-R BT.2100* *Reference PQ* reverse
     opto-electrical transfer function (OETF / OECF).
@@ -116,6 +120,9 @@ def oetf_reverse_BT2100_PQ(E_p):
     E_p : numeric or array_like
         :math:`E` is the resulting non-linear signal (:math:`R'`, :math:`G'`,
         :math:`B'`) normalised to range [0, 1].
+    use_LUT : bool, optional
+        Whether to apply a cached *SMPTE ST 2084:2014* look-up table, see
+        :func:`colour.models.eotf_ST2084` definition.
 
     Returns
     -------
@@ -136,10 +143,10 @@ def oetf_reverse_BT2100_PQ(E_p):
     0.0999999...
     """
 
-    return ootf_reverse_BT2100_PQ(eotf_ST2084(E_p, 10000))
+    return ootf_reverse_BT2100_PQ(eotf_ST2084(E_p, 10000, use_LUT=use_LUT))
 
 
-def eotf_BT2100_PQ(E_p):
+def eotf_BT2100_PQ(E_p, use_LUT=False):
     """
     Defines *Recommendation ITU-R BT.2100* *Reference PQ* electro-optical
     transfer function (EOTF / EOCF).
@@ -151,6 +158,9 @@ def eotf_BT2100_PQ(E_p):
     E_p : numeric or array_like
         :math:`E'` denotes a non-linear colour value :math:`{R', G', B'}` or
         :math:`{L', M', S'}` in *PQ* space [0, 1].
+    use_LUT : bool, optional
+        Whether to apply a cached *SMPTE ST 2084:2014* look-up table, see
+        :func:`colour.models.eotf_ST2084` definition.
 
     Returns
     -------
@@ -170,10 +180,10 @@ def eotf_BT2100_PQ(E_p):
     779.9883608...
     """
 
-    return eotf_ST2084(E_p, 10000)
+    return eotf_ST2084(E_p, 10000, use_LUT=use_LUT)
 
 
-def eotf_reverse_BT2100_PQ(F_D):
+def eotf_reverse_BT2100_PQ(F_D, use_LUT=False):
     """
     Defines *Recommendation ITU-R BT.2100* *Reference PQ* reverse
     electro-optical transfer function (EOTF / EOCF).
@@ -184,6 +194,9 @@ def eotf_reverse_BT2100_PQ(F_D):
         :math:`F_D` is the luminance of a displayed linear component
         :math:`{R_D, G_D, B_D}` or :math:`Y_D` or :math:`I_D`, in
         :math:`cd/m^2`.
+    use_LUT : bool, optional
+        Whether to apply a cached *SMPTE ST 2084:2014* look-up table, see
+        :func:`colour.models.oetf_ST2084` definition.
 
     Returns
     -------
@@ -202,7 +215,7 @@ def eotf_reverse_BT2100_PQ(F_D):
     0.7247698...
     """
 
-    return oetf_ST2084(F_D, 10000)
+    return oetf_ST2084(F_D, 10000, use_LUT=use_LUT)
 
 
 def ootf_BT2100_PQ(E):
@@ -237,7 +250,7 @@ def ootf_BT2100_PQ(E):
     779.9883608...
     """
 
-    E = np.asarray(E)
+    E = as_float_array(E)
 
     return 100 * eotf_BT1886(oetf_BT709(59.5208 * E))
 
@@ -272,7 +285,7 @@ def ootf_reverse_BT2100_PQ(F_D):
     0.1000000...
     """
 
-    F_D = np.asarray(F_D)
+    F_D = as_float_array(F_D)
 
     return oetf_reverse_BT709(eotf_reverse_BT1886(F_D / 100)) / 59.5208
 
@@ -511,7 +524,8 @@ def ootf_BT2100_HLG(E, L_B=0, L_W=1000, gamma=None):
     alpha = L_W - L_B
     beta = L_B
 
-    Y_S = np.sum(BT2100_HLG_WEIGHTS * tstack((R_S, G_S, B_S)), axis=-1)
+    Y_S = np.sum(
+        as_float_array(BT2100_HLG_WEIGHTS) * tstack((R_S, G_S, B_S)), axis=-1)
 
     if gamma is None:
         gamma = function_gamma_BT2100_HLG(L_W)
@@ -575,7 +589,8 @@ def ootf_reverse_BT2100_HLG(F_D, L_B=0, L_W=1000, gamma=None):
     else:
         R_D, G_D, B_D = tsplit(F_D)
 
-    Y_D = np.sum(BT2100_HLG_WEIGHTS * tstack((R_D, G_D, B_D)), axis=-1)
+    Y_D = np.sum(
+        as_float_array(BT2100_HLG_WEIGHTS) * tstack((R_D, G_D, B_D)), axis=-1)
 
     alpha = L_W - L_B
     beta = L_B
@@ -35,6 +35,7 @@ import numpy as np
 
 from colour.models.rgb.transfer_functions import (log_encoding_Cineon,
                                                   log_decoding_Cineon)
+from colour.utilities import as_float_array
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -77,7 +78,7 @@ def log_encoding_REDLog(x, black_offset=10 ** ((0 - 1023) / 511)):
     0.6376218...
     """
 
-    x = np.asarray(x)
+    x = as_float_array(x)
 
     return ((
         1023 + 511 * np.log10(x * (1 - black_offset) + black_offset)) / 1023)
@@ -110,7 +111,7 @@ def log_decoding_REDLog(y, black_offset=10 ** ((0 - 1023) / 511)):
     0.1...
     """
 
-    y = np.asarray(y)
+    y = as_float_array(y)
 
     return (((10 ** ((1023 * y - 1023) / 511)) - black_offset) /
             (1 - black_offset))
@@ -239,7 +240,7 @@ def log_encoding_Log3G10(x, legacy_curve=False):
     0.0915514...
     """
 
-    x = np.asarray(x)
+    x = as_float_array(x)
 
     if legacy_curve:
         return np.sign(x) * 0.222497 * np.log10((np.abs(x) * 169.379333) + 1)
@@ -277,7 +278,7 @@ def log_decoding_Log3G10(y, legacy_curve=False):
     184.3223476...
     """
 
-    y = np.asarray(y)
+    y = as_float_array(y)
 
     if legacy_curve:
         return (np.sign(y) *
@@ -312,7 +313,7 @@ def log_encoding_Log3G12(x):
     0.3333326...
     """
 
-    x = np.asarray(x)
+    x = as_float_array(x)
 
     return np.sign(x) * 0.184904 * np.log10((np.abs(x) * 347.189667) + 1)
 
@@ -342,7 +343,7 @@ def log_decoding_Log3G12(y):
     0.1800015...
     """
 
-    y = np.asarray(y)
+    y = as_float_array(y)
 
     return (np.sign(y) *
             (np.power(10.0, np.abs(y) / 0.184904) - 1) / 347.189667)
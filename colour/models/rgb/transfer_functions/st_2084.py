@@ -9,6 +9,11 @@ and electro-optical transfer function (EOTF / EOCF):
 -   :func:`colour.models.eotf_ST2084`
 -   :func:`colour.models.oetf_ST2084`
 
+Both functions evaluate several fractional powers per value, they optionally
+apply a cached :class:`colour.LogLUT1D` class look-up table instead, whose
+maximum relative error is given by :attr:`colour.models.ST2084_LUT_ERRORS`
+attribute.
+
 See Also
 --------
 `RGB Colourspaces Jupyter Notebook
@@ -31,7 +36,8 @@ from __future__ import division, unicode_literals
 
 import numpy as np
 
-from colour.utilities import Structure
+from colour.algebra import LogLUT1D
+from colour.utilities import CaseInsensitiveMapping, Structure, as_float_array
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -40,7 +46,9 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['ST2084_CONSTANTS', 'oetf_ST2084', 'eotf_ST2084']
+__all__ = [
+    'ST2084_CONSTANTS', 'ST2084_LUT_ERRORS', 'oetf_ST2084', 'eotf_ST2084'
+]
 
 ST2084_CONSTANTS = Structure(
     m_1=2610 / 4096 * (1 / 4),
@@ -55,8 +63,69 @@ Constants for *SMPTE ST 2084:2014* opto-electrical transfer function
 ST2084_CONSTANTS : Structure
 """
 
+ST2084_LUT_ERRORS = CaseInsensitiveMapping({'OETF': 1e-6, 'EOTF': 5e-6})
+ST2084_LUT_ERRORS.__doc__ = """
+Maximum relative errors of the *SMPTE ST 2084:2014* look-up tables applied by
+:func:`colour.models.oetf_ST2084` and :func:`colour.models.eotf_ST2084`
+definitions, the values outside the look-up tables domain being evaluated
+exactly.
+
+The *OETF* look-up table samples the normalised optical output
+:math:`C / L_p` over domain :math:`[2^{-32}, 2^4)` with 256 values per octave,
+the *EOTF* look-up table samples the non-linear signal offset by its value at
+zero optical output over domain :math:`[2^{-32}, 2^0)` with 1024 values per
+octave, the optical output being a power function of order
+:math:`1 / m_1 \\approx 6.3` of the offset signal near black.
+
+ST2084_LUT_ERRORS : CaseInsensitiveMapping
+    **{'OETF', 'EOTF'}**
+"""
+
+_ST2084_LUTS_CACHE = {}
+"""
+Cache for the *SMPTE ST 2084:2014* look-up tables.
+
+_ST2084_LUTS_CACHE : dict
+"""
+
+
+def _ST2084_LUT(kind, constants=ST2084_CONSTANTS):
+    """
+    Returns the *SMPTE ST 2084:2014* look-up table of given kind and constants
+    and caches it if not existing.
+
+    Parameters
+    ----------
+    kind : unicode
+        **{'OETF', 'EOTF'}**,
+        Look-up table kind.
+    constants : Structure, optional
+        *SMPTE ST 2084:2014* constants.
+
+    Returns
+    -------
+    LogLUT1D
+        *SMPTE ST 2084:2014* look-up table for a display peak luminance of 1.
+    """
+
+    key = (kind, tuple(sorted(constants.items())))
+    LUT = _ST2084_LUTS_CACHE.get(key)
+    if LUT is None:
+        if kind == 'OETF':
+            LUT = LogLUT1D(
+                lambda x: oetf_ST2084(x, 1, constants), (-32, 4), 8,
+                name='ST 2084 - OETF')
+        else:
+            LUT = LogLUT1D(
+                lambda x: eotf_ST2084(x, 1, constants), (-32, 0), 10,
+                constants.c_1 ** constants.m_2, 'ST 2084 - EOTF')
+
+        _ST2084_LUTS_CACHE[key] = LUT
+
+    return LUT
 
-def oetf_ST2084(C, L_p=10000, constants=ST2084_CONSTANTS):
+
+def oetf_ST2084(C, L_p=10000, constants=ST2084_CONSTANTS, use_LUT=False):
     """
     Defines *SMPTE ST 2084:2014* optimised perceptual opto-electronic transfer
     function (OETF / OECF).
@@ -70,6 +139,10 @@ def oetf_ST2084(C, L_p=10000, constants=ST2084_CONSTANTS):
         Display peak luminance :math:`cd/m^2`.
     constants : Structure, optional
         *SMPTE ST 2084:2014* constants.
+    use_LUT : bool, optional
+        Whether to apply a cached look-up table instead of evaluating the
+        function, its maximum relative error is given by
+        :attr:`colour.models.ST2084_LUT_ERRORS` attribute.
 
     Returns
     -------
@@ -88,9 +161,14 @@ def oetf_ST2084(C, L_p=10000, constants=ST2084_CONSTANTS):
     --------
     >>> oetf_ST2084(10.0, 1000)  # doctest: +ELLIPSIS
     0.5080784...
+    >>> oetf_ST2084(10.0, 1000, use_LUT=True)  # doctest: +ELLIPSIS
+    0.508078...
     """
 
-    C = np.asarray(C)
+    C = as_float_array(C)
+
+    if use_LUT:
+        return _ST2084_LUT('OETF', constants).apply(C / L_p)
 
     Y_p = (C / L_p) ** constants.m_1
 
@@ -100,7 +178,7 @@ def oetf_ST2084(C, L_p=10000, constants=ST2084_CONSTANTS):
     return N
 
 
-def eotf_ST2084(N, L_p=10000, constants=ST2084_CONSTANTS):
+def eotf_ST2084(N, L_p=10000, constants=ST2084_CONSTANTS, use_LUT=False):
     """
     Defines *SMPTE ST 2084:2014* optimised perceptual electro-optical transfer
     function (EOTF / EOCF).
@@ -119,6 +197,10 @@ def eotf_ST2084(N, L_p=10000, constants=ST2084_CONSTANTS):
         Display peak luminance :math:`cd/m^2`.
     constants : Structure, optional
         *SMPTE ST 2084:2014* constants.
+    use_LUT : bool, optional
+        Whether to apply a cached look-up table instead of evaluating the
+        function, its maximum relative error is given by
+        :attr:`colour.models.ST2084_LUT_ERRORS` attribute.
 
     Returns
     -------
@@ -135,9 +217,14 @@ def eotf_ST2084(N, L_p=10000, constants=ST2084_CONSTANTS):
     --------
     >>> eotf_ST2084(0.508078421517399)  # doctest: +ELLIPSIS
     100.0000000...
+    >>> eotf_ST2084(0.508078421517399, use_LUT=True)  # doctest: +ELLIPSIS
+    100.000...
     """
 
-    N = np.asarray(N)
+    N = as_float_array(N)
+
+    if use_LUT:
+        return L_p * _ST2084_LUT('EOTF', constants).apply(N)
 
     m_1_d = 1 / constants.m_1
     m_2_d = 1 / constants.m_2
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.models.rgb.transfer_functions` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import unittest
+
+from colour.models.rgb.transfer_functions import (
+    CCTF_LUT1D_REGISTRIES, cctf_LUT1D, eotf_ST2084, log_decoding_ALEXALogC)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['TestCctf_LUT1D']
+
+
+class TestCctf_LUT1D(unittest.TestCase):
+    """
+    Defines :func:`colour.models.rgb.transfer_functions.cctf_LUT1D`
+    definition unit tests methods.
+    """
+
+    def test_cctf_LUT1D(self):
+        """
+        Tests :func:`colour.models.rgb.transfer_functions.cctf_LUT1D`
+        definition.
+        """
+
+        LUT = cctf_LUT1D('ALEXA Log C', 'Log Decoding', EI=400)
+
+        x = np.arange(1024, dtype=np.uint16)
+        np.testing.assert_almost_equal(
+            LUT.apply(x, bit_depth=10),
+            log_decoding_ALEXALogC(x / 1023, EI=400),
+            decimal=10)
+
+        self.assertLess(LUT.maximum_error(), 1e-4)
+
+        LUT = cctf_LUT1D('ST 2084', 'EOTF', size=1024, L_p=10000)
+        x = np.linspace(0, 1, 11)
+        np.testing.assert_allclose(
+            LUT.apply(x, 'Cubic'), eotf_ST2084(x), rtol=1e-3, atol=1e-3)
+
+        for kind, registry in CCTF_LUT1D_REGISTRIES.items():
+            for function in registry:
+                LUT = cctf_LUT1D(function, kind, size=16)
+                self.assertEqual(LUT.size, 16)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,7 +9,10 @@ from __future__ import division, unicode_literals
 import numpy as np
 import unittest
 
-from colour.models.rgb.transfer_functions import oetf_ST2084, eotf_ST2084
+from colour.models.jzazbz import JZAZBZ_CONSTANTS
+from colour.models.rgb.transfer_functions import (ST2084_LUT_ERRORS,
+                                                  oetf_ST2084, eotf_ST2084)
+from colour.models.rgb.transfer_functions.st_2084 import ST2084_CONSTANTS
 from colour.utilities import ignore_numpy_errors
 
 __author__ = 'Colour Developers'
@@ -64,6 +67,23 @@ oetf_ST2084` definition n-dimensional arrays support.
         N = np.reshape(N, (2, 3, 1))
         np.testing.assert_almost_equal(oetf_ST2084(C), N, decimal=7)
 
+    def test_LUT_oetf_ST2084(self):
+        """
+        Tests :func:`colour.models.rgb.transfer_functions.st_2084.\
+oetf_ST2084` definition look-up table maximum relative error.
+        """
+
+        C = 10000 * 2 ** np.random.RandomState(4).uniform(-32, 4, 100000)
+        C = np.hstack([C, [0.0, 0.001, 100, 10000]])
+        for constants in (ST2084_CONSTANTS, JZAZBZ_CONSTANTS):
+            N = oetf_ST2084(C, constants=constants)
+            N_LUT = oetf_ST2084(C, constants=constants, use_LUT=True)
+
+            self.assertLess(
+                np.max(np.abs(N_LUT - N) / N), ST2084_LUT_ERRORS['OETF'])
+
+        self.assertEqual(oetf_ST2084(0.0, use_LUT=True), oetf_ST2084(0.0))
+
     @ignore_numpy_errors
     def test_nan_oetf_ST2084(self):
         """
@@ -116,6 +136,24 @@ eotf_ST2084` definition n-dimensional arrays support.
         C = np.reshape(C, (2, 3, 1))
         np.testing.assert_almost_equal(eotf_ST2084(N), C, decimal=7)
 
+    def test_LUT_eotf_ST2084(self):
+        """
+        Tests :func:`colour.models.rgb.transfer_functions.st_2084.\
+eotf_ST2084` definition look-up table maximum relative error.
+        """
+
+        for constants in (ST2084_CONSTANTS, JZAZBZ_CONSTANTS):
+            N_0 = constants.c_1 ** constants.m_2
+            N = N_0 + 2 ** np.random.RandomState(4).uniform(-32, 0, 100000)
+            N = np.hstack([N, np.linspace(0, 1, 1024)])
+            C = eotf_ST2084(N, constants=constants)
+            C_LUT = eotf_ST2084(N, constants=constants, use_LUT=True)
+
+            np.testing.assert_array_equal(C_LUT[C == 0], 0)
+            self.assertLess(
+                np.max(np.abs(C_LUT - C)[C != 0] / C[C != 0]),
+                ST2084_LUT_ERRORS['EOTF'])
+
     @ignore_numpy_errors
     def test_nan_eotf_ST2084(self):
         """
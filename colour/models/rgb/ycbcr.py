@@ -7,6 +7,8 @@ Defines the *Y'CbCr* colour encoding related transformations:
 
 -   :func:`colour.RGB_to_YCbCr`
 -   :func:`colour.YCbCr_to_RGB`
+-   :func:`colour.RGB_to_YCbCr_subsampled`
+-   :func:`colour.YCbCr_subsampled_to_RGB`
 -   :func:`colour.RGB_to_YcCbcCrc`
 -   :func:`colour.YcCbcCrc_to_RGB`
 
@@ -53,10 +55,10 @@ from __future__ import division, unicode_literals
 
 import numpy as np
 
-from colour.constants import DEFAULT_FLOAT_DTYPE
 from colour.models.rgb.transfer_functions import (CV_range, oetf_BT2020,
                                                   eotf_BT2020)
-from colour.utilities import CaseInsensitiveMapping, tsplit, tstack
+from colour.utilities import (CaseInsensitiveMapping, as_float_array,
+                              get_float_precision, tsplit, tstack)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -66,7 +68,8 @@ __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Development'
 
 __all__ = [
-    'YCBCR_WEIGHTS', 'YCbCr_ranges', 'RGB_to_YCbCr', 'YCbCr_to_RGB',
+    'YCBCR_WEIGHTS', 'CHROMA_SUBSAMPLINGS', 'YCbCr_ranges', 'RGB_to_YCbCr',
+    'YCbCr_to_RGB', 'RGB_to_YCbCr_subsampled', 'YCbCr_subsampled_to_RGB',
     'RGB_to_YcCbcCrc', 'YcCbcCrc_to_RGB'
 ]
 
@@ -91,6 +94,27 @@ YCBCR_WEIGHTS : dict
     **{'ITU-R BT.601', 'ITU-R BT.709', 'ITU-R BT.2020', 'SMPTE-240M}**
 """
 
+CHROMA_SUBSAMPLINGS = CaseInsensitiveMapping({
+    '4:4:4': (1, 1),
+    '4:2:2': (1, 2),
+    '4:2:0': (2, 2)
+})
+"""
+Chroma subsampling schemes, the chroma planes rows and columns subsampling
+factors.
+
+CHROMA_SUBSAMPLINGS : CaseInsensitiveMapping
+    **{'4:4:4', '4:2:2', '4:2:0'}**
+"""
+
+_YCBCR_INTEGER_MATRICES_CACHE = {}
+"""
+Cache for the *R'G'B'* to *Y'CbCr* colour encoding integer conversion
+matrices.
+
+_YCBCR_INTEGER_MATRICES_CACHE : dict
+"""
+
 
 def YCbCr_ranges(bits, is_legal, is_int):
     """"
@@ -129,7 +153,7 @@ def YCbCr_ranges(bits, is_legal, is_int):
         ranges = np.array([0, 2 ** bits - 1, 0, 2 ** bits - 1])
 
     if not is_int:
-        ranges = ranges.astype(DEFAULT_FLOAT_DTYPE) / (2 ** bits - 1)
+        ranges = ranges.astype(get_float_precision()) / (2 ** bits - 1)
 
     if is_int and not is_legal:
         ranges[3] = 2 ** bits
@@ -141,6 +165,127 @@ def YCbCr_ranges(bits, is_legal, is_int):
     return ranges
 
 
+def _YCbCr_integer_matrix(K, RGB_range, YCbCr_range, reverse=False):
+    """
+    Returns the matrix and offset converting *R'G'B'* code values to
+    *Y'CbCr* code values, or the reverse, as affine transformation.
+
+    Parameters
+    ----------
+    K : array_like
+        Luma weighting coefficients of red and blue.
+    RGB_range : array_like
+        *R'G'B'* code values range *(RGB_min, RGB_max)*.
+    YCbCr_range : array_like
+        *Y'CbCr* code values range *(Y_min, Y_max, C_min, C_max)*.
+    reverse : bool, optional
+        Whether to return the *Y'CbCr* to *R'G'B'* transformation.
+
+    Returns
+    -------
+    tuple
+        Matrix and offset.
+    """
+
+    Kr, Kb = (float(k) for k in K)
+    RGB_min, RGB_max = (float(x) for x in RGB_range)
+    Y_min, Y_max, C_min, C_max = (float(x) for x in YCbCr_range)
+
+    key = (Kr, Kb, RGB_min, RGB_max, Y_min, Y_max, C_min, C_max, reverse)
+    if key in _YCBCR_INTEGER_MATRICES_CACHE:
+        return _YCBCR_INTEGER_MATRICES_CACHE[key]
+
+    Kg = 1 - Kr - Kb
+    T = np.array([
+        [Kr, Kg, Kb],
+        [-0.5 * Kr / (1 - Kb), -0.5 * Kg / (1 - Kb), 0.5],
+        [0.5, -0.5 * Kg / (1 - Kr), -0.5 * Kb / (1 - Kr)],
+    ])
+    scale = np.array([Y_max - Y_min, C_max - C_min, C_max - C_min])
+    offset = np.array([Y_min, (C_max + C_min) / 2, (C_max + C_min) / 2])
+
+    M = scale[:, np.newaxis] * T / (RGB_max - RGB_min)
+    if not reverse:
+        matrix = (M, offset - np.dot(M, np.full(3, RGB_min)))
+    else:
+        M = np.linalg.inv(M)
+        matrix = (M, RGB_min - np.dot(M, offset))
+
+    _YCBCR_INTEGER_MATRICES_CACHE[key] = matrix
+
+    return matrix
+
+
+def _integer_affine_transform(M, offset, channels, divisor=1):
+    """
+    Applies given affine transformation to given integer channels using
+    fixed-point arithmetic, without converting them to float.
+
+    The results are rounded to the nearest integer, the values that are ties
+    in exact arithmetic, i.e. within the fixed-point error bound of a half
+    integer, are rounded half to even as :func:`np.round` definition does.
+
+    Parameters
+    ----------
+    M : array_like, (n, 3)
+        Transformation matrix.
+    offset : array_like, (n, )
+        Transformation offset.
+    channels : array_like
+        Three broadcastable integer channels, they may be sums of *divisor*
+        values to transform their average.
+    divisor : integer, optional
+        Power of two the channels are divided by.
+
+    Returns
+    -------
+    list
+        Transformed channels as *int64* arrays.
+
+    Raises
+    ------
+    ValueError
+        If the channels values are too large for the fixed-point arithmetic.
+    """
+
+    channels = [np.asarray(channel).astype(np.int64) for channel in channels]
+
+    # The channels peak value bounds the accumulator, the fixed-point shift is
+    # the largest one not overflowing *int64*.
+    peak = max([1] + [
+        max(abs(int(np.min(channel))), abs(int(np.max(channel))))
+        for channel in channels if channel.size
+    ])
+    bound = np.max(
+        np.sum(np.abs(M), axis=-1) * peak + np.abs(offset) * divisor) + 1
+    shift = min(62 - int(np.ceil(np.log2(bound))), 52)
+    if shift < 1:
+        raise ValueError('"{0}" peak value is too large for the integer '
+                         'conversion!'.format(peak))
+
+    M_i = np.round(np.asarray(M) * 2 ** shift).astype(np.int64)
+    offset_i = np.round(
+        np.asarray(offset) * divisor * 2 ** shift).astype(np.int64)
+    # Coefficients rounding and float representation error bound.
+    tolerance = int(np.ceil(1.5 * peak)) + 1026
+
+    shift += int(np.log2(divisor))
+    half = np.int64(1) << (shift - 1)
+
+    values = []
+    for i in range(M_i.shape[0]):
+        value = (M_i[i, 0] * channels[0] + M_i[i, 1] * channels[1] +
+                 M_i[i, 2] * channels[2] + offset_i[i])
+        quotient = value >> shift
+        remainder = value - (quotient << shift)
+        quotient += np.where(
+            np.abs(remainder - half) <= tolerance, quotient & 1,
+            remainder > half)
+        values.append(quotient.astype(np.int_))
+
+    return values
+
+
 def RGB_to_YCbCr(RGB,
                  K=YCBCR_WEIGHTS['ITU-R BT.709'],
                  in_bits=10,
@@ -272,15 +417,24 @@ def RGB_to_YCbCr(RGB,
     array([ 36, 136, 175])
     """
 
-    RGB = np.asarray(RGB)
+    RGB_range = kwargs.get('in_range', CV_range(in_bits, in_legal, in_int))
+    YCbCr_range = kwargs.get('out_range',
+                             YCbCr_ranges(out_bits, out_legal, out_int))
+
+    if in_int and out_int:
+        RGB = np.asarray(RGB)
+        if np.issubdtype(RGB.dtype, np.integer):
+            M, offset = _YCbCr_integer_matrix(K, RGB_range, YCbCr_range)
+
+            return tstack(
+                _integer_affine_transform(M, offset, tsplit(RGB, False)))
+
+    RGB = as_float_array(RGB)
     Kr, Kb = K
-    RGB_min, RGB_max = kwargs.get('in_range',
-                                  CV_range(in_bits, in_legal, in_int))
-    Y_min, Y_max, C_min, C_max = kwargs.get('out_range',
-                                            YCbCr_ranges(
-                                                out_bits, out_legal, out_int))
+    RGB_min, RGB_max = RGB_range
+    Y_min, Y_max, C_min, C_max = YCbCr_range
 
-    RGB_float = RGB.astype(DEFAULT_FLOAT_DTYPE) - RGB_min
+    RGB_float = RGB.astype(get_float_precision()) - RGB_min
     RGB_float *= 1 / (RGB_max - RGB_min)
     R, G, B = tsplit(RGB_float)
 
@@ -380,14 +534,24 @@ def YCbCr_to_RGB(YCbCr,
     array([ 0.5,  0.5,  0.5])
     """
 
-    YCbCr = np.asarray(YCbCr)
-    Y, Cb, Cr = tsplit(YCbCr.astype(DEFAULT_FLOAT_DTYPE))
+    YCbCr_range = kwargs.get('in_range',
+                             YCbCr_ranges(in_bits, in_legal, in_int))
+    RGB_range = kwargs.get('out_range', CV_range(out_bits, out_legal,
+                                                 out_int))
+
+    if in_int and out_int:
+        YCbCr = np.asarray(YCbCr)
+        if np.issubdtype(YCbCr.dtype, np.integer):
+            M, offset = _YCbCr_integer_matrix(K, RGB_range, YCbCr_range, True)
+
+            return tstack(
+                _integer_affine_transform(M, offset, tsplit(YCbCr, False)))
+
+    YCbCr = as_float_array(YCbCr)
+    Y, Cb, Cr = tsplit(YCbCr.astype(get_float_precision()))
     Kr, Kb = K
-    Y_min, Y_max, C_min, C_max = kwargs.get('in_range',
-                                            YCbCr_ranges(
-                                                in_bits, in_legal, in_int))
-    RGB_min, RGB_max = kwargs.get('out_range',
-                                  CV_range(out_bits, out_legal, out_int))
+    Y_min, Y_max, C_min, C_max = YCbCr_range
+    RGB_min, RGB_max = RGB_range
 
     Y -= Y_min
     Cb -= (C_max + C_min) / 2
@@ -407,6 +571,209 @@ def YCbCr_to_RGB(YCbCr,
     return RGB
 
 
+def RGB_to_YCbCr_subsampled(RGB,
+                            subsampling='4:2:0',
+                            K=YCBCR_WEIGHTS['ITU-R BT.709'],
+                            in_bits=10,
+                            in_legal=False,
+                            out_bits=10,
+                            out_legal=True,
+                            **kwargs):
+    """
+    Converts an image of integer *R'G'B'* code values to the corresponding
+    *Y'CbCr* colour encoding integer code values planes, subsampling the
+    chroma planes in the same pass.
+
+    The conversion uses fixed-point arithmetic without float conversion, the
+    chroma code values are the rounded averages of the blocks chroma values.
+
+    Parameters
+    ----------
+    RGB : array_like
+        Input *R'G'B'* image of integer code values with shape
+        *(..., height, width, 3)*.
+    subsampling : unicode, optional
+        **{'4:2:0', '4:2:2', '4:4:4'}**,
+        Chroma subsampling scheme, the image height and width must be
+        divisible by its factors.
+    K : array_like, optional
+        Luma weighting coefficients of red and blue. See
+        :attr:`colour.YCBCR_WEIGHTS` for presets. Default is
+        *(0.2126, 0.0722)*, the weightings for *ITU-R BT.709*.
+    in_bits : int, optional
+        Bit depth of the input code values. Default is *10*.
+    in_legal : bool, optional
+        Whether to treat the input values as legal range. Default is *False*.
+    out_bits : int, optional
+        Bit depth of the output code values. Default is *10*.
+    out_legal : bool, optional
+        Whether to return legal range values. Default is *True*.
+
+    Other Parameters
+    ----------------
+    in_range : array_like, optional
+        Array overriding the computed range such as
+        *in_range = (RGB_min, RGB_max)*.
+    out_range : array_like, optional
+        Array overriding the computed range such as
+        *out_range = (Y_min, Y_max, C_min, C_max)*.
+
+    Returns
+    -------
+    tuple
+        *Y'*, *Cb* and *Cr* integer code values planes.
+
+    Raises
+    ------
+    ValueError
+        If the image is not an array of integer code values or if its height
+        or width is not divisible by the chroma subsampling factors.
+
+    Examples
+    --------
+    >>> RGB = np.tile(np.array([1023, 0, 512]), (2, 2, 1))
+    >>> RGB[0, 0] = np.array([0, 1023, 0])
+    >>> Y, Cb, Cr = RGB_to_YCbCr_subsampled(RGB)
+    >>> Y
+    array([[691, 282],
+           [282, 282]])
+    >>> Cb, Cr
+    (array([[517]]), array([[731]]))
+    """
+
+    RGB = np.asarray(RGB)
+    if not np.issubdtype(RGB.dtype, np.integer):
+        raise ValueError('"R\'G\'B\'" image must be an array of integer code '
+                         'values!')
+
+    rows, columns = CHROMA_SUBSAMPLINGS[subsampling]
+    shape = RGB.shape[:-3]
+    height, width = RGB.shape[-3:-1]
+    if height % rows or width % columns:
+        raise ValueError(
+            '"{0}x{1}" image cannot be subsampled with "{2}" scheme!'.format(
+                width, height, subsampling))
+
+    M, offset = _YCbCr_integer_matrix(
+        K, kwargs.get('in_range', CV_range(in_bits, in_legal, True)),
+        kwargs.get('out_range', YCbCr_ranges(out_bits, out_legal, True)))
+
+    RGB_s = np.reshape(
+        RGB, shape + (height // rows, rows, width // columns, columns, 3))
+    RGB_s = np.sum(RGB_s.astype(np.int64), axis=(-4, -2))
+
+    Y = _integer_affine_transform(M[:1], offset[:1], tsplit(RGB, False))[0]
+    Cb, Cr = _integer_affine_transform(M[1:], offset[1:], tsplit(RGB_s, False),
+                                       rows * columns)
+
+    return Y, Cb, Cr
+
+
+def YCbCr_subsampled_to_RGB(Y,
+                            Cb,
+                            Cr,
+                            subsampling='4:2:0',
+                            K=YCBCR_WEIGHTS['ITU-R BT.709'],
+                            in_bits=10,
+                            in_legal=True,
+                            out_bits=10,
+                            out_legal=False,
+                            **kwargs):
+    """
+    Converts given *Y'CbCr* colour encoding integer code values planes to the
+    corresponding image of integer *R'G'B'* code values, upsampling the
+    chroma planes in the same pass.
+
+    The conversion uses fixed-point arithmetic without float conversion, the
+    chroma planes are upsampled by replication, i.e. each chroma code value
+    is used for its whole block.
+
+    Parameters
+    ----------
+    Y : array_like
+        *Y'* integer code values plane with shape *(..., height, width)*.
+    Cb : array_like
+        *Cb* integer code values plane with shape
+        *(..., height / rows, width / columns)*.
+    Cr : array_like
+        *Cr* integer code values plane with shape
+        *(..., height / rows, width / columns)*.
+    subsampling : unicode, optional
+        **{'4:2:0', '4:2:2', '4:4:4'}**,
+        Chroma subsampling scheme.
+    K : array_like, optional
+        Luma weighting coefficients of red and blue. See
+        :attr:`colour.YCBCR_WEIGHTS` for presets. Default is
+        *(0.2126, 0.0722)*, the weightings for *ITU-R BT.709*.
+    in_bits : int, optional
+        Bit depth of the input code values. Default is *10*.
+    in_legal : bool, optional
+        Whether to treat the input values as legal range. Default is *True*.
+    out_bits : int, optional
+        Bit depth of the output code values. Default is *10*.
+    out_legal : bool, optional
+        Whether to return legal range values. Default is *False*.
+
+    Other Parameters
+    ----------------
+    in_range : array_like, optional
+        Array overriding the computed range such as
+        *in_range = (Y_min, Y_max, C_min, C_max)*.
+    out_range : array_like, optional
+        Array overriding the computed range such as
+        *out_range = (RGB_min, RGB_max)*.
+
+    Returns
+    -------
+    ndarray
+        *R'G'B'* image of integer code values.
+
+    Raises
+    ------
+    ValueError
+        If the planes are not arrays of integer code values or if their
+        shapes do not match the chroma subsampling scheme.
+
+    Examples
+    --------
+    >>> Y = np.array([[691, 282], [282, 282]])
+    >>> Cb = np.array([[517]])
+    >>> Cr = np.array([[731]])
+    >>> YCbCr_subsampled_to_RGB(Y, Cb, Cr)[0]
+    array([[1126,  614,  743],
+           [ 648,  136,  265]])
+    """
+
+    Y, Cb, Cr = np.asarray(Y), np.asarray(Cb), np.asarray(Cr)
+    if not all(np.issubdtype(a.dtype, np.integer) for a in (Y, Cb, Cr)):
+        raise ValueError('"Y\'CbCr" planes must be arrays of integer code '
+                         'values!')
+
+    rows, columns = CHROMA_SUBSAMPLINGS[subsampling]
+    shape = Y.shape[:-2]
+    height, width = Y.shape[-2:]
+    shape_s = shape + (height // rows, 1, width // columns, 1)
+    if (Cb.shape != Cr.shape or height % rows or width % columns or
+            Cb.shape != shape_s[:-3] + shape_s[-2:-1]):
+        raise ValueError(
+            '"Y\'CbCr" planes shapes do not match "{0}" scheme!'.format(
+                subsampling))
+
+    M, offset = _YCbCr_integer_matrix(
+        K, kwargs.get('out_range', CV_range(out_bits, out_legal, True)),
+        kwargs.get('in_range', YCbCr_ranges(in_bits, in_legal, True)), True)
+
+    # The chroma planes are broadcast over their blocks.
+    RGB = _integer_affine_transform(M, offset, (
+        np.reshape(Y, shape + (height // rows, rows, width // columns,
+                               columns)),
+        np.reshape(Cb, shape_s),
+        np.reshape(Cr, shape_s),
+    ))
+
+    return np.reshape(tstack(RGB), shape + (height, width, 3))
+
+
 def RGB_to_YcCbcCrc(RGB,
                     out_bits=10,
                     out_legal=True,
@@ -467,7 +834,7 @@ def RGB_to_YcCbcCrc(RGB,
     array([422, 512, 512])
     """
 
-    RGB = np.asarray(RGB)
+    RGB = as_float_array(RGB)
     R, G, B = tsplit(RGB)
     Y_min, Y_max, C_min, C_max = kwargs.get('out_range',
                                             YCbCr_ranges(
@@ -552,8 +919,8 @@ def YcCbcCrc_to_RGB(YcCbcCrc,
     array([ 0.1800903...,  0.1800903...,  0.1800903...])
     """
 
-    YcCbcCrc = np.asarray(YcCbcCrc)
-    Yc, Cbc, Crc = tsplit(YcCbcCrc.astype(DEFAULT_FLOAT_DTYPE))
+    YcCbcCrc = as_float_array(YcCbcCrc)
+    Yc, Cbc, Crc = tsplit(YcCbcCrc.astype(get_float_precision()))
     Y_min, Y_max, C_min, C_max = kwargs.get('in_range',
                                             YCbCr_ranges(
                                                 in_bits, in_legal, in_int))
@@ -105,6 +105,25 @@ class TestXYZ_to_Lab(unittest.TestCase):
         np.testing.assert_almost_equal(
             XYZ_to_Lab(XYZ, illuminant), Lab, decimal=7)
 
+    def test_out_XYZ_to_Lab(self):
+        """
+        Tests :func:`colour.models.cie_lab.XYZ_to_Lab` definition *out*
+        argument support.
+        """
+
+        XYZ = np.array([0.07049534, 0.10080000, 0.09558313])
+        Lab = np.array([37.98562910, -23.62907688, -4.41746615])
+        illuminant = np.array([0.34570, 0.35850])
+
+        XYZ = np.tile(XYZ, (6, 1))
+        Lab = np.tile(Lab, (6, 1))
+        out = np.zeros(XYZ.shape)
+        self.assertIs(XYZ_to_Lab(XYZ, illuminant, out=out), out)
+        np.testing.assert_almost_equal(out, Lab, decimal=7)
+
+        self.assertIs(XYZ_to_Lab(XYZ, illuminant, out=XYZ), XYZ)
+        np.testing.assert_almost_equal(XYZ, Lab, decimal=7)
+
     @ignore_numpy_errors
     def test_nan_XYZ_to_Lab(self):
         """
@@ -200,6 +219,25 @@ class TestLab_to_XYZ(unittest.TestCase):
         np.testing.assert_almost_equal(
             Lab_to_XYZ(Lab, illuminant), XYZ, decimal=7)
 
+    def test_out_Lab_to_XYZ(self):
+        """
+        Tests :func:`colour.models.cie_lab.Lab_to_XYZ` definition *out*
+        argument support.
+        """
+
+        Lab = np.array([37.98562910, -23.62907688, -4.41746615])
+        XYZ = np.array([0.07049534, 0.10080000, 0.09558313])
+        illuminant = np.array([0.34570, 0.35850])
+
+        Lab = np.tile(Lab, (6, 1))
+        XYZ = np.tile(XYZ, (6, 1))
+        out = np.zeros(Lab.shape)
+        self.assertIs(Lab_to_XYZ(Lab, illuminant, out=out), out)
+        np.testing.assert_almost_equal(out, XYZ, decimal=7)
+
+        self.assertIs(Lab_to_XYZ(Lab, illuminant, out=Lab), Lab)
+        np.testing.assert_almost_equal(Lab, XYZ, decimal=7)
+
     @ignore_numpy_errors
     def test_nan_Lab_to_XYZ(self):
         """
@@ -258,6 +296,24 @@ class TestLab_to_LCHab(unittest.TestCase):
         LCHab = np.reshape(LCHab, (2, 3, 3))
         np.testing.assert_almost_equal(Lab_to_LCHab(Lab), LCHab, decimal=7)
 
+    def test_out_Lab_to_LCHab(self):
+        """
+        Tests :func:`colour.models.cie_lab.Lab_to_LCHab` definition *out*
+        argument support.
+        """
+
+        Lab = np.array([37.98562910, -23.62907688, -4.41746615])
+        LCHab = np.array([37.98562910, 24.03845422, 190.58923377])
+
+        Lab = np.tile(Lab, (6, 1))
+        LCHab = np.tile(LCHab, (6, 1))
+        out = np.zeros(Lab.shape)
+        self.assertIs(Lab_to_LCHab(Lab, out=out), out)
+        np.testing.assert_almost_equal(out, LCHab, decimal=7)
+
+        self.assertIs(Lab_to_LCHab(Lab, out=Lab), Lab)
+        np.testing.assert_almost_equal(Lab, LCHab, decimal=7)
+
     @ignore_numpy_errors
     def test_nan_Lab_to_LCHab(self):
         """
@@ -316,6 +372,24 @@ class TestLCHab_to_Lab(unittest.TestCase):
         Lab = np.reshape(Lab, (2, 3, 3))
         np.testing.assert_almost_equal(LCHab_to_Lab(LCHab), Lab, decimal=7)
 
+    def test_out_LCHab_to_Lab(self):
+        """
+        Tests :func:`colour.models.cie_lab.LCHab_to_Lab` definition *out*
+        argument support.
+        """
+
+        LCHab = np.array([37.98562910, 24.03845422, 190.58923377])
+        Lab = np.array([37.98562910, -23.62907688, -4.41746615])
+
+        LCHab = np.tile(LCHab, (6, 1))
+        Lab = np.tile(Lab, (6, 1))
+        out = np.zeros(LCHab.shape)
+        self.assertIs(LCHab_to_Lab(LCHab, out=out), out)
+        np.testing.assert_almost_equal(out, Lab, decimal=7)
+
+        self.assertIs(LCHab_to_Lab(LCHab, out=LCHab), LCHab)
+        np.testing.assert_almost_equal(LCHab, Lab, decimal=7)
+
     @ignore_numpy_errors
     def test_nan_LCHab_to_Lab(self):
         """
@@ -103,6 +103,24 @@ class TestXYZ_to_xyY(unittest.TestCase):
         np.testing.assert_almost_equal(
             XYZ_to_xyY(XYZ, illuminant), xyY, decimal=7)
 
+    def test_out_XYZ_to_xyY(self):
+        """
+        Tests :func:`colour.models.cie_xyy.XYZ_to_xyY` definition *out*
+        argument support.
+        """
+
+        XYZ = np.array([0.07049534, 0.10080000, 0.09558313])
+        xyY = np.array([0.26414772, 0.37770001, 0.10080000])
+
+        XYZ = np.tile(XYZ, (6, 1))
+        xyY = np.tile(xyY, (6, 1))
+        out = np.zeros(XYZ.shape)
+        self.assertIs(XYZ_to_xyY(XYZ, out=out), out)
+        np.testing.assert_almost_equal(out, xyY, decimal=7)
+
+        self.assertIs(XYZ_to_xyY(XYZ, out=XYZ), XYZ)
+        np.testing.assert_almost_equal(XYZ, xyY, decimal=7)
+
     @ignore_numpy_errors
     def test_nan_XYZ_to_xyY(self):
         """
@@ -166,6 +184,24 @@ class TestxyY_to_XYZ(unittest.TestCase):
         XYZ = np.reshape(XYZ, (2, 3, 3))
         np.testing.assert_almost_equal(xyY_to_XYZ(xyY), XYZ, decimal=7)
 
+    def test_out_xyY_to_XYZ(self):
+        """
+        Tests :func:`colour.models.cie_xyy.xyY_to_XYZ` definition *out*
+        argument support.
+        """
+
+        xyY = np.array([0.26414772, 0.37770001, 0.10080000])
+        XYZ = np.array([0.07049534, 0.10080000, 0.09558313])
+
+        xyY = np.tile(xyY, (6, 1))
+        XYZ = np.tile(XYZ, (6, 1))
+        out = np.zeros(xyY.shape)
+        self.assertIs(xyY_to_XYZ(xyY, out=out), out)
+        np.testing.assert_almost_equal(out, XYZ, decimal=7)
+
+        self.assertIs(xyY_to_XYZ(xyY, out=xyY), xyY)
+        np.testing.assert_almost_equal(xyY, XYZ, decimal=7)
+
     @ignore_numpy_errors
     def test_nan_xyY_to_XYZ(self):
         """
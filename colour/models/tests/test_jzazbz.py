@@ -66,6 +66,16 @@ class TestXYZ_to_JzAzBz(unittest.TestCase):
         JzAzBz = np.reshape(JzAzBz, (2, 3, 3))
         np.testing.assert_almost_equal(XYZ_to_JzAzBz(XYZ), JzAzBz, decimal=7)
 
+    def test_LUT_XYZ_to_JzAzBz(self):
+        """
+        Tests :func:`colour.models.jzazbz.XYZ_to_JzAzBz` definition look-up
+        table support.
+        """
+
+        XYZ = np.random.RandomState(4).random_sample((64, 3))
+        np.testing.assert_almost_equal(
+            XYZ_to_JzAzBz(XYZ, use_LUT=True), XYZ_to_JzAzBz(XYZ), decimal=6)
+
     @ignore_numpy_errors
     def test_nan_XYZ_to_JzAzBz(self):
         """
@@ -124,6 +134,18 @@ class TestJzAzBz_to_XYZ(unittest.TestCase):
         XYZ = np.reshape(XYZ, (2, 3, 3))
         np.testing.assert_almost_equal(JzAzBz_to_XYZ(JzAzBz), XYZ, decimal=7)
 
+    def test_LUT_JzAzBz_to_XYZ(self):
+        """
+        Tests :func:`colour.models.jzazbz.JzAzBz_to_XYZ` definition look-up
+        table support.
+        """
+
+        JzAzBz = XYZ_to_JzAzBz(np.random.RandomState(4).random_sample((64, 3)))
+        np.testing.assert_almost_equal(
+            JzAzBz_to_XYZ(JzAzBz, use_LUT=True),
+            JzAzBz_to_XYZ(JzAzBz),
+            decimal=6)
+
     @ignore_numpy_errors
     def test_nan_JzAzBz_to_XYZ(self):
         """
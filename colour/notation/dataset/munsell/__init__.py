@@ -2,12 +2,25 @@
 
 from __future__ import absolute_import
 
-from .all import MUNSELL_COLOURS_ALL
-from .experimental import MUNSELL_COLOURS_1929
-from .real import MUNSELL_COLOURS_REAL
+from .cache import (MUNSELL_COLOURS_CACHE_FILE, write_munsell_colours_cache,
+                    read_munsell_colours_cache)
 from colour.utilities import CaseInsensitiveMapping
 
-__all__ = ['MUNSELL_COLOURS_ALL']
+_MUNSELL_COLOURS_CACHE = read_munsell_colours_cache()
+if _MUNSELL_COLOURS_CACHE is not None:
+    MUNSELL_COLOURS_ALL = _MUNSELL_COLOURS_CACHE['MUNSELL_COLOURS_ALL']
+    MUNSELL_COLOURS_1929 = _MUNSELL_COLOURS_CACHE['MUNSELL_COLOURS_1929']
+    MUNSELL_COLOURS_REAL = _MUNSELL_COLOURS_CACHE['MUNSELL_COLOURS_REAL']
+else:
+    from .all import MUNSELL_COLOURS_ALL
+    from .experimental import MUNSELL_COLOURS_1929
+    from .real import MUNSELL_COLOURS_REAL
+
+__all__ = [
+    'MUNSELL_COLOURS_CACHE_FILE', 'write_munsell_colours_cache',
+    'read_munsell_colours_cache'
+]
+__all__ += ['MUNSELL_COLOURS_ALL']
 __all__ += ['MUNSELL_COLOURS_1929']
 __all__ += ['MUNSELL_COLOURS_REAL']
 
@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+"""
+Munsell Renotation System Dataset - Cache
+=========================================
+
+Defines the objects storing the *Munsell Renotation System* datasets as packed
+arrays in a *.npz* file next to their modules:
+
+-   :attr:`colour.notation.dataset.munsell.MUNSELL_COLOURS_CACHE_FILE`
+-   :func:`colour.notation.dataset.munsell.write_munsell_colours_cache`
+-   :func:`colour.notation.dataset.munsell.read_munsell_colours_cache`
+
+The *Python* literal modules, e.g.
+:mod:`colour.notation.dataset.munsell.all`, remain the canonical source of
+the datasets: the cache is generated from them at build time and only read
+at runtime, avoiding the compilation and evaluation of thousands of lines of
+literals.
+"""
+
+from __future__ import division, unicode_literals
+
+import hashlib
+import numpy as np
+import os
+from collections import OrderedDict
+from importlib import import_module
+
+from colour.utilities import warning
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'MUNSELL_COLOURS_CACHE_FILE', 'MUNSELL_COLOURS_SOURCES',
+    'write_munsell_colours_cache', 'read_munsell_colours_cache'
+]
+
+MUNSELL_COLOURS_CACHE_FILE = os.path.join(
+    os.path.dirname(__file__), 'munsell_colours.npz')
+"""
+*Munsell Renotation System* datasets cache file path.
+
+MUNSELL_COLOURS_CACHE_FILE : unicode
+"""
+
+MUNSELL_COLOURS_SOURCES = OrderedDict((
+    ('MUNSELL_COLOURS_ALL', 'all'),
+    ('MUNSELL_COLOURS_1929', 'experimental'),
+    ('MUNSELL_COLOURS_REAL', 'real'),
+))
+"""
+*Munsell Renotation System* datasets and the literal modules, relative to
+:mod:`colour.notation.dataset.munsell` package, defining them.
+
+MUNSELL_COLOURS_SOURCES : OrderedDict
+"""
+
+
+def _munsell_colours_sources_checksum():
+    """
+    Returns the checksum of the *Munsell Renotation System* datasets literal
+    modules sources, *None* if they are not available, e.g. bytecode only
+    distributions.
+    """
+
+    checksum = hashlib.sha1()
+    for module in MUNSELL_COLOURS_SOURCES.values():
+        path = os.path.join(os.path.dirname(__file__), module + '.py')
+        if not os.path.exists(path):
+            return None
+
+        with open(path, 'rb') as source_file:
+            checksum.update(source_file.read())
+
+    return checksum.hexdigest()
+
+
+def write_munsell_colours_cache(path=MUNSELL_COLOURS_CACHE_FILE):
+    """
+    Writes the *Munsell Renotation System* datasets cache from their literal
+    modules.
+
+    Parameters
+    ----------
+    path : unicode, optional
+        Cache file path.
+
+    Returns
+    -------
+    bool
+        Definition success.
+
+    Notes
+    -----
+    -   Each dataset is stored as three arrays: the hues, the values and
+        chromas and the *CIE xyY* colourspace arrays.
+
+    Examples
+    --------
+    >>> write_munsell_colours_cache()  # doctest: +SKIP
+    True
+    """
+
+    arrays = {}
+    for name, module in MUNSELL_COLOURS_SOURCES.items():
+        dataset = getattr(
+            import_module('{0}.{1}'.format(__package__, module)), name)
+
+        specifications, xyY = zip(*dataset)
+        hues, values, chromas = zip(*specifications)
+        arrays['{0}_hue'.format(name)] = np.array(hues)
+        arrays['{0}_value_chroma'.format(name)] = np.column_stack(
+            [values, chromas]).astype(np.float64)
+        arrays['{0}_xyY'.format(name)] = np.array(xyY, dtype=np.float64)
+
+    arrays['checksum'] = np.array(_munsell_colours_sources_checksum() or '')
+
+    with open(path, 'wb') as cache_file:
+        np.savez(cache_file, **arrays)
+
+    return True
+
+
+def read_munsell_colours_cache(path=MUNSELL_COLOURS_CACHE_FILE):
+    """
+    Reads the *Munsell Renotation System* datasets cache.
+
+    Parameters
+    ----------
+    path : unicode, optional
+        Cache file path.
+
+    Returns
+    -------
+    OrderedDict or None
+        *Munsell Renotation System* datasets, in the same form as defined by
+        their literal modules, *None* if the cache file does not exist or is
+        outdated.
+
+    Warning
+    -------
+    The cache is outdated if its literal modules have been modified since it
+    has been written, in that event
+    :func:`colour.notation.dataset.munsell.write_munsell_colours_cache`
+    definition should be used to regenerate it.
+
+    Examples
+    --------
+    >>> datasets = read_munsell_colours_cache()  # doctest: +SKIP
+    >>> datasets['MUNSELL_COLOURS_ALL'][0]  # doctest: +SKIP
+    (('2.5GY', 0.2, 2.0), array([ 0.713,  1.414,  0.237]))
+    """
+
+    if not os.path.exists(path):
+        return None
+
+    with np.load(path) as arrays:
+        arrays = dict((key, arrays[key]) for key in arrays.files)
+
+    checksum = _munsell_colours_sources_checksum()
+    if checksum is not None and checksum != arrays['checksum'].item():
+        warning('"{0}" cache file is outdated, its literal modules are used '
+                'instead!'.format(path))
+        return None
+
+    datasets = OrderedDict()
+    for name in MUNSELL_COLOURS_SOURCES:
+        hues = arrays['{0}_hue'.format(name)].tolist()
+        values_chromas = arrays['{0}_value_chroma'.format(name)].tolist()
+        xyY = arrays['{0}_xyY'.format(name)]
+
+        datasets[name] = tuple(
+            ((hue, value, chroma), xyY)
+            for hue, (value, chroma), xyY in zip(hues, values_chromas, xyY))
+
+    return datasets
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.notation.dataset.munsell.cache` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import os
+import shutil
+import unittest
+import tempfile
+
+from colour.notation.dataset.munsell import (read_munsell_colours_cache,
+                                             write_munsell_colours_cache)
+from colour.notation.dataset.munsell.all import MUNSELL_COLOURS_ALL
+from colour.notation.dataset.munsell.experimental import MUNSELL_COLOURS_1929
+from colour.notation.dataset.munsell.real import MUNSELL_COLOURS_REAL
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['TestMunsellColoursCache']
+
+
+class TestMunsellColoursCache(unittest.TestCase):
+    """
+    Defines :func:`colour.notation.dataset.munsell.cache.\
+write_munsell_colours_cache` and :func:`colour.notation.dataset.munsell.cache.\
+read_munsell_colours_cache` definitions units tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_munsell_colours_cache(self):
+        """
+        Tests :func:`colour.notation.dataset.munsell.cache.\
+write_munsell_colours_cache` and :func:`colour.notation.dataset.munsell.cache.\
+read_munsell_colours_cache` definitions.
+        """
+
+        path = os.path.join(self._temporary_directory, 'munsell_colours.npz')
+        self.assertIsNone(read_munsell_colours_cache(path))
+
+        self.assertTrue(write_munsell_colours_cache(path))
+        datasets = read_munsell_colours_cache(path)
+
+        for name, dataset in (('MUNSELL_COLOURS_ALL', MUNSELL_COLOURS_ALL),
+                              ('MUNSELL_COLOURS_1929', MUNSELL_COLOURS_1929),
+                              ('MUNSELL_COLOURS_REAL', MUNSELL_COLOURS_REAL)):
+            self.assertEqual(len(datasets[name]), len(dataset))
+            self.assertListEqual([x[0] for x in datasets[name]],
+                                 [x[0] for x in dataset])
+            np.testing.assert_equal([x[1] for x in datasets[name]],
+                                    [x[1] for x in dataset])
+
+        with np.load(path) as arrays:
+            arrays = dict((key, arrays[key]) for key in arrays.files)
+        arrays['checksum'] = np.array('')
+        with open(path, 'wb') as cache_file:
+            np.savez(cache_file, **arrays)
+
+        self.assertIsNone(read_munsell_colours_cache(path))
+
+
+if __name__ == '__main__':
+    unittest.main()
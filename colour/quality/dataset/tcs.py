@@ -25,8 +25,10 @@ References
 
 from __future__ import division, unicode_literals
 
+from functools import partial
+
 from colour.colorimetry import SpectralPowerDistribution
-from colour.utilities import CaseInsensitiveMapping
+from colour.utilities import CaseInsensitiveMapping, LazyCaseInsensitiveMapping
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -1445,8 +1447,8 @@ TCS_SPDS_DATA = {
     }
 }
 
-TCS_SPDS = CaseInsensitiveMapping(
-    dict((key, SpectralPowerDistribution(value, name=key))
+TCS_SPDS = LazyCaseInsensitiveMapping(
+    dict((key, partial(SpectralPowerDistribution, value, name=key))
          for key, value in TCS_SPDS_DATA.items()))
 """
 Test colour samples spectral power distributions.
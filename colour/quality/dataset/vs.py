@@ -27,8 +27,10 @@ References
 
 from __future__ import division, unicode_literals
 
+from functools import partial
+
 from colour.colorimetry import SpectralPowerDistribution
-from colour.utilities import CaseInsensitiveMapping
+from colour.utilities import CaseInsensitiveMapping, LazyCaseInsensitiveMapping
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -1483,8 +1485,8 @@ VS_SPDS_DATA = {
     }
 }
 
-VS_SPDS = CaseInsensitiveMapping(
-    dict((key, SpectralPowerDistribution(value, name=key))
+VS_SPDS = LazyCaseInsensitiveMapping(
+    dict((key, partial(SpectralPowerDistribution, value, name=key))
          for key, value in VS_SPDS_DATA.items()))
 """
 CQS test colour samples spectral power distributions.
@@ -14,8 +14,10 @@ References
 
 from __future__ import division, unicode_literals
 
+from functools import partial
+
 from colour.colorimetry.spectrum import SpectralPowerDistribution
-from colour.utilities import CaseInsensitiveMapping, filter_warnings
+from colour.utilities import LazyCaseInsensitiveMapping, suppress_warnings
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -113,45 +115,42 @@ SMITS_1999_SPDS_DATA = {
     }
 }
 
-filter_warnings(True)
-"""
-Filtering warnings issued by Smits (1999) non-uniform wavelengths distribution.
-Using `np.linspace(380, 720, 10)` does not solve the issue:
 
->>> colour.utilities.interval(np.linspace(380, 720, 10))
-array([ 37.77777778,  37.77777778,  37.77777778])
-"""
+def _smits_1999_spd(name):
+    """
+    Returns the *Smits (1999)* spectral power distribution with given name.
+
+    Parameters
+    ----------
+    name : unicode
+        Spectral power distribution name.
+
+    Returns
+    -------
+    SpectralPowerDistribution
+        *Smits (1999)* spectral power distribution.
 
-SMITS_1999_SPDS = CaseInsensitiveMapping({
-    'white':
-        SpectralPowerDistribution(
-            SMITS_1999_SPDS_DATA['white'],
-            name='white'),
-    'cyan':
-        SpectralPowerDistribution(
-            SMITS_1999_SPDS_DATA['cyan'],
-            name='cyan'),
-    'magenta':
-        SpectralPowerDistribution(
-            SMITS_1999_SPDS_DATA['magenta'],
-            name='magenta'),
-    'yellow':
-        SpectralPowerDistribution(
-            SMITS_1999_SPDS_DATA['yellow'],
-            name='yellow'),
-    'red':
-        SpectralPowerDistribution(
-            SMITS_1999_SPDS_DATA['red'],
-            name='red'),
-    'green':
-        SpectralPowerDistribution(
-            SMITS_1999_SPDS_DATA['green'],
-            name='green'),
-    'blue':
-        SpectralPowerDistribution(
-            SMITS_1999_SPDS_DATA['blue'],
-            name='blue')
-})  # yapf: disable
+    Notes
+    -----
+    -   The warnings issued by *Smits (1999)* non-uniform wavelengths
+        distribution are filtered, using `np.linspace(380, 720, 10)` does not
+        solve the issue as :func:`colour.utilities.interval` definition
+        returns `array([ 37.77777778,  37.77777778,  37.77777778])`.
+    """
+
+    with suppress_warnings():
+        return SpectralPowerDistribution(SMITS_1999_SPDS_DATA[name], name=name)
+
+
+SMITS_1999_SPDS = LazyCaseInsensitiveMapping({
+    'white': partial(_smits_1999_spd, 'white'),
+    'cyan': partial(_smits_1999_spd, 'cyan'),
+    'magenta': partial(_smits_1999_spd, 'magenta'),
+    'yellow': partial(_smits_1999_spd, 'yellow'),
+    'red': partial(_smits_1999_spd, 'red'),
+    'green': partial(_smits_1999_spd, 'green'),
+    'blue': partial(_smits_1999_spd, 'blue')
+})
 SMITS_1999_SPDS.__doc__ = """
 *Smits (1999)* spectral power distributions.
 
@@ -161,6 +160,3 @@ References
 
 SMITS_1999_SPDS : CaseInsensitiveMapping
 """
-
-# Restoring warnings original state.
-filter_warnings(False)
@@ -6,13 +6,17 @@ from .common import (handle_numpy_errors, ignore_numpy_errors,
                      raise_numpy_errors, print_numpy_errors, warn_numpy_errors,
                      ignore_python_warnings, batch, is_openimageio_installed,
                      is_pandas_installed, is_iterable, is_string, is_numeric,
-                     is_integer, filter_kwargs, first_item)
-from .array import (as_numeric, as_namedtuple, closest_indexes, closest,
-                    normalise_maximum, interval, is_uniform, in_array, tstack,
-                    tsplit, row_as_diagonal, dot_vector, dot_matrix, orient,
-                    centroid, linear_conversion, fill_nan, ndarray_write)
-from .data_structures import Lookup, Structure, CaseInsensitiveMapping
+                     is_integer, filter_kwargs, get_function, first_item)
+from .array import (get_float_precision, set_float_precision,
+                    float_precision, as_float_array, as_numeric, as_namedtuple,
+                    closest_indexes, closest, normalise_maximum, interval,
+                    is_uniform, in_array, tstack, tsplit, row_as_diagonal,
+                    dot_vector, dot_matrix, orient, centroid,
+                    linear_conversion, fill_nan, ndarray_write)
+from .data_structures import (Lookup, Structure, CaseInsensitiveMapping,
+                              LazyCaseInsensitiveMapping)
 from .metrics import metric_mse, metric_psnr
+from .tiling import DEFAULT_TILE_SIZE, image_tiles, apply_tiled
 from .verbose import (ColourWarning, message_box, warning, filter_warnings,
                       suppress_warnings, numpy_print_options)
 
@@ -20,16 +24,22 @@ __all__ = [
     'handle_numpy_errors', 'ignore_numpy_errors', 'raise_numpy_errors',
     'print_numpy_errors', 'warn_numpy_errors', 'ignore_python_warnings',
     'batch', 'is_openimageio_installed', 'is_pandas_installed', 'is_iterable',
-    'is_string', 'is_numeric', 'is_integer', 'filter_kwargs', 'first_item'
+    'is_string', 'is_numeric', 'is_integer', 'filter_kwargs', 'get_function',
+    'first_item'
 ]
 __all__ += [
-    'as_numeric', 'as_namedtuple', 'closest_indexes', 'closest',
-    'normalise_maximum', 'interval', 'is_uniform', 'in_array', 'tstack',
-    'tsplit', 'row_as_diagonal', 'dot_vector', 'dot_matrix', 'orient',
-    'centroid', 'linear_conversion', 'fill_nan', 'ndarray_write'
+    'get_float_precision', 'set_float_precision', 'float_precision',
+    'as_float_array', 'as_numeric', 'as_namedtuple', 'closest_indexes',
+    'closest', 'normalise_maximum', 'interval', 'is_uniform', 'in_array',
+    'tstack', 'tsplit', 'row_as_diagonal', 'dot_vector', 'dot_matrix',
+    'orient', 'centroid', 'linear_conversion', 'fill_nan', 'ndarray_write'
+]
+__all__ += [
+    'Lookup', 'Structure', 'CaseInsensitiveMapping',
+    'LazyCaseInsensitiveMapping'
 ]
-__all__ += ['Lookup', 'Structure', 'CaseInsensitiveMapping']
 __all__ += ['metric_mse', 'metric_psnr']
+__all__ += ['DEFAULT_TILE_SIZE', 'image_tiles', 'apply_tiled']
 __all__ += [
     'ColourWarning', 'message_box', 'warning', 'filter_warnings',
     'suppress_warnings', 'numpy_print_options'
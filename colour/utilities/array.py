@@ -33,14 +33,150 @@ __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
 __all__ = [
-    'as_numeric', 'as_namedtuple', 'closest_indexes', 'closest',
-    'normalise_maximum', 'interval', 'is_uniform', 'in_array', 'tstack',
-    'tsplit', 'row_as_diagonal', 'dot_vector', 'dot_matrix', 'orient',
-    'centroid', 'linear_conversion', 'fill_nan', 'ndarray_write'
+    'get_float_precision', 'set_float_precision', 'float_precision',
+    'as_float_array', 'as_numeric', 'as_namedtuple', 'closest_indexes',
+    'closest', 'normalise_maximum', 'interval', 'is_uniform', 'in_array',
+    'tstack', 'tsplit', 'row_as_diagonal', 'dot_vector', 'dot_matrix',
+    'orient', 'centroid', 'linear_conversion', 'fill_nan', 'ndarray_write'
 ]
 
 
-def as_numeric(a, type_=DEFAULT_FLOAT_DTYPE):
+_FLOAT_PRECISION = [DEFAULT_FLOAT_DTYPE]
+"""
+Current floating point precision, a mutable container is used so that the
+definitions reading it see its updates.
+
+_FLOAT_PRECISION : list
+"""
+
+
+def get_float_precision():
+    """
+    Returns the current floating point precision, i.e. the dtype the
+    definitions supporting it compute with.
+
+    Returns
+    -------
+    type
+        Current floating point precision.
+
+    Examples
+    --------
+    >>> get_float_precision()
+    <class 'numpy.float64'>
+    """
+
+    return _FLOAT_PRECISION[0]
+
+
+def set_float_precision(dtype=DEFAULT_FLOAT_DTYPE):
+    """
+    Sets the current floating point precision.
+
+    The models, transfer functions and colour appearance models convert their
+    inputs, constants and outputs to that precision, e.g. *float32* images
+    are processed in *float32* instead of being promoted to *float64*, halving
+    memory usage and bandwidth at the expense of accuracy.
+
+    Parameters
+    ----------
+    dtype : type, optional
+        **{np.float16, np.float32, np.float64}**,
+        Floating point precision, :attr:`colour.constants.DEFAULT_FLOAT_DTYPE`
+        restores the default precision.
+
+    Returns
+    -------
+    type
+        Previous floating point precision.
+
+    Raises
+    ------
+    ValueError
+        If the given dtype is not a floating point dtype.
+
+    Warning
+    -------
+    The floating point precision is global to the process and shared by all
+    its threads.
+
+    Examples
+    --------
+    >>> set_float_precision(np.float32)
+    <class 'numpy.float64'>
+    >>> as_float_array([0.5, 1.0]).dtype
+    dtype('float32')
+    >>> set_float_precision()
+    <class 'numpy.float32'>
+    """
+
+    dtype = np.dtype(dtype).type
+    if not issubclass(dtype, np.floating):
+        raise ValueError(
+            '"{0}" is not a floating point dtype!'.format(dtype.__name__))
+
+    previous = _FLOAT_PRECISION[0]
+    _FLOAT_PRECISION[0] = dtype
+
+    return previous
+
+
+@contextmanager
+def float_precision(dtype):
+    """
+    A context manager setting the floating point precision while in use.
+
+    Parameters
+    ----------
+    dtype : type
+        **{np.float16, np.float32, np.float64}**,
+        Floating point precision.
+
+    Examples
+    --------
+    >>> with float_precision(np.float32):
+    ...     as_float_array([0.5, 1.0]).dtype
+    dtype('float32')
+    >>> as_float_array([0.5, 1.0]).dtype
+    dtype('float64')
+    """
+
+    previous = set_float_precision(dtype)
+    try:
+        yield
+    finally:
+        set_float_precision(previous)
+
+
+def as_float_array(a, dtype=None):
+    """
+    Converts given :math:`a` variable to *ndarray* with given floating point
+    dtype, without copy if it already has it.
+
+    Parameters
+    ----------
+    a : object
+        Variable to convert.
+    dtype : type, optional
+        Floating point dtype, default to the current floating point precision
+        as returned by :func:`colour.utilities.get_float_precision`
+        definition.
+
+    Returns
+    -------
+    ndarray
+        :math:`a` variable converted to *ndarray*.
+
+    Examples
+    --------
+    >>> as_float_array([1, 2, 3])
+    array([ 1.,  2.,  3.])
+    """
+
+    return np.asarray(a, _FLOAT_PRECISION[0] if dtype is None else dtype)
+
+
+def as_numeric(a, type_=None):
     """
     Converts given :math:`a` variable to *numeric*. In the event where
     :math:`a` cannot be converted, it is passed as is.
@@ -49,8 +185,10 @@ def as_numeric(a, type_=DEFAULT_FLOAT_DTYPE):
     ----------
     a : object
         Variable to convert.
-    type_ : object
-        Type to use for conversion.
+    type_ : object, optional
+        Type to use for conversion, default to the current floating point
+        precision as returned by :func:`colour.utilities.get_float_precision`
+        definition.
 
     Returns
     -------
@@ -65,6 +203,9 @@ def as_numeric(a, type_=DEFAULT_FLOAT_DTYPE):
     array([ 0.,  1.,  2.,  3.,  4.,  5.,  6.,  7.,  8.,  9.])
     """
 
+    if type_ is None:
+        type_ = _FLOAT_PRECISION[0]
+
     try:
         return type_(a)
     except TypeError:
@@ -339,7 +480,7 @@ def in_array(a, b, tolerance=EPSILON):
     return np.any(d <= tolerance, axis=0).reshape(a.shape)
 
 
-def tstack(a):
+def tstack(a, out=None):
     """
     Stacks arrays in sequence along the last axis (tail).
 
@@ -349,6 +490,9 @@ def tstack(a):
     ----------
     a : array_like
         Array to perform the stacking.
+    out : ndarray, optional
+        Array to write the stacked arrays into, it must have the stacked
+        arrays shape, its last axis being their count.
 
     Returns
     -------
@@ -383,14 +527,24 @@ def tstack(a):
              [3, 3, 3],
              [4, 4, 4],
              [5, 5, 5]]]])
+    >>> out = np.zeros((1, 1, 6, 3), dtype=np.int_)
+    >>> tstack((a, a, a), out) is out
+    True
     """
 
-    a = np.asarray(a)
+    if out is not None:
+        # Arrays overlapping the output, e.g. channels views of an array
+        # converted in place, are copied before being overwritten.
+        a = [np.copy(x) if np.may_share_memory(x, out) else x for x in a]
+        for i, x in enumerate(a):
+            out[..., i] = x
 
-    return np.concatenate([x[..., np.newaxis] for x in a], axis=-1)
+        return out
 
+    return np.stack(a, axis=-1)
 
-def tsplit(a):
+
+def tsplit(a, copy=True):
     """
     Splits arrays in sequence along the last axis (tail).
 
@@ -398,6 +552,10 @@ def tsplit(a):
     ----------
     a : array_like
         Array to perform the splitting.
+    copy : bool, optional
+        Whether to return a copy of the array channels, if *False*, a view on
+        the array is returned, avoiding a copy but modifying the returned
+        channels in place modifies the array.
 
     Returns
     -------
@@ -434,10 +592,15 @@ def tsplit(a):
            [[0, 1, 2, 3, 4, 5]],
     <BLANKLINE>
            [[0, 1, 2, 3, 4, 5]]])
+    >>> np.may_share_memory(tsplit(a, copy=False), a)
+    True
     """
 
     a = np.asarray(a)
 
+    if not copy:
+        return np.moveaxis(a, -1, 0)
+
     return np.array([a[..., x] for x in range(a.shape[-1])])
 
 
@@ -494,7 +657,7 @@ def row_as_diagonal(a):
     return np.eye(a.shape[-1]) * a
 
 
-def dot_vector(m, v):
+def dot_vector(m, v, out=None):
     """
     Convenient wrapper around :func:`np.einsum` with the following subscripts:
     *'...ij,...j->...i'*.
@@ -502,12 +665,18 @@ def dot_vector(m, v):
     It performs the dot product of two arrays where *m* parameter is expected
     to be an array of 3x3 matrices and parameter *v* an array of vectors.
 
+    A single 3x3 matrix is applied with :func:`np.matmul` to the vectors
+    array, avoiding the broadcasting overhead of :func:`np.einsum`.
+
     Parameters
     ----------
     m : array_like
         Array of 3x3 matrices.
     v : array_like
         Array of vectors.
+    out : ndarray, optional
+        Array to write the dot product into, it must have the vectors array
+        shape and may be the vectors array itself.
 
     Returns
     -------
@@ -532,7 +701,23 @@ def dot_vector(m, v):
            [ 0.0794399...,  0.1220905...,  0.0955788...]])
     """
 
-    return np.einsum('...ij,...j->...i', m, v)
+    m = as_float_array(m)
+    v = as_float_array(v)
+
+    if out is None:
+        if m.ndim == 2:
+            return np.matmul(v, m.T)
+
+        return np.einsum('...ij,...j->...i', m, v)
+
+    # The products are not computed in place, overlapping vectors are copied.
+    if np.may_share_memory(v, out):
+        v = np.copy(v)
+
+    if m.ndim == 2:
+        return np.matmul(v, m.T, out=out)
+
+    return np.einsum('...ij,...j->...i', m, v, out=out)
 
 
 def dot_matrix(a, b):
@@ -590,7 +775,8 @@ def dot_matrix(a, b):
             [-0.0044203...,  0.0377490...,  0.9666713...]]])
     """
 
-    return np.einsum('...ij,...jk->...ik', a, b)
+    return np.einsum('...ij,...jk->...ik', as_float_array(a),
+                     as_float_array(b))
 
 
 def orient(a, orientation):
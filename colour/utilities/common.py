@@ -19,8 +19,8 @@ import inspect
 import functools
 import numpy as np
 import warnings
-from copy import deepcopy
 from six import string_types
+from weakref import WeakKeyDictionary
 
 from colour.constants import INTEGER_THRESHOLD
 
@@ -35,9 +35,18 @@ __all__ = [
     'handle_numpy_errors', 'ignore_numpy_errors', 'raise_numpy_errors',
     'print_numpy_errors', 'warn_numpy_errors', 'ignore_python_warnings',
     'batch', 'is_openimageio_installed', 'is_pandas_installed', 'is_iterable',
-    'is_string', 'is_numeric', 'is_integer', 'filter_kwargs', 'first_item'
+    'is_string', 'is_numeric', 'is_integer', 'filter_kwargs', 'get_function',
+    'first_item'
 ]
 
+_FILTER_KWARGS_ARGUMENTS_CACHE = WeakKeyDictionary()
+"""
+Cache for the functions arguments names used by
+:func:`colour.utilities.filter_kwargs` definition.
+
+_FILTER_KWARGS_ARGUMENTS_CACHE : WeakKeyDictionary
+"""
+
 
 def handle_numpy_errors(**kwargs):
     """
@@ -356,14 +365,69 @@ def filter_kwargs(function, **kwargs):
     (1, 2, 3)
     """
 
-    kwargs = deepcopy(kwargs)
-    args, _varargs, _keywords, _defaults = inspect.getargspec(function)
+    if not kwargs:
+        return kwargs
+
+    try:
+        args = _FILTER_KWARGS_ARGUMENTS_CACHE.get(function)
+    except TypeError:
+        args = None
+
+    if args is None:
+        args = frozenset(inspect.getargspec(function).args)
+        try:
+            _FILTER_KWARGS_ARGUMENTS_CACHE[function] = args
+        except TypeError:
+            pass
+
+    return dict((key, value) for key, value in kwargs.items() if key in args)
+
+
+def get_function(mapping, name, **kwargs):
+    """
+    Returns the function with given name in given mapping of functions with
+    the keyword arguments compatible with its signature bound to it.
+
+    The dispatching definitions, e.g. :func:`colour.oetf` or
+    :func:`colour.delta_E`, resolve the function and filter the keyword
+    arguments on each call, the returned function can be called repeatedly,
+    e.g. in a loop over small arrays, without that overhead.
+
+    Parameters
+    ----------
+    mapping : CaseInsensitiveMapping or dict
+        Mapping of functions, e.g. :attr:`colour.OETFS`.
+    name : unicode
+        Function name in the mapping.
+
+    Other Parameters
+    ----------------
+    \**kwargs : dict, optional
+        Keywords arguments, the ones incompatible with the function signature
+        are filtered.
+
+    Returns
+    -------
+    partial
+        Function with the compatible keyword arguments bound.
+
+    Examples
+    --------
+    >>> def fn_a(a, b=0):
+    ...     return a, b
+    >>> def fn_b(a, c=0):
+    ...     return a, c
+    >>> mapping = {'A': fn_a, 'B': fn_b}
+    >>> function = get_function(mapping, 'A', b=2, c=3)
+    >>> function(1)
+    (1, 2)
+    >>> get_function(mapping, 'B', b=2, c=3)(1)
+    (1, 3)
+    """
 
-    args = set(kwargs.keys()) - set(args)
-    for key in args:
-        kwargs.pop(key)
+    function = mapping[name]
 
-    return kwargs
+    return functools.partial(function, **filter_kwargs(function, **kwargs))
 
 
 def first_item(a):
@@ -11,6 +11,8 @@ Defines various data structures classes:
     retrieve keys by values.
 -   :class:`colour.utilities.CaseInsensitiveMapping`: A case insensitive
     mapping allowing values retrieving from keys while ignoring the key case.
+-   :class:`colour.utilities.LazyCaseInsensitiveMapping`: Another case
+    insensitive mapping building its values from factories on first access.
 
 References
 ----------
@@ -27,7 +29,8 @@ structures.py#L37
 
 from __future__ import division, unicode_literals
 
-from collections import Mapping, MutableMapping
+from collections import Mapping, MutableMapping, OrderedDict
+from functools import partial
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -36,7 +39,10 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['Structure', 'Lookup', 'CaseInsensitiveMapping']
+__all__ = [
+    'Structure', 'Lookup', 'CaseInsensitiveMapping',
+    'LazyCaseInsensitiveMapping'
+]
 
 
 class Structure(dict):
@@ -454,3 +460,161 @@ class CaseInsensitiveMapping(MutableMapping):
         """
 
         return ((item, value[1]) for (item, value) in self._data.items())
+
+
+class LazyCaseInsensitiveMapping(CaseInsensitiveMapping):
+    """
+    Implements a lazy case-insensitive mutable mapping / *dict* object.
+
+    The callable values stored into the mapping are treated as factories:
+    they are called without arguments on first access and their result is
+    memoised in place of them, deferring the construction of costly values,
+    e.g. datasets spectral power distributions, until they are actually
+    needed. The items insertion order is preserved.
+
+    Parameters
+    ----------
+    data : dict
+        *dict* of data to store into the mapping at initialisation.
+
+    Other Parameters
+    ----------------
+    \**kwargs : dict, optional
+        Key / Value pairs to store into the mapping at initialisation.
+
+    Methods
+    -------
+    __getitem__
+    update
+    copy
+    lower_items
+    is_resolved
+
+    Warning
+    -------
+    Callable values, e.g. classes or functions, cannot be stored as is into
+    the mapping, they must be returned by a factory.
+
+    Notes
+    -----
+    -   Updating the mapping with another
+        :class:`colour.utilities.LazyCaseInsensitiveMapping` class instance
+        does not resolve its values: the unresolved ones are stored as
+        factories resolving them from that mapping so that both share the
+        same objects.
+
+    Examples
+    --------
+    >>> methods = LazyCaseInsensitiveMapping({'McCamy': lambda: 1})
+    >>> methods.is_resolved('mccamy')
+    False
+    >>> methods['mccamy']
+    1
+    >>> methods.is_resolved('mccamy')
+    True
+    """
+
+    def __init__(self, data=None, **kwargs):
+        super(LazyCaseInsensitiveMapping, self).__init__()
+
+        self._data = OrderedDict()
+
+        self.update({} if data is None else data, **kwargs)
+
+    def __getitem__(self, item):
+        """
+        Returns the value of given item.
+
+        The item value is built by its factory and memoised if not already
+        resolved.
+
+        Parameters
+        ----------
+        item : unicode
+            Item name.
+
+        Returns
+        -------
+        object
+            Item value.
+        """
+
+        key, value = self._data[item.lower()]
+
+        if callable(value):
+            value = value()
+            self._data[item.lower()] = (key, value)
+
+        return value
+
+    def update(self, *args, **kwargs):
+        """
+        Updates the mapping with given mapping or key / value pairs.
+
+        Parameters
+        ----------
+        \*args : list, optional
+            Mapping or iterable of key / value pairs.
+
+        Other Parameters
+        ----------------
+        \**kwargs : dict, optional
+            Key / Value pairs.
+        """
+
+        if len(args) == 1 and isinstance(args[0],
+                                         LazyCaseInsensitiveMapping):
+            data = args[0]
+            for key, value in data.data.values():
+                self[key] = (partial(data.__getitem__, key)
+                             if callable(value) else value)
+            args = ()
+
+        super(LazyCaseInsensitiveMapping, self).update(*args, **kwargs)
+
+    def copy(self):
+        """
+        Returns a copy of the mapping.
+
+        Returns
+        -------
+        LazyCaseInsensitiveMapping
+            Mapping copy.
+
+        Notes
+        -----
+        -   The :class:`colour.utilities.LazyCaseInsensitiveMapping` class
+            copy returned is a simple *copy* not a *deepcopy*, its unresolved
+            values are resolved from the original mapping.
+        """
+
+        return LazyCaseInsensitiveMapping(self)
+
+    def lower_items(self):
+        """
+        Iterates over the lower items names.
+
+        Returns
+        -------
+        generator
+            Lower item names.
+        """
+
+        return ((item, self[item]) for item in list(self._data.keys()))
+
+    def is_resolved(self, item):
+        """
+        Returns if given item value has been resolved.
+
+        Parameters
+        ----------
+        item : unicode
+            Item name.
+
+        Returns
+        -------
+        bool
+            Is item value resolved.
+        """
+
+        return not callable(self._data[item.lower()][1])
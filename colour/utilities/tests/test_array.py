@@ -10,11 +10,12 @@ import unittest
 from collections import namedtuple
 
 from colour.constants import DEFAULT_FLOAT_DTYPE
-from colour.utilities import (as_numeric, as_namedtuple, closest_indexes,
-                              closest, normalise_maximum, interval, is_uniform,
-                              in_array, tstack, tsplit, row_as_diagonal,
-                              dot_vector, dot_matrix, orient, centroid,
-                              linear_conversion, fill_nan, ndarray_write)
+from colour.utilities import (
+    get_float_precision, set_float_precision, float_precision, as_float_array,
+    as_numeric, as_namedtuple, closest_indexes, closest, normalise_maximum,
+    interval, is_uniform, in_array, tstack, tsplit, row_as_diagonal,
+    dot_vector, dot_matrix, orient, centroid, linear_conversion, fill_nan,
+    ndarray_write)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -24,14 +25,184 @@ __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
 __all__ = [
-    'TestAsNumeric', 'TestAsNametuple', 'TestClosestIndexes', 'TestClosest',
-    'TestNormaliseMaximum', 'TestInterval', 'TestIsUniform', 'TestInArray',
-    'TestTstack', 'TestTsplit', 'TestRowAsDiagonal', 'TestDotVector',
-    'TestDotMatrix', 'TestOrient', 'TestCentroid', 'TestLinearConversion',
-    'TestFillNan', 'TestNdarrayWrite'
+    'TestGetFloatPrecision', 'TestSetFloatPrecision', 'TestFloatPrecision',
+    'TestAsFloatArray', 'TestAsNumeric', 'TestAsNametuple',
+    'TestClosestIndexes', 'TestClosest', 'TestNormaliseMaximum',
+    'TestInterval', 'TestIsUniform', 'TestInArray', 'TestTstack', 'TestTsplit',
+    'TestRowAsDiagonal', 'TestDotVector', 'TestDotMatrix', 'TestOrient',
+    'TestCentroid', 'TestLinearConversion', 'TestFillNan', 'TestNdarrayWrite'
 ]
 
 
+class TestGetFloatPrecision(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.array.get_float_precision` definition unit
+    tests methods.
+    """
+
+    def test_get_float_precision(self):
+        """
+        Tests :func:`colour.utilities.array.get_float_precision` definition.
+        """
+
+        self.assertIs(get_float_precision(), DEFAULT_FLOAT_DTYPE)
+
+
+class TestSetFloatPrecision(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.array.set_float_precision` definition unit
+    tests methods.
+    """
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        set_float_precision()
+
+    def test_set_float_precision(self):
+        """
+        Tests :func:`colour.utilities.array.set_float_precision` definition.
+        """
+
+        self.assertIs(set_float_precision(np.float32), DEFAULT_FLOAT_DTYPE)
+        self.assertIs(get_float_precision(), np.float32)
+        self.assertEqual(as_numeric(np.array([0.5])).dtype, np.float32)
+
+        self.assertIs(set_float_precision('float16'), np.float32)
+        self.assertIs(get_float_precision(), np.float16)
+
+        self.assertIs(set_float_precision(), np.float16)
+        self.assertIs(get_float_precision(), DEFAULT_FLOAT_DTYPE)
+
+        self.assertRaises(ValueError, set_float_precision, np.int_)
+
+
+class TestFloatPrecision(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.array.float_precision` definition unit
+    tests methods.
+    """
+
+    def test_float_precision(self):
+        """
+        Tests :func:`colour.utilities.array.float_precision` definition.
+        """
+
+        with float_precision(np.float32):
+            self.assertIs(get_float_precision(), np.float32)
+
+        self.assertIs(get_float_precision(), DEFAULT_FLOAT_DTYPE)
+
+        try:
+            with float_precision(np.float32):
+                raise RuntimeError()
+        except RuntimeError:
+            pass
+
+        self.assertIs(get_float_precision(), DEFAULT_FLOAT_DTYPE)
+
+    def test_float_precision_accuracy(self):
+        """
+        Tests :func:`colour.utilities.array.float_precision` definition
+        accuracy bounds of the models, transfer functions and colour appearance
+        models processing *float32* arrays.
+        """
+
+        import colour
+
+        state = np.random.RandomState(4)
+        XYZ = state.uniform(0.05, 0.95, (16, 3))
+        RGB = state.uniform(0.01, 1.00, (16, 3))
+        Lab = colour.XYZ_to_Lab(XYZ)
+        XYZ_w = np.array([95.05, 100.00, 108.88])
+        xy_w = np.array([0.3127, 0.3290])
+
+        def specification(function, *args, **kwargs):
+            """
+            Returns the first correlates of given colour appearance model.
+            """
+
+            return lambda *a: tstack(function(*(a + args), **kwargs)[:3])
+
+        # Function, arguments, relative tolerance.
+        functions = [
+            (colour.XYZ_to_xyY, (XYZ, ), 1e-6),
+            (colour.xyY_to_XYZ, (colour.XYZ_to_xyY(XYZ), ), 1e-6),
+            (colour.XYZ_to_Lab, (XYZ, ), 1e-5),
+            (colour.Lab_to_XYZ, (Lab, ), 1e-6),
+            (colour.Lab_to_LCHab, (Lab, ), 1e-6),
+            (colour.XYZ_to_Luv, (XYZ, ), 1e-4),
+            (colour.XYZ_to_IPT, (XYZ, ), 1e-4),
+            (colour.XYZ_to_hdr_IPT, (XYZ, ), 1e-4),
+            (colour.XYZ_to_hdr_CIELab, (XYZ, ), 1e-4),
+            (colour.XYZ_to_OSA_UCS, (XYZ * 100, ), 1e-4),
+            (colour.XYZ_to_RGB,
+             (XYZ, xy_w, xy_w, colour.sRGB_COLOURSPACE.XYZ_to_RGB_matrix),
+             1e-5),
+            (colour.RGB_to_ICTCP, (RGB, ), 1e-3),
+            (colour.RGB_to_YCbCr, (RGB, ), 1e-6),
+            (colour.chromatic_adaptation,
+             (XYZ, XYZ_w / 100, np.array([1.09850, 1.0, 0.35585])), 1e-6),
+            (specification(colour.XYZ_to_CIECAM02, XYZ_w, 318.31, 20.0),
+             (XYZ * 100, ), 1e-4),
+            (specification(colour.XYZ_to_CAM16, XYZ_w, 318.31, 20.0),
+             (XYZ * 100, ), 1e-4),
+            (specification(colour.XYZ_to_LLAB, XYZ_w, 318.31, 20.0),
+             (XYZ * 100, ), 1e-4),
+            (specification(colour.XYZ_to_RLAB, XYZ_w, 318.31),
+             (XYZ * 100, ), 1e-4),
+            (specification(colour.XYZ_to_Nayatani95, XYZ_w, 20.0, 318.31,
+                           1.0), (XYZ * 100, ), 1e-4),
+            (lambda a, b: colour.delta_E(a, b, 'CIE 2000'),
+             (Lab, Lab * 1.05), 1e-4),
+        ]
+        functions += [(colour.OETFS[name], (RGB, ), 1e-4)
+                      for name in colour.OETFS]
+        functions += [(colour.EOTFS[name], (RGB * 0.9, ), 1e-4)
+                      for name in colour.EOTFS]
+        functions += [(colour.LOG_ENCODING_CURVES[name], (RGB, ), 1e-4)
+                      for name in colour.LOG_ENCODING_CURVES
+                      if name != 'ACESproxy']
+        functions += [(colour.LOG_DECODING_CURVES[name], (RGB * 0.9, ), 1e-4)
+                      for name in colour.LOG_DECODING_CURVES
+                      if name != 'ACESproxy']
+
+        for function, args, tolerance in functions:
+            value = function(*args)
+
+            with float_precision(np.float32):
+                value_f = function(*[a.astype(np.float32) for a in args])
+
+            self.assertEqual(value_f.dtype, np.float32)
+            np.testing.assert_allclose(
+                value_f, value, rtol=tolerance, atol=tolerance)
+
+
+class TestAsFloatArray(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.array.as_float_array` definition unit
+    tests methods.
+    """
+
+    def test_as_float_array(self):
+        """
+        Tests :func:`colour.utilities.array.as_float_array` definition.
+        """
+
+        self.assertEqual(as_float_array([1, 2, 3]).dtype, DEFAULT_FLOAT_DTYPE)
+
+        self.assertEqual(
+            as_float_array([1, 2, 3], np.float32).dtype, np.float32)
+
+        a = np.array([1, 2, 3], dtype=DEFAULT_FLOAT_DTYPE)
+        self.assertIs(as_float_array(a), a)
+
+        with float_precision(np.float32):
+            self.assertEqual(as_float_array(a).dtype, np.float32)
+
+
 class TestAsNumeric(unittest.TestCase):
     """
     Defines :func:`colour.utilities.array.as_numeric` definition unit tests
@@ -353,6 +524,22 @@ class TestTstack(unittest.TestCase):
                 [[3, 3, 3], [4, 4, 4], [5, 5, 5]],
             ]]))
 
+    def test_out_tstack(self):
+        """
+        Tests :func:`colour.utilities.array.tstack` definition *out* argument
+        support.
+        """
+
+        a = np.arange(0, 6)
+        out = np.zeros((6, 3), dtype=np.int_)
+        self.assertIs(tstack((a, a, a), out), out)
+        np.testing.assert_equal(out, tstack((a, a, a)))
+
+        a = np.reshape(np.arange(0, 18), (6, 3))
+        np.testing.assert_equal(
+            tstack((a[..., 2], a[..., 0], a[..., 1]), a)[0],
+            np.array([2, 0, 1]))
+
 
 class TestTsplit(unittest.TestCase):
     """
@@ -406,6 +593,18 @@ class TestTsplit(unittest.TestCase):
                 [[[0, 1, 2], [3, 4, 5]]],
             ]))
 
+    def test_copy_tsplit(self):
+        """
+        Tests :func:`colour.utilities.array.tsplit` definition *copy* argument
+        support.
+        """
+
+        a = np.reshape(np.arange(0, 18), (6, 3))
+        np.testing.assert_equal(tsplit(a, copy=False), tsplit(a))
+
+        self.assertFalse(np.may_share_memory(tsplit(a), a))
+        self.assertTrue(np.may_share_memory(tsplit(a, copy=False), a))
+
 
 class TestRowAsDiagonal(unittest.TestCase):
     """
@@ -479,6 +678,34 @@ class TestDotVector(unittest.TestCase):
             ]),
             decimal=7)
 
+    def test_out_dot_vector(self):
+        """
+        Tests :func:`colour.utilities.array.dot_vector` definition *out*
+        argument support.
+        """
+
+        m = np.array([
+            [0.7328, 0.4296, -0.1624],
+            [-0.7036, 1.6975, 0.0061],
+            [0.0030, 0.0136, 0.9834],
+        ])
+
+        v = np.array([0.07049534, 0.10080000, 0.09558313])
+        v = np.tile(v, (6, 1))
+        v_o = np.tile(np.array([0.07943996, 0.12209054, 0.09557882]), (6, 1))
+
+        out = np.zeros(v.shape)
+        self.assertIs(dot_vector(m, v, out), out)
+        np.testing.assert_almost_equal(out, v_o, decimal=7)
+
+        m = np.reshape(np.tile(m, (6, 1)), (6, 3, 3))
+        out = np.zeros(v.shape)
+        self.assertIs(dot_vector(m, v, out), out)
+        np.testing.assert_almost_equal(out, v_o, decimal=7)
+
+        self.assertIs(dot_vector(m, v, v), v)
+        np.testing.assert_almost_equal(v, v_o, decimal=7)
+
 
 class TestDotMatrix(unittest.TestCase):
     """
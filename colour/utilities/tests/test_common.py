@@ -10,7 +10,9 @@ import unittest
 from collections import OrderedDict
 
 from colour.utilities import (batch, is_iterable, is_string, is_numeric,
-                              is_integer, filter_kwargs, first_item)
+                              is_integer, filter_kwargs, get_function,
+                              first_item, CaseInsensitiveMapping)
+from colour.utilities.common import _FILTER_KWARGS_ARGUMENTS_CACHE
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -21,7 +23,7 @@ __status__ = 'Production'
 
 __all__ = [
     'TestBatch', 'TestIsIterable', 'TestIsString', 'TestIsNumeric',
-    'TestIsInteger', 'TestFilterKwargs', 'TestFirstItem'
+    'TestIsInteger', 'TestFilterKwargs', 'TestGetFunction', 'TestFirstItem'
 ]
 
 
@@ -186,6 +188,63 @@ class TestFilterKwargs(unittest.TestCase):
         self.assertTupleEqual((1, 2, 3),
                               fn_c(1, **filter_kwargs(fn_c, b=2, c=3)))
 
+    def test_filter_kwargs_caching(self):
+        """
+        Tests :func:`colour.utilities.common.filter_kwargs` definition
+        function arguments caching.
+        """
+
+        def fn_a(a, b=0):
+            """
+            :func:`filter_kwargs` unit tests :func:`fn_a`.
+            """
+
+            return a, b
+
+        kwargs = {'b': 2, 'c': 3}
+        self.assertDictEqual(filter_kwargs(fn_a, **kwargs), {'b': 2})
+        self.assertIn(fn_a, _FILTER_KWARGS_ARGUMENTS_CACHE)
+        self.assertDictEqual(filter_kwargs(fn_a, **kwargs), {'b': 2})
+        self.assertDictEqual(kwargs, {'b': 2, 'c': 3})
+
+        self.assertDictEqual(filter_kwargs(fn_a), {})
+
+
+class TestGetFunction(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.common.get_function` definition units
+    tests methods.
+    """
+
+    def test_get_function(self):
+        """
+        Tests :func:`colour.utilities.common.get_function` definition.
+        """
+
+        def fn_a(a, b=0):
+            """
+            :func:`get_function` unit tests :func:`fn_a`.
+            """
+
+            return a, b
+
+        def fn_b(a, c=0):
+            """
+            :func:`get_function` unit tests :func:`fn_b`.
+            """
+
+            return a, c
+
+        mapping = CaseInsensitiveMapping({'Function A': fn_a, 'B': fn_b})
+
+        function = get_function(mapping, 'function a', b=2, c=3)
+        self.assertTupleEqual(function(1), (1, 2))
+        self.assertTupleEqual(function(1, b=4), (1, 4))
+
+        self.assertTupleEqual(get_function(mapping, 'B', b=2)(1), (1, 0))
+
+        self.assertRaises(KeyError, get_function, mapping, 'C')
+
 
 class TestFirstItem(unittest.TestCase):
     """
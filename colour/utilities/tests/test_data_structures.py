@@ -7,8 +7,10 @@ from __future__ import division, unicode_literals
 
 import pickle
 import unittest
+from collections import OrderedDict
 
-from colour.utilities import Structure, Lookup, CaseInsensitiveMapping
+from colour.utilities import (Structure, Lookup, CaseInsensitiveMapping,
+                              LazyCaseInsensitiveMapping)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -17,7 +19,10 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['TestStructure', 'TestLookup', 'TestCaseInsensitiveMapping']
+__all__ = [
+    'TestStructure', 'TestLookup', 'TestCaseInsensitiveMapping',
+    'TestLazyCaseInsensitiveMapping'
+]
 
 
 class TestStructure(unittest.TestCase):
@@ -274,5 +279,82 @@ CaseInsensitiveMapping.lower_items` method.
             [('jane', 'Doe'), ('john', 'Doe')])
 
 
+class TestLazyCaseInsensitiveMapping(unittest.TestCase):
+    """
+    Defines :class:`colour.utilities.data_structures.\
+LazyCaseInsensitiveMapping` class unit tests methods.
+    """
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__getitem__', 'update', 'copy', 'lower_items',
+                            'is_resolved')
+
+        for method in required_methods:
+            self.assertIn(method, dir(LazyCaseInsensitiveMapping))
+
+    def test__getitem__(self):
+        """
+        Tests :meth:`colour.utilities.data_structures.\
+LazyCaseInsensitiveMapping.__getitem__` method.
+        """
+
+        calls = []
+
+        def factory():
+            """
+            Returns a new object and records the call.
+            """
+
+            calls.append(None)
+
+            return ['Doe']
+
+        mapping = LazyCaseInsensitiveMapping(
+            OrderedDict([('John', factory), ('Jane', 'Doe')]))
+        self.assertEqual(len(calls), 0)
+        self.assertFalse(mapping.is_resolved('john'))
+        self.assertTrue(mapping.is_resolved('Jane'))
+
+        self.assertListEqual(mapping['john'], ['Doe'])
+        self.assertIs(mapping['John'], mapping['JOHN'])
+        self.assertEqual(len(calls), 1)
+        self.assertListEqual(list(mapping.keys()), ['John', 'Jane'])
+
+    def test_update(self):
+        """
+        Tests :meth:`colour.utilities.data_structures.\
+LazyCaseInsensitiveMapping.update` method.
+        """
+
+        mapping1 = LazyCaseInsensitiveMapping(John=lambda: ['Doe'])
+        mapping2 = LazyCaseInsensitiveMapping(mapping1, Jane='Doe')
+        self.assertFalse(mapping1.is_resolved('John'))
+        self.assertFalse(mapping2.is_resolved('John'))
+
+        self.assertIs(mapping2['John'], mapping1['John'])
+
+        mapping3 = mapping1.copy()
+        self.assertTrue(mapping3.is_resolved('John'))
+        self.assertIs(mapping3['John'], mapping1['John'])
+
+    def test_lower_items(self):
+        """
+        Tests :meth:`colour.utilities.data_structures.\
+LazyCaseInsensitiveMapping.lower_items` method.
+        """
+
+        mapping = LazyCaseInsensitiveMapping(John=lambda: 'Doe', Jane='Doe')
+
+        self.assertListEqual(
+            sorted([item for item in mapping.lower_items()]),
+            [('jane', 'Doe'), ('john', 'Doe')])
+        self.assertEqual(mapping, CaseInsensitiveMapping(john='Doe',
+                                                         jane='Doe'))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.utilities.tiling` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import unittest
+
+from colour.appearance import XYZ_to_CIECAM02
+from colour.difference import delta_E
+from colour.models import XYZ_to_Lab
+from colour.utilities import apply_tiled, image_tiles
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['TestImageTiles', 'TestApplyTiled']
+
+
+class TestImageTiles(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.tiling.image_tiles` definition unit tests
+    methods.
+    """
+
+    def test_image_tiles(self):
+        """
+        Tests :func:`colour.utilities.tiling.image_tiles` definition.
+        """
+
+        self.assertEqual(len(image_tiles((5, 7, 3), 2)), 12)
+
+        self.assertListEqual(
+            image_tiles((10, 3), 2),
+            [(slice(0, 4), ), (slice(4, 8), ), (slice(8, 12), )])
+
+        self.assertListEqual(image_tiles((3, ), 2), [(slice(0, 3), )])
+
+
+class TestApplyTiled(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.tiling.apply_tiled` definition unit tests
+    methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._XYZ = np.random.RandomState(4).uniform(size=(37, 21, 3))
+
+    def test_apply_tiled(self):
+        """
+        Tests :func:`colour.utilities.tiling.apply_tiled` definition.
+        """
+
+        Lab = XYZ_to_Lab(self._XYZ)
+        for workers in (1, 4):
+            np.testing.assert_almost_equal(
+                apply_tiled(XYZ_to_Lab, self._XYZ, 8, workers),
+                Lab,
+                decimal=7)
+
+        np.testing.assert_almost_equal(
+            apply_tiled(XYZ_to_Lab, self._XYZ.reshape(-1, 3), 4),
+            Lab.reshape(-1, 3),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            apply_tiled(delta_E, (Lab, Lab * 1.1), 8, method='CIE 2000'),
+            delta_E(Lab, Lab * 1.1, method='CIE 2000'),
+            decimal=7)
+
+        out = np.zeros(self._XYZ.shape)
+        self.assertIs(apply_tiled(XYZ_to_Lab, self._XYZ, 8, out=out), out)
+        np.testing.assert_almost_equal(out, Lab, decimal=7)
+
+        for shape in ((0, 4, 3), (4, 0, 3), (0, 3)):
+            self.assertTupleEqual(
+                apply_tiled(XYZ_to_Lab, np.zeros(shape), 8).shape, shape)
+
+        self.assertRaises(ValueError, apply_tiled, np.sum, self._XYZ, 8)
+
+    def test_apply_tiled_namedtuple(self):
+        """
+        Tests :func:`colour.utilities.tiling.apply_tiled` definition with
+        a function returning a *namedtuple*.
+        """
+
+        XYZ = self._XYZ * 100
+        XYZ_w = np.array([95.05, 100.00, 108.88])
+        specification = XYZ_to_CIECAM02(XYZ, XYZ_w, 318.31, 20.0)
+        specification_t = apply_tiled(
+            XYZ_to_CIECAM02, XYZ, 8, 4, XYZ_w=XYZ_w, L_A=318.31, Y_b=20.0)
+
+        self.assertIsInstance(specification_t, type(specification))
+        for field in specification._fields:
+            value, value_t = (getattr(specification, field),
+                              getattr(specification_t, field))
+            if value is None:
+                self.assertIsNone(value_t)
+            else:
+                np.testing.assert_almost_equal(value_t, value, decimal=7)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+"""
+Tiling Utilities
+================
+
+Defines the objects applying array-in / array-out colour science definitions
+to large images in tiles, optionally in parallel:
+
+-   :func:`colour.utilities.image_tiles`
+-   :func:`colour.utilities.apply_tiled`
+"""
+
+from __future__ import division, unicode_literals
+
+import multiprocessing
+import numpy as np
+from multiprocessing.pool import ThreadPool
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['DEFAULT_TILE_SIZE', 'image_tiles', 'apply_tiled']
+
+DEFAULT_TILE_SIZE = 256
+"""
+Default tiles size in pixels along the image rows and columns, a 256x256
+*RGB* *float64* tile is 1.5MB.
+
+DEFAULT_TILE_SIZE : integer
+"""
+
+
+def image_tiles(shape, tile_size=DEFAULT_TILE_SIZE):
+    """
+    Returns the tiles slices of an image with given shape.
+
+    The image is tiled along its first two axes, i.e. its rows and columns,
+    its last axis is assumed to hold the channels. An array with only two
+    axes, e.g. an array of *RGB* values, is tiled along its first axis in
+    chunks of *tile_size * tile_size* values.
+
+    Parameters
+    ----------
+    shape : array_like
+        Image shape.
+    tile_size : integer, optional
+        Tiles size in pixels along the image rows and columns.
+
+    Returns
+    -------
+    list
+        Tiles slices.
+
+    Examples
+    --------
+    >>> image_tiles((3, 4, 3), 2)  # doctest: +ELLIPSIS
+    [(slice(0, 2, None), slice(0, 2, None)), \
+(slice(0, 2, None), slice(2, 4, None)), \
+(slice(2, 4, None), slice(0, 2, None)), \
+(slice(2, 4, None), slice(2, 4, None))]
+    """
+
+    if len(shape) < 2:
+        return [(slice(0, shape[0] if shape else 1), )]
+
+    if len(shape) == 2:
+        size = tile_size * tile_size
+        return [(slice(i, i + size), ) for i in range(0, shape[0], size)]
+
+    return [(slice(i, i + tile_size), slice(j, j + tile_size))
+            for i in range(0, shape[0], tile_size)
+            for j in range(0, shape[1], tile_size)]
+
+
+def apply_tiled(function,
+                a,
+                tile_size=DEFAULT_TILE_SIZE,
+                workers=None,
+                out=None,
+                **kwargs):
+    """
+    Applies given array-in / array-out function to given image in tiles,
+    executed on a thread pool and written into a preallocated output.
+
+    Tiling bounds the temporary arrays allocated by the function to the tiles
+    size and keeps them cache friendly, while the thread pool uses all the
+    cores, *Numpy* releasing the *GIL* during most array operations.
+
+    Parameters
+    ----------
+    function : callable
+        Function to apply, it must operate independently on each pixel and
+        return an array, or a *tuple* or *namedtuple* of arrays, whose leading
+        axes match the input tile ones, e.g.
+        :func:`colour.XYZ_to_CIECAM02`, :func:`colour.RGB_to_ICTCP` or
+        :func:`colour.delta_E`.
+    a : array_like or tuple
+        Image to apply the function to, a *tuple* of images with the same
+        leading axes is passed to the function as positional arguments, e.g.
+        the two *CIE L\\*a\\*b\\** colourspace arrays of
+        :func:`colour.delta_E`.
+    tile_size : integer, optional
+        Tiles size in pixels along the image rows and columns.
+    workers : integer, optional
+        Thread pool workers count, default to the *CPU* count, the tiles are
+        applied sequentially if 1.
+    out : ndarray or tuple, optional
+        Array, or *tuple* of arrays if the function returns a *tuple*, to
+        write the output into.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        Keywords arguments passed to the function.
+
+    Returns
+    -------
+    ndarray or tuple
+        Function output.
+
+    Raises
+    ------
+    ValueError
+        If the function output leading axes do not match the input tile ones.
+
+    Examples
+    --------
+    >>> from colour import XYZ_to_Lab
+    >>> XYZ = np.tile(np.array([0.07049534, 0.10080000, 0.09558313]),
+    ...               (4, 4, 1))
+    >>> apply_tiled(XYZ_to_Lab, XYZ, tile_size=2)[3, 3]  # doctest: +ELLIPSIS
+    array([ 37.9856291..., -23.6290768...,  -4.4174661...])
+    """
+
+    arrays = (tuple(np.asarray(x) for x in a)
+              if isinstance(a, (tuple, list)) else (np.asarray(a), ))
+    shape = arrays[0].shape
+    tiles = image_tiles(shape, tile_size)
+    if not tiles:
+        tiles = [(slice(None), ) * min(len(shape), 2)]
+
+    axes = len(tiles[0])
+
+    def evaluate(tile):
+        """
+        Evaluates the function on given tile.
+        """
+
+        return function(*[x[tile] for x in arrays], **kwargs)
+
+    def allocate(value, tile):
+        """
+        Allocates an output array for given tile value.
+        """
+
+        if value is None:
+            return None
+
+        value = np.asarray(value)
+        tile_shape = arrays[0][tile].shape[:axes]
+        if value.shape[:axes] != tile_shape:
+            raise ValueError(
+                '"{0}" output shape {1} does not match the tile shape {2}, '
+                'it cannot be applied in tiles!'.format(
+                    function.__name__, value.shape, tile_shape))
+
+        return np.empty(shape[:axes] + value.shape[axes:], dtype=value.dtype)
+
+    first = evaluate(tiles[0])
+    is_tuple = isinstance(first, tuple)
+    values = first if is_tuple else (first, )
+
+    if out is None:
+        outs = tuple(allocate(value, tiles[0]) for value in values)
+    else:
+        outs = tuple(out) if is_tuple else (out, )
+
+    def write(tile, values):
+        """
+        Writes given tile values into the output arrays.
+        """
+
+        for out_i, value in zip(outs, values):
+            if out_i is not None:
+                out_i[tile] = value
+
+    write(tiles[0], values)
+
+    def process(tile):
+        """
+        Evaluates the function on given tile and writes its output.
+        """
+
+        value = evaluate(tile)
+        write(tile, value if is_tuple else (value, ))
+
+    if workers is None:
+        workers = multiprocessing.cpu_count()
+
+    if workers <= 1 or len(tiles) == 1:
+        for tile in tiles[1:]:
+            process(tile)
+    else:
+        pool = ThreadPool(min(workers, len(tiles) - 1))
+        try:
+            pool.map(process, tiles[1:])
+        finally:
+            pool.close()
+            pool.join()
+
+    if not is_tuple:
+        return outs[0]
+
+    return (first._make(outs) if hasattr(first, '_make') else outs)
@@ -14,11 +14,14 @@ blob/master/notebooks/volume/macadam_limits.ipynb>`_
 
 from __future__ import division, unicode_literals
 
+import hashlib
 import numpy as np
-from scipy.spatial import Delaunay
 
+from colour.colorimetry import STANDARD_OBSERVERS_CMFS, SpectralShape
 from colour.models import xyY_to_XYZ
-from colour.volume import ILLUMINANTS_OPTIMAL_COLOUR_STIMULI
+from colour.utilities import is_string
+from colour.volume import (ILLUMINANTS_OPTIMAL_COLOUR_STIMULI,
+                           is_within_convex_hull)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -27,21 +30,91 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['is_within_macadam_limits']
+__all__ = ['XYZ_optimal_colour_stimuli', 'is_within_macadam_limits']
 
 _XYZ_OPTIMAL_COLOUR_STIMULI_CACHE = {}
-_XYZ_OPTIMAL_COLOUR_STIMULI_TRIANGULATIONS_CACHE = {}
 
 
-def _XYZ_optimal_colour_stimuli(illuminant):
+def XYZ_optimal_colour_stimuli(
+        illuminant,
+        cmfs=STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer'],
+        interval=5):
+    """
+    Generates the *Optimal Colour Stimuli* in *CIE XYZ* tristimulus values of
+    given illuminant spectral power distribution and colour matching
+    functions.
+
+    The *Optimal Colour Stimuli* are the stimuli of the block reflectances,
+    i.e. equal to 1 on a single band of wavelengths and 0 elsewhere, either
+    band-pass or band-stop. They are computed for all the bands start and
+    width combinations at once using the cumulative sums of the illuminant
+    weighted colour matching functions.
+
+    Parameters
+    ----------
+    illuminant : SpectralPowerDistribution
+        Illuminant spectral power distribution.
+    cmfs : XYZ_ColourMatchingFunctions, optional
+        Standard observer colour matching functions.
+    interval : numeric, optional
+        Wavelength :math:`\lambda_{i}` range interval in nm used to sample the
+        colour matching functions and illuminant spectral power distribution.
+        The number of generated stimuli is quadratic in the resulting samples
+        count.
+
+    Returns
+    -------
+    ndarray
+        *Optimal Colour Stimuli* in *CIE XYZ* tristimulus values normalised so
+        that the perfect reflecting diffuser has a luminance :math:`Y` of 1.
+
+    Examples
+    --------
+    >>> from colour import ILLUMINANTS_SPDS
+    >>> XYZ = XYZ_optimal_colour_stimuli(ILLUMINANTS_SPDS['D65'])
+    >>> XYZ.shape
+    (8932, 3)
+    >>> XYZ[-1]  # doctest: +ELLIPSIS
+    array([ 0.9504...,  1.        ,  1.0889...])
+    """
+
+    wavelengths = SpectralShape(cmfs.shape.start, cmfs.shape.end,
+                                interval).range()
+
+    W = cmfs[wavelengths] * illuminant[wavelengths][..., np.newaxis]
+    n = W.shape[0]
+
+    W_c = np.zeros((2 * n + 1, 3))
+    W_c[1:] = np.cumsum(np.tile(W, (2, 1)), axis=0)
+
+    # Cyclic bands encode both the band-pass and band-stop reflectances.
+    start = np.arange(n)[..., np.newaxis]
+    width = np.arange(1, n)[np.newaxis, ...]
+    XYZ = np.reshape(W_c[start + width] - W_c[start], (-1, 3))
+
+    XYZ = np.vstack([np.zeros((1, 3)), XYZ, W_c[n][np.newaxis, ...]])
+    XYZ = np.unique(XYZ / W_c[n][1], axis=0)
+
+    return XYZ
+
+
+def _XYZ_optimal_colour_stimuli(
+        illuminant,
+        cmfs=STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer']):
     """
     Returns given illuminant *Optimal Colour Stimuli* in *CIE XYZ* tristimulus
     values and caches it if not existing.
 
     Parameters
     ----------
-    illuminant : unicode
-        Illuminant.
+    illuminant : unicode or SpectralPowerDistribution
+        Illuminant name or spectral power distribution, the *Optimal Colour
+        Stimuli* of the latter are generated with
+        :func:`colour.volume.XYZ_optimal_colour_stimuli` definition and cached
+        with their spectral content as key.
+    cmfs : XYZ_ColourMatchingFunctions, optional
+        Standard observer colour matching functions used when generating the
+        *Optimal Colour Stimuli*.
 
     Returns
     -------
@@ -49,6 +122,19 @@ def _XYZ_optimal_colour_stimuli(illuminant):
         Illuminant *Optimal Colour Stimuli*.
     """
 
+    if not is_string(illuminant):
+        key = hashlib.sha1()
+        for data in (illuminant.wavelengths, illuminant.values,
+                     cmfs.wavelengths, cmfs.values):
+            key.update(np.ascontiguousarray(data, dtype=np.float64).tobytes())
+        key = key.hexdigest()
+
+        cached_ocs = _XYZ_OPTIMAL_COLOUR_STIMULI_CACHE.get(key)
+        if cached_ocs is None:
+            _XYZ_OPTIMAL_COLOUR_STIMULI_CACHE[key] = cached_ocs = (
+                XYZ_optimal_colour_stimuli(illuminant, cmfs))
+        return cached_ocs
+
     optimal_colour_stimuli = ILLUMINANTS_OPTIMAL_COLOUR_STIMULI.get(illuminant)
     if optimal_colour_stimuli is None:
         raise KeyError('"{0}" not found in factory '
@@ -63,7 +149,11 @@ def _XYZ_optimal_colour_stimuli(illuminant):
     return cached_ocs
 
 
-def is_within_macadam_limits(xyY, illuminant, tolerance=None):
+def is_within_macadam_limits(
+        xyY,
+        illuminant,
+        tolerance=None,
+        cmfs=STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer']):
     """
     Returns if given *CIE xyY* colourspace array is within MacAdam limits of
     given illuminant.
@@ -72,10 +162,17 @@ def is_within_macadam_limits(xyY, illuminant, tolerance=None):
     ----------
     xyY : array_like
         *CIE xyY* colourspace array.
-    illuminant : unicode
-        Illuminant.
+    illuminant : unicode or SpectralPowerDistribution
+        Illuminant name from
+        :attr:`colour.ILLUMINANTS_OPTIMAL_COLOUR_STIMULI` attribute or
+        illuminant spectral power distribution whose *Optimal Colour Stimuli*
+        are generated on demand.
     tolerance : numeric, optional
-        Tolerance allowed in the inside-triangle check.
+        Distance outside the *Optimal Colour Stimuli* convex hull facets still
+        considered as within.
+    cmfs : XYZ_ColourMatchingFunctions, optional
+        Standard observer colour matching functions used when generating the
+        *Optimal Colour Stimuli* of an illuminant spectral power distribution.
 
     Returns
     -------
@@ -85,25 +182,25 @@ def is_within_macadam_limits(xyY, illuminant, tolerance=None):
     Notes
     -----
     -   Input *CIE xyY* colourspace array is normalised to domain [0, 1].
+    -   The MacAdam limits solid being convex, the check is performed against
+        the half-spaces of the *Optimal Colour Stimuli* convex hull with
+        :func:`colour.volume.is_within_convex_hull` definition.
 
     Examples
     --------
+    >>> import numpy as np
     >>> is_within_macadam_limits(np.array([0.3205, 0.4131, 0.51]), 'A')
     array(True, dtype=bool)
     >>> a = np.array([[0.3205, 0.4131, 0.51],
     ...               [0.0005, 0.0031, 0.001]])
     >>> is_within_macadam_limits(a, 'A')
     array([ True, False], dtype=bool)
+    >>> from colour import ILLUMINANTS_SPDS
+    >>> is_within_macadam_limits(a, ILLUMINANTS_SPDS['A'])
+    array([ True, False], dtype=bool)
     """
 
-    optimal_colour_stimuli = _XYZ_optimal_colour_stimuli(illuminant)
-    triangulation = _XYZ_OPTIMAL_COLOUR_STIMULI_TRIANGULATIONS_CACHE.get(
-        illuminant)
-    if triangulation is None:
-        _XYZ_OPTIMAL_COLOUR_STIMULI_TRIANGULATIONS_CACHE[illuminant] = \
-            triangulation = Delaunay(optimal_colour_stimuli)
-
-    simplex = triangulation.find_simplex(xyY_to_XYZ(xyY), tol=tolerance)
-    simplex = np.where(simplex >= 0, True, False)
+    optimal_colour_stimuli = _XYZ_optimal_colour_stimuli(illuminant, cmfs)
 
-    return simplex
+    return is_within_convex_hull(
+        xyY_to_XYZ(xyY), optimal_colour_stimuli, tolerance)
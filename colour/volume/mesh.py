@@ -8,8 +8,12 @@ Defines helpers objects related to volume computations.
 
 from __future__ import division, unicode_literals
 
+import hashlib
 import numpy as np
-from scipy.spatial import Delaunay
+from collections import OrderedDict
+from scipy.spatial import ConvexHull, Delaunay
+
+from colour.constants import DEFAULT_FLOAT_DTYPE
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -18,7 +22,118 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['is_within_mesh_volume']
+__all__ = [
+    'MESH_TRIANGULATIONS_CACHE_SIZE', 'CONVEX_HULL_CHUNK_SIZE',
+    'is_within_mesh_volume', 'is_within_convex_hull'
+]
+
+MESH_TRIANGULATIONS_CACHE_SIZE = 16
+"""
+Maximum number of mesh *Delaunay* triangulations and convex hulls half-spaces
+kept in cache.
+
+MESH_TRIANGULATIONS_CACHE_SIZE : integer
+"""
+
+CONVEX_HULL_CHUNK_SIZE = 65536
+"""
+Default points count processed at once by
+:func:`colour.volume.is_within_convex_hull` definition.
+
+CONVEX_HULL_CHUNK_SIZE : integer
+"""
+
+_MESH_TRIANGULATIONS_CACHE = OrderedDict()
+_MESH_HALF_SPACES_CACHE = OrderedDict()
+
+
+def _cached_mesh_object(cache, mesh, factory):
+    """
+    Returns the object built by given factory for given mesh from given cache
+    and caches it if not existing.
+
+    The cache is keyed by the mesh content hash and the least recently used
+    objects are discarded once
+    :attr:`colour.volume.mesh.MESH_TRIANGULATIONS_CACHE_SIZE` attribute is
+    exceeded.
+
+    Parameters
+    ----------
+    cache : OrderedDict
+        Cache to retrieve the object from.
+    mesh : array_like
+        Points of the volume.
+    factory : callable
+        Callable building the object from the mesh points.
+
+    Returns
+    -------
+    object
+        Cached object.
+    """
+
+    mesh = np.ascontiguousarray(mesh, dtype=DEFAULT_FLOAT_DTYPE)
+    key = (mesh.shape, hashlib.sha1(mesh.tobytes()).hexdigest())
+
+    value = cache.pop(key, None)
+    if value is None:
+        value = factory(mesh)
+
+    cache[key] = value
+    while len(cache) > MESH_TRIANGULATIONS_CACHE_SIZE:
+        cache.popitem(last=False)
+
+    return value
+
+
+def _mesh_triangulation(mesh):
+    """
+    Returns the *Delaunay* triangulation of given mesh and caches it if not
+    existing.
+
+    Parameters
+    ----------
+    mesh : array_like
+        Points of the volume used to generate the Delaunay triangulation.
+
+    Returns
+    -------
+    Delaunay
+        Mesh *Delaunay* triangulation.
+    """
+
+    return _cached_mesh_object(_MESH_TRIANGULATIONS_CACHE, mesh, Delaunay)
+
+
+def _mesh_half_spaces(mesh):
+    """
+    Returns the half-spaces of the convex hull of given mesh and caches them
+    if not existing.
+
+    Parameters
+    ----------
+    mesh : array_like
+        Points of the volume used to generate the convex hull.
+
+    Returns
+    -------
+    tuple
+        Convex hull facets outward unit normals and offsets, a point :math:`p`
+        is within the convex hull if :math:`p \cdot n \leq o` for all the
+        facets.
+    """
+
+    def half_spaces(mesh):
+        """
+        Computes the half-spaces of the convex hull of given mesh.
+        """
+
+        equations = ConvexHull(mesh).equations
+
+        return (np.ascontiguousarray(equations[..., :-1]),
+                np.ascontiguousarray(-equations[..., -1]))
+
+    return _cached_mesh_object(_MESH_HALF_SPACES_CACHE, mesh, half_spaces)
 
 
 def is_within_mesh_volume(points, mesh, tolerance=None):
@@ -40,6 +155,11 @@ def is_within_mesh_volume(points, mesh, tolerance=None):
     bool
         Is within mesh volume.
 
+    Notes
+    -----
+    -   The mesh *Delaunay* triangulation is cached and reused by subsequent
+        calls with a mesh of identical content.
+
     Examples
     --------
     >>> mesh = np.array(
@@ -57,9 +177,84 @@ def is_within_mesh_volume(points, mesh, tolerance=None):
     array([ True, False], dtype=bool)
     """
 
-    triangulation = Delaunay(mesh)
+    triangulation = _mesh_triangulation(mesh)
 
     simplex = triangulation.find_simplex(points, tol=tolerance)
     simplex = np.where(simplex >= 0, True, False)
 
     return simplex
+
+
+def is_within_convex_hull(points,
+                          mesh,
+                          tolerance=None,
+                          dtype=None,
+                          chunk_size=CONVEX_HULL_CHUNK_SIZE):
+    """
+    Returns if given points are within the convex hull of given mesh using
+    its half-spaces representation.
+
+    This is an alternative to :func:`colour.volume.is_within_mesh_volume`
+    definition for convex solids: the convex hull facets equations are
+    computed once and cached, the points are then tested with a matrix
+    product against the facets normals.
+
+    Parameters
+    ----------
+    points : array_like
+        Points to check if they are within ``mesh`` convex hull.
+    mesh : array_like
+        Points of the volume used to generate the convex hull.
+    tolerance : numeric, optional
+        Distance outside the convex hull facets still considered as within,
+        default to a hundred times the ``dtype`` epsilon.
+    dtype : type, optional
+        {'np.float32', 'np.float64'},
+        Floating point type used for the computations, default to
+        :attr:`colour.constants.DEFAULT_FLOAT_DTYPE` attribute.
+    chunk_size : integer, optional
+        Points count processed at once, bounding the temporary memory used.
+
+    Returns
+    -------
+    bool
+        Is within mesh convex hull.
+
+    Examples
+    --------
+    >>> mesh = np.array(
+    ...     [[-1.0, -1.0, 1.0],
+    ...       [1.0, -1.0, 1.0],
+    ...       [1.0, -1.0, -1.0],
+    ...       [-1.0, -1.0, -1.0],
+    ...       [0.0, 1.0, 0.0]]
+    ... )
+    >>> is_within_convex_hull(np.array([0.0005, 0.0031, 0.0010]), mesh)
+    array(True, dtype=bool)
+    >>> a = np.array([[0.0005, 0.0031, 0.0010],
+    ...               [0.3205, 0.4131, 0.5100]])
+    >>> is_within_convex_hull(a, mesh)
+    array([ True, False], dtype=bool)
+    """
+
+    if dtype is None:
+        dtype = DEFAULT_FLOAT_DTYPE
+
+    if tolerance is None:
+        tolerance = 100 * np.finfo(dtype).eps
+
+    normals, offsets = _mesh_half_spaces(mesh)
+    normals = normals.T.astype(dtype)
+    offsets = (offsets + tolerance).astype(dtype)
+
+    points = np.asarray(points)
+    shape = points.shape[:-1]
+    points = np.reshape(points, (-1, points.shape[-1])).astype(
+        dtype, copy=False)
+
+    within = np.empty(points.shape[0], dtype=np.bool_)
+    for i in range(0, points.shape[0], chunk_size):
+        within[i:i + chunk_size] = np.all(
+            np.dot(points[i:i + chunk_size], normals) <= offsets, axis=-1)
+
+    return np.reshape(within, shape)
@@ -27,6 +27,28 @@ __status__ = 'Production'
 
 __all__ = ['is_within_pointer_gamut']
 
+_XYZ_POINTER_GAMUT_CACHE = None
+
+
+def _XYZ_pointer_gamut():
+    """
+    Returns *Pointer's Gamut* data in *CIE XYZ* tristimulus values and caches
+    it if not existing.
+
+    Returns
+    -------
+    ndarray
+        *Pointer's Gamut* data in *CIE XYZ* tristimulus values.
+    """
+
+    global _XYZ_POINTER_GAMUT_CACHE
+
+    if _XYZ_POINTER_GAMUT_CACHE is None:
+        _XYZ_POINTER_GAMUT_CACHE = Lab_to_XYZ(
+            LCHab_to_Lab(POINTER_GAMUT_DATA), POINTER_GAMUT_ILLUMINANT)
+
+    return _XYZ_POINTER_GAMUT_CACHE
+
 
 def is_within_pointer_gamut(XYZ, tolerance=None):
     """
@@ -59,7 +81,4 @@ def is_within_pointer_gamut(XYZ, tolerance=None):
     array([ True, False], dtype=bool)
     """
 
-    XYZ_p = Lab_to_XYZ(
-        LCHab_to_Lab(POINTER_GAMUT_DATA), POINTER_GAMUT_ILLUMINANT)
-
-    return is_within_mesh_volume(XYZ, XYZ_p, tolerance)
+    return is_within_mesh_volume(XYZ, _XYZ_pointer_gamut(), tolerance)
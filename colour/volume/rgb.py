@@ -7,6 +7,7 @@ Defines various RGB colourspace volume computation objects:
 
 -   :func:`colour.RGB_colourspace_limits`
 -   :func:`colour.RGB_colourspace_volume_MonteCarlo`
+-   :func:`colour.RGB_colourspace_volume_mesh`
 -   :func:`colour.RGB_colourspace_volume_coverage_MonteCarlo`
 -   :func:`colour.RGB_colourspace_pointer_gamut_coverage_MonteCarlo`
 -   :func:`colour.RGB_colourspace_visible_spectrum_coverage_MonteCarlo`
@@ -38,7 +39,8 @@ __status__ = 'Production'
 
 __all__ = [
     'sample_RGB_colourspace_volume_MonteCarlo', 'RGB_colourspace_limits',
-    'RGB_colourspace_volume_MonteCarlo',
+    'RGB_colourspace_volume_MonteCarlo', 'RGB_colourspace_volume_mesh',
+    'RGB_colourspace_volume_coverage_MonteCarlo',
     'RGB_colourspace_pointer_gamut_coverage_MonteCarlo',
     'RGB_colourspace_visible_spectrum_coverage_MonteCarlo'
 ]
@@ -263,6 +265,168 @@ reproducibility-of-python-pseudo-random-numbers-across-systems-and-versions
     return Lab_volume * np.sum(results) / (process_samples * cpu_count)
 
 
+def _RGB_cube_faces(resolution):
+    """
+    Returns the regular grids tessellating the six faces of the unit *RGB*
+    cube at given resolution.
+
+    The grids are ordered so that the cross product of their first and second
+    axes points outward for the faces at 1 and inward for the faces at 0.
+
+    Parameters
+    ----------
+    resolution : integer
+        Quads count along each face edge.
+
+    Returns
+    -------
+    tuple
+        *RGB* faces grids of shape (6, resolution + 1, resolution + 1, 3) and
+        faces orientation signs.
+    """
+
+    samples = np.linspace(0, 1, resolution + 1)
+    u, v = np.meshgrid(samples, samples, indexing='ij')
+
+    faces, signs = [], []
+    for axis in range(3):
+        for side in (0, 1):
+            face = np.empty(u.shape + (3, ))
+            face[..., axis] = side
+            face[..., (axis + 1) % 3] = u
+            face[..., (axis + 2) % 3] = v
+            faces.append(face)
+            signs.append(1 if side else -1)
+
+    return np.array(faces), np.array(signs)
+
+
+def _mesh_signed_volume(faces, signs):
+    """
+    Returns the signed volume enclosed by given quads grids using the
+    divergence theorem over their triangulation.
+
+    Parameters
+    ----------
+    faces : array_like
+        Faces grids of shape (faces, m, n, 3).
+    signs : array_like
+        Faces orientation signs.
+
+    Returns
+    -------
+    numeric
+        Signed volume.
+    """
+
+    A = faces[:, :-1, :-1]
+    B = faces[:, 1:, :-1]
+    C = faces[:, 1:, 1:]
+    D = faces[:, :-1, 1:]
+
+    volumes = (np.sum(A * np.cross(B, C), axis=-1) +
+               np.sum(A * np.cross(C, D), axis=-1))
+
+    return np.sum(signs * np.sum(volumes, axis=(1, 2))) / 6
+
+
+def RGB_colourspace_volume_mesh(
+        colourspace,
+        resolution=32,
+        illuminant_Lab=ILLUMINANTS['CIE 1931 2 Degree Standard Observer'][
+            'D50'],
+        chromatic_adaptation_method='CAT02',
+        tolerance=None,
+        maximum_resolution=512):
+    """
+    Performs given *RGB* colourspace volume computation by tessellating the
+    *RGB* cube faces, converting them to *CIE L\*a\*b\** colourspace and
+    integrating the enclosed volume with the divergence theorem.
+
+    Parameters
+    ----------
+    colourspace : RGB_Colourspace
+        *RGB* colourspace to compute the volume of.
+    resolution : integer, optional
+        Quads count along each *RGB* cube face edge.
+    illuminant_Lab : array_like, optional
+        *Lab* colourspace *illuminant* chromaticity coordinates.
+    chromatic_adaptation_method : unicode, optional
+        **{'CAT02', 'XYZ Scaling', 'Von Kries', 'Bradford', 'Sharp',
+        'Fairchild', 'CMCCAT97', 'CMCCAT2000', 'CAT02_BRILL_CAT', 'Bianco',
+        'Bianco PC'}**,
+        *Chromatic adaptation* method.
+    tolerance : numeric, optional
+        Maximum allowed deviation in *CIE L\*a\*b\** colourspace between
+        the converted quads centres and the planar approximation of the mesh.
+        If given, the resolution is increased until the tessellation
+        curvature error is below the tolerance.
+    maximum_resolution : integer, optional
+        Resolution upper bound when refining the tessellation.
+
+    Returns
+    -------
+    float
+        *RGB* colourspace volume.
+
+    Notes
+    -----
+    -   The computation is deterministic and its error decreases
+        quadratically with the resolution.
+    -   The refinement is applied uniformly to all the faces so that the mesh
+        stays watertight, the resolution required is estimated from the
+        largest deviation between each converted quad centre and the average
+        of its converted vertices.
+
+    Examples
+    --------
+    >>> from colour import sRGB_COLOURSPACE as sRGB
+    >>> RGB_colourspace_volume_mesh(sRGB)  # doctest: +ELLIPSIS
+    8...
+    """
+
+    def RGB_to_Lab(RGB):
+        """
+        Converts given *RGB* colourspace array to *CIE L\*a\*b\**
+        colourspace.
+        """
+
+        return XYZ_to_Lab(
+            RGB_to_XYZ(
+                RGB,
+                colourspace.whitepoint,
+                illuminant_Lab,
+                colourspace.RGB_to_XYZ_matrix,
+                chromatic_adaptation_transform=chromatic_adaptation_method),
+            illuminant_Lab)
+
+    resolution = int(resolution)
+    while True:
+        faces, signs = _RGB_cube_faces(resolution)
+        faces_Lab = RGB_to_Lab(faces)
+
+        if tolerance is None or resolution >= maximum_resolution:
+            break
+
+        centres = (faces[:, :-1, :-1] + faces[:, 1:, 1:]) / 2
+        centres_Lab = RGB_to_Lab(centres)
+        centres_planar = (faces_Lab[:, :-1, :-1] + faces_Lab[:, 1:, :-1] +
+                          faces_Lab[:, 1:, 1:] + faces_Lab[:, :-1, 1:]) / 4
+        deviation = np.max(
+            np.linalg.norm(centres_Lab - centres_planar, axis=-1))
+
+        if deviation <= tolerance:
+            break
+
+        # The deviation is quadratic in the quads size.
+        resolution = min(
+            maximum_resolution,
+            max(resolution + 1,
+                int(np.ceil(resolution * np.sqrt(deviation / tolerance)))))
+
+    return np.abs(_mesh_signed_volume(faces_Lab, signs))
+
+
 def RGB_colourspace_volume_coverage_MonteCarlo(
         colourspace,
         coverage_sampler,
@@ -15,7 +15,7 @@ blob/master/notebooks/volume/spectrum.ipynb>`_
 from __future__ import division, unicode_literals
 
 from colour.colorimetry import STANDARD_OBSERVERS_CMFS
-from colour.volume import is_within_mesh_volume
+from colour.volume import is_within_convex_hull
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -42,7 +42,8 @@ def is_within_visible_spectrum(
     cmfs : XYZ_ColourMatchingFunctions
         Standard observer colour matching functions.
     tolerance : numeric, optional
-        Tolerance allowed in the inside-triangle check.
+        Distance outside the colour matching functions convex hull facets
+        still considered as within.
 
     Returns
     -------
@@ -52,6 +53,9 @@ def is_within_visible_spectrum(
     Notes
     -----
     -   Input *CIE XYZ* tristimulus values are normalised to domain [0, 1].
+    -   The visible spectrum volume is the convex hull of the colour matching
+        functions, the check is performed against its half-spaces with
+        :func:`colour.volume.is_within_convex_hull` definition.
 
     Examples
     --------
@@ -64,4 +68,4 @@ def is_within_visible_spectrum(
     array([ True, False], dtype=bool)
     """
 
-    return is_within_mesh_volume(XYZ, cmfs.values, tolerance)
+    return is_within_convex_hull(XYZ, cmfs.values, tolerance)
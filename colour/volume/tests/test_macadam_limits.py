@@ -9,7 +9,12 @@ import numpy as np
 import unittest
 from itertools import permutations
 
-from colour.volume import is_within_macadam_limits
+from colour.colorimetry import ILLUMINANTS_SPDS
+from colour.models import xyY_to_XYZ
+from colour.volume import (ILLUMINANTS_OPTIMAL_COLOUR_STIMULI,
+                           XYZ_optimal_colour_stimuli, is_within_convex_hull,
+                           is_within_macadam_limits)
+from colour.volume.macadam_limits import _XYZ_OPTIMAL_COLOUR_STIMULI_CACHE
 from colour.utilities import ignore_numpy_errors
 
 __author__ = 'Colour Developers'
@@ -19,7 +24,36 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['TestIsWithinMacadamLimits']
+__all__ = ['TestXYZ_optimal_colour_stimuli', 'TestIsWithinMacadamLimits']
+
+
+class TestXYZ_optimal_colour_stimuli(unittest.TestCase):
+    """
+    Defines :func:`colour.volume.macadam_limits.XYZ_optimal_colour_stimuli`
+    definition unit tests methods.
+    """
+
+    def test_XYZ_optimal_colour_stimuli(self):
+        """
+        Tests :func:`colour.volume.macadam_limits.XYZ_optimal_colour_stimuli`
+        definition.
+        """
+
+        XYZ = XYZ_optimal_colour_stimuli(ILLUMINANTS_SPDS['D65'])
+
+        self.assertEqual(XYZ.shape, (8932, 3))
+
+        np.testing.assert_almost_equal(XYZ[0], np.zeros(3), decimal=7)
+        np.testing.assert_almost_equal(
+            XYZ[-1], np.array([0.95046695, 1.00000000, 1.08896911]), decimal=7)
+
+        XYZ_t = xyY_to_XYZ(ILLUMINANTS_OPTIMAL_COLOUR_STIMULI['D65']) / 100
+        self.assertTrue(np.all(is_within_convex_hull(XYZ_t, XYZ, 0.005)))
+        self.assertFalse(np.all(is_within_convex_hull(XYZ_t * 1.05, XYZ)))
+
+        self.assertEqual(
+            XYZ_optimal_colour_stimuli(ILLUMINANTS_SPDS['D65'],
+                                       interval=10).shape, (2258, 3))
 
 
 class TestIsWithinMacadamLimits(unittest.TestCase):
@@ -46,6 +80,41 @@ class TestIsWithinMacadamLimits(unittest.TestCase):
         self.assertFalse(
             is_within_macadam_limits(np.array([0.0025, 0.0088, 0.0340]), 'C'))
 
+        self.assertTrue(
+            is_within_macadam_limits(
+                np.array([0.3205, 0.4131, 0.5100]), ILLUMINANTS_SPDS['A']))
+
+        self.assertFalse(
+            is_within_macadam_limits(
+                np.array([0.0005, 0.0031, 0.0010]), ILLUMINANTS_SPDS['A']))
+
+        self.assertTrue(
+            is_within_macadam_limits(
+                np.array([0.4325, 0.3788, 0.1034]), ILLUMINANTS_SPDS['C']))
+
+        self.assertFalse(
+            is_within_macadam_limits(
+                np.array([0.0025, 0.0088, 0.0340]), ILLUMINANTS_SPDS['C']))
+
+    def test_cache_is_within_macadam_limits(self):
+        """
+        Tests :func:`colour.volume.macadam_limits.is_within_macadam_limits`
+        definition *Optimal Colour Stimuli* caching.
+        """
+
+        spd = ILLUMINANTS_SPDS['F2'].copy()
+        is_within_macadam_limits(np.array([0.3205, 0.4131, 0.5100]), spd)
+        cache_size = len(_XYZ_OPTIMAL_COLOUR_STIMULI_CACHE)
+
+        is_within_macadam_limits(np.array([0.3205, 0.4131, 0.5100]),
+                                 ILLUMINANTS_SPDS['F2'].copy())
+        self.assertEqual(len(_XYZ_OPTIMAL_COLOUR_STIMULI_CACHE), cache_size)
+
+        spd.values = spd.values * 2
+        is_within_macadam_limits(np.array([0.3205, 0.4131, 0.5100]), spd)
+        self.assertEqual(
+            len(_XYZ_OPTIMAL_COLOUR_STIMULI_CACHE), cache_size + 1)
+
     def test_n_dimensional_is_within_macadam_limits(self):
         """
         Tests :func:`colour.volume.macadam_limits.is_within_macadam_limits`
@@ -9,7 +9,10 @@ import numpy as np
 import unittest
 from itertools import permutations
 
-from colour.volume import is_within_mesh_volume
+from colour.volume import is_within_convex_hull, is_within_mesh_volume
+from colour.volume.mesh import (MESH_TRIANGULATIONS_CACHE_SIZE,
+                                _MESH_TRIANGULATIONS_CACHE,
+                                _mesh_triangulation)
 from colour.utilities import ignore_numpy_errors
 
 __author__ = 'Colour Developers'
@@ -19,7 +22,41 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['TestIsWithinMeshVolume']
+__all__ = [
+    'TestMeshTriangulation', 'TestIsWithinMeshVolume',
+    'TestIsWithinConvexHull'
+]
+
+
+class TestMeshTriangulation(unittest.TestCase):
+    """
+    Defines :func:`colour.volume.mesh._mesh_triangulation` definition unit
+    tests methods.
+    """
+
+    def test__mesh_triangulation(self):
+        """
+        Tests :func:`colour.volume.mesh._mesh_triangulation` definition.
+        """
+
+        mesh = np.array([
+            [-1.0, -1.0, 1.0],
+            [1.0, -1.0, 1.0],
+            [1.0, -1.0, -1.0],
+            [-1.0, -1.0, -1.0],
+            [0.0, 1.0, 0.0],
+        ])
+
+        triangulation = _mesh_triangulation(mesh)
+        self.assertIs(_mesh_triangulation(np.copy(mesh)), triangulation)
+        self.assertIsNot(_mesh_triangulation(mesh * 2), triangulation)
+
+        for i in range(MESH_TRIANGULATIONS_CACHE_SIZE + 1):
+            _mesh_triangulation(mesh + i + 1)
+
+        self.assertEqual(
+            len(_MESH_TRIANGULATIONS_CACHE), MESH_TRIANGULATIONS_CACHE_SIZE)
+        self.assertIsNot(_mesh_triangulation(mesh), triangulation)
 
 
 class TestIsWithinMeshVolume(unittest.TestCase):
@@ -93,5 +130,94 @@ class TestIsWithinMeshVolume(unittest.TestCase):
             is_within_mesh_volume(case, self._mesh)
 
 
+class TestIsWithinConvexHull(unittest.TestCase):
+    """
+    Defines :func:`colour.volume.mesh.is_within_convex_hull` definition unit
+    tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._mesh = np.array([
+            [-1.0, -1.0, 1.0],
+            [1.0, -1.0, 1.0],
+            [1.0, -1.0, -1.0],
+            [-1.0, -1.0, -1.0],
+            [0.0, 1.0, 0.0],
+        ])
+
+    def test_is_within_convex_hull(self):
+        """
+        Tests :func:`colour.volume.mesh.is_within_convex_hull` definition.
+        """
+
+        self.assertTrue(
+            is_within_convex_hull(
+                np.array([0.0005, 0.0031, 0.0010]), self._mesh))
+
+        self.assertFalse(
+            is_within_convex_hull(
+                np.array([0.3205, 0.4131, 0.5100]), self._mesh))
+
+        self.assertTrue(
+            is_within_convex_hull(
+                np.array([0.0025, 0.0088, 0.0340]), self._mesh))
+
+        self.assertFalse(
+            is_within_convex_hull(
+                np.array([0.4325, 0.3788, 0.1034]), self._mesh))
+
+        self.assertFalse(
+            is_within_convex_hull(
+                np.array([0.0000, 1.0100, 0.0000]), self._mesh))
+
+        self.assertTrue(
+            is_within_convex_hull(
+                np.array([0.0000, 1.0100, 0.0000]),
+                self._mesh,
+                tolerance=0.01))
+
+        points = np.random.RandomState(4).uniform(-1.5, 1.5, (1000, 3))
+        np.testing.assert_equal(
+            is_within_convex_hull(points, self._mesh, chunk_size=64),
+            is_within_mesh_volume(points, self._mesh))
+        np.testing.assert_equal(
+            is_within_convex_hull(points, self._mesh, dtype=np.float32),
+            is_within_mesh_volume(points, self._mesh))
+
+    def test_n_dimensional_is_within_convex_hull(self):
+        """
+        Tests :func:`colour.volume.mesh.is_within_convex_hull` definition
+        n-dimensional arrays support.
+        """
+
+        a = np.array([0.0005, 0.0031, 0.0010])
+        b = np.array([True])
+        np.testing.assert_almost_equal(is_within_convex_hull(a, self._mesh), b)
+
+        a = np.tile(a, (6, 1))
+        b = np.tile(b, 6)
+        np.testing.assert_almost_equal(is_within_convex_hull(a, self._mesh), b)
+
+        a = np.reshape(a, (2, 3, 3))
+        b = np.reshape(b, (2, 3))
+        np.testing.assert_almost_equal(is_within_convex_hull(a, self._mesh), b)
+
+    @ignore_numpy_errors
+    def test_nan_is_within_convex_hull(self):
+        """
+        Tests :func:`colour.volume.mesh.is_within_convex_hull` definition nan
+        support.
+        """
+
+        cases = [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]
+        cases = set(permutations(cases * 3, r=3))
+        for case in cases:
+            is_within_convex_hull(case, self._mesh)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -27,7 +27,7 @@ from colour.models import (ACES_2065_1_COLOURSPACE, BT2020_COLOURSPACE,
                            BT709_COLOURSPACE)
 from colour.volume import (
     RGB_colourspace_limits, RGB_colourspace_volume_MonteCarlo,
-    RGB_colourspace_volume_coverage_MonteCarlo,
+    RGB_colourspace_volume_mesh, RGB_colourspace_volume_coverage_MonteCarlo,
     RGB_colourspace_pointer_gamut_coverage_MonteCarlo,
     RGB_colourspace_visible_spectrum_coverage_MonteCarlo,
     is_within_pointer_gamut)
@@ -41,6 +41,7 @@ __status__ = 'Production'
 
 __all__ = [
     'TestRGB_colourspaceLimits', 'TestRGB_colourspaceVolumeMonteCarlo',
+    'TestRGB_colourspaceVolumeMesh',
     'TestRGB_colourspace_volume_coverage_MonteCarlo',
     'TestRGB_colourspacePointerGamutCoverageMonteCarlo',
     'TestRGB_colourspaceVisibleSpectrumCoverageMonteCarlo'
@@ -103,6 +104,54 @@ class TestRGB_colourspaceVolumeMonteCarlo(unittest.TestCase):
                 processes=1), 858600.0)
 
 
+class TestRGB_colourspaceVolumeMesh(unittest.TestCase):
+    """
+    Defines :func:`colour.volume.rgb.RGB_colourspace_volume_mesh` definition
+    unit tests methods.
+    """
+
+    def test_RGB_colourspace_volume_mesh(self):
+        """
+        Tests :func:`colour.volume.rgb.RGB_colourspace_volume_mesh`
+        definition.
+        """
+
+        self.assertAlmostEqual(
+            RGB_colourspace_volume_mesh(BT709_COLOURSPACE),
+            853507.88321137,
+            places=4)
+
+        self.assertAlmostEqual(
+            RGB_colourspace_volume_mesh(BT2020_COLOURSPACE),
+            1935653.33406738,
+            places=4)
+
+        self.assertAlmostEqual(
+            RGB_colourspace_volume_mesh(BT709_COLOURSPACE, 128) /
+            RGB_colourspace_volume_MonteCarlo(
+                BT709_COLOURSPACE,
+                10e3,
+                random_state=np.random.RandomState(2),
+                processes=1),
+            1,
+            places=1)
+
+    def test_refinement_RGB_colourspace_volume_mesh(self):
+        """
+        Tests :func:`colour.volume.rgb.RGB_colourspace_volume_mesh`
+        definition refinement.
+        """
+
+        self.assertEqual(
+            RGB_colourspace_volume_mesh(
+                BT709_COLOURSPACE, 8, tolerance=1e-6, maximum_resolution=64),
+            RGB_colourspace_volume_mesh(BT709_COLOURSPACE, 64))
+
+        self.assertEqual(
+            RGB_colourspace_volume_mesh(BT709_COLOURSPACE, 8, tolerance=1e6),
+            RGB_colourspace_volume_mesh(BT709_COLOURSPACE, 8))
+
+
 class TestRGB_colourspace_volume_coverage_MonteCarlo(unittest.TestCase):
     """
     Defines :func:`colour.volume.rgb.\
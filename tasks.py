@@ -16,6 +16,7 @@ from invoke import task
 
 import colour
 from colour import read_image
+from colour.notation.dataset import write_munsell_colours_cache
 from colour.utilities import message_box, metric_psnr
 
 __author__ = 'Colour Developers'
@@ -27,8 +28,8 @@ __status__ = 'Production'
 
 __all__ = [
     'APPLICATION_NAME', 'PYTHON_PACKAGE_NAME', 'PYPI_PACKAGE_NAME', 'clean',
-    'formatting', 'tests', 'quality', 'examples', 'docs', 'todo', 'preflight',
-    'build', 'virtualise', 'tag', 'release', 'sha256'
+    'formatting', 'tests', 'quality', 'examples', 'docs', 'todo', 'datasets',
+    'preflight', 'build', 'virtualise', 'tag', 'release', 'sha256'
 ]
 
 APPLICATION_NAME = colour.__application_name__
@@ -277,6 +278,27 @@ def todo(ctx):
         ctx.run('./export_todo.py')
 
 
+@task
+def datasets(ctx):
+    """
+    Writes the datasets caches.
+
+    Parameters
+    ----------
+    ctx : invoke.context.Context
+        Context.
+
+    Returns
+    -------
+    bool
+        Task success.
+    """
+
+    message_box('Writing datasets caches...')
+
+    write_munsell_colours_cache()
+
+
 @task(formatting, tests, quality, examples)
 def preflight(ctx):
     """
@@ -297,11 +319,11 @@ def preflight(ctx):
     message_box('Finishing "Preflight"...')
 
 
-@task(docs, todo, preflight)
+@task(docs, todo, datasets, preflight)
 def build(ctx):
     """
-    Builds the project and runs dependency tasks, i.e. *docs*, *todo*, and
-    *preflight*.
+    Builds the project and runs dependency tasks, i.e. *docs*, *todo*,
+    *datasets* and *preflight*.
 
     Parameters
     ----------